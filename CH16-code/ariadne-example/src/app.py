@@ -1,11 +1,74 @@
+import os
+
+from contextlib import asynccontextmanager
+from pathlib import Path
+
 from fastapi import FastAPI
 from ariadne.asgi import GraphQL
 from ariadne import make_executable_schema, load_schema_from_path
+from graphql import specified_rules, validate
 
-from resolvers import query, mutation
+from hms.core.data_objects import close_env_async_database_pool
+from hms.core.graphql_queries import QueryDocumentCache, \
+    cost_limit_rule
+
+from resolvers import artisan_type, get_context_value, mutation, \
+    product_type, query
 
 type_defs = load_schema_from_path("src/schema.graphql")
-schema = make_executable_schema(type_defs, query, mutation)
+schema = make_executable_schema(
+    type_defs, query, mutation, artisan_type, product_type
+)
+
+# If GRAPHQL_PERSISTED_QUERIES is set to a directory, only the
+# queries in the .graphql files in it are allowed
+PERSISTED_QUERIES = os.getenv("GRAPHQL_PERSISTED_QUERIES")
+
+# Each distinct query is parsed and validated only once
+query_cache = QueryDocumentCache(
+    schema, persisted_only=bool(PERSISTED_QUERIES)
+)
+if PERSISTED_QUERIES:
+    for query_file in sorted(Path(PERSISTED_QUERIES).glob("*.graphql")):
+        query_cache.register(query_file.read_text())
+
+
+def parse_query(context_value, data):
+    document, errors = query_cache.get_document(data["query"])
+    if document is None:
+        raise errors[0]
+    return document
+
+
+def validate_query(schema, document_ast, rules=None, *args, **kwargs):
+    # The document's results for the specified rules were
+    # cached with it, so only the request's own rules are run
+    _, errors = query_cache.get_document(document_ast.loc.source.body)
+    request_rules = [
+        rule for rule in rules or () if rule not in specified_rules
+    ]
+    return errors or validate(schema, document_ast, request_rules)
+
+
+def get_validation_rules(context_value, document, data):
+    # The cost depends on the variables, so it is checked for
+    # every request
+    return [cost_limit_rule(data.get("variables"))]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await close_env_async_database_pool()
+
 
-app = FastAPI()
-app.mount("/graphql", GraphQL(schema, debug=True))
+app = FastAPI(lifespan=lifespan)
+app.mount("/graphql", GraphQL(
+    schema,
+    # Only include tracebacks in errors if asked to
+    debug=os.getenv("GRAPHQL_DEBUG") == "on",
+    context_value=get_context_value,
+    query_parser=parse_query,
+    query_validator=validate_query,
+    validation_rules=get_validation_rules,
+))
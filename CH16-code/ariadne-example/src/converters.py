@@ -1,4 +1,5 @@
-from hms.core.business_objects import Artisan, Address
+from hms.core.business_objects import Artisan, Address, \
+    Product, ProductImage
 from pydantic import EmailStr, NameEmail
 from typing import Union
 
@@ -27,3 +28,35 @@ def artisan_to_dict(artisan: Artisan) -> dict:
         "emailAddress": str(artisan.email_address),
         "businessAddress": artisan.business_address.model_dump(mode="json")
     }
+
+def _decimal_to_str(value) -> Union[str, None]:
+    # Decimal values are returned as strings, to keep their
+    # precision
+    return None if value is None else str(value)
+
+def product_to_dict(product: Product) -> dict:
+    return {
+        "oid": str(product.oid),
+        "artisanOid": str(product.artisan_oid),
+        "name": product.name,
+        "summary": product.summary,
+        "description": product.description,
+        "price": _decimal_to_str(product.price),
+        "shippingWeight": _decimal_to_str(product.shipping_weight),
+        "height": _decimal_to_str(product.height),
+        "length": _decimal_to_str(product.length),
+        "width": _decimal_to_str(product.width),
+        "size": product.size,
+    }
+
+def product_image_to_dict(image: ProductImage) -> dict:
+    return {
+        "oid": str(image.oid),
+        "productOid": str(image.product_oid),
+        "isPrimaryImage": image.is_primary_image,
+        "imageUrl": str(image.image_url),
+        "caption": image.caption,
+        "altText": image.alt_text,
+        "width": image.width,
+        "height": image.height,
+    }
@@ -1,32 +1,70 @@
-from ariadne import QueryType, MutationType
-from hms.core.business_objects import Artisan
+from ariadne import ObjectType, QueryType, MutationType
+from hms.core.business_objects import Artisan, Product, ProductImage
+from hms.core.loaders import RequestLoaders
 from uuid import UUID
-from converters import artisan_to_dict, input_to_artisan
+from converters import artisan_to_dict, input_to_artisan, \
+    product_image_to_dict, product_to_dict
 
 query = QueryType()
 mutation = MutationType()
+artisan_type = ObjectType("Artisan")
+product_type = ObjectType("Product")
+
+# The tables that each business object is read from
+DB_SOURCE_NAMES = {
+    Artisan: 'Artisan',
+    Product: 'Products',
+    ProductImage: 'ProductImages',
+}
+
+# -- Request Context --
+def get_context_value(request, data):
+    # Each request gets its own loaders, which batch the
+    # lookups its resolvers make into single queries, and
+    # cache their results until the request is complete
+    return {
+        "request": request,
+        "loaders": RequestLoaders(DB_SOURCE_NAMES),
+    }
 
 # -- Query Resolvers --
 @query.field("get_artisans")
-def resolve_get_artisans(_, info):
-    artisans = Artisan.get(db_source_name='Artisan')
+async def resolve_get_artisans(_, info):
+    artisans = await Artisan.aget(db_source_name='Artisan')
+    loader = info.context["loaders"].loader(Artisan)
+    for a in artisans:
+        loader.prime(a)
     return [artisan_to_dict(a) for a in artisans]
 
 @query.field("get_artisan_by_oid")
-def resolve_get_artisan_by_oid(_, info, oid):
-    artisan = Artisan.get(UUID(oid), db_source_name='Artisan')
-    return artisan_to_dict(artisan[0]) if artisan else None
+async def resolve_get_artisan_by_oid(_, info, oid):
+    artisan = await info.context["loaders"].loader(Artisan).load(oid)
+    return artisan_to_dict(artisan) if artisan else None
+
+# -- Object Resolvers --
+@artisan_type.field("products")
+async def resolve_artisan_products(obj, info):
+    products = await info.context["loaders"] \
+        .loader(Product, "artisan_oid").load(obj["oid"])
+    return [product_to_dict(p) for p in products]
+
+@product_type.field("productImages")
+async def resolve_product_images(obj, info):
+    images = await info.context["loaders"] \
+        .loader(ProductImage, "product_oid").load(obj["oid"])
+    return [product_image_to_dict(i) for i in images]
 
 # -- Mutation Resolvers --
 @mutation.field("create_artisan")
-def resolve_create_artisan(_, info, artisan):
+async def resolve_create_artisan(_, info, artisan):
     new_artisan = input_to_artisan(artisan)
-    new_artisan.save(db_source_name='Artisan')
+    await new_artisan.asave(db_source_name='Artisan')
     return artisan_to_dict(new_artisan)
 
 @mutation.field("update_artisan_by_oid")
-def resolve_update_artisan_by_oid(_, info, oid, artisan):
+async def resolve_update_artisan_by_oid(_, info, oid, artisan):
     updated = input_to_artisan(artisan)
     updated.oid = UUID(oid)
-    updated.save(db_source_name='Artisan')
+    await updated.asave(db_source_name='Artisan')
+    info.context["loaders"].clear(updated)
     return artisan_to_dict(updated)
@@ -6,18 +6,30 @@ import logging
 import os
 import pprint
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from hms.core.business_objects import Artisan, Address
-from hms.core.data_objects import BaseDataObject
+from hms.core.data_objects import BaseDataObject, \
+    close_env_async_database_pool
 
 host = os.getenv('FASTAPI_RUN_HOST', '127.0.0.1')
 port = int(os.getenv('FASTAPI_RUN_PORT', '5000'))
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The async database pool is created on first use;
+    # close it, releasing its connections, on shutdown
+    yield
+    await close_env_async_database_pool()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Templates (Jinja2)
 templates = Jinja2Templates(directory='templates')
@@ -56,7 +68,7 @@ async def api_root(request: Request):
 @app.get('/api/v1/artisans/{oid}/')
 async def get_artisan_by_oid(oid: str):
     try:
-        artisans = Artisan.get(
+        artisans = await Artisan.aget(
             oid, db_source_name='Artisan'
         )
         results = [
@@ -74,7 +86,9 @@ async def get_artisan_by_oid(oid: str):
 @app.get('/api/v1/artisans/')
 async def get_artisans_root():
     try:
-        artisans = Artisan.get(db_source_name='Artisan')
+        artisans = await Artisan.aget(
+            db_source_name='Artisan'
+        )
         results = [
             artisan.model_dump(mode='json')
             for artisan in artisans
@@ -90,8 +104,8 @@ async def get_artisans_root():
 @app.patch('/api/v1/artisans/{oid}/')
 async def patch_artisan_by_oid(oid: str, payload: dict):
     try:
-        artisan = Artisan.get(
-            oid, db_source_name='Artisan'
+        artisan = (
+            await Artisan.aget(oid, db_source_name='Artisan')
         )[0]
         logger.info(f'Retrieved Artisan {artisan}')
         for key, value in payload.items():
@@ -99,7 +113,7 @@ async def patch_artisan_by_oid(oid: str, payload: dict):
                 setattr(artisan, key, Address(**value))
             else:
                 setattr(artisan, key, value)
-        artisan.save(db_source_name='Artisan')
+        await artisan.asave(db_source_name='Artisan')
         return artisan.model_dump(mode='json')
     except Exception as error:
         logger.exception('Error in patch_artisan_by_oid')
@@ -112,7 +126,7 @@ async def patch_artisan_by_oid(oid: str, payload: dict):
 async def post_artisans_root(payload: dict):
     try:
         new_artisan = Artisan(**payload)
-        new_artisan.save(db_source_name='Artisan')
+        await new_artisan.asave(db_source_name='Artisan')
         return JSONResponse(
             content=new_artisan.model_dump(mode='json')
         )
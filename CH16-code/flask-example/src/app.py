@@ -28,7 +28,7 @@ import os
 import pprint
 
 # Third-Party Imports
-from flask import Flask, render_template, request
+from flask import Flask, Response, render_template, request
 from markupsafe import escape
 
 # Path-Manipulations (avoid these!) and "Local" Imports
@@ -93,15 +93,30 @@ def get_artisan_by_oid(*args, **kwargs):
         return json.dumps(result), 500
 
 
+def stream_json_list(first, items):
+    """
+    Yields the JSON of a list of models a piece at a time,
+    so that the whole list never has to be held in memory.
+    """
+    yield '['
+    if first is not None:
+        yield first.model_dump_json()
+        for item in items:
+            yield ', ' + item.model_dump_json()
+    yield ']'
+
+
 @app.route('/api/v1/artisans/', methods=['GET'])
 def get_artisans_root():
     try:
-        artisans = Artisan.get(db_source_name='Artisan')
-        results = [
-            artisan.model_dump(mode='json')
-            for artisan in artisans
-        ]
-        return json.dumps(results), 200
+        artisans = Artisan.iter(db_source_name='Artisan')
+        # Read the first one here, which executes the
+        # query, so that errors are still handled below
+        first = next(artisans, None)
+        return Response(
+            stream_json_list(first, artisans),
+            status=200, mimetype='application/json'
+        )
     except Exception as error:
         result = {
             'error': error.__class__.__name__,
@@ -11,10 +11,14 @@ curl -X POST http://localhost:8000/graphql/ \
 
 from fastapi import FastAPI
 from starlette_graphene3 import GraphQLApp, make_graphiql_handler
-from schema import schema
+from schema import make_context, schema
 
 app = FastAPI()
 app.mount(
     "/graphql",
-    GraphQLApp(schema=schema, on_get=make_graphiql_handler())
+    GraphQLApp(
+        schema=schema, on_get=make_graphiql_handler(),
+        # A new context, with new loaders, for each request
+        context_value=make_context,
+    )
 )
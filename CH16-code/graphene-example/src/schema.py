@@ -1,12 +1,46 @@
+import os
+
+from inspect import isawaitable
+from pathlib import Path
+
 import graphene
 from graphene import ObjectType, Field, List, \
-    Mutation, UUID as GrapheneUUID, String
+    Mutation, UUID as GrapheneUUID
 from graphene_pydantic import PydanticObjectType, \
     PydanticInputObjectType
-
-from hms.core.business_objects import Artisan, Address
+from graphql import ExecutionResult, execute, validate
+from starlette.background import BackgroundTasks
+
+from hms.core.business_objects import Artisan, Address, \
+    Product, ProductImage
+from hms.core.graphql_queries import QueryDocumentCache, \
+    cost_limit_rule
+from hms.core.loaders import RequestLoaders
 from uuid import UUID
 
+# --- Request Context ---
+
+# The tables that each business object is read from
+DB_SOURCE_NAMES = {
+    Artisan: 'Artisan',
+    Product: 'Products',
+    ProductImage: 'ProductImages',
+}
+
+def make_context(request):
+    """
+    Creates the context for a single GraphQL request, with
+    the loaders that batch and cache the request's lookups,
+    so that, for example, the products of every artisan in
+    a get_artisans result are retrieved with one query.
+    """
+    return {
+        "request": request,
+        "background": BackgroundTasks(),
+        # This example uses the synchronous connector
+        "loaders": RequestLoaders(DB_SOURCE_NAMES, asynchronous=False),
+    }
+
 # --- Graphene Types ---
 
 class AddressInput(PydanticInputObjectType):
@@ -19,21 +53,53 @@ class AddressType(PydanticObjectType):
         model = Address
         exclude_fields = ()
 
+class ProductImageType(PydanticObjectType):
+    class Meta:
+        model = ProductImage
+        exclude_fields = (
+            # Custom handling
+            "image_url",
+        )
+
+    image_url = graphene.String()
+
+    def resolve_image_url(parent, info):
+        return str(parent.image_url)
+
+class ProductType(PydanticObjectType):
+    class Meta:
+        model = Product
+        exclude_fields = (
+            # Loaded by product_oid
+            "product_images",
+        )
+
+    product_images = List(ProductImageType)
+
+    async def resolve_product_images(parent, info):
+        return await info.context["loaders"] \
+            .loader(ProductImage, "product_oid").load(parent.oid)
+
 class ArtisanType(PydanticObjectType):
     class Meta:
         model = Artisan
         exclude_fields = (
             # Custom handling
             "email_address",
-            # Ignoring Product associations for now
+            # Loaded by artisan_oid
             "products"
         )
 
     email_address = graphene.String()
+    products = List(ProductType)
 
     def resolve_email_address(parent, info):
         return str(parent.email_address)
 
+    async def resolve_products(parent, info):
+        return await info.context["loaders"] \
+            .loader(Product, "artisan_oid").load(parent.oid)
+
 class ArtisanInput(PydanticInputObjectType):
     class Meta:
         model = Artisan
@@ -74,6 +140,9 @@ class UpdateArtisanByOid(Mutation):
             raise Exception(f"Artisan with oid {oid} not found")
         updated_artisan = artisan_data.model_copy(update={"oid": oid})
         updated_artisan.save(db_source_name='Artisan')
+        # Later lookups in this request must not get the
+        # cached, pre-update object
+        info.context["loaders"].clear(updated_artisan)
         return updated_artisan
 
 # --- Queries ---
@@ -83,10 +152,10 @@ class Query(ObjectType):
     get_artisan_by_oid = Field(ArtisanType, oid=GrapheneUUID(required=True))
 
     def resolve_get_artisans(root, info):
-        return Artisan.get(db_source_name='Artisan')
+        return Artisan.iter(db_source_name='Artisan')
 
-    def resolve_get_artisan_by_oid(root, info, oid: UUID):
-        return Artisan.get(oid,db_source_name='Artisan')[0] if Artisan.get(oid) else None
+    async def resolve_get_artisan_by_oid(root, info, oid: UUID):
+        return await info.context["loaders"].loader(Artisan).load(oid)
 
 # --- Mutation Root ---
 
@@ -96,4 +165,49 @@ class Mutation(ObjectType):
 
 # --- Final Schema ---
 
-schema = graphene.Schema(query=Query, mutation=Mutation)
+class CachedQuerySchema(graphene.Schema):
+    """
+    A schema that parses and validates each distinct query
+    only once, caching the document by the hash of the query,
+    and that rejects queries that would cost too much to
+    resolve before executing them.
+    """
+
+    def __init__(self, *args, persisted_only=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.query_cache = QueryDocumentCache(
+            self.graphql_schema, persisted_only=persisted_only
+        )
+
+    async def execute_async(
+        self, source, *, variable_values=None, **kwargs
+    ):
+        document, errors = self.query_cache.get_document(source)
+        if not errors:
+            # The cost depends on the variables, so it is
+            # checked for every request
+            errors = validate(
+                self.graphql_schema, document,
+                [cost_limit_rule(variable_values)]
+            )
+        if errors:
+            return ExecutionResult(data=None, errors=errors)
+        result = execute(
+            self.graphql_schema, document,
+            variable_values=variable_values, **kwargs
+        )
+        if isawaitable(result):
+            result = await result
+        return result
+
+# If GRAPHQL_PERSISTED_QUERIES is set to a directory, only the
+# queries in the .graphql files in it are allowed
+PERSISTED_QUERIES = os.getenv("GRAPHQL_PERSISTED_QUERIES")
+
+schema = CachedQuerySchema(
+    query=Query, mutation=Mutation,
+    persisted_only=bool(PERSISTED_QUERIES),
+)
+if PERSISTED_QUERIES:
+    for query_file in sorted(Path(PERSISTED_QUERIES).glob("*.graphql")):
+        schema.query_cache.register(query_file.read_text())
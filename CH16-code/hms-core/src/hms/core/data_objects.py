@@ -8,6 +8,7 @@ from __future__ import annotations
 
 # Built-In Imports
 import abc
+import asyncio
 import itertools
 import json
 import os
@@ -15,10 +16,12 @@ import os
 from datetime import datetime
 from functools import cache
 from random import shuffle
-from typing import Any, ClassVar, Self
+from typing import Any, ClassVar, Iterator, Self
 from uuid import UUID, uuid4
+from weakref import WeakKeyDictionary
 
 # Third-Party Imports
+import aiomysql
 import mysql.connector
 
 from mysql.connector.connection_cext import \
@@ -41,6 +44,10 @@ SQL_OPERATORS = {
     '_in': ' IN %s',
 }
 
+# Async connection pools, one per running event loop,
+# since aiomysql pools cannot be shared between loops
+_ASYNC_DATABASE_POOLS = WeakKeyDictionary()
+
 # Module Custom Exceptions
 
 
@@ -217,6 +224,115 @@ def build_order_by_clause(
     return ''
 
 
+@typechecked
+async def close_env_async_database_pool() -> None:
+    """
+    Closes the async MySQL connection pool created by
+    get_env_async_database_pool for the running event
+    loop, if there is one, waiting for its connections
+    to be released.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _ASYNC_DATABASE_POOLS.pop(loop, None)
+    if pool is not None:
+        pool.close()
+        await pool.wait_closed()
+
+
+@typechecked
+async def get_env_async_database_pool() -> aiomysql.Pool:
+    """
+    Creates, caches and returns an async MySQL connection
+    pool for the running event loop, suitable for making
+    concurrent requests against the database specified in
+    the environment.
+
+    Environment:
+    ------------
+    MYSQL_HOST : str
+        The host name of the MySQL server to
+        connect to.
+    MYSQL_PORT : int
+        The network port of the MySQL server to
+        connect to.
+    MYSQL_USER : str
+        The account name to use to connect to
+        the MySQL server.
+    MYSQL_PASS : str
+        The password to use to connect to the
+        MySQL server.
+    MYSQL_DB : str
+        The name of the database to connect to
+        on the MySQL server.
+    MYSQL_POOL_MIN_SIZE : Optional int
+        The number of connections to open when the
+        pool is created (default 1).
+    MYSQL_POOL_MAX_SIZE : Optional int
+        The maximum number of connections the pool
+        will open, and thus of queries that can be
+        in flight at once (default 10).
+
+    Notes:
+    ------
+    Pools are bound to the event loop they were created
+    in, so one is cached for each running loop.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _ASYNC_DATABASE_POOLS.get(loop)
+    if pool is None:
+        new_pool = await aiomysql.create_pool(
+            host=os.environ['MYSQL_HOST'],
+            port=int(os.environ['MYSQL_PORT']),
+            user=os.environ['MYSQL_USER'],
+            password=os.environ['MYSQL_PASS'],
+            db=os.environ['MYSQL_DB'],
+            minsize=int(
+                os.getenv('MYSQL_POOL_MIN_SIZE', '1')
+            ),
+            maxsize=int(
+                os.getenv('MYSQL_POOL_MAX_SIZE', '10')
+            ),
+            # Reads must not leave a transaction open, or the
+            # pool closes their connections when released;
+            # writes commit explicitly
+            autocommit=True,
+        )
+        # Another task may have created a pool while
+        # this one was being created; keep the first
+        pool = _ASYNC_DATABASE_POOLS.setdefault(
+            loop, new_pool
+        )
+        if pool is not new_pool:
+            new_pool.close()
+            await new_pool.wait_closed()
+    return pool
+
+
+@typechecked
+def connect_env_database() -> CMySQLConnection:
+    """
+    Creates and returns a new, uncached MySQL connector
+    object, supporting cursors, suitable for making
+    requests against the database specified in the
+    environment, using the same environment variables
+    as get_env_database_connector.
+
+    Notes:
+    ------
+    The caller owns the connection returned, and is
+    responsible for closing it. This is intended for
+    long-running work, like streaming a large result-set,
+    that should not tie up the shared connector.
+    """
+    return mysql.connector.connect(
+        host=os.environ['MYSQL_HOST'],
+        port=os.environ['MYSQL_PORT'],
+        user=os.environ['MYSQL_USER'],
+        password=os.environ['MYSQL_PASS'],
+        database=os.environ['MYSQL_DB'],
+    )
+
+
 @cache
 @typechecked
 def get_env_database_connector() -> CMySQLConnection:
@@ -249,14 +365,7 @@ def get_env_database_connector() -> CMySQLConnection:
     development purposes, but will be managed in a
     more secure fashion in production.
     """
-    connector = mysql.connector.connect(
-        host=os.environ['MYSQL_HOST'],
-        port=os.environ['MYSQL_PORT'],
-        user=os.environ['MYSQL_USER'],
-        password=os.environ['MYSQL_PASS'],
-        database=os.environ['MYSQL_DB'],
-    )
-    return connector
+    return connect_env_database()
 
 
 @typechecked
@@ -422,13 +531,14 @@ class BaseDataObject(metaclass=abc.ABCMeta):
     )
 
     @typechecked
-    def save(
-        self, *,
+    def _build_save_sql(
+        self,
         db_source_name: str | None = None
-    ) -> None:
+    ) -> tuple[str, tuple]:
         """
-        Saves the instance's state data to the back end
-        data store.
+        Builds and returns the SQL and parameters needed to
+        save the instance's state data to the back end data
+        store, shared by save and asave.
 
         Parameters:
         -----------
@@ -463,6 +573,26 @@ class BaseDataObject(metaclass=abc.ABCMeta):
             UPDATE_NAMES_VALUES=', '.join(update_names),
         )
         parameters = tuple(field_values + update_values)
+        return final_sql, parameters
+
+    @typechecked
+    def save(
+        self, *,
+        db_source_name: str | None = None
+    ) -> None:
+        """
+        Saves the instance's state data to the back end
+        data store.
+
+        Parameters:
+        -----------
+        db_source_name : Optional str
+            The name of an alternative table to execute
+            the query against during the save.
+        """
+        final_sql, parameters = self._build_save_sql(
+            db_source_name
+        )
 
         # Get the connector, create a cursor, execute the
         # query (with parameters if any are supplied)
@@ -474,6 +604,37 @@ class BaseDataObject(metaclass=abc.ABCMeta):
                 cursor.execute(final_sql)
             connector.commit()
 
+    @typechecked
+    async def asave(
+        self, *,
+        db_source_name: str | None = None
+    ) -> None:
+        """
+        Saves the instance's state data to the back end
+        data store, without blocking the running event
+        loop while the query executes.
+
+        Parameters:
+        -----------
+        db_source_name : Optional str
+            The name of an alternative table to execute
+            the query against during the save.
+        """
+        final_sql, parameters = self._build_save_sql(
+            db_source_name
+        )
+
+        # Get a pooled connection, create a cursor, execute
+        # the query (with parameters if any are supplied)
+        pool = await get_env_async_database_pool()
+        async with pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                if parameters:
+                    await cursor.execute(final_sql, parameters)
+                else:
+                    await cursor.execute(final_sql)
+            await connection.commit()
+
     @classmethod
     @typechecked
     def from_record(
@@ -500,66 +661,35 @@ class BaseDataObject(metaclass=abc.ABCMeta):
 
     @classmethod
     @typechecked
-    def get(
+    def _build_get_sql(
         cls,
-        *oids: UUID | str,
-        db_source_name: str | None = None,
-        page_size: int | None = None,
-        page_number: int | None = None,
-        **criteria: Any
-    ) -> list[Self]:
+        oids: tuple[UUID | str, ...],
+        db_source_name: str | None,
+        page_size: int | None,
+        page_number: int | None,
+        criteria: dict[str, Any]
+    ) -> tuple[str, tuple]:
         """
-        Queries the database for a collection of <cls>
-        business objects, returning a list of those that
-        were retrieved.
+        Builds and returns the SQL and parameters needed to
+        query the database for a collection of <cls>
+        business objects, shared by get and aget.
 
         Parameters:
         -----------
-        oids : UUID | str
+        oids : tuple of UUID | str
             The unique object identifiers of the objects
-            to retrieve and return.
+            to retrieve.
         db_source_name : optional str
             The name of the table or view to execute the
-            query against to retrieve the records for the
-            objects to be created.
+            query against.
         page_size : optional int
-            The number of records to query, and thus
-            objects to return, as a "page" of results.
+            The number of records to query as a "page" of
+            results.
         page_number : optional int
             The number of the "page" of records to return.
-        criteria : any
+        criteria : dict
             The names and values to be used to generate
-            the query, or (less ideally) to be used to
-            filter results in code.
-            May also be passed names to indicate a sort-
-            order, of the form "sort_{field}"
-            May also be passed names to indicate criteria
-            and operations against any of the fields in
-            the class' CRITERIA_FIELDS attribute, suffixed
-            with any of the following operations:
-            - _eq to use an equality comparison.
-              Note that this suffix is optional; a field
-              name with an "=" is equivalent to the
-              _eq-suffixed name.
-              For example:
-                name='Dough'
-              is equivalent to
-                name_eq='Dough'
-            - _neq  to use an inequality (!=) comparison.
-            - _gt to use a greater-than (>) comparison.
-            - _gte to use a greater-than-or-equal-to (>=)
-              comparison.
-            - _lt to use a less-than (>) comparison.
-            - _lte to use a less-than-or-equal-to (<=)
-              comparison.
-            - _like to use a LIKE (LIKE '%some value%')
-              evaluation.
-            - _in to use a "membership" comparison with a
-              list or tuple of specific values to match.
-              For example:
-                name_in=('John', 'Jane')
-              or
-                name_in=['John', 'Jane']
+            the query, as described in get.
 
         Raises:
         -------
@@ -567,8 +697,10 @@ class BaseDataObject(metaclass=abc.ABCMeta):
             If any oids value is not a UUID, or a string
             representation of one.
         """
-        # Build the WHERE clause from **criteria,
-        # including any oids values specified
+        # Build the WHERE clause from criteria, including
+        # any oids values specified, without changing the
+        # caller's criteria
+        criteria = dict(criteria)
         if oids:
             try:
                 if len(oids) == 1:
@@ -594,7 +726,7 @@ class BaseDataObject(metaclass=abc.ABCMeta):
             criteria, cls.CRITERIA_FIELDS
         )
 
-        # Build the ORDER BY clause from **criteria
+        # Build the ORDER BY clause from criteria
         order_by = build_order_by_clause(
             criteria, cls.CRITERIA_FIELDS
         )
@@ -622,11 +754,85 @@ class BaseDataObject(metaclass=abc.ABCMeta):
             WHERE=where, ORDER_BY=order_by,
             LIMIT=limit
         )
+        return final_sql.strip(), parameters
+
+    @classmethod
+    @typechecked
+    def get(
+        cls,
+        *oids: UUID | str,
+        db_source_name: str | None = None,
+        page_size: int | None = None,
+        page_number: int | None = None,
+        **criteria: Any
+    ) -> list[Self]:
+        """
+        Queries the database for a collection of <cls>
+        business objects, returning a list of those that
+        were retrieved.
+
+        Parameters:
+        -----------
+        oids : UUID | str
+            The unique object identifiers of the objects
+            to retrieve and return.
+        db_source_name : optional str
+            The name of the table or view to execute the
+            query against to retrieve the records for the
+            objects to be created.
+        page_size : optional int
+            The number of records to query, and thus
+            objects to return, as a "page" of results.
+        page_number : optional int
+            The number of the "page" of records to return.
+        criteria : any
+            The names and values to be used to generate
+            the query, or (less ideally) to be used to
+            filter results in code.
+            May also be passed names to indicate a sort-
+            order, of the form "sort_{field}"
+            May also be passed names to indicate criteria
+            and operations against any of the fields in
+            the class' CRITERIA_FIELDS attribute, suffixed
+            with any of the following operations:
+            - _eq to use an equality comparison.
+              Note that this suffix is optional; a field
+              name with an "=" is equivalent to the
+              _eq-suffixed name.
+              For example:
+                name='Dough'
+              is equivalent to
+                name_eq='Dough'
+            - _neq  to use an inequality (!=) comparison.
+            - _gt to use a greater-than (>) comparison.
+            - _gte to use a greater-than-or-equal-to (>=)
+              comparison.
+            - _lt to use a less-than (>) comparison.
+            - _lte to use a less-than-or-equal-to (<=)
+              comparison.
+            - _like to use a LIKE (LIKE '%some value%')
+              evaluation.
+            - _in to use a "membership" comparison with a
+              list or tuple of specific values to match.
+              For example:
+                name_in=('John', 'Jane')
+              or
+                name_in=['John', 'Jane']
+
+        Raises:
+        -------
+        ValueError:
+            If any oids value is not a UUID, or a string
+            representation of one.
+        """
+        final_sql, parameters = cls._build_get_sql(
+            oids, db_source_name, page_size, page_number,
+            criteria
+        )
 
         # Get a connector, create a cursor, execute the
         # query (with parameters if any are supplied)
         connector = get_env_database_connector()
-        final_sql = final_sql.strip()
         with connector.cursor(dictionary=True) as cursor:
             if parameters:
                 cursor.execute(final_sql, parameters)
@@ -645,35 +851,190 @@ class BaseDataObject(metaclass=abc.ABCMeta):
 
     @classmethod
     @typechecked
-    def delete(
+    async def aget(
         cls,
         *oids: UUID | str,
         db_source_name: str | None = None,
-    ) -> None:
+        page_size: int | None = None,
+        page_number: int | None = None,
+        **criteria: Any
+    ) -> list[Self]:
         """
-        Deletes records in the database specified by
-        one or more oid values.
+        Queries the database for a collection of <cls>
+        business objects, returning a list of those that
+        were retrieved, without blocking the running event
+        loop while the query executes.
+
+        Parameters:
+        -----------
+        The same as get, which describes the criteria
+        that are supported in detail.
+
+        Raises:
+        -------
+        ValueError:
+            If any oids value is not a UUID, or a string
+            representation of one.
+        """
+        final_sql, parameters = cls._build_get_sql(
+            oids, db_source_name, page_size, page_number,
+            criteria
+        )
+
+        # Get a pooled connection, create a cursor, execute
+        # the query (with parameters if any are supplied)
+        pool = await get_env_async_database_pool()
+        async with pool.acquire() as connection:
+            async with connection.cursor(
+                aiomysql.DictCursor
+            ) as cursor:
+                if parameters:
+                    await cursor.execute(final_sql, parameters)
+                else:
+                    await cursor.execute(final_sql)
+                rows = await cursor.fetchall()
+
+        return [
+            cls.from_record(json.loads(row['object_state']))
+            for row in rows
+        ]
+
+    @classmethod
+    @typechecked
+    def iter(
+        cls,
+        *oids: UUID | str,
+        db_source_name: str | None = None,
+        chunk_size: int = 1000,
+        **criteria: Any
+    ) -> Iterator[Self]:
+        """
+        Queries the database for a collection of <cls>
+        business objects, returning an iterator that
+        creates and yields them lazily, as their records
+        are read from the database, rather than holding
+        them all in memory like get does.
 
         Parameters:
         -----------
         oids : UUID | str
+            The unique object identifiers of the objects
+            to retrieve and yield.
+        db_source_name : optional str
+            The name of the table or view to execute the
+            query against to retrieve the records for the
+            objects to be created.
+        chunk_size : int
+            The number of records to read from the
+            database at a time (default 1000).
+        criteria : any
+            The names and values to be used to generate
+            the query, as described in get.
+
+        Raises:
+        -------
+        ValueError:
+            If any oids value is not a UUID, or a string
+            representation of one, or if the chunk_size is
+            less than one.
+
+        Notes:
+        ------
+        The query is executed on a dedicated, unbuffered
+        connection the first time the iterator is advanced,
+        so records are streamed from the server as they are
+        consumed, and the shared connector remains free for
+        other queries. The connection is closed when the
+        iterator is exhausted, closed, or garbage-collected.
+        """
+        if chunk_size < 1:
+            raise ValueError(
+                f'{cls.__name__}.iter expects a chunk_size '
+                f'of 1 or more, but was passed {chunk_size}'
+            )
+        final_sql, parameters = cls._build_get_sql(
+            oids, db_source_name, None, None, criteria
+        )
+        return cls._iter_records(
+            final_sql, parameters, chunk_size
+        )
+
+    @classmethod
+    @typechecked
+    def _iter_records(
+        cls,
+        final_sql: str,
+        parameters: tuple,
+        chunk_size: int,
+    ) -> Iterator[Self]:
+        """
+        Executes the query provided on a dedicated,
+        unbuffered connection, yielding <cls> objects
+        created from the records returned, reading them
+        from the server chunk_size records at a time.
+
+        Parameters:
+        -----------
+        final_sql : str
+            The SQL to execute.
+        parameters : tuple
+            The parameters for the SQL, if any.
+        chunk_size : int
+            The number of records to read at a time.
+        """
+        connector = connect_env_database()
+        try:
+            cursor = connector.cursor(
+                dictionary=True, buffered=False
+            )
+            if parameters:
+                cursor.execute(final_sql, parameters)
+            else:
+                cursor.execute(final_sql)
+            while rows := cursor.fetchmany(chunk_size):
+                for row in rows:
+                    yield cls.from_record(
+                        json.loads(row['object_state'])
+                    )
+        finally:
+            # Closing the connection also discards any
+            # records that were not read
+            connector.close()
+
+    @classmethod
+    @typechecked
+    def _build_delete_sql(
+        cls,
+        oids: tuple[UUID | str, ...],
+        db_source_name: str | None = None,
+    ) -> tuple[str, tuple]:
+        """
+        Builds and returns the SQL and parameters needed to
+        delete records in the database specified by one or
+        more oid values, shared by delete and adelete.
+
+        Parameters:
+        -----------
+        oids : tuple of UUID | str
             The unique object identifiers of the object
             records to delete.
+        db_source_name : optional str
+            The name of an alternative table to execute
+            the query against.
         """
         assert len(oids), \
             f'{cls.__name__}.delete must be ' \
             'provided specific oids to delete.'
         # Build the WHERE clause from **criteria,
         # including any oids values specified
-        if oids:
-            if len(oids) == 1:
-                # Single oid
-                criteria = {'oid': str(oids[0])}
-            else:
-                # Multiple oids
-                criteria = {
-                    'oid_in': [str(o) for o in oids]
-                }
+        if len(oids) == 1:
+            # Single oid
+            criteria = {'oid': str(oids[0])}
+        else:
+            # Multiple oids
+            criteria = {
+                'oid_in': [str(o) for o in oids]
+            }
         where, parameters = build_where_clause(
             criteria, cls.CRITERIA_FIELDS
         )
@@ -681,6 +1042,28 @@ class BaseDataObject(metaclass=abc.ABCMeta):
             TABLE_NAME=db_source_name or cls.TABLE_NAME,
             WHERE=where
         )
+        return final_sql, parameters
+
+    @classmethod
+    @typechecked
+    def delete(
+        cls,
+        *oids: UUID | str,
+        db_source_name: str | None = None,
+    ) -> None:
+        """
+        Deletes records in the database specified by
+        one or more oid values.
+
+        Parameters:
+        -----------
+        oids : UUID | str
+            The unique object identifiers of the object
+            records to delete.
+        """
+        final_sql, parameters = cls._build_delete_sql(
+            oids, db_source_name
+        )
         # Get the connector, create a cursor, execute the
         # query (with parameters if any are supplied)
         connector = get_env_database_connector()
@@ -691,6 +1074,38 @@ class BaseDataObject(metaclass=abc.ABCMeta):
                 cursor.execute(final_sql)
         connector.commit()
 
+    @classmethod
+    @typechecked
+    async def adelete(
+        cls,
+        *oids: UUID | str,
+        db_source_name: str | None = None,
+    ) -> None:
+        """
+        Deletes records in the database specified by
+        one or more oid values, without blocking the
+        running event loop while the query executes.
+
+        Parameters:
+        -----------
+        oids : UUID | str
+            The unique object identifiers of the object
+            records to delete.
+        """
+        final_sql, parameters = cls._build_delete_sql(
+            oids, db_source_name
+        )
+        # Get a pooled connection, create a cursor, execute
+        # the query (with parameters if any are supplied)
+        pool = await get_env_async_database_pool()
+        async with pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                if parameters:
+                    await cursor.execute(final_sql, parameters)
+                else:
+                    await cursor.execute(final_sql)
+            await connection.commit()
+
 
 # Module Concrete Classes
 
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3.11
+"""
+Provides protection and caching for the GraphQL APIs: a cache
+of parsed and validated query documents, keyed by a hash of
+their text, that can also be restricted to a set of persisted
+queries, and a validation rule that rejects queries whose
+estimated depth or breadth exceed a budget, before any of
+their resolvers (and the database queries they make) run.
+"""
+from __future__ import annotations
+
+# Built-In Imports
+import hashlib
+
+from collections import OrderedDict
+from typing import Any
+
+# Third-Party Imports
+from graphql import DocumentNode, FieldNode, \
+    FragmentDefinitionNode, FragmentSpreadNode, \
+    GraphQLError, GraphQLList, GraphQLNonNull, GraphQLSchema, \
+    IntValueNode, OperationDefinitionNode, SelectionSetNode, \
+    ValidationRule, VariableNode, \
+    get_named_type, parse, validate
+from typeguard import typechecked
+
+# Path Manipulations (avoid these!) and "Local" Imports
+
+# Module "Constants" and Other Attributes
+
+# The most parsed and validated documents to keep in a cache,
+# besides the persisted queries that are always kept
+DEFAULT_CACHE_SIZE = 1000
+
+# The budget that queries are checked against by default: the
+# deepest nesting of object fields, and the estimated number of
+# objects that a query resolves
+MAX_QUERY_DEPTH = 8
+MAX_QUERY_BREADTH = 2000
+
+# The number of items that a list field is assumed to return
+# when the query does not limit it with one of the arguments
+# in LIST_SIZE_ARGUMENTS
+DEFAULT_LIST_SIZE = 10
+LIST_SIZE_ARGUMENTS = ('first', 'last', 'limit', 'page_size', 'pageSize')
+
+# Module Custom Exceptions
+
+
+# Module Functions
+@typechecked
+def analyze_query_cost(
+    schema: GraphQLSchema,
+    document: DocumentNode,
+    variables: dict[str, Any] | None = None,
+    list_size: int = DEFAULT_LIST_SIZE,
+) -> dict[str | None, dict[str, int]]:
+    """
+    Estimates the cost of each operation in a query document,
+    returning the depth (the deepest nesting of object fields)
+    and breadth (the estimated number of objects resolved, with
+    each list field multiplying the objects below it) of each,
+    by operation name. Introspection fields are not counted.
+
+    Parameters:
+    -----------
+    schema : GraphQLSchema
+        The schema that the document is executed against.
+    document : DocumentNode
+        The parsed (and valid) query document.
+    variables : optional dict
+        The variable values that the query is executed with,
+        which are used for list-size arguments.
+    list_size : int
+        The number of items that a list field is assumed to
+        return, if its size is not limited by an argument.
+    """
+    variables = variables or {}
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+
+    def get_list_size(field: FieldNode) -> int:
+        # The value of the field's first list-size argument
+        # that has an integer value, or the default list_size
+        for argument in field.arguments or ():
+            if argument.name.value not in LIST_SIZE_ARGUMENTS:
+                continue
+            value = argument.value
+            if isinstance(value, IntValueNode):
+                return int(value.value)
+            if isinstance(value, VariableNode):
+                value = variables.get(value.name.value)
+                if isinstance(value, int) \
+                        and not isinstance(value, bool):
+                    return value
+        return list_size
+
+    def get_selection_cost(
+        parent_type: Any,
+        selection_set: SelectionSetNode,
+        count: int,
+        spreads: frozenset[str],
+    ) -> tuple[int, int]:
+        # The depth and breadth of the selections made from
+        # count parent_type objects, without expanding any of
+        # the fragments being expanded again inside themselves
+        depth = breadth = 0
+        # Unions have no fields, only fragments
+        fields = getattr(parent_type, 'fields', {})
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                field = fields.get(selection.name.value)
+                if selection.name.value.startswith('__') \
+                        or field is None \
+                        or not selection.selection_set:
+                    # Introspection, unknown (which validation
+                    # reports) and scalar fields add nothing
+                    continue
+                field_type = field.type
+                if isinstance(field_type, GraphQLNonNull):
+                    field_type = field_type.of_type
+                objects = count * (
+                    get_list_size(selection)
+                    if isinstance(field_type, GraphQLList) else 1
+                )
+                child_depth, child_breadth = get_selection_cost(
+                    get_named_type(field_type),
+                    selection.selection_set, objects, spreads
+                )
+                depth = max(depth, child_depth + 1)
+                breadth += objects + child_breadth
+                continue
+            if isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = fragments.get(name)
+                if fragment is None or name in spreads:
+                    continue
+                fragment_spreads = spreads | {name}
+            else:
+                fragment, fragment_spreads = selection, spreads
+            # Fragments select from their type condition, or
+            # from the parent type if an inline fragment has none
+            type_condition = fragment.type_condition
+            fragment_type = parent_type if type_condition is None \
+                else schema.get_type(type_condition.name.value)
+            if fragment_type is None:
+                continue
+            fragment_depth, fragment_breadth = get_selection_cost(
+                fragment_type, fragment.selection_set, count,
+                fragment_spreads
+            )
+            depth = max(depth, fragment_depth)
+            breadth += fragment_breadth
+        return depth, breadth
+
+    costs = {}
+    for definition in document.definitions:
+        if not isinstance(definition, OperationDefinitionNode):
+            continue
+        depth, breadth = get_selection_cost(
+            schema.get_root_type(definition.operation),
+            definition.selection_set, 1, frozenset()
+        )
+        name = definition.name.value if definition.name else None
+        costs[name] = {'depth': depth, 'breadth': breadth}
+    return costs
+
+
+@typechecked
+def cost_limit_rule(
+    variables: dict[str, Any] | None = None,
+    *,
+    max_depth: int = MAX_QUERY_DEPTH,
+    max_breadth: int = MAX_QUERY_BREADTH,
+    list_size: int = DEFAULT_LIST_SIZE,
+) -> type[ValidationRule]:
+    """
+    Creates and returns a validation rule that reports an error
+    for each operation in a query whose estimated depth or
+    breadth (see analyze_query_cost) exceeds a budget. Since
+    the estimate depends on the variables that a query is
+    executed with, a new rule is created for each request, and
+    it is not cached with the document's other validation
+    results.
+
+    Parameters:
+    -----------
+    variables : optional dict
+        The variable values that the query is executed with.
+    max_depth : int
+        The deepest nesting of object fields allowed.
+    max_breadth : int
+        The most objects that a query is allowed to resolve.
+    list_size : int
+        The number of items that a list field is assumed to
+        return, if its size is not limited by an argument.
+    """
+
+    class CostLimitRule(ValidationRule):
+
+        def enter_document(self, node, *args):
+            costs = analyze_query_cost(
+                self.context.schema, node, variables, list_size
+            )
+            operations = {
+                definition.name.value if definition.name else None:
+                definition
+                for definition in node.definitions
+                if isinstance(definition, OperationDefinitionNode)
+            }
+            for name, cost in costs.items():
+                label = f'Operation {name}' if name else 'The query'
+                if cost['depth'] > max_depth:
+                    self.report_error(
+                        GraphQLError(
+                            f'{label} has a depth of {cost["depth"]}, '
+                            f'more than the maximum of {max_depth}.',
+                            operations[name]
+                        )
+                    )
+                if cost['breadth'] > max_breadth:
+                    self.report_error(
+                        GraphQLError(
+                            f'{label} is estimated to resolve '
+                            f'{cost["breadth"]} objects, more than '
+                            f'the maximum of {max_breadth}.',
+                            operations[name]
+                        )
+                    )
+
+    return CostLimitRule
+
+
+@typechecked
+def get_query_hash(query: str) -> str:
+    """
+    Returns the SHA-256 hash (as hex) of the text of a query,
+    which is also how persisted queries are identified by
+    clients that use Apollo's automatic persisted queries.
+
+    Parameters:
+    -----------
+    query : str
+        The text of the query.
+    """
+    return hashlib.sha256(query.encode('utf-8')).hexdigest()
+
+
+# Module Metaclasses
+
+# Module Abstract Base Classes
+
+
+# Module Concrete Classes
+class QueryDocumentCache:
+    """
+    Caches the documents of queries after they have been parsed and validated against a schema, keyed by the hash of their text, so that a query that is executed repeatedly is only parsed and validated once. The validation errors of invalid queries are cached as well. Queries can be registered as persisted queries, which are never evicted from the cache, and if the cache is persisted_only, any other query is rejected without being parsed.
+    """  # noqa: E501
+
+    @typechecked
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        *,
+        max_size: int = DEFAULT_CACHE_SIZE,
+        persisted_only: bool = False,
+    ) -> None:
+        """
+        Parameters:
+        -----------
+        schema : GraphQLSchema
+            The schema to validate documents against.
+        max_size : int
+            The most documents to cache, besides persisted
+            queries; the least recently used are evicted first.
+        persisted_only : bool
+            Whether to reject every query that has not been
+            registered.
+        """
+        self.schema = schema
+        self.max_size = max_size
+        self.persisted_only = persisted_only
+        self._persisted = {}
+        self._cached = OrderedDict()
+
+    def _parse_and_validate(
+        self, query: str
+    ) -> tuple[DocumentNode | None, list[GraphQLError]]:
+        """
+        Parses a query and validates it against the schema,
+        returning the document, or None if the query could not
+        be parsed, and a list of any errors.
+
+        Parameters:
+        -----------
+        query : str
+            The text of the query.
+        """
+        try:
+            document = parse(query)
+        except GraphQLError as error:
+            return None, [error]
+        return document, validate(self.schema, document)
+
+    @typechecked
+    def get_document(
+        self, query: str
+    ) -> tuple[DocumentNode | None, list[GraphQLError]]:
+        """
+        Returns the document of a query, or None if the query
+        could not be parsed, and a list of the errors found in
+        it, parsing and validating it only if it has not been
+        cached.
+
+        Parameters:
+        -----------
+        query : str
+            The text of the query.
+        """
+        query_hash = get_query_hash(query)
+        entry = self._persisted.get(query_hash)
+        if entry is not None:
+            return entry
+        if self.persisted_only:
+            return None, [
+                GraphQLError(
+                    f'The query (hash {query_hash}) is not a '
+                    'persisted query.'
+                )
+            ]
+        entry = self._cached.get(query_hash)
+        if entry is not None:
+            self._cached.move_to_end(query_hash)
+            return entry
+        entry = self._parse_and_validate(query)
+        self._cached[query_hash] = entry
+        if len(self._cached) > self.max_size:
+            self._cached.popitem(last=False)
+        return entry
+
+    @typechecked
+    def register(self, query: str) -> str:
+        """
+        Registers a query as a persisted query, returning its
+        hash.
+
+        Parameters:
+        -----------
+        query : str
+            The text of the query.
+
+        Raises:
+        -------
+        GraphQLError:
+            If the query could not be parsed, or is not valid.
+        """
+        document, errors = self._parse_and_validate(query)
+        if errors:
+            raise errors[0]
+        query_hash = get_query_hash(query)
+        self._persisted[query_hash] = (document, errors)
+        self._cached.pop(query_hash, None)
+        return query_hash
+
+
+# Code to run if the module is executed directly
+if __name__ == '__main__':
+
+    pass
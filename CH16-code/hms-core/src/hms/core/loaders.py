@@ -0,0 +1,430 @@
+#!/usr/bin/env python3.11
+"""
+Provides request-scoped loaders that batch and cache the
+retrieval of business objects, so that the resolvers of a
+GraphQL request can each ask for the objects they need,
+while all of the lookups made at the same time are made
+with a single query.
+"""
+from __future__ import annotations
+
+# Built-In Imports
+import asyncio
+
+from typing import Any, Iterable
+from uuid import UUID
+
+# Third-Party Imports
+from typeguard import typechecked
+
+# Path Manipulations (avoid these!) and "Local" Imports
+from hms.core.data_objects import BaseDataObject
+
+# Module "Constants" and Other Attributes
+
+# The most keys that a loader will look up with a single
+# query; larger batches are split into several queries
+MAX_BATCH_SIZE = 500
+
+# Module Custom Exceptions
+
+
+# Module Functions
+@typechecked
+def normalize_key(key: UUID | str) -> str:
+    """
+    Returns the string representation of a UUID key, so that
+    a UUID and any string representation of the same UUID
+    are cached and looked up as the same key.
+
+    Parameters:
+    -----------
+    key : UUID | str
+        The key to normalize.
+
+    Raises:
+    -------
+    ValueError:
+        If the key is not a UUID, or a string representation
+        of one.
+    """
+    try:
+        return str(key if isinstance(key, UUID) else UUID(key))
+    except ValueError as error:
+        raise ValueError(
+            f'{key!r} could not be converted to a UUID'
+        ) from error
+
+
+# Module Metaclasses
+
+# Module Abstract Base Classes
+
+
+# Module Concrete Classes
+class ObjectLoader:
+    """
+    Loads business objects of a single class by a key field, batching every key that is asked for before the event loop gets around to running the loader into a single get or aget call, and caching the result of each key for the life of the loader. A loader keyed on oid resolves each key to an object (or None); a loader keyed on a foreign key (artisan_oid, product_oid) resolves each key to a list of objects. A loader is meant to be created for each request, and discarded with it, so that nothing is cached between requests.
+    """  # noqa: E501
+
+    @typechecked
+    def __init__(
+        self,
+        data_class: type[BaseDataObject],
+        *,
+        key_field: str = 'oid',
+        db_source_name: str | None = None,
+        asynchronous: bool = True,
+        max_batch_size: int = MAX_BATCH_SIZE,
+    ) -> None:
+        """
+        Parameters:
+        -----------
+        data_class : type[BaseDataObject]
+            The class of the objects to load.
+        key_field : str
+            The name of the field to load objects by, which
+            must be "oid" or one of the data_class'
+            CRITERIA_FIELDS.
+        db_source_name : optional str
+            The name of the table or view to query.
+        asynchronous : bool
+            Whether to query with the data_class' aget method
+            (the default), or its synchronous get method, for
+            applications that use the synchronous connector.
+        max_batch_size : int
+            The most keys to look up with a single query.
+
+        Raises:
+        -------
+        ValueError:
+            If the key_field is not a criteria field of the
+            data_class, or the max_batch_size is less than one.
+        """
+        if key_field not in data_class.CRITERIA_FIELDS:
+            raise ValueError(
+                f'{self.__class__.__name__} cannot load '
+                f'{data_class.__name__} objects by {key_field}, '
+                'which is not one of its CRITERIA_FIELDS'
+            )
+        if max_batch_size < 1:
+            raise ValueError(
+                f'{self.__class__.__name__} expects a '
+                'max_batch_size of 1 or more, but was passed '
+                f'{max_batch_size}'
+            )
+        self.data_class = data_class
+        self.key_field = key_field
+        self.db_source_name = db_source_name
+        self.asynchronous = asynchronous
+        self.max_batch_size = max_batch_size
+        # The futures for every key that has been asked for,
+        # which are also the loader's cache
+        self._futures = {}
+        # The futures of the keys waiting to be looked up by
+        # the next batch
+        self._pending = {}
+
+    @property
+    def many(self) -> bool:
+        """
+        Whether each key resolves to a list of objects, which
+        is the case for any key_field but oid.
+        """
+        return self.key_field != 'oid'
+
+    def _dispatch(self) -> None:
+        """
+        Looks up the pending keys, in batches of no more than
+        max_batch_size keys.
+        """
+        pending, self._pending = list(self._pending.items()), {}
+        for start in range(0, len(pending), self.max_batch_size):
+            batch = dict(pending[start:start + self.max_batch_size])
+            if self.asynchronous:
+                asyncio.get_running_loop().create_task(
+                    self._aload_batch(batch)
+                )
+            else:
+                try:
+                    results = self._get_batch(list(batch))
+                except Exception as error:
+                    self._fail_batch(batch, error)
+                else:
+                    self._resolve_batch(batch, results)
+
+    def _get_batch(self, keys: list[str]) -> list[BaseDataObject]:
+        """
+        Retrieves the objects for a batch of keys with a
+        single get call.
+
+        Parameters:
+        -----------
+        keys : list[str]
+            The normalized keys to retrieve objects for.
+        """
+        if self.many:
+            return self.data_class.get(
+                db_source_name=self.db_source_name,
+                **{f'{self.key_field}_in': keys}
+            )
+        return self.data_class.get(
+            *keys, db_source_name=self.db_source_name
+        )
+
+    async def _aget_batch(self, keys: list[str]) -> list[BaseDataObject]:
+        """
+        Retrieves the objects for a batch of keys with a
+        single aget call.
+
+        Parameters:
+        -----------
+        keys : list[str]
+            The normalized keys to retrieve objects for.
+        """
+        if self.many:
+            return await self.data_class.aget(
+                db_source_name=self.db_source_name,
+                **{f'{self.key_field}_in': keys}
+            )
+        return await self.data_class.aget(
+            *keys, db_source_name=self.db_source_name
+        )
+
+    async def _aload_batch(self, batch: dict[str, asyncio.Future]) -> None:
+        """
+        Retrieves the objects for a batch of keys with a
+        single aget call, and resolves their futures.
+
+        Parameters:
+        -----------
+        batch : dict[str, Future]
+            The futures of the batch, by normalized key.
+        """
+        try:
+            results = await self._aget_batch(list(batch))
+        except Exception as error:
+            self._fail_batch(batch, error)
+        else:
+            self._resolve_batch(batch, results)
+
+    def _fail_batch(
+        self, batch: dict[str, asyncio.Future], error: Exception
+    ) -> None:
+        """
+        Sets an error as the result of the futures of a batch,
+        and removes them from the cache, so that their keys
+        are retrieved again the next time they are loaded.
+
+        Parameters:
+        -----------
+        batch : dict[str, Future]
+            The futures of the batch that failed, by
+            normalized key.
+        error : Exception
+            The error that was raised.
+        """
+        for key, future in batch.items():
+            if self._futures.get(key) is future:
+                del self._futures[key]
+            if not future.done():
+                future.set_exception(error)
+
+    def _resolve_batch(
+        self,
+        batch: dict[str, asyncio.Future],
+        results: list[BaseDataObject]
+    ) -> None:
+        """
+        Resolves the futures of a batch from the objects
+        retrieved for their keys.
+
+        Parameters:
+        -----------
+        batch : dict[str, Future]
+            The futures of the batch, by normalized key.
+        results : list[BaseDataObject]
+            The objects retrieved for the batch.
+        """
+        if self.many:
+            values = {key: [] for key in batch}
+            for result in results:
+                values.setdefault(
+                    str(getattr(result, self.key_field)), []
+                ).append(result)
+        else:
+            values = {str(result.oid): result for result in results}
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(values.get(key))
+
+    @typechecked
+    def clear(self, *keys: UUID | str) -> None:
+        """
+        Removes keys from the loader's cache, so that they
+        are retrieved again the next time they are loaded, or
+        every key if none are specified. A loader keyed on oid
+        should be cleared of the oids of any objects that a
+        request changes.
+
+        Parameters:
+        -----------
+        keys : UUID | str
+            The keys to remove.
+        """
+        if not keys:
+            self._futures.clear()
+        for key in keys:
+            self._futures.pop(normalize_key(key), None)
+
+    @typechecked
+    async def load(self, key: UUID | str) -> Any:
+        """
+        Returns the object for a key (or None if there is no
+        such object), or the list of objects for it if the
+        loader's key_field is not oid.
+
+        Parameters:
+        -----------
+        key : UUID | str
+            The key to load the object(s) for.
+
+        Raises:
+        -------
+        ValueError:
+            If the key is not a UUID, or a string
+            representation of one.
+        """
+        key = normalize_key(key)
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            if not self._pending:
+                # Wait until every resolver that is ready to
+                # run has had the chance to ask for its keys
+                loop.call_soon(self._dispatch)
+            self._futures[key] = self._pending[key] = future
+        return await future
+
+    @typechecked
+    async def load_many(self, keys: Iterable[UUID | str]) -> list:
+        """
+        Returns the results of loading each of a number of
+        keys, in the same order as the keys.
+
+        Parameters:
+        -----------
+        keys : Iterable[UUID | str]
+            The keys to load the object(s) for.
+        """
+        return list(
+            await asyncio.gather(*(self.load(key) for key in keys))
+        )
+
+    @typechecked
+    def prime(self, obj: BaseDataObject) -> None:
+        """
+        Caches an object that has already been retrieved (or
+        was just saved) by its oid, so that loading it does
+        not query the database again. Only loaders keyed on
+        oid can be primed.
+
+        Parameters:
+        -----------
+        obj : BaseDataObject
+            The object to cache.
+
+        Raises:
+        -------
+        TypeError:
+            If the loader is not keyed on oid.
+        """
+        if self.many:
+            raise TypeError(
+                f'{self.__class__.__name__} objects keyed on '
+                f'{self.key_field} cannot be primed'
+            )
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(obj)
+        self._futures[str(obj.oid)] = future
+
+
+class RequestLoaders:
+    """
+    Provides the loaders for a single request, creating each one the first time it is asked for, so that every resolver in the request that loads the same class by the same key field shares a single loader, and the batching and caching that it provides. An instance should be created for each request, typically as (or in) the GraphQL context value.
+    """  # noqa: E501
+
+    @typechecked
+    def __init__(
+        self,
+        db_source_names: dict[type[BaseDataObject], str] | None = None,
+        *,
+        asynchronous: bool = True,
+        max_batch_size: int = MAX_BATCH_SIZE,
+    ) -> None:
+        """
+        Parameters:
+        -----------
+        db_source_names : optional dict
+            The name of the table or view to query for each
+            data class that does not use its TABLE_NAME.
+        asynchronous : bool
+            Whether the loaders query with aget (the default)
+            or get.
+        max_batch_size : int
+            The most keys each loader looks up with a single
+            query.
+        """
+        self.db_source_names = dict(db_source_names or {})
+        self.asynchronous = asynchronous
+        self.max_batch_size = max_batch_size
+        self._loaders = {}
+
+    @typechecked
+    def clear(self, obj: BaseDataObject) -> None:
+        """
+        Removes an object from the cache of the loaders that
+        load its class by oid, after it has been changed.
+
+        Parameters:
+        -----------
+        obj : BaseDataObject
+            The object that was changed.
+        """
+        loader = self._loaders.get((type(obj), 'oid'))
+        if loader is not None:
+            loader.clear(obj.oid)
+
+    @typechecked
+    def loader(
+        self, data_class: type[BaseDataObject], key_field: str = 'oid'
+    ) -> ObjectLoader:
+        """
+        Returns the request's loader for a data class and key
+        field, creating it if it has not been created yet.
+
+        Parameters:
+        -----------
+        data_class : type[BaseDataObject]
+            The class of the objects to load.
+        key_field : str
+            The name of the field to load objects by.
+        """
+        loader = self._loaders.get((data_class, key_field))
+        if loader is None:
+            loader = ObjectLoader(
+                data_class,
+                key_field=key_field,
+                db_source_name=self.db_source_names.get(data_class),
+                asynchronous=self.asynchronous,
+                max_batch_size=self.max_batch_size,
+            )
+            self._loaders[(data_class, key_field)] = loader
+        return loader
+
+
+# Code to run if the module is executed directly
+if __name__ == '__main__':
+
+    pass
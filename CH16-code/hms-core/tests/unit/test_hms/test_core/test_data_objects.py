@@ -3,16 +3,19 @@
 """
 
 # Built-In Imports
+import asyncio
 import json
 import os
 import unittest
 
 from datetime import datetime
 from typing import ClassVar
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from uuid import UUID
 
 # Third-Party Imports
+import aiomysql
+
 from mysql.connector.connection_cext import \
     CMySQLConnection
 
@@ -31,6 +34,8 @@ from typeguard import TypeCheckError
 from hms.core.data_objects import \
     BaseDataObject, build_limit_clause, \
     build_order_by_clause, build_where_clause, \
+    close_env_async_database_pool, connect_env_database, \
+    get_env_async_database_pool, \
     get_env_database_connector, get_examples, \
     SQL_OPERATORS
 
@@ -40,6 +45,61 @@ class ExampleModel(BaseDataObject, BaseModel):
     pass
 
 
+def make_async_pool_mocks():
+    """
+    Creates and returns mocks standing in for an aiomysql
+    pool, and the connection and cursor it provides.
+    """
+    mock_pool = MagicMock()
+    mock_connection = MagicMock()
+    mock_connection.commit = AsyncMock()
+    mock_cursor = AsyncMock()
+    mock_pool.acquire.return_value.__aenter__ \
+        .return_value = mock_connection
+    mock_connection.cursor.return_value.__aenter__ \
+        .return_value = mock_cursor
+    return mock_pool, mock_connection, mock_cursor
+
+
+class FakeAsyncConnection:
+    """
+    Stands in for an aiomysql connection in a real aiomysql
+    pool, reporting an open transaction after a query unless
+    it was created with autocommit, as MySQL does.
+    """
+
+    def __init__(self, *, autocommit=False, **kwargs):
+        self.autocommit_mode = autocommit
+        self.closed = False
+        self.in_transaction = False
+        self.last_usage = 0
+        self._reader = MagicMock(eof_received=False)
+        self._reader.at_eof.return_value = False
+        self._reader.exception.return_value = None
+        self.cursor_instance = AsyncMock()
+        self.cursor_instance.fetchall.return_value = []
+
+    def close(self):
+        self.closed = True
+
+    def cursor(self, *args):
+        connection = self
+
+        class CursorContext:
+            async def __aenter__(self):
+                connection.in_transaction = \
+                    not connection.autocommit_mode
+                return connection.cursor_instance
+
+            async def __aexit__(self, *args):
+                pass
+
+        return CursorContext()
+
+    def get_transaction_status(self):
+        return self.in_transaction
+
+
 # Source-to-test-module correspondance test
 class test_ProjectTestMembersExist(
     unittest.TestCase,
@@ -312,6 +372,328 @@ class test_BaseDataObject(
             self.assertEqual(inst.modified, None)
 
     # Test-methods for source methods
+    def test__build_delete_sql_happy_paths(self):
+        class ConcreteDataObject(
+            BaseDataObject, BaseModel
+        ):
+            DELETE_TEMPLATE: ClassVar = 'DELETE FROM ' \
+                '{TABLE_NAME} {WHERE}'
+            TABLE_NAME: ClassVar = 'no_such_table'
+
+        oid = '00000000-0000-0000-0000-000000000001'
+        with self.subTest(msg='Test with single oid'):
+            self.assertEqual(
+                ConcreteDataObject._build_delete_sql((oid,)),
+                (
+                    'DELETE FROM no_such_table WHERE oid = %s',
+                    (oid,)
+                )
+            )
+        with self.subTest(msg='Test with db_source_name'):
+            self.assertEqual(
+                ConcreteDataObject._build_delete_sql(
+                    (UUID(oid),), 'other_table'
+                ),
+                (
+                    'DELETE FROM other_table WHERE oid = %s',
+                    (oid,)
+                )
+            )
+        with self.subTest(msg='Test with no oids'):
+            with self.assertRaises(AssertionError):
+                ConcreteDataObject._build_delete_sql(tuple())
+
+    def test__build_get_sql_happy_paths(self):
+        class ConcreteDataObject(
+            BaseDataObject, BaseModel
+        ):
+            TABLE_NAME: ClassVar = 'no_such_table'
+
+        oid = '00000000-0000-0000-0000-000000000001'
+        with self.subTest(msg='Test with single oid'):
+            self.assertEqual(
+                ConcreteDataObject._build_get_sql(
+                    (oid,), None, None, None, {}
+                ),
+                (
+                    'SELECT * FROM no_such_table '
+                    'WHERE oid = %s  ;',
+                    (oid,)
+                )
+            )
+        with self.subTest(
+            msg='Test with criteria and paging'
+        ):
+            criteria = {'is_active': True}
+            self.assertEqual(
+                ConcreteDataObject._build_get_sql(
+                    tuple(), 'other_table', 10, 2, criteria
+                ),
+                (
+                    'SELECT * FROM other_table '
+                    'WHERE is_active = %s  LIMIT 10 OFFSET 20;',
+                    (True,)
+                )
+            )
+            # The caller's criteria should not be changed
+            self.assertEqual(criteria, {'is_active': True})
+        with self.subTest(msg='Test with bad oid'):
+            with self.assertRaises(ValueError):
+                ConcreteDataObject._build_get_sql(
+                    ('not-a-uuid',), None, None, None, {}
+                )
+        with self.subTest(
+            msg='Test with page_number but no page_size'
+        ):
+            with self.assertRaises(TypeError):
+                ConcreteDataObject._build_get_sql(
+                    tuple(), None, None, 1, {}
+                )
+
+    def test__build_save_sql_happy_paths(self):
+        class ConcreteDataObject(
+            BaseDataObject, BaseModel
+        ):
+            TABLE_NAME: ClassVar = 'no_such_table'
+
+        inst = ConcreteDataObject()
+        final_sql, parameters = inst._build_save_sql()
+        self.assertTrue(
+            final_sql.startswith(
+                'INSERT INTO no_such_table (oid, '
+            ),
+            f'Unexpected SQL: {final_sql}'
+        )
+        self.assertEqual(
+            parameters[:len(parameters) // 2],
+            parameters[len(parameters) // 2:]
+        )
+        self.assertEqual(parameters[0], str(inst.oid))
+        self.assertEqual(
+            parameters[-1], inst.model_dump_json()
+        )
+        final_sql, _ = inst._build_save_sql('other_table')
+        self.assertTrue(
+            final_sql.startswith('INSERT INTO other_table ')
+        )
+
+    @patch('hms.core.data_objects.connect_env_database')
+    def test__iter_records_happy_paths(self, mock_connect):
+        # Arrange
+        class ConcreteDataObject(
+            BaseDataObject, BaseModel
+        ):
+            given_name: str = Field()
+
+        expected = [
+            ConcreteDataObject(given_name=name)
+            for name in ('Ann', 'Bob', 'Cat')
+        ]
+        records = [
+            {'object_state': item.model_dump_json()}
+            for item in expected
+        ]
+        mock_connection = MagicMock()
+        mock_cursor = mock_connection.cursor.return_value
+        mock_cursor.fetchmany.side_effect = [
+            records[:2], records[2:], []
+        ]
+        mock_connect.return_value = mock_connection
+        # Act
+        records_iter = ConcreteDataObject._iter_records(
+            'SELECT *', ('Ann',), 2
+        )
+        # Assert
+        # - Nothing happens until the iterator is advanced
+        mock_connect.assert_not_called()
+        self.assertEqual(list(records_iter), expected)
+        mock_connection.cursor.assert_called_once_with(
+            dictionary=True, buffered=False
+        )
+        mock_cursor.execute.assert_called_once_with(
+            'SELECT *', ('Ann',)
+        )
+        mock_cursor.fetchmany.assert_called_with(2)
+        mock_connection.close.assert_called_once()
+
+        with self.subTest(msg='Test closing early'):
+            mock_connection.reset_mock()
+            mock_cursor.fetchmany.side_effect = [records]
+            records_iter = ConcreteDataObject._iter_records(
+                'SELECT *', tuple(), 10
+            )
+            self.assertEqual(next(records_iter), expected[0])
+            records_iter.close()
+            mock_cursor.execute.assert_called_once_with(
+                'SELECT *'
+            )
+            mock_connection.close.assert_called_once()
+
+    @patch('hms.core.data_objects.connect_env_database')
+    def test_iter_happy_paths(self, mock_connect):
+        # Arrange
+        class ConcreteDataObject(
+            BaseDataObject, BaseModel
+        ):
+            TABLE_NAME: ClassVar = 'no_such_table'
+            given_name: str = Field()
+
+        expected = ConcreteDataObject(given_name='Ann')
+        mock_connection = MagicMock()
+        mock_cursor = mock_connection.cursor.return_value
+        mock_cursor.fetchmany.side_effect = [
+            [{'object_state': expected.model_dump_json()}],
+            []
+        ]
+        mock_connect.return_value = mock_connection
+        # Act
+        actual = list(
+            ConcreteDataObject.iter(
+                db_source_name='other_table',
+                chunk_size=50, is_active=False
+            )
+        )
+        # Assert
+        self.assertEqual(actual, [expected])
+        mock_cursor.execute.assert_called_once_with(
+            'SELECT * FROM other_table '
+            'WHERE is_active = %s  ;',
+            (False,)
+        )
+        mock_cursor.fetchmany.assert_called_with(50)
+        with self.subTest(msg='Test with bad chunk_size'):
+            with self.assertRaises(ValueError):
+                ConcreteDataObject.iter(chunk_size=0)
+        with self.subTest(msg='Test with bad oid'):
+            with self.assertRaises(ValueError):
+                ConcreteDataObject.iter('not-a-uuid')
+
+    @patch(
+        'hms.core.data_objects.get_env_async_database_pool'
+    )
+    def test_adelete_happy_paths(self, mock_get_pool):
+        # Arrange
+        class ConcreteDataObject(
+            BaseDataObject, BaseModel
+        ):
+            DELETE_TEMPLATE: ClassVar = 'DELETE FROM ' \
+                '{TABLE_NAME} {WHERE}'
+            TABLE_NAME: ClassVar = 'no_such_table'
+
+        mock_pool, mock_connection, mock_cursor = \
+            make_async_pool_mocks()
+        mock_get_pool.return_value = mock_pool
+        oid = '00000000-0000-0000-0000-000000000001'
+        # Act
+        asyncio.run(ConcreteDataObject.adelete(oid))
+        # Assert
+        mock_cursor.execute.assert_awaited_once_with(
+            'DELETE FROM no_such_table WHERE oid = %s',
+            (oid,)
+        )
+        mock_connection.commit.assert_awaited_once()
+
+    @patch(
+        'hms.core.data_objects.get_env_async_database_pool'
+    )
+    def test_aget_happy_paths(self, mock_get_pool):
+        # Arrange
+        class ConcreteDataObject(
+            BaseDataObject, BaseModel
+        ):
+            TABLE_NAME: ClassVar = 'no_such_table'
+            given_name: str = Field()
+
+        mock_pool, mock_connection, mock_cursor = \
+            make_async_pool_mocks()
+        mock_get_pool.return_value = mock_pool
+        expected = ConcreteDataObject(given_name='Jane')
+        mock_cursor.fetchall.return_value = [
+            {'object_state': expected.model_dump_json()}
+        ]
+        # Act
+        actual = asyncio.run(
+            ConcreteDataObject.aget(
+                expected.oid, is_active=False
+            )
+        )
+        # Assert
+        mock_connection.cursor.assert_called_once_with(
+            aiomysql.DictCursor
+        )
+        mock_cursor.execute.assert_awaited_once_with(
+            'SELECT * FROM no_such_table WHERE '
+            'is_active = %s AND oid = %s  ;',
+            (False, str(expected.oid))
+        )
+        self.assertEqual(actual, [expected])
+        with self.subTest(msg='Test with bad oid'):
+            with self.assertRaises(ValueError):
+                asyncio.run(
+                    ConcreteDataObject.aget('not-a-uuid')
+                )
+
+    @patch('aiomysql.pool.connect', new_callable=AsyncMock)
+    @patch.dict(
+        os.environ,
+        {
+            'MYSQL_HOST': 'some-database-host',
+            'MYSQL_PORT': '1234',
+            'MYSQL_DB': 'some-database-name',
+            'MYSQL_USER': 'some-user-name',
+            'MYSQL_PASS': 'super-secret-password-really',
+        }
+    )
+    def test_aget_reuses_pooled_connection(self, mock_connect):
+        # Arrange
+        class ConcreteDataObject(
+            BaseDataObject, BaseModel
+        ):
+            TABLE_NAME: ClassVar = 'no_such_table'
+
+        mock_connect.side_effect = \
+            lambda **kwargs: FakeAsyncConnection(**kwargs)
+
+        async def get_twice():
+            await ConcreteDataObject.aget()
+            await ConcreteDataObject.aget()
+            pool = await get_env_async_database_pool()
+            free = list(pool._free)
+            await close_env_async_database_pool()
+            return free
+
+        # Act
+        free = asyncio.run(get_twice())
+        # Assert: one connection served both reads, and was
+        # returned to the pool instead of being closed
+        mock_connect.assert_awaited_once()
+        self.assertEqual(len(free), 1)
+        self.assertEqual(
+            free[0].cursor_instance.execute.await_count, 2
+        )
+
+    @patch(
+        'hms.core.data_objects.get_env_async_database_pool'
+    )
+    def test_asave_happy_paths(self, mock_get_pool):
+        # Arrange
+        class ConcreteDataObject(
+            BaseDataObject, BaseModel
+        ):
+            WRITE_TEMPLATE: ClassVar = '/* This is some SQL */'
+
+        mock_pool, mock_connection, mock_cursor = \
+            make_async_pool_mocks()
+        mock_get_pool.return_value = mock_pool
+        inst = ConcreteDataObject()
+        # Act
+        asyncio.run(inst.asave())
+        # Assert
+        mock_cursor.execute.assert_awaited_once_with(
+            *inst._build_save_sql()
+        )
+        mock_connection.commit.assert_awaited_once()
+
     @patch.dict(
         os.environ,
         {
@@ -1007,6 +1389,137 @@ class test_build_where_clause(
                 )
 
 
+class test_close_env_async_database_pool(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_FUNCTION = 'close_env_async_database_pool'
+
+    @patch('aiomysql.create_pool', new_callable=AsyncMock)
+    @patch.dict(
+        os.environ,
+        {
+            'MYSQL_HOST': 'some-database-host',
+            'MYSQL_PORT': '1234',
+            'MYSQL_DB': 'some-database-name',
+            'MYSQL_USER': 'some-user-name',
+            'MYSQL_PASS': 'super-secret-password-really',
+        }
+    )
+    def test_close_env_async_database_pool_happy_paths(
+        self, patch_create_pool
+    ):
+        mock_pool = MagicMock()
+        mock_pool.wait_closed = AsyncMock()
+        patch_create_pool.return_value = mock_pool
+
+        async def create_and_close():
+            await get_env_async_database_pool()
+            await close_env_async_database_pool()
+            # Closing again, with no pool, is a no-op
+            await close_env_async_database_pool()
+            # A new pool is created after closing
+            await get_env_async_database_pool()
+            await close_env_async_database_pool()
+
+        asyncio.run(create_and_close())
+        self.assertEqual(mock_pool.close.call_count, 2)
+        self.assertEqual(mock_pool.wait_closed.await_count, 2)
+        self.assertEqual(patch_create_pool.await_count, 2)
+
+
+class test_connect_env_database(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_FUNCTION = 'connect_env_database'
+
+    @patch.dict(
+        os.environ,
+        {
+            'MYSQL_HOST': 'some-database-host',
+            'MYSQL_PORT': '1234',
+            'MYSQL_DB': 'some-database-name',
+            'MYSQL_USER': 'some-user-name',
+            'MYSQL_PASS': 'super-secret-password-really',
+        }
+    )
+    @patch('mysql.connector.connect', autospec=True)
+    def test_connect_env_database_happy_paths(
+        self, patch_connection
+    ):
+        """Test getting new, uncached connections."""
+        patch_connection.side_effect = \
+            lambda **kwargs: CMySQLConnection()
+        connector = connect_env_database()
+        patch_connection.assert_called_once_with(
+            host=os.environ['MYSQL_HOST'],
+            port=os.environ['MYSQL_PORT'],
+            user=os.environ['MYSQL_USER'],
+            password=os.environ['MYSQL_PASS'],
+            database=os.environ['MYSQL_DB'],
+        )
+        self.assertIsNot(connector, connect_env_database())
+
+
+class test_get_env_async_database_pool(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_FUNCTION = 'get_env_async_database_pool'
+
+    @patch('aiomysql.create_pool', new_callable=AsyncMock)
+    @patch.dict(
+        os.environ,
+        {
+            'MYSQL_HOST': 'some-database-host',
+            'MYSQL_PORT': '1234',
+            'MYSQL_DB': 'some-database-name',
+            'MYSQL_USER': 'some-user-name',
+            'MYSQL_PASS': 'super-secret-password-really',
+            'MYSQL_POOL_MAX_SIZE': '25',
+        }
+    )
+    def test_get_env_async_database_pool_happy_paths(
+        self, patch_create_pool
+    ):
+        """Test getting a cached, per-loop pool."""
+        patch_create_pool.side_effect = \
+            lambda **kwargs: MagicMock(
+                wait_closed=AsyncMock()
+            )
+
+        async def get_pools():
+            pools = await asyncio.gather(
+                get_env_async_database_pool(),
+                get_env_async_database_pool(),
+            )
+            cached = await get_env_async_database_pool()
+            await close_env_async_database_pool()
+            return pools, cached
+
+        # Concurrent first calls in one loop share a pool
+        (first, second), cached = asyncio.run(get_pools())
+        self.assertIs(first, second)
+        self.assertIs(first, cached)
+        patch_create_pool.assert_awaited_with(
+            host=os.environ['MYSQL_HOST'],
+            port=1234,
+            user=os.environ['MYSQL_USER'],
+            password=os.environ['MYSQL_PASS'],
+            db=os.environ['MYSQL_DB'],
+            minsize=1,
+            maxsize=25,
+            autocommit=True,
+        )
+        # A different loop gets its own pool
+        (other, _), _ = asyncio.run(get_pools())
+        self.assertIsNot(first, other)
+
+
 class test_get_env_database_connector(
     unittest.TestCase,
     ExaminesSourceFunction
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3.11
+"""
+"""
+
+# Built-In Imports
+import unittest
+
+# Third-Party Imports
+from goblinfish.testing.pact.modules import \
+    ExaminesModuleMembers
+from goblinfish.testing.pact.module_members import \
+    ExaminesSourceClass, ExaminesSourceFunction
+
+from graphql import GraphQLError, build_schema, \
+    get_introspection_query, parse, validate
+
+from typeguard import TypeCheckError
+
+# Path Manipulations (avoid these!) and "Local" Imports
+
+# Import the test target
+from hms.core.graphql_queries import DEFAULT_LIST_SIZE, \
+    QueryDocumentCache, analyze_query_cost, cost_limit_rule, \
+    get_query_hash
+
+# Set up a schema to test with
+SCHEMA = build_schema(
+    """
+    type Image { oid: ID! url: String! }
+    type Product { oid: ID! name: String! images: [Image!]! }
+    type Artisan {
+      oid: ID!
+      name: String!
+      products(first: Int): [Product!]!
+    }
+    union Owner = Artisan | Product
+    type Query {
+      artisans(page_size: Int): [Artisan!]!
+      artisan(oid: ID!): Artisan
+      owners: [Owner!]!
+    }
+    """
+)
+
+CATALOG_QUERY = """
+query Catalog {
+  artisans { oid products { name images { url } } }
+}
+"""
+
+
+# Source-to-test-module correspondance test
+class test_ProjectTestMembersExist(
+    unittest.TestCase,
+    ExaminesModuleMembers
+):
+    """
+    Tests that all source module members have
+    corresponding test module members in this
+    test module.
+    """
+    TARGET_MODULE = 'hms.core.graphql_queries'
+
+
+# Expected test-case classes
+class test_QueryDocumentCache(
+    unittest.TestCase,
+    ExaminesSourceClass
+):
+    TARGET_MODULE = 'hms.core.graphql_queries'
+    TARGET_CLASS = 'QueryDocumentCache'
+
+    def test___init___happy_paths(self):
+        cache = QueryDocumentCache(SCHEMA, max_size=2)
+        self.assertIs(cache.schema, SCHEMA)
+        self.assertEqual(cache.max_size, 2)
+        self.assertFalse(cache.persisted_only)
+        with self.assertRaises(TypeCheckError):
+            QueryDocumentCache('not a schema')
+
+    def test__parse_and_validate_happy_paths(self):
+        cache = QueryDocumentCache(SCHEMA)
+        document, errors = cache._parse_and_validate(CATALOG_QUERY)
+        self.assertEqual(
+            document.definitions[0].name.value, 'Catalog'
+        )
+        self.assertEqual(errors, [])
+        with self.subTest(msg='Test with a syntax error'):
+            document, errors = cache._parse_and_validate('{ oops')
+            self.assertIsNone(document)
+            self.assertEqual(len(errors), 1)
+        with self.subTest(msg='Test with an invalid query'):
+            document, errors = cache._parse_and_validate(
+                '{ artisans { no_such_field } }'
+            )
+            self.assertIsNotNone(document)
+            self.assertEqual(len(errors), 1)
+
+    def test_get_document_happy_paths(self):
+        cache = QueryDocumentCache(SCHEMA, max_size=2)
+        first = cache.get_document(CATALOG_QUERY)
+        # Repeated queries are parsed and validated only once
+        self.assertIs(cache.get_document(CATALOG_QUERY), first)
+        # ... as are invalid ones
+        invalid = cache.get_document('{ oops')
+        self.assertIs(cache.get_document('{ oops'), invalid)
+        # The least recently used document is evicted
+        cache.get_document(CATALOG_QUERY)
+        cache.get_document('{ artisans { oid } }')
+        self.assertIs(cache.get_document(CATALOG_QUERY), first)
+        self.assertIsNot(cache.get_document('{ oops'), invalid)
+
+    def test_get_document_persisted_only(self):
+        cache = QueryDocumentCache(SCHEMA, persisted_only=True)
+        document, errors = cache.get_document(CATALOG_QUERY)
+        self.assertIsNone(document)
+        self.assertIn(get_query_hash(CATALOG_QUERY), errors[0].message)
+        cache.register(CATALOG_QUERY)
+        document, errors = cache.get_document(CATALOG_QUERY)
+        self.assertIsNotNone(document)
+        self.assertEqual(errors, [])
+
+    def test_register_happy_paths(self):
+        cache = QueryDocumentCache(SCHEMA, max_size=1)
+        self.assertEqual(
+            cache.register(CATALOG_QUERY),
+            get_query_hash(CATALOG_QUERY)
+        )
+        # Persisted queries are never evicted
+        entry = cache.get_document(CATALOG_QUERY)
+        cache.get_document('{ artisans { oid } }')
+        cache.get_document('{ artisans { name } }')
+        self.assertIs(cache.get_document(CATALOG_QUERY), entry)
+        with self.subTest(msg='Test with an invalid query'):
+            with self.assertRaises(GraphQLError):
+                cache.register('{ artisans { no_such_field } }')
+
+
+class test_analyze_query_cost(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.graphql_queries'
+    TARGET_FUNCTION = 'analyze_query_cost'
+
+    def test_analyze_query_cost_bad_document(self):
+        with self.assertRaises(TypeCheckError):
+            analyze_query_cost(SCHEMA, CATALOG_QUERY)
+
+    def test_analyze_query_cost_bad_schema(self):
+        with self.assertRaises(TypeCheckError):
+            analyze_query_cost(None, parse(CATALOG_QUERY))
+
+    def test_analyze_query_cost_bad_variables(self):
+        with self.assertRaises(TypeCheckError):
+            analyze_query_cost(SCHEMA, parse(CATALOG_QUERY), [])
+
+    def test_analyze_query_cost_bad_list_size(self):
+        with self.assertRaises(TypeCheckError):
+            analyze_query_cost(
+                SCHEMA, parse(CATALOG_QUERY), list_size='10'
+            )
+
+    def test_analyze_query_cost_happy_paths(self):
+        size = DEFAULT_LIST_SIZE
+        self.assertEqual(
+            analyze_query_cost(SCHEMA, parse(CATALOG_QUERY)),
+            {
+                'Catalog': {
+                    'depth': 3,
+                    'breadth': size + size ** 2 + size ** 3,
+                }
+            }
+        )
+        self.assertEqual(
+            analyze_query_cost(
+                SCHEMA,
+                parse(
+                    'query($n: Int) { artisans(page_size: 2) '
+                    '{ products(first: $n) { oid } } '
+                    'artisan(oid: "x") { name } }'
+                ),
+                {'n': 5}
+            ),
+            # Scalar-only selections still count as objects
+            {None: {'depth': 2, 'breadth': 2 + 10 + 1}}
+        )
+        with self.subTest(msg='Test with fragments'):
+            self.assertEqual(
+                analyze_query_cost(
+                    SCHEMA,
+                    parse(
+                        '{ owners { ... on Artisan { products '
+                        '{ ...P } } ...P } } '
+                        'fragment P on Product { images { url } }'
+                    ),
+                    list_size=2
+                ),
+                # 2 owners, 4 products, 4 images of the owners
+                # and 8 images of the products
+                {None: {'depth': 3, 'breadth': 2 + 4 + 4 + 8}}
+            )
+        with self.subTest(msg='Introspection is not counted'):
+            self.assertEqual(
+                analyze_query_cost(
+                    SCHEMA, parse(get_introspection_query())
+                ),
+                {'IntrospectionQuery': {'depth': 0, 'breadth': 0}}
+            )
+
+
+class test_cost_limit_rule(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.graphql_queries'
+    TARGET_FUNCTION = 'cost_limit_rule'
+
+    def test_cost_limit_rule_bad_variables(self):
+        with self.assertRaises(TypeCheckError):
+            cost_limit_rule('n=5')
+
+    def test_cost_limit_rule_bad_max_depth(self):
+        with self.assertRaises(TypeCheckError):
+            cost_limit_rule(max_depth=None)
+
+    def test_cost_limit_rule_bad_max_breadth(self):
+        with self.assertRaises(TypeCheckError):
+            cost_limit_rule(max_breadth=None)
+
+    def test_cost_limit_rule_bad_list_size(self):
+        with self.assertRaises(TypeCheckError):
+            cost_limit_rule(list_size=None)
+
+    def test_cost_limit_rule_happy_paths(self):
+        document = parse(CATALOG_QUERY)
+        self.assertEqual(
+            validate(SCHEMA, document, [cost_limit_rule()]), []
+        )
+        errors = validate(
+            SCHEMA, document,
+            [cost_limit_rule(max_depth=2, max_breadth=100)]
+        )
+        self.assertEqual(
+            [error.message for error in errors],
+            [
+                'Operation Catalog has a depth of 3, more than '
+                'the maximum of 2.',
+                'Operation Catalog is estimated to resolve 1110 '
+                'objects, more than the maximum of 100.',
+            ]
+        )
+        # Variables can make a query cheaper, or more costly
+        errors = validate(
+            SCHEMA,
+            parse(
+                'query($n: Int) { artisans(page_size: $n) '
+                '{ oid } }'
+            ),
+            [cost_limit_rule({'n': 101}, max_breadth=100)]
+        )
+        self.assertEqual(len(errors), 1)
+
+
+class test_get_query_hash(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.graphql_queries'
+    TARGET_FUNCTION = 'get_query_hash'
+
+    def test_get_query_hash_bad_query(self):
+        with self.assertRaises(TypeCheckError):
+            get_query_hash(b'{ artisans { oid } }')
+
+    def test_get_query_hash_happy_paths(self):
+        self.assertEqual(
+            get_query_hash('{ artisans { oid } }'),
+            'e99062bd502677f9b865e96c170b7669'
+            '1e8d734ff6bac11f3ba1fe7cb1fdb8a0'
+        )
+        self.assertNotEqual(
+            get_query_hash('{ artisans { oid } }'),
+            get_query_hash('{ artisans { name } }')
+        )
+
+
+# Code to run if the module is executed directly
+if __name__ == '__main__':
+
+    unittest.main()
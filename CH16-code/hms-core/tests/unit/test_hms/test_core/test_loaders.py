@@ -0,0 +1,375 @@
+#!/usr/bin/env python3.11
+"""
+"""
+
+# Built-In Imports
+import asyncio
+import unittest
+
+from typing import ClassVar
+from unittest.mock import patch, AsyncMock
+from uuid import UUID, uuid4
+
+# Third-Party Imports
+from goblinfish.testing.pact.modules import \
+    ExaminesModuleMembers
+from goblinfish.testing.pact.module_members import \
+    ExaminesSourceClass, ExaminesSourceFunction
+
+from pydantic import BaseModel, Field
+
+from typeguard import TypeCheckError
+
+# Path Manipulations (avoid these!) and "Local" Imports
+from hms.core.data_objects import BaseDataObject
+
+# Import the test target
+from hms.core.loaders import MAX_BATCH_SIZE, ObjectLoader, \
+    RequestLoaders, normalize_key
+
+
+# Set up classes to test with
+class Parent(BaseDataObject, BaseModel):
+    pass
+
+
+class Child(BaseDataObject, BaseModel):
+    CRITERIA_FIELDS: ClassVar[list[str]] = \
+        BaseDataObject.CRITERIA_FIELDS + ['parent_oid']
+
+    parent_oid: UUID = Field()
+
+
+# Source-to-test-module correspondance test
+class test_ProjectTestMembersExist(
+    unittest.TestCase,
+    ExaminesModuleMembers
+):
+    """
+    Tests that all source module members have
+    corresponding test module members in this
+    test module.
+    """
+    TARGET_MODULE = 'hms.core.loaders'
+
+
+# Expected test-case classes
+class test_ObjectLoader(
+    unittest.TestCase,
+    ExaminesSourceClass
+):
+    TARGET_MODULE = 'hms.core.loaders'
+    TARGET_CLASS = 'ObjectLoader'
+
+    def test___init___happy_paths(self):
+        loader = ObjectLoader(Child, key_field='parent_oid')
+        self.assertIs(loader.data_class, Child)
+        self.assertEqual(loader.key_field, 'parent_oid')
+        self.assertIsNone(loader.db_source_name)
+        self.assertTrue(loader.asynchronous)
+        self.assertEqual(loader.max_batch_size, MAX_BATCH_SIZE)
+        with self.subTest(msg='Test with a non-criteria field'):
+            with self.assertRaises(ValueError):
+                ObjectLoader(Parent, key_field='parent_oid')
+        with self.subTest(msg='Test with a bad max_batch_size'):
+            with self.assertRaises(ValueError):
+                ObjectLoader(Parent, max_batch_size=0)
+        with self.subTest(msg='Test with a bad data_class'):
+            with self.assertRaises(TypeCheckError):
+                ObjectLoader(dict)
+
+    def test_many_happy_paths(self):
+        self.assertFalse(ObjectLoader(Parent).many)
+        self.assertTrue(
+            ObjectLoader(Child, key_field='parent_oid').many
+        )
+
+    def test_many_invalid_del(self):
+        loader = ObjectLoader(Parent)
+        with self.assertRaises(AttributeError):
+            del loader.many
+
+    def test_many_set_bad_instance(self):
+        loader = ObjectLoader(Parent)
+        with self.assertRaises(AttributeError):
+            loader.many = object()
+
+    def test_many_set_bad_value(self):
+        loader = ObjectLoader(Parent)
+        with self.assertRaises(AttributeError):
+            loader.many = True
+
+    @patch.object(Parent, 'aget', new_callable=AsyncMock)
+    def test__aget_batch_happy_paths(self, mock_aget):
+        keys = [str(uuid4()), str(uuid4())]
+        asyncio.run(
+            ObjectLoader(Parent, db_source_name='Parents')
+            ._aget_batch(keys)
+        )
+        mock_aget.assert_awaited_once_with(
+            *keys, db_source_name='Parents'
+        )
+
+    @patch.object(Child, 'aget', new_callable=AsyncMock)
+    def test__aget_batch_happy_paths_foreign_key(self, mock_aget):
+        keys = [str(uuid4()), str(uuid4())]
+        asyncio.run(
+            ObjectLoader(Child, key_field='parent_oid')
+            ._aget_batch(keys)
+        )
+        mock_aget.assert_awaited_once_with(
+            db_source_name=None, parent_oid_in=keys
+        )
+
+    @patch.object(Parent, 'aget', new_callable=AsyncMock)
+    def test__aload_batch_happy_paths(self, mock_aget):
+        expected = Parent()
+        mock_aget.return_value = [expected]
+
+        async def load_batch():
+            loop = asyncio.get_running_loop()
+            batch = {
+                str(expected.oid): loop.create_future(),
+                str(uuid4()): loop.create_future(),
+            }
+            await ObjectLoader(Parent)._aload_batch(batch)
+            return [future.result() for future in batch.values()]
+
+        self.assertEqual(asyncio.run(load_batch()), [expected, None])
+
+    @patch.object(Parent, 'aget', new_callable=AsyncMock)
+    def test__dispatch_happy_paths(self, mock_aget):
+        mock_aget.return_value = []
+
+        async def load():
+            loader = ObjectLoader(Parent, max_batch_size=2)
+            return await loader.load_many(
+                [uuid4() for _ in range(5)]
+            )
+
+        # Five keys are looked up in batches of 2, 2 and 1
+        self.assertEqual(asyncio.run(load()), [None] * 5)
+        self.assertEqual(
+            [len(call.args) for call in mock_aget.await_args_list],
+            [2, 2, 1]
+        )
+
+    def test__fail_batch_happy_paths(self):
+        async def fail_batch():
+            loader = ObjectLoader(Parent)
+            future = asyncio.get_running_loop().create_future()
+            key = str(uuid4())
+            loader._futures[key] = future
+            error = RuntimeError('Lost connection')
+            loader._fail_batch({key: future}, error)
+            self.assertIs(future.exception(), error)
+            self.assertNotIn(key, loader._futures)
+
+        asyncio.run(fail_batch())
+
+    @patch.object(Parent, 'get')
+    def test__get_batch_happy_paths(self, mock_get):
+        keys = [str(uuid4())]
+        ObjectLoader(Parent, asynchronous=False)._get_batch(keys)
+        mock_get.assert_called_once_with(*keys, db_source_name=None)
+
+    def test__resolve_batch_happy_paths(self):
+        parent_oid = uuid4()
+        children = [
+            Child(parent_oid=parent_oid),
+            Child(parent_oid=parent_oid),
+        ]
+
+        async def resolve_batch():
+            loop = asyncio.get_running_loop()
+            batch = {
+                str(parent_oid): loop.create_future(),
+                str(uuid4()): loop.create_future(),
+            }
+            ObjectLoader(Child, key_field='parent_oid') \
+                ._resolve_batch(batch, children)
+            return [future.result() for future in batch.values()]
+
+        self.assertEqual(asyncio.run(resolve_batch()), [children, []])
+
+    @patch.object(Parent, 'aget', new_callable=AsyncMock)
+    def test_clear_happy_paths(self, mock_aget):
+        expected = Parent()
+        mock_aget.return_value = [expected]
+
+        async def load():
+            loader = ObjectLoader(Parent)
+            await loader.load(expected.oid)
+            loader.clear(str(expected.oid))
+            await loader.load(expected.oid)
+            loader.clear()
+            await loader.load(expected.oid)
+
+        asyncio.run(load())
+        self.assertEqual(mock_aget.await_count, 3)
+
+    @patch.object(Parent, 'aget', new_callable=AsyncMock)
+    def test_load_happy_paths(self, mock_aget):
+        expected = Parent()
+        mock_aget.return_value = [expected]
+
+        async def load():
+            loader = ObjectLoader(Parent)
+            # Concurrent loads, of the same oid in different
+            # forms, are coalesced into a single query
+            results = await asyncio.gather(
+                loader.load(expected.oid),
+                loader.load(str(expected.oid).upper()),
+            )
+            # ... and later loads are served from the cache
+            results.append(await loader.load(str(expected.oid)))
+            return results
+
+        self.assertEqual(asyncio.run(load()), [expected] * 3)
+        mock_aget.assert_awaited_once_with(
+            str(expected.oid), db_source_name=None
+        )
+        with self.subTest(msg='Test with a bad key'):
+            with self.assertRaises(ValueError):
+                asyncio.run(ObjectLoader(Parent).load('not-a-uuid'))
+
+    @patch.object(Parent, 'aget', new_callable=AsyncMock)
+    def test_load_failure(self, mock_aget):
+        expected = Parent()
+        mock_aget.side_effect = [RuntimeError('Lost connection'), [expected]]
+
+        async def load():
+            loader = ObjectLoader(Parent)
+            with self.assertRaises(RuntimeError):
+                await loader.load(expected.oid)
+            # Failed keys are not cached, so they can be retried
+            return await loader.load(expected.oid)
+
+        self.assertEqual(asyncio.run(load()), expected)
+
+    @patch.object(Parent, 'get')
+    def test_load_synchronous(self, mock_get):
+        expected = [Parent(), Parent()]
+        mock_get.return_value = expected
+
+        async def load():
+            loader = ObjectLoader(Parent, asynchronous=False)
+            return await loader.load_many(
+                [item.oid for item in expected]
+            )
+
+        self.assertEqual(asyncio.run(load()), expected)
+        mock_get.assert_called_once_with(
+            *[str(item.oid) for item in expected],
+            db_source_name=None
+        )
+
+    @patch.object(Child, 'aget', new_callable=AsyncMock)
+    def test_load_many_happy_paths(self, mock_aget):
+        first, second = uuid4(), uuid4()
+        children = [
+            Child(parent_oid=second),
+            Child(parent_oid=first),
+            Child(parent_oid=second),
+        ]
+        mock_aget.return_value = children
+
+        async def load_many():
+            loader = ObjectLoader(Child, key_field='parent_oid')
+            return await loader.load_many([first, second, uuid4()])
+
+        self.assertEqual(
+            asyncio.run(load_many()),
+            [[children[1]], [children[0], children[2]], []]
+        )
+        mock_aget.assert_awaited_once()
+
+    @patch.object(Parent, 'aget', new_callable=AsyncMock)
+    def test_prime_happy_paths(self, mock_aget):
+        expected = Parent()
+
+        async def load():
+            loader = ObjectLoader(Parent)
+            loader.prime(expected)
+            return await loader.load(expected.oid)
+
+        self.assertIs(asyncio.run(load()), expected)
+        mock_aget.assert_not_awaited()
+        with self.subTest(msg='Test with a foreign key loader'):
+            with self.assertRaises(TypeError):
+                ObjectLoader(Child, key_field='parent_oid') \
+                    .prime(Child(parent_oid=uuid4()))
+
+
+class test_RequestLoaders(
+    unittest.TestCase,
+    ExaminesSourceClass
+):
+    TARGET_MODULE = 'hms.core.loaders'
+    TARGET_CLASS = 'RequestLoaders'
+
+    def test___init___happy_paths(self):
+        loaders = RequestLoaders(
+            {Parent: 'Parents'}, asynchronous=False,
+            max_batch_size=10
+        )
+        self.assertEqual(loaders.db_source_names, {Parent: 'Parents'})
+        self.assertFalse(loaders.asynchronous)
+        self.assertEqual(loaders.max_batch_size, 10)
+        with self.subTest(msg='Test with bad db_source_names'):
+            with self.assertRaises(TypeCheckError):
+                RequestLoaders({'Parent': 'Parents'})
+
+    @patch.object(Parent, 'aget', new_callable=AsyncMock)
+    def test_clear_happy_paths(self, mock_aget):
+        expected = Parent()
+        mock_aget.return_value = [expected]
+        loaders = RequestLoaders()
+
+        async def load():
+            await loaders.loader(Parent).load(expected.oid)
+            loaders.clear(expected)
+            await loaders.loader(Parent).load(expected.oid)
+
+        asyncio.run(load())
+        self.assertEqual(mock_aget.await_count, 2)
+        # Clearing an object whose class has no loader yet
+        # does nothing
+        loaders.clear(Child(parent_oid=uuid4()))
+
+    def test_loader_happy_paths(self):
+        loaders = RequestLoaders({Parent: 'Parents'}, max_batch_size=10)
+        loader = loaders.loader(Parent)
+        self.assertIs(loaders.loader(Parent), loader)
+        self.assertEqual(loader.db_source_name, 'Parents')
+        self.assertEqual(loader.max_batch_size, 10)
+        children = loaders.loader(Child, 'parent_oid')
+        self.assertIsNot(children, loaders.loader(Child))
+        self.assertTrue(children.many)
+        self.assertIsNone(children.db_source_name)
+
+
+class test_normalize_key(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.loaders'
+    TARGET_FUNCTION = 'normalize_key'
+
+    def test_normalize_key_bad_key(self):
+        with self.assertRaises(ValueError):
+            normalize_key('not-a-uuid')
+        with self.assertRaises(TypeCheckError):
+            normalize_key(1)
+
+    def test_normalize_key_happy_paths(self):
+        oid = uuid4()
+        for key in (oid, str(oid), str(oid).upper(), oid.hex):
+            with self.subTest(key=key):
+                self.assertEqual(normalize_key(key), str(oid))
+
+
+# Code to run if the module is executed directly
+if __name__ == '__main__':
+
+    unittest.main()
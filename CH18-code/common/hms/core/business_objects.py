@@ -11,18 +11,30 @@ from uuid import UUID
 # Third-Party Imports
 from pydantic import (
     # Model-related items
-    BaseModel, Field,
+    BaseModel, ConfigDict, Field,
     # Specific formats used in models
     EmailStr, NameEmail, HttpUrl
 )
 
 # Path Manipulations (avoid these!) and "Local" Imports
 from hms.core.data_objects import \
-    BaseDataObject, \
-    get_examples, get_env_database_connector
+    BaseDataObject, UnitOfWork, \
+    database_connector, get_examples, lazy_examples
+
+# The not-found errors live in hms.core.errors, so that they can
+# be imported without this module, but are still available here
+from hms.core.errors import ArtisanNotFoundError, \
+    ProductImageNotFoundError, ProductNotFoundError  # noqa: F401
 
 # Module "Constants" and Other Attributes
 
+# The models build their validators and serializers the first
+# time they are used, rather than when they are defined, so
+# that importing this module stays cheap for callers that only
+# use some of them (for example, only Artisan needs the e-mail
+# validation package, which is slow to import)
+DEFERRED_BUILD_CONFIG = ConfigDict(defer_build=True)
+
 # Module Custom Exceptions
 
 # Module Functions
@@ -37,6 +49,9 @@ class Address(BaseModel):
     """
     Represents a physical mailing address.
     """  # noqa E501
+
+    model_config = DEFERRED_BUILD_CONFIG
+
     street_address: str = Field(
         title='Street Address',
         description='The required street address part of '
@@ -108,6 +123,8 @@ class ProductImageSize(BaseModel):
     Provides a common data structure to describe the size (width and height) of a ProductImage variant -- original, detail, and thumbnail sizes.
     """  # noqa E501
 
+    model_config = DEFERRED_BUILD_CONFIG
+
     width: int=Field(
         title='Image Width',
         description='The width of the image, in pixels.',
@@ -128,6 +145,9 @@ class ProductImage(BaseModel, BaseDataObject):
     Represents an image for a Product in the context of the HMS systems, with data access functionality and operability.
     """  # noqa E501
 
+    model_config = DEFERRED_BUILD_CONFIG
+
+    TABLE_NAME: ClassVar[str] = 'ProductImages'
     CRITERIA_FIELDS: ClassVar[list[str]] = \
         BaseDataObject.CRITERIA_FIELDS + [
             'product_oid',
@@ -209,8 +229,33 @@ class Product(BaseModel, BaseDataObject):
     Represents a Product in the context of the HMS systems, with data access functionality and operability.
     """  # noqa E501
 
+    model_config = DEFERRED_BUILD_CONFIG
+
+    TABLE_NAME: ClassVar[str] = 'Products'
     CRITERIA_FIELDS: ClassVar[list[str]] = \
-        BaseDataObject.CRITERIA_FIELDS + ['artisan_oid']
+        BaseDataObject.CRITERIA_FIELDS + [
+            'artisan_oid', 'name', 'price',
+        ]
+    GENERATED_FIELDS: ClassVar[list[str]] = ['name', 'price']
+    METADATA_DELETE_TEMPLATE: ClassVar[str] = (
+        'DELETE FROM ProductMetadata WHERE product_oid = %s;'
+    )
+    METADATA_WRITE_TEMPLATE: ClassVar[str] = (
+        'INSERT INTO ProductMetadata '
+        '(product_oid, category_name, value) VALUES {ROWS};'
+    )
+    METADATA_ARCHIVE_TEMPLATES: ClassVar[tuple[str, ...]] = (
+        'INSERT INTO ProductMetadata_Archive '
+        '(product_oid, category_name, value) '
+        'SELECT product_oid, category_name, value '
+        'FROM ProductMetadata WHERE product_oid IN %s;',
+        'DELETE FROM ProductMetadata WHERE product_oid IN %s;',
+    )
+    RELATIONS: ClassVar[
+        dict[str, tuple[type[BaseDataObject], str]]
+    ] = {
+        'product_images': (ProductImage, 'product_oid'),
+    }
 
     # Relational links
     artisan_oid: UUID = Field(
@@ -263,10 +308,9 @@ class Product(BaseModel, BaseDataObject):
         description='The list of ProductImages '
         'associated with the Product',
         default_factory=list,
-        examples=[
-            [],
-            get_examples(ProductImage, max_items=2)
-        ]
+        **lazy_examples(
+            lambda: [[], get_examples(ProductImage, max_items=2)]
+        )
     )
     # Commerce data
     price: Decimal = Field(
@@ -344,6 +388,23 @@ class Product(BaseModel, BaseDataObject):
         ]
     )
 
+    @classmethod
+    def _archive_related(cls, oids: list[str]) -> None:
+        """
+        Archives the metadata of Products being archived by
+        archive_deleted, in the same transaction. OVERRIDES
+        BaseDataObject._archive_related.
+
+        Parameters:
+        -----------
+        oids : list[str]
+            The oids of the Products being archived.
+        """
+        with database_connector() as connector:
+            with connector.cursor() as cursor:
+                for template in cls.METADATA_ARCHIVE_TEMPLATES:
+                    cursor.execute(template, (oids,))
+
     def save(
         self, *,
         db_source_name: str | None = None,
@@ -367,35 +428,47 @@ class Product(BaseModel, BaseDataObject):
         Note:
         -----
         If no metadata is supplied, existing metadata
-        for the Product will be left untouched.
+        for the Product will be left untouched. If it is,
+        the Product and its metadata are saved in a single
+        transaction.
         """
-        BaseDataObject.save(
-            self, db_source_name=db_source_name
-        )
-        if metadata:
+        if not metadata:
+            BaseDataObject.save(
+                self, db_source_name=db_source_name
+            )
+            return
+        with UnitOfWork():
+            BaseDataObject.save(
+                self, db_source_name=db_source_name
+            )
             self.save_metadata(**metadata)
 
     def save_metadata(self, **metadata: str) -> None:
         """
         Creates metadata records for the instance,
         deleting and overwriting any existing ones
-        in the process.
+        in the process, with a single multi-row INSERT
+        in the same transaction as the DELETE.
         """
-        connector = get_env_database_connector()
-        cursor = connector.cursor()
-        cursor.execute(
-            "DELETE FROM ProductMetadata "
-            "WHERE product_oid='%s';",
-            (self.oid)
-        )
-        for key, value in metadata.items():
-            cursor.execute(
-                "INSERT INTO ProductMetadata "
-                "(product_oid, category_name, value) "
-                "VALUES ('%s', '%s', '%s')",
-                (self.oid, key, value)
-            )
-        connector.commit()
+        oid = str(self.oid)
+        with database_connector(commit=True) as connector:
+            with connector.cursor() as cursor:
+                cursor.execute(
+                    self.METADATA_DELETE_TEMPLATE, (oid,)
+                )
+                if metadata:
+                    cursor.execute(
+                        self.METADATA_WRITE_TEMPLATE.format(
+                            ROWS=', '.join(
+                                ['(%s, %s, %s)'] * len(metadata)
+                            )
+                        ),
+                        tuple(
+                            parameter
+                            for key, value in metadata.items()
+                            for parameter in (oid, key, value)
+                        )
+                    )
 
 
 class Artisan(BaseModel, BaseDataObject):
@@ -403,6 +476,22 @@ class Artisan(BaseModel, BaseDataObject):
     Represents an Artisan in the context of the HMS systems, with data access functionality and operability.
     """  # noqa E501
 
+    model_config = DEFERRED_BUILD_CONFIG
+
+    TABLE_NAME: ClassVar[str] = 'Artisan'
+    CRITERIA_FIELDS: ClassVar[list[str]] = \
+        BaseDataObject.CRITERIA_FIELDS + [
+            'family_name', 'given_name',
+        ]
+    GENERATED_FIELDS: ClassVar[list[str]] = [
+        'family_name', 'given_name',
+    ]
+    RELATIONS: ClassVar[
+        dict[str, tuple[type[BaseDataObject], str]]
+    ] = {
+        'products': (Product, 'artisan_oid'),
+    }
+
     # Person-name information fields
     honorific: Optional[str] | None = Field(
         title='Honorific',
@@ -484,7 +573,9 @@ class Artisan(BaseModel, BaseDataObject):
         title='Business Mailing Address',
         description='The required mailing address for '
         'the Artisan.',
-        examples=get_examples(Address, max_items=2)
+        **lazy_examples(
+            lambda: get_examples(Address, max_items=2)
+        )
     )
     email_address: EmailStr | NameEmail = Field(
         title='Email Address',
@@ -504,37 +595,12 @@ class Artisan(BaseModel, BaseDataObject):
         description='The list of Products associated '
         'with the Artisan',
         default_factory=list,
-        examples=[
-            [],
-            get_examples(Product, max_items=2)
-        ]
+        **lazy_examples(
+            lambda: [[], get_examples(Product, max_items=2)]
+        )
     )
 
 
-class ArtisanNotFoundError(Exception):
-    """
-    An exception to be raised if Artisan.get does not
-    return an expected collection of Artisan objects.
-    """
-    ...
-
-
-class ProductImageNotFoundError(Exception):
-    """
-    An exception to be raised if Product.get does not
-    return an expected collection of Product objects.
-    """
-    ...
-
-
-class ProductNotFoundError(Exception):
-    """
-    An exception to be raised if Product.get does not
-    return an expected collection of Product objects.
-    """
-    ...
-
-
 # Code to run if the module is executed directly
 if __name__ == '__main__':
 
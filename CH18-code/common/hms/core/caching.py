@@ -0,0 +1,637 @@
+#!/usr/bin/env python3.11
+"""
+Provides cache back ends, and the read-through object and
+query caches that BaseDataObject.get uses to serve repeated
+reads from memory instead of the back-end data-store.
+"""
+from __future__ import annotations
+
+# Built-In Imports
+import abc
+import hashlib
+import os
+import threading
+
+from collections import OrderedDict
+from functools import cache
+from time import monotonic
+from uuid import UUID, uuid4
+
+# Third-Party Imports
+
+# Path Manipulations (avoid these!) and "Local" Imports
+from hms.core.typechecks import typechecked
+from logger import logger
+
+# Module "Constants" and Other Attributes
+
+# Default object- and query-cache settings, any of which
+# can be overridden by an environment variable of the same
+# name. Each cache is disabled unless its TTL is set to a
+# positive number of seconds.
+CACHE_DEFAULTS = {
+    'HMS_OBJECT_CACHE_SIZE': 1024,
+    'HMS_OBJECT_CACHE_TTL': 0.0,
+    'HMS_OBJECT_CACHE_NEGATIVE_TTL': 5.0,
+    'HMS_QUERY_CACHE_SIZE': 256,
+    'HMS_QUERY_CACHE_TTL': 0.0,
+}
+
+
+# Module Custom Exceptions
+
+# Module Functions
+def _get_env_cache_settings() -> dict[str, int | float]:
+    """
+    Returns the cache settings in CACHE_DEFAULTS, with any
+    that are set as environment variables overridden.
+    """
+    return {
+        name: type(default)(os.getenv(name, default))
+        for name, default in CACHE_DEFAULTS.items()
+    }
+
+
+@cache
+@typechecked
+def get_env_object_cache() -> ObjectCache | None:
+    """
+    Creates and returns an ObjectCache with a LocalCache
+    back end, configured from the HMS_OBJECT_CACHE_*
+    environment variables (see CACHE_DEFAULTS), or None
+    if HMS_OBJECT_CACHE_TTL is not a positive number.
+    The same instance is returned by every call, so that
+    all the objects in a process share one cache.
+    """
+    settings = _get_env_cache_settings()
+    logger.debug(f'object cache settings: {settings}')
+    if settings['HMS_OBJECT_CACHE_TTL'] <= 0:
+        return None
+    return ObjectCache(
+        LocalCache(max_size=settings['HMS_OBJECT_CACHE_SIZE']),
+        ttl=settings['HMS_OBJECT_CACHE_TTL'],
+        negative_ttl=settings['HMS_OBJECT_CACHE_NEGATIVE_TTL'],
+    )
+
+
+@cache
+@typechecked
+def get_env_query_cache() -> QueryCache | None:
+    """
+    Creates and returns a QueryCache with a LocalCache
+    back end, configured from the HMS_QUERY_CACHE_*
+    environment variables (see CACHE_DEFAULTS), or None
+    if HMS_QUERY_CACHE_TTL is not a positive number.
+    The same instance is returned by every call, so that
+    all the objects in a process share one cache.
+    """
+    settings = _get_env_cache_settings()
+    logger.debug(f'query cache settings: {settings}')
+    if settings['HMS_QUERY_CACHE_TTL'] <= 0:
+        return None
+    return QueryCache(
+        LocalCache(max_size=settings['HMS_QUERY_CACHE_SIZE']),
+        ttl=settings['HMS_QUERY_CACHE_TTL'],
+    )
+
+
+# Module Metaclasses
+
+# Module Abstract Base Classes
+class CacheBackend(metaclass=abc.ABCMeta):
+    """
+    Provides the interface that a cache back end must implement to be used by an ObjectCache or QueryCache: a process-local store like LocalCache, or a shared one (memcached, Redis, etc.) that lets Lambda containers share cached values. Values are strings (or None), so that any back end can store them.
+    """  # noqa: E501
+
+    # Whether the back end's values are shared by every process
+    # that uses it, so that a version stamp bumped by one of
+    # them is seen by all of them
+    SHARED = False
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Gets any counters that the back end keeps, for
+        example of evictions.
+        """
+        return {}
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """
+        Removes all values from the cache.
+        """
+        raise NotImplementedError(
+            f'{self.__class__.__name__}.clear has not '
+            'been implemented, as required by '
+            'CacheBackend'
+        )
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Removes the value stored for a key from the
+        cache, if there is one.
+
+        Parameters:
+        -----------
+        key : str
+            The key to remove the value of.
+        """
+        raise NotImplementedError(
+            f'{self.__class__.__name__}.delete has not '
+            'been implemented, as required by '
+            'CacheBackend'
+        )
+
+    @abc.abstractmethod
+    def get(self, key: str) -> tuple[bool, str | None]:
+        """
+        Returns a tuple of whether an unexpired value is
+        stored for a key, and that value (or None).
+
+        Parameters:
+        -----------
+        key : str
+            The key to get the value of.
+        """
+        raise NotImplementedError(
+            f'{self.__class__.__name__}.get has not '
+            'been implemented, as required by '
+            'CacheBackend'
+        )
+
+    @abc.abstractmethod
+    def set(self, key: str, value: str | None, ttl: float) -> None:
+        """
+        Stores a value for a key, to expire after a number
+        of seconds.
+
+        Parameters:
+        -----------
+        key : str
+            The key to store the value under.
+        value : str or None
+            The value to store.
+        ttl : float
+            The number of seconds that the value should
+            be returned for.
+        """
+        raise NotImplementedError(
+            f'{self.__class__.__name__}.set has not '
+            'been implemented, as required by '
+            'CacheBackend'
+        )
+
+
+# Module Concrete Classes
+class LocalCache(CacheBackend):
+    """
+    Provides a thread-safe, process-local cache back end, with values that expire after their TTL, and that evicts the least recently used values when it holds more than a maximum number of them.
+    """  # noqa: E501
+
+    @typechecked
+    def __init__(self, max_size: int = 1024) -> None:
+        """
+        Parameters:
+        -----------
+        max_size : int
+            The maximum number of values to hold.
+        """
+        assert max_size > 0, \
+            f'{self.__class__.__name__} expects a positive ' \
+            f'max_size, but {max_size} was passed.'
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {'evictions': 0, 'expirations': 0}
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Gets the number of values currently held, and
+        the number evicted and expired so far.
+        """
+        with self._lock:
+            return {'size': len(self._entries)} \
+                | self._counters
+
+    def clear(self) -> None:
+        """
+        Removes all values from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    @typechecked
+    def delete(self, key: str) -> None:
+        """
+        Removes the value stored for a key from the
+        cache, if there is one.
+
+        Parameters:
+        -----------
+        key : str
+            The key to remove the value of.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    @typechecked
+    def get(self, key: str) -> tuple[bool, str | None]:
+        """
+        Returns a tuple of whether an unexpired value is
+        stored for a key, and that value (or None),
+        marking it as the most recently used value.
+
+        Parameters:
+        -----------
+        key : str
+            The key to get the value of.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return (False, None)
+            expires, value = entry
+            if expires <= monotonic():
+                del self._entries[key]
+                self._counters['expirations'] += 1
+                return (False, None)
+            self._entries.move_to_end(key)
+            return (True, value)
+
+    @typechecked
+    def set(self, key: str, value: str | None, ttl: float) -> None:
+        """
+        Stores a value for a key, to expire after a number
+        of seconds, evicting the least recently used value
+        if the cache is full.
+
+        Parameters:
+        -----------
+        key : str
+            The key to store the value under.
+        value : str or None
+            The value to store.
+        ttl : float
+            The number of seconds that the value should
+            be returned for.
+        """
+        with self._lock:
+            self._entries[key] = (monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._counters['evictions'] += 1
+
+
+class ObjectCache:
+    """
+    Provides a read-through cache of the object_state data of individual objects, keyed by the table (or other data source) they are stored in and their oid, including "negative" entries for oids that do not exist, with counters of cache hits and misses.
+    """  # noqa: E501
+
+    @typechecked
+    def __init__(
+        self,
+        backend: CacheBackend,
+        *,
+        ttl: float = 60.0,
+        negative_ttl: float = 5.0,
+    ) -> None:
+        """
+        Parameters:
+        -----------
+        backend : CacheBackend
+            The back end that stores cached values.
+        ttl : float
+            The number of seconds that the state data of
+            an object is cached for.
+        negative_ttl : float
+            The number of seconds that the absence of an
+            object is cached for. No negative entries are
+            cached if this is not positive.
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._counters = {
+            'hits': 0, 'misses': 0,
+            'negative_hits': 0, 'invalidations': 0,
+        }
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Gets the hit, miss, negative-hit and invalidation
+        counts of the cache, and any counters kept by its
+        back end.
+        """
+        with self._lock:
+            return dict(self._counters) | self.backend.stats
+
+    @staticmethod
+    def _key(source: str, oid: UUID | str) -> str:
+        """
+        Returns the back end key for an object.
+
+        Parameters:
+        -----------
+        source : str
+            The name of the table or view the object is
+            stored in.
+        oid : UUID | str
+            The unique identifier of the object.
+        """
+        return f'{source}:{str(oid).lower()}'
+
+    def _count(self, name: str) -> None:
+        """
+        Increments one of the cache's counters.
+
+        Parameters:
+        -----------
+        name : str
+            The name of the counter to increment.
+        """
+        with self._lock:
+            self._counters[name] += 1
+
+    def clear(self) -> None:
+        """
+        Removes everything from the cache.
+        """
+        self._count('invalidations')
+        self.backend.clear()
+
+    @typechecked
+    def get(
+        self, source: str, oid: UUID | str
+    ) -> tuple[bool, str | None]:
+        """
+        Returns a tuple of whether the cache has an entry
+        for an object, and its object_state data, which
+        is None if the object is known not to exist.
+
+        Parameters:
+        -----------
+        source : str
+            The name of the table or view the object is
+            stored in.
+        oid : UUID | str
+            The unique identifier of the object.
+        """
+        found, state = self.backend.get(self._key(source, oid))
+        if not found:
+            self._count('misses')
+        elif state is None:
+            self._count('negative_hits')
+        else:
+            self._count('hits')
+        logger.debug(
+            f'Object cache {"hit" if found else "miss"} '
+            f'for {source} {oid}'
+        )
+        return (found, state)
+
+    @typechecked
+    def invalidate(self, source: str, *oids: UUID | str) -> None:
+        """
+        Removes the entries for objects from the cache.
+
+        Parameters:
+        -----------
+        source : str
+            The name of the table or view the objects are
+            stored in.
+        oids : UUID | str
+            The unique identifiers of the objects.
+        """
+        for oid in oids:
+            self._count('invalidations')
+            self.backend.delete(self._key(source, oid))
+
+    @typechecked
+    def set(
+        self, source: str, oid: UUID | str, state: str | None
+    ) -> None:
+        """
+        Caches the object_state data of an object, or the
+        absence of the object if the state is None.
+
+        Parameters:
+        -----------
+        source : str
+            The name of the table or view the object is
+            stored in.
+        oid : UUID | str
+            The unique identifier of the object.
+        state : str or None
+            The object_state JSON of the object, or None
+            if it does not exist.
+        """
+        ttl = self.ttl if state is not None else self.negative_ttl
+        if ttl > 0:
+            self.backend.set(self._key(source, oid), state, ttl)
+
+
+class QueryCache:
+    """
+    Provides a cache of the records returned by queries, keyed by the table (or other data source) they were queried from, the current version stamp of that table, and the normalized query. Bumping the version stamp of a table when any of its records change drops every cached result for it at once, with no need to track which queries a record appeared in.
+    """  # noqa: E501
+
+    @typechecked
+    def __init__(
+        self,
+        backend: CacheBackend,
+        *,
+        ttl: float = 10.0,
+        version_ttl: float = 86400.0,
+    ) -> None:
+        """
+        Parameters:
+        -----------
+        backend : CacheBackend
+            The back end that stores cached values and
+            version stamps.
+        ttl : float
+            The number of seconds that query results are
+            cached for.
+        version_ttl : float
+            The number of seconds that table version stamps
+            are kept for. A table whose stamp has expired
+            or been evicted gets a new one, so this only
+            needs to outlast the results cached under it.
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self.version_ttl = version_ttl
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'bumps': 0}
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Gets the hit, miss and version-bump counts of the
+        cache, and any counters kept by its back end.
+        """
+        with self._lock:
+            return dict(self._counters) | self.backend.stats
+
+    def _count(self, name: str) -> None:
+        """
+        Increments one of the cache's counters.
+
+        Parameters:
+        -----------
+        name : str
+            The name of the counter to increment.
+        """
+        with self._lock:
+            self._counters[name] += 1
+
+    def _key(self, source: str, query: str, version: str) -> str:
+        """
+        Returns the back end key for the results of a
+        query against a version of a table.
+
+        Parameters:
+        -----------
+        source : str
+            The name of the table or view queried.
+        query : str
+            The normalized query.
+        version : str
+            The version stamp of the table.
+        """
+        digest = hashlib.sha256(query.encode('utf-8')).hexdigest()
+        return f'query:{source}:{version}:{digest}'
+
+    @typechecked
+    def bump(self, source: str) -> None:
+        """
+        Gives a table a new version stamp, so that none of
+        the results cached for its previous version are
+        returned again.
+
+        Parameters:
+        -----------
+        source : str
+            The name of the table or view that changed.
+        """
+        self._count('bumps')
+        self.backend.set(
+            f'version:{source}', uuid4().hex, self.version_ttl
+        )
+
+    @typechecked
+    def etag(self, query: str, *sources: str) -> str | None:
+        """
+        Returns a weak ETag for the results of a query
+        against the current versions of one or more tables,
+        which can be compared to a request's If-None-Match
+        header before the query is executed, and which
+        changes whenever any of the tables is bumped. A
+        table written by another process is only bumped in
+        this process if the back end is SHARED, so None is
+        returned for any other back end, and the ETag has to
+        be computed from the results instead.
+
+        Parameters:
+        -----------
+        query : str
+            The normalized query.
+        sources : str
+            The names of the tables or views that the
+            results are read from.
+        """
+        if not self.backend.SHARED:
+            return None
+        digest = hashlib.blake2b(
+            '\n'.join(
+                [query] + [self.version(source) for source in sources]
+            ).encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+        return f'W/"{digest}"'
+
+    @typechecked
+    def get(
+        self, source: str, query: str
+    ) -> tuple[bool, str | None, str]:
+        """
+        Returns a tuple of whether the cache has results
+        for a query against the current version of a
+        table, those results, and the version stamp they
+        were looked up with. Results read from the table
+        after a miss should be cached with that version,
+        so that they are not cached as current if the table
+        changes while they are being read.
+
+        Parameters:
+        -----------
+        source : str
+            The name of the table or view queried.
+        query : str
+            The normalized query.
+        """
+        version = self.version(source)
+        found, results = self.backend.get(
+            self._key(source, query, version)
+        )
+        self._count('hits' if found else 'misses')
+        logger.debug(
+            f'Query cache {"hit" if found else "miss"} '
+            f'for {source}'
+        )
+        return (found, results, version)
+
+    @typechecked
+    def set(
+        self,
+        source: str,
+        query: str,
+        results: str,
+        version: str | None = None,
+    ) -> None:
+        """
+        Caches the results of a query against a version of
+        a table.
+
+        Parameters:
+        -----------
+        source : str
+            The name of the table or view queried.
+        query : str
+            The normalized query.
+        results : str
+            The serialized results of the query.
+        version : optional str
+            The version stamp returned by the get call that
+            missed, before the results were read; the
+            table's current version if it is not provided.
+        """
+        version = version or self.version(source)
+        self.backend.set(
+            self._key(source, query, version), results, self.ttl
+        )
+
+    @typechecked
+    def version(self, source: str) -> str:
+        """
+        Returns the current version stamp of a table,
+        creating one if it does not have one.
+
+        Parameters:
+        -----------
+        source : str
+            The name of the table or view.
+        """
+        found, version = self.backend.get(f'version:{source}')
+        if not found or version is None:
+            version = uuid4().hex
+            self.backend.set(
+                f'version:{source}', version, self.version_ttl
+            )
+        return version
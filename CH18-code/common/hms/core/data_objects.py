@@ -8,23 +8,35 @@ from __future__ import annotations
 
 # Built-In Imports
 import abc
+import base64
 import itertools
 import json
 import os
+import threading
+import types
 
-from datetime import datetime
-from functools import cache
+from collections import deque
+from contextlib import contextmanager
+from datetime import date, datetime
+from decimal import Decimal
+from functools import cache, lru_cache, partial
 from random import shuffle
-from typing import Any, ClassVar, Self
+from time import monotonic, sleep
+from typing import Any, Callable, ClassVar, Iterable, Iterator, \
+    Self, Union, get_args, get_origin
 from uuid import UUID, uuid4
 
 # Third-Party Imports
 import pymysql
 
-from pydantic import BaseModel, Field, PydanticUserError
-from typeguard import typechecked
+from pydantic import BaseModel, Field, PydanticUserError, \
+    TypeAdapter, ValidationError
+from pydantic_core import to_jsonable_python
 
 # Path Manipulations (avoid these!) and "Local" Imports
+from hms.core.caching import ObjectCache, QueryCache, \
+    get_env_object_cache, get_env_query_cache
+from hms.core.typechecks import typechecked
 from hms.environment import get_env_vars
 from logger import logger
 
@@ -36,11 +48,43 @@ SQL_OPERATORS = {
     '_gte': ' >= %s',
     '_lt': ' < %s',
     '_lte': ' <= %s',
-    '_like':  'LIKE %s',
+    '_like': ' LIKE %s',
+    '_startswith': ' LIKE %s',
     '_in': ' IN %s',
 }
 
+# Default connection-pool settings, any of which can be
+# overridden by an environment variable of the same name
+POOL_DEFAULTS = {
+    'MYSQL_POOL_SIZE': 5,
+    'MYSQL_POOL_MAX_OVERFLOW': 5,
+    'MYSQL_POOL_TIMEOUT': 30.0,
+    'MYSQL_POOL_MAX_IDLE': 300.0,
+    'MYSQL_POOL_MAX_LIFETIME': 3600.0,
+}
+
+# Converters from the JSON values of fields of these types
+# back to the types themselves, used by construct_trusted
+TRUSTED_CONVERTERS = {
+    UUID: UUID,
+    date: date.fromisoformat,
+    datetime: datetime.fromisoformat,
+    Decimal: Decimal,
+    float: float,
+}
+
+# The UnitOfWork, if any, that the database statements made
+# by the current thread are executed in
+_UNIT_OF_WORK = threading.local()
+
+
 # Module Custom Exceptions
+class PoolTimeoutError(Exception):
+    """
+    An exception to be raised if a ConnectionPool could
+    not provide a connection within its timeout period.
+    """
+    ...
 
 
 # Module Functions
@@ -63,91 +107,145 @@ def build_where_clause(
         The names of the criteria fields allowed in a
         query, typically provided by the calling object's
         CRITERIA_FIELDS class attribute.
+
+    Notes:
+    ------
+    The SQL for any given "shape" of criteria (their
+    names, and the number of any "_in" values) is always
+    the same, so it is generated once, by the memoized
+    _build_where_template function, and only the
+    parameters are gathered from the criteria values
+    on each call.
     """
     # If there are no criteria supplied, we can just
     # return something empty, exiting early.
     if not criteria:
         return ('', tuple())
 
-    # Otherwise, we need to generate the WHERE clause
-    # and the related parameters
-    # - Get the relevant criteria key/value pairs
-    actual_criteria = {
-        key: value for key, value in criteria.items()
-        if key in criteria_fields
-        or any(
-            [
-                key.endswith(op_name)
-                for op_name in SQL_OPERATORS
-                if op_name
-            ]
+    # "IN" values have to be broken out as individual
+    # values for parameterized query usage, so make sure
+    # that they are lists or tuples
+    for key, value in criteria.items():
+        if key.endswith('_in') and key not in criteria_fields:
+            assert isinstance(value, (list, tuple)), (
+                '"_in" criteria must be supplied as a list '
+                f'or tuple, but {value} is a '
+                f'{type(value).__name__}.'
+            )
+
+    # Get the SQL and the plan for gathering parameters
+    # for the shape of the criteria
+    criteria_shape = tuple(
+        (
+            key,
+            len(value) if key.endswith('_in')
+            and isinstance(value, (list, tuple)) else None
         )
-    }
-    # - Build the clause and parameters, starting with
-    # an empty list of the values that they'll eventually
-    # contain
-    where = []
+        for key, value in criteria.items()
+    )
+    where, parameter_plan = _build_where_template(
+        criteria_shape, tuple(criteria_fields)
+    )
+
+    # Gather the parameters from the criteria values
     parameters = []
+    for key, kind in parameter_plan:
+        value = criteria[key]
+        if kind == 'values':
+            parameters += list(value)
+        elif kind == 'prefix':
+            # Prefix matches escape any LIKE wildcards in
+            # the value, so that they can use an index on
+            # the field
+            parameters.append(
+                str(value)
+                .replace('\\', '\\\\')
+                .replace('%', '\\%')
+                .replace('_', '\\_')
+                + '%'
+            )
+        else:
+            parameters.append(value)
+
+    # - Finalize the values and return them
+    if where and parameters:
+        return (where, tuple(parameters))
+    return ('', tuple())
+
+
+@lru_cache(maxsize=1024)
+@typechecked
+def _build_where_template(
+    criteria_shape: tuple[tuple[str, int | None], ...],
+    criteria_fields: tuple[str, ...],
+) -> tuple[str, tuple[tuple[str, str], ...]]:
+    """
+    Builds and returns the SQL `WHERE` clause for a shape
+    of criteria, and the plan for gathering its parameter
+    values from the criteria: a tuple of the criteria
+    names and the kind of parameter each provides
+    ("value", "values" for "_in" criteria, or "prefix" for
+    "_startswith" criteria).
 
-    # Iterate over the actual criteria items...
-    for field, value in actual_criteria.items():
+    Parameters:
+    -----------
+    criteria_shape : tuple
+        The names of the criteria, each paired with the
+        number of values in the criteria value for "_in"
+        criteria, or None.
+    criteria_fields : tuple[str]
+        The names of the criteria fields allowed in a
+        query, typically provided by the calling object's
+        CRITERIA_FIELDS class attribute.
+    """
+    where = []
+    parameter_plan = []
+
+    # Iterate over the criteria names...
+    for field, value_count in criteria_shape:
         if field in criteria_fields:
             # If it's not suffixed, just add it
             where.append(f'{field} = %s')
-            parameters.append(value)
-        else:
-            # Otherwise, handle it based on the operator
-            # that is specified for the field
-            for op_key, op_value in SQL_OPERATORS.items():
-                if field.endswith(op_key):
-                    # Use the non-suffixed field-name
-                    field_name = field[0:-len(op_key)]
-                    # "IN" values have to be broken out as
-                    # individual values for parameterized
-                    # query usage.
-                    if op_key == '_in':
-                        # Make sure the value is a list
-                        # or tuple
-                        assert isinstance(
-                            value, (list, tuple)
-                        ), (
-                            '"_in" criteria must be '
-                            'supplied as a list or '
-                            f'tuple, but {value} is a '
-                            f'{type(value).__name__}.'
-                        )
-                        # Generate the placeholders for
-                        # the WHERE clause
-                        placeholder_list = ', '.join(
-                            ['%s'] * len(value)
-                        )
-                        where.append(
-                            f'{field_name} IN '
-                            f'({placeholder_list})'
-                        )
-                        # Append the value-items to the
-                        # parameters
-                        parameters += list(value)
-                    else:
-                        # All the other operations can use
-                        # the simple placeholder values in
-                        # the global SQL_OPERATORS
-                        where.append(
-                            f'{field_name}{op_value}'
+            parameter_plan.append((field, 'value'))
+            continue
+        # Otherwise, handle it based on the operator that
+        # is specified for the field, if any
+        for op_key, op_value in SQL_OPERATORS.items():
+            if field.endswith(op_key):
+                # Use the non-suffixed field-name
+                field_name = field[0:-len(op_key)]
+                if op_key == '_in':
+                    # Generate the placeholders for the
+                    # individual values
+                    placeholder_list = ', '.join(
+                        ['%s'] * (value_count or 0)
+                    )
+                    where.append(
+                        f'{field_name} IN '
+                        f'({placeholder_list})'
+                    )
+                    parameter_plan.append((field, 'values'))
+                else:
+                    # All the other operations can use the
+                    # simple placeholder values in the
+                    # global SQL_OPERATORS
+                    where.append(f'{field_name}{op_value}')
+                    parameter_plan.append(
+                        (
+                            field,
+                            'prefix' if op_key == '_startswith'
+                            else 'value'
                         )
-                        parameters.append(value)
-                    break
-                # TODO: Consider raising an error here
-                # for unsupported operations?
+                    )
+                break
+            # TODO: Consider raising an error here
+            # for unsupported operations?
 
-    # - Finalize the values and return them
-    if where and parameters:
-        where = 'WHERE ' + ' AND '.join(where)
-        parameters = tuple(parameters)
-    else:
-        where = ''
-        parameters = tuple()
-    return (where, parameters)
+    if not where:
+        return ('', tuple())
+    return (
+        'WHERE ' + ' AND '.join(where), tuple(parameter_plan)
+    )
 
 
 @typechecked
@@ -201,28 +299,443 @@ def build_order_by_clause(
     # specified
     if not criteria:
         return ''
-    # Extract the sort fields and their values
-    sort_fields = {
-        key[5:]: value for key, value in criteria.items()
+    # Extract the sort fields and their values, and get
+    # the (memoized) clause for them
+    sort_shape = tuple(
+        (key[5:], value) for key, value in criteria.items()
         if key.startswith('sort_')
-        and key[5:] in criteria_fields
-    }
+    )
+    if not sort_shape:
+        return ''
+    return _build_order_by_template(
+        sort_shape, tuple(criteria_fields)
+    )
+
+
+@lru_cache(maxsize=1024)
+@typechecked
+def _build_order_by_template(
+    sort_shape: tuple[tuple[str, str], ...],
+    criteria_fields: tuple[str, ...],
+) -> str:
+    """
+    Builds and returns a SQL `ORDER BY` clause for the
+    sort fields and directions provided.
+
+    Parameters:
+    -----------
+    sort_shape : tuple
+        The names of the fields to sort by, each paired
+        with the sort direction ("asc" or "desc").
+    criteria_fields : tuple[str]
+        The names of the sort fields allowed in a query,
+        typically provided by the calling object's
+        CRITERIA_FIELDS class attribute.
+    """
     sort_phrases = [
         f'{key} {v if v.lower() == "desc" else ""}'
-        .strip() for key, v in sort_fields.items()
+        .strip() for key, v in dict(sort_shape).items()
+        if key in criteria_fields
     ]
     if sort_phrases:
         return f'ORDER BY {", ".join(sort_phrases)}'
     return ''
 
 
+@typechecked
+def build_page_token(
+    sort_field: str, direction: str, row: dict[str, Any]
+) -> str:
+    """
+    Creates and returns an opaque continuation token that
+    identifies the position of a record in a keyset-
+    paginated result set, intended to be used by the
+    BaseDataObject.get class method to retrieve the page
+    of records after that record.
+
+    Parameters:
+    -----------
+    sort_field : str
+        The name of the field the results are sorted by,
+        as returned by get_keyset_sort.
+    direction : str ("asc" or "desc")
+        The direction of that sort.
+    row : dict
+        The record (as returned by the database) that
+        the next page of results should start after.
+    """
+    token_data = json.dumps(
+        [sort_field, direction, row[sort_field], row['oid']],
+        default=str
+    )
+    return base64.urlsafe_b64encode(
+        token_data.encode('utf-8')
+    ).decode('ascii').rstrip('=')
+
+
+@typechecked
+def build_seek_clause(
+    sort_field: str, direction: str, page_token: str
+) -> tuple[str, tuple[Any, ...]]:
+    """
+    Builds and returns a SQL predicate and its parameters
+    that select the records after the position encoded in
+    a continuation token created by build_page_token.
+
+    Parameters:
+    -----------
+    sort_field : str
+        The name of the field the results are sorted by,
+        as returned by get_keyset_sort.
+    direction : str ("asc" or "desc")
+        The direction of that sort.
+    page_token : str
+        The continuation token of the last record in the
+        previous page of results.
+
+    Raises:
+    -------
+    ValueError
+        If the page_token cannot be decoded, or was not
+        created for the same sort_field and direction.
+    """
+    try:
+        padding = '=' * (-len(page_token) % 4)
+        token_field, token_direction, value, oid = \
+            json.loads(
+                base64.urlsafe_b64decode(page_token + padding)
+            )
+    except Exception as error:
+        raise ValueError(
+            f'"{page_token}" is not a valid page token'
+        ) from error
+    if (token_field, token_direction) != (sort_field, direction):
+        raise ValueError(
+            f'Page token "{page_token}" was created for '
+            f'results sorted by {token_field} '
+            f'{token_direction}, not {sort_field} {direction}'
+        )
+    if value is None:
+        raise ValueError(
+            'Keyset pagination cannot continue from a '
+            f'record with a null {sort_field} value'
+        )
+    operator = '<' if direction == 'desc' else '>'
+    if sort_field == 'oid':
+        return (f'oid {operator} %s', (oid,))
+    return (
+        f'({sort_field} {operator} %s OR '
+        f'({sort_field} = %s AND oid {operator} %s))',
+        (value, value, oid)
+    )
+
+
+@typechecked
+def build_select_list(
+    fields: list[str] | tuple[str, ...],
+    criteria_fields: list[str, ...] | tuple[str, ...],
+) -> str:
+    """
+    Builds and returns the column-list of a SQL `SELECT`
+    statement that retrieves only the named fields from
+    the object_state JSON of each record, as a smaller
+    object_state JSON object, along with the criteria
+    columns that queries filter, sort and paginate on.
+
+    Parameters:
+    -----------
+    fields : list or tuple of str
+        The names of the object_state fields to retrieve.
+    criteria_fields : list[str]
+        The names of the columns to retrieve, typically
+        provided by the calling object's CRITERIA_FIELDS
+        class attribute.
+
+    Raises:
+    -------
+    ValueError
+        If no fields are specified, or any field name is
+        not a valid identifier.
+    """
+    if not fields:
+        raise ValueError(
+            'build_select_list expects at least one field '
+            'name, but none were passed'
+        )
+    bad_fields = [
+        field for field in fields if not field.isidentifier()
+    ]
+    if bad_fields:
+        raise ValueError(
+            f'build_select_list received invalid field names '
+            f'{bad_fields}'
+        )
+    json_members = ', '.join(
+        f"'{field}', JSON_EXTRACT(object_state, '$.{field}')"
+        for field in dict.fromkeys(fields)
+    )
+    return ', '.join(
+        list(criteria_fields)
+        + [f'JSON_OBJECT({json_members}) AS object_state']
+    )
+
+
+@lru_cache(maxsize=256)
+@typechecked
+def build_write_sql(
+    template: str,
+    table_name: str | None,
+    field_names: tuple[str, ...]
+) -> str:
+    """
+    Builds and returns the SQL to write a record with the
+    named fields to a table, from a WRITE_TEMPLATE, with
+    placeholders for the field values followed by those
+    for the same values in its update clause. The SQL is
+    memoized, since it is the same for every object of a
+    class saved to the same table.
+
+    Parameters:
+    -----------
+    template : str
+        The template of the SQL, typically provided by the
+        calling object's WRITE_TEMPLATE class attribute.
+    table_name : str
+        The name of the table to write to.
+    field_names : tuple[str]
+        The names of the fields to write.
+    """
+    return template.format(
+        TABLE_NAME=table_name,
+        FIELD_NAMES=', '.join(field_names),
+        FIELD_VALUES=', '.join(['%s'] * len(field_names)),
+        UPDATE_NAMES_VALUES=', '.join(
+            f'{key} = %s' for key in field_names
+        ),
+    )
+
+
+# Not @typechecked: this is the hot path that trusted
+# hydration exists to speed up, and is called once for
+# every record, and every model nested in one
+def construct_trusted(
+    model_class: type[BaseModel],
+    data: dict[str, Any]
+) -> BaseModel:
+    """
+    Creates and returns an instance of a model class from
+    the JSON-compatible state data of one, as written by its
+    model_dump_json method, without validating it. Fields of
+    the types in TRUSTED_CONVERTERS, and nested models and
+    lists of them, are converted back to those types, while
+    all other field values are used as they are.
+
+    Parameters:
+    -----------
+    model_class : type[BaseModel]
+        The class of the model to create.
+    data : dict
+        The state data of the model, which is updated in
+        place with the converted values.
+
+    Notes:
+    ------
+    This should only be used for data known to have been
+    valid when it was written, like the object_state of
+    records written by BaseDataObject.save. Values of
+    fields with union types other than Optional ones, for
+    example an EmailStr | NameEmail, are left as their JSON
+    values, which is a str in that case.
+    """
+    for name, converter in _get_trusted_converters(model_class):
+        value = data.get(name)
+        if value is not None:
+            data[name] = converter(value)
+    return model_class.model_construct(**data)
+
+
+@cache
+@typechecked
+def _get_trusted_converters(
+    model_class: type[BaseModel]
+) -> tuple[tuple[str, Callable], ...]:
+    """
+    Builds and returns the names and converters of the
+    fields of a model class whose values construct_trusted
+    must convert, cached for each class.
+
+    Parameters:
+    -----------
+    model_class : type[BaseModel]
+        The model class to build the converters for.
+    """
+    def build_converter(annotation):
+        origin = get_origin(annotation)
+        if origin in (Union, types.UnionType):
+            members = [
+                member for member in get_args(annotation)
+                if member is not type(None)
+            ]
+            # None values are never converted, so only
+            # Optional unions have a converter
+            if len(members) != 1:
+                return None
+            return build_converter(members[0])
+        if origin is list:
+            item_converter = build_converter(
+                get_args(annotation)[0]
+            )
+            if item_converter is None:
+                return None
+            return partial(_convert_items, item_converter)
+        if isinstance(annotation, type) \
+                and issubclass(annotation, BaseModel):
+            return partial(construct_trusted, annotation)
+        return TRUSTED_CONVERTERS.get(annotation)
+
+    converters = []
+    for name, field in model_class.model_fields.items():
+        converter = build_converter(field.annotation)
+        if converter is not None:
+            converters.append((name, converter))
+    return tuple(converters)
+
+
 @cache
 @typechecked
-def get_env_database_connector():
+def _get_field_adapter(
+    model_class: type[BaseModel],
+    name: str
+) -> TypeAdapter:
     """
-    Creates, caches and returns a MySQL connector object,
-    supporting cursors, suitable for making requests
-    against the database specified in the environment.
+    Builds and returns a TypeAdapter for the type of a
+    field of a model class, cached for each class and
+    field, that converts criteria values to that type.
+
+    Parameters:
+    -----------
+    model_class : type[BaseModel]
+        The model class that the field belongs to.
+    name : str
+        The name of the field.
+    """
+    return TypeAdapter(model_class.model_fields[name].annotation)
+
+
+def _convert_items(
+    converter: Callable,
+    values: list[Any]
+) -> list[Any]:
+    """
+    Converts and returns the items of a list field's value
+    for construct_trusted. Not @typechecked, for the same
+    reasons.
+
+    Parameters:
+    -----------
+    converter : Callable
+        The converter for each item.
+    values : list
+        The items to convert.
+    """
+    return [converter(value) for value in values]
+
+
+@typechecked
+def get_keyset_sort(
+    criteria: dict[str, Any],
+    criteria_fields: list[str, ...] | tuple[str, ...],
+) -> tuple[str, str]:
+    """
+    Returns the field name and direction ("asc" or "desc")
+    that keyset-paginated results will be sorted by: the
+    first sort_{field} criteria value for a field in the
+    criteria_fields, or the oid, ascending, if there isn't
+    one. Records are always sorted by oid after the sort
+    field, so that every record has a unique position.
+
+    Parameters:
+    -----------
+    criteria : dict
+        The criteria provided to a BaseDataObject.get
+        call that sort-order criteria will be extracted
+        from.
+    criteria_fields : list[str]
+        The names of the sort fields allowed in a query,
+        typically provided by the calling object's
+        CRITERIA_FIELDS class attribute.
+    """
+    for key, value in criteria.items():
+        if key.startswith('sort_') \
+                and key[5:] in criteria_fields:
+            direction = 'desc' if str(value).lower() == 'desc' \
+                else 'asc'
+            return (key[5:], direction)
+    return ('oid', 'asc')
+
+
+@contextmanager
+@typechecked
+def database_connector(*, commit: bool = False) -> Iterator[Any]:
+    """
+    Provides a connector to execute database statements with,
+    for the duration of a with block: the current UnitOfWork's,
+    if there is one, whose statements are committed when the
+    unit of work is, or one checked out from the connection
+    pool otherwise, which is checked back in when the block
+    exits.
+
+    Parameters:
+    -----------
+    commit : bool
+        Whether to commit the statements executed with a
+        connector checked out from the pool when the block
+        exits without an error. Ignored in a unit of work.
+    """
+    unit_of_work = UnitOfWork.current()
+    if unit_of_work is not None:
+        yield unit_of_work.connector
+        return
+    connector = get_env_database_connector()
+    try:
+        yield connector
+        if commit:
+            connector.commit()
+    finally:
+        connector.close()
+
+
+@typechecked
+def get_env_database_connector() -> PooledConnection:
+    """
+    Checks out and returns a MySQL connector object,
+    supporting cursors, from the connection pool for the
+    database specified in the environment.
+
+    Notes:
+    ------
+    The connector returned is on loan from the pool, and
+    must be returned to it when the caller is done with
+    it, either by calling its close method, or by using
+    it as a context manager:
+
+        with get_env_database_connector() as connector:
+            ...
+
+    See get_env_database_pool for the environment
+    variables that are used.
+    """
+    return get_env_database_pool().checkout()
+
+
+@cache
+@typechecked
+def get_env_database_pool() -> ConnectionPool:
+    """
+    Creates, caches and returns a ConnectionPool of MySQL
+    connector objects, supporting cursors, suitable for
+    making requests against the database specified in
+    the environment.
 
     Environment:
     ------------
@@ -241,12 +754,30 @@ def get_env_database_connector():
     MYSQL_DB : str
         The name of the database to connect to
         on the MySQL server.
+    MYSQL_POOL_SIZE : Optional int
+        The number of connections to keep open in the
+        pool once they have been created.
+    MYSQL_POOL_MAX_OVERFLOW : Optional int
+        The number of additional connections that can
+        be opened when all of the pooled ones are in
+        use. These are closed when they are returned.
+    MYSQL_POOL_TIMEOUT : Optional float
+        The number of seconds to wait for a connection
+        before raising a PoolTimeoutError.
+    MYSQL_POOL_MAX_IDLE : Optional float
+        The number of seconds that a connection can sit
+        unused in the pool before it is recycled.
+    MYSQL_POOL_MAX_LIFETIME : Optional float
+        The number of seconds after its creation that a
+        connection will be recycled.
 
     Notes:
     ------
     Environment variables can be set locally for
     development purposes, but will be managed in a
-    more secure fashion in production.
+    more secure fashion in production. The MYSQL_POOL_*
+    variables fall back to the values in POOL_DEFAULTS
+    if they are not set.
     """
     expected_env_vars = {
         'MYSQL_HOST', 'MYSQL_PORT', 'MYSQL_DB',
@@ -257,15 +788,27 @@ def get_env_database_connector():
     )
     if missing_env_vars:
         get_env_vars(*missing_env_vars)
-    connector = pymysql.connect(
-        host=os.environ['MYSQL_HOST'],
-        port=int(os.environ['MYSQL_PORT']),
-        user=os.environ['MYSQL_USER'],
-        password=os.environ['MYSQL_PASS'],
-        database=os.environ['MYSQL_DB'],
-        cursorclass=pymysql.cursors.DictCursor
+    pool_settings = {
+        name: type(default)(os.getenv(name, default))
+        for name, default in POOL_DEFAULTS.items()
+    }
+    logger.debug(f'pool_settings: {pool_settings}')
+    return ConnectionPool(
+        partial(
+            pymysql.connect,
+            host=os.environ['MYSQL_HOST'],
+            port=int(os.environ['MYSQL_PORT']),
+            user=os.environ['MYSQL_USER'],
+            password=os.environ['MYSQL_PASS'],
+            database=os.environ['MYSQL_DB'],
+            cursorclass=pymysql.cursors.DictCursor
+        ),
+        pool_size=pool_settings['MYSQL_POOL_SIZE'],
+        max_overflow=pool_settings['MYSQL_POOL_MAX_OVERFLOW'],
+        timeout=pool_settings['MYSQL_POOL_TIMEOUT'],
+        max_idle=pool_settings['MYSQL_POOL_MAX_IDLE'],
+        max_lifetime=pool_settings['MYSQL_POOL_MAX_LIFETIME'],
     )
-    return connector
 
 
 @typechecked
@@ -313,7 +856,9 @@ def get_examples(
             'have fields?'
         )
         examples = {
-            field_name: getattr(field, 'examples', [])
+            field_name: resolve_examples(
+                getattr(field, 'examples', None)
+            )
             for field_name, field in fields.items()
         }
         iterables = {
@@ -354,6 +899,56 @@ def get_examples(
         results = [results]
     return results
 
+
+@typechecked
+def lazy_examples(factory: Callable[[], list]) -> dict[str, Any]:
+    """
+    Returns the examples and json_schema_extra arguments for
+    a pydantic Field whose examples are costly to create, for
+    example with get_examples, so that they are created the
+    first time they are needed, by get_examples or to generate
+    a JSON schema, rather than when the class is defined.
+
+    Parameters:
+    -----------
+    factory : Callable
+        A function, called with no arguments, that creates
+        and returns the list of examples.
+
+    Example:
+    --------
+        products: list[Product] = Field(
+            title='Products',
+            **lazy_examples(
+                lambda: [[], get_examples(Product, max_items=2)]
+            )
+        )
+    """
+    examples = LazyExamples(factory)
+    return {
+        'examples': examples,
+        'json_schema_extra': examples.update_schema,
+    }
+
+
+@typechecked
+def resolve_examples(examples: list | None) -> list:
+    """
+    Returns the examples of a pydantic Field, creating them
+    first if they are LazyExamples that have not been created
+    yet, or an empty list if the field has no examples.
+
+    Parameters:
+    -----------
+    examples : list or None
+        The examples of the field.
+    """
+    if examples is None:
+        return []
+    if isinstance(examples, LazyExamples):
+        examples.resolve()
+    return examples
+
 # Module Metaclasses
 
 
@@ -368,11 +963,48 @@ class BaseDataObject(metaclass=abc.ABCMeta):
         'oid', 'is_active', 'is_deleted',
         'created', 'modified'
     ]
+    # CRITERIA_FIELDS that the database generates from the
+    # object_state, which are queried but never written
+    GENERATED_FIELDS: ClassVar[list[str]] = []
+    # Related objects that get can load with its include
+    # argument: the name of the field they are attached to,
+    # mapped to their class and the name of the field in
+    # that class that refers to the oid of this one
+    RELATIONS: ClassVar[
+        dict[str, tuple[type[BaseDataObject], str]]
+    ] = {}
+    # The cache that single-object reads are served from,
+    # if not the one configured by the environment (see
+    # hms.core.caching.get_env_object_cache)
+    OBJECT_CACHE: ClassVar[ObjectCache | None] = None
+    # The cache that the results of other reads are served
+    # from, if not the one configured by the environment
+    # (see hms.core.caching.get_env_query_cache)
+    QUERY_CACHE: ClassVar[QueryCache | None] = None
+    # The templates used by archive_deleted to select, copy
+    # and remove deleted records, in batches. The archive
+    # table has the same columns as the table it archives,
+    # and an archived column that defaults to the time that
+    # the records were archived.
+    ARCHIVE_SELECT_TEMPLATE: ClassVar[str] = (
+        'SELECT oid FROM {TABLE_NAME} '
+        'WHERE is_deleted = 1 AND created < %s '
+        'AND (modified IS NULL OR modified < %s) '
+        'LIMIT %s FOR UPDATE;'
+    )
+    ARCHIVE_COPY_TEMPLATE: ClassVar[str] = (
+        'INSERT INTO {ARCHIVE_NAME} ({FIELD_NAMES}) '
+        'SELECT {FIELD_NAMES} FROM {TABLE_NAME} '
+        'WHERE oid IN %s;'
+    )
+    ARCHIVE_DELETE_TEMPLATE: ClassVar[str] = (
+        'DELETE FROM {TABLE_NAME} WHERE oid IN %s;'
+    )
     DELETE_TEMPLATE: ClassVar[str] = (
         'DELETE FROM {TABLE_NAME} {WHERE};'
     )
     GET_TEMPLATE: ClassVar[str] = (
-        'SELECT * FROM {TABLE_NAME} '
+        'SELECT {FIELDS} FROM {TABLE_NAME} '
         '{WHERE} {ORDER_BY} {LIMIT};'
     )
     WRITE_TEMPLATE: ClassVar[str] = (
@@ -381,6 +1013,12 @@ class BaseDataObject(metaclass=abc.ABCMeta):
         'ON DUPLICATE KEY UPDATE '
         '{UPDATE_NAMES_VALUES};'
     )
+    WRITE_MANY_TEMPLATE: ClassVar[str] = (
+        'INSERT INTO {TABLE_NAME} '
+        '({FIELD_NAMES}) VALUES {ROWS} '
+        'ON DUPLICATE KEY UPDATE '
+        '{UPDATE_NAMES_VALUES};'
+    )
 
     oid: UUID = Field(
         title='Object ID',
@@ -445,49 +1083,309 @@ class BaseDataObject(metaclass=abc.ABCMeta):
             The name of an alternative table to execute
             the query against during the save.
         """
+        field_data = self._get_field_data()
+        final_sql = build_write_sql(
+            self.WRITE_TEMPLATE,
+            db_source_name or self.__class__.TABLE_NAME,
+            tuple(field_data)
+        )
+        field_values = list(field_data.values())
+        parameters = tuple(field_values + field_values)
+
+        # Get a connector, create a cursor and execute the
+        # query (with parameters if any are supplied). The
+        # connector commits and is returned to the pool, or
+        # belongs to the current UnitOfWork, which commits
+        with database_connector(commit=True) as connector:
+            with connector.cursor() as cursor:
+                if parameters:
+                    cursor.execute(final_sql, parameters)
+                else:
+                    cursor.execute(final_sql)
+        self._invalidate_cached(db_source_name, self.oid)
+
+    @classmethod
+    @typechecked
+    def save_many(
+        cls,
+        objects: Iterable[BaseDataObject],
+        *,
+        batch_size: int = 500,
+        db_source_name: str | None = None
+    ) -> list[dict[str, int | float]]:
+        """
+        Saves the state data of many instances of the class
+        to the back end data store, writing them in batches
+        of multi-row INSERT ... ON DUPLICATE KEY UPDATE
+        statements, with one commit per batch.
+
+        Parameters:
+        -----------
+        objects : iterable of <cls> instances
+            The objects to save. May be any iterable,
+            including a generator, and is only consumed
+            one batch at a time.
+        batch_size : int
+            The maximum number of objects to write in a
+            single statement and transaction.
+        db_source_name : Optional str
+            The name of an alternative table to execute
+            the queries against during the save.
+
+        Returns:
+        --------
+        A list of dicts, one per batch written, with the
+        number of rows in the batch and the time it took
+        to write and commit, in seconds.
+
+        Raises:
+        -------
+        TypeError
+            If any of the objects is not an instance of
+            the class.
+
+        Notes:
+        ------
+        Each batch is committed as it is written, so if an
+        error is raised, the batches before the one that
+        was being written will have been saved, unless
+        save_many is called in a UnitOfWork, which commits
+        all of them, or none, when it exits. Overrides of
+        save in derived classes (for example, saving
+        Product metadata) are not applied.
+        """
+        assert batch_size > 0, \
+            f'{cls.__name__}.save_many expects a positive ' \
+            f'batch_size value, but {batch_size} was passed.'
+        table_name = db_source_name or cls.TABLE_NAME
+        objects = iter(objects)
+        timings = []
+        in_unit_of_work = UnitOfWork.current() is not None
+        with database_connector() as connector:
+            while batch := list(
+                itertools.islice(objects, batch_size)
+            ):
+                started = monotonic()
+                rows = []
+                parameters = []
+                for item in batch:
+                    if not isinstance(item, cls):
+                        raise TypeError(
+                            f'{cls.__name__}.save_many can only '
+                            f'save {cls.__name__} objects, but '
+                            f'was passed {item} '
+                            f'({type(item).__name__}).'
+                        )
+                    field_data = item._get_field_data()
+                    rows.append(
+                        '(' + ', '.join(['%s'] * len(field_data))
+                        + ')'
+                    )
+                    parameters += field_data.values()
+                final_sql = cls.WRITE_MANY_TEMPLATE.format(
+                    TABLE_NAME=table_name,
+                    FIELD_NAMES=', '.join(field_data),
+                    ROWS=', '.join(rows),
+                    UPDATE_NAMES_VALUES=', '.join(
+                        f'{key} = VALUES({key})'
+                        for key in field_data
+                    ),
+                )
+                with connector.cursor() as cursor:
+                    cursor.execute(final_sql, tuple(parameters))
+                if not in_unit_of_work:
+                    connector.commit()
+                cls._invalidate_cached(
+                    table_name, *(item.oid for item in batch)
+                )
+                timings.append(
+                    {
+                        'batch': len(timings),
+                        'rows': len(batch),
+                        'seconds': monotonic() - started,
+                    }
+                )
+                logger.info(
+                    f'{cls.__name__}.save_many wrote batch '
+                    f'{len(timings) - 1} ({len(batch)} rows) '
+                    f'in {timings[-1]["seconds"]:.4f}s'
+                )
+        return timings
+
+    @classmethod
+    @typechecked
+    def archive_deleted(
+        cls,
+        older_than: datetime,
+        *,
+        batch_size: int = 500,
+        throttle: float = 1.0,
+        time_limit: float | None = None,
+        on_batch: Callable[[list[str]], Any] | None = None,
+        db_source_name: str | None = None
+    ) -> list[dict[str, int | float]]:
+        """
+        Moves the records of the class that have been marked
+        as deleted, and not modified since a cutoff, to the
+        archive table of the class' table (<TABLE_NAME>_Archive),
+        in batches, each of which is copied and removed in a
+        single transaction, pausing between them.
+
+        Parameters:
+        -----------
+        older_than : datetime
+            The (UTC) cutoff: records last modified, or
+            created if they were never modified, after it
+            are left in place.
+        batch_size : int
+            The maximum number of records to archive in a
+            single transaction, which bounds how long its
+            locks are held.
+        throttle : float
+            How long to pause after each batch, as a multiple
+            of how long the batch took, so that replicas have
+            time to apply it before the next one. At 1.0, the
+            archiver writes for no more than half of the time.
+        time_limit : Optional float
+            The number of seconds after which no new batch is
+            started, for callers (a Lambda Function, for
+            example) that have to stop in time.
+        on_batch : Optional callable
+            A function called with the oids of each batch,
+            inside its transaction, before it is committed,
+            to clean up anything else that belongs to the
+            records (their files, for example). If it raises
+            an error, the batch is rolled back.
+        db_source_name : Optional str
+            The name of an alternative table to archive the
+            records of.
+
+        Returns:
+        --------
+        A list of dicts, one per batch archived, with the
+        number of records in the batch, the time it took
+        to archive, and the time paused after it, in
+        seconds.
+
+        Raises:
+        -------
+        RuntimeError
+            If it is called in a UnitOfWork, which would make
+            all of the batches a single transaction.
+        """
+        assert batch_size > 0, \
+            f'{cls.__name__}.archive_deleted expects a ' \
+            f'positive batch_size value, but {batch_size} ' \
+            'was passed.'
+        assert throttle >= 0, \
+            f'{cls.__name__}.archive_deleted expects a ' \
+            f'throttle value of zero or more, but {throttle} ' \
+            'was passed.'
+        if UnitOfWork.current() is not None:
+            raise RuntimeError(
+                f'{cls.__name__}.archive_deleted commits each '
+                'batch that it archives, and cannot be called '
+                'in a UnitOfWork.'
+            )
+        table_name = db_source_name or cls.TABLE_NAME
+        names = dict(
+            TABLE_NAME=table_name,
+            ARCHIVE_NAME=f'{table_name}_Archive',
+            FIELD_NAMES=', '.join(
+                [
+                    name for name in cls.CRITERIA_FIELDS
+                    if name not in cls.GENERATED_FIELDS
+                ] + ['object_state']
+            ),
+        )
+        select_sql = cls.ARCHIVE_SELECT_TEMPLATE.format(**names)
+        copy_sql = cls.ARCHIVE_COPY_TEMPLATE.format(**names)
+        delete_sql = cls.ARCHIVE_DELETE_TEMPLATE.format(**names)
+        deadline = None if time_limit is None \
+            else monotonic() + time_limit
+        timings = []
+        while deadline is None or monotonic() < deadline:
+            started = monotonic()
+            with UnitOfWork() as unit_of_work:
+                with unit_of_work.connector.cursor() as cursor:
+                    cursor.execute(
+                        select_sql,
+                        (older_than, older_than, batch_size)
+                    )
+                    oids = [row['oid'] for row in cursor.fetchall()]
+                    if oids:
+                        cursor.execute(copy_sql, (oids,))
+                        cursor.execute(delete_sql, (oids,))
+                if oids:
+                    cls._archive_related(oids)
+                    if on_batch is not None:
+                        on_batch(oids)
+                    cls._invalidate_cached(db_source_name, *oids)
+            if not oids:
+                break
+            seconds = monotonic() - started
+            # A short batch means that there are no more
+            # records to archive, so there is no need to pause
+            finished = len(oids) < batch_size
+            paused = 0.0 if finished else seconds * throttle
+            timings.append(
+                {
+                    'batch': len(timings),
+                    'rows': len(oids),
+                    'seconds': seconds,
+                    'paused': paused,
+                }
+            )
+            logger.info(
+                f'{cls.__name__}.archive_deleted archived batch '
+                f'{len(timings) - 1} ({len(oids)} rows) in '
+                f'{seconds:.4f}s, pausing for {paused:.4f}s'
+            )
+            if finished:
+                break
+            sleep(paused)
+        return timings
+
+    @classmethod
+    def _archive_related(cls, oids: list[str]) -> None:
+        """
+        Archives anything else that belongs to the records
+        being archived by archive_deleted, in the same
+        transaction. Does nothing unless overridden by a
+        derived class whose records own other records.
+
+        Parameters:
+        -----------
+        oids : list[str]
+            The oids of the records being archived.
+        """
+        pass
+
+    def _get_field_data(self) -> dict[str, Any]:
+        """
+        Returns the field names and values to be written
+        to the back end data store for the instance: the
+        CRITERIA_FIELDS values that are not GENERATED_FIELDS,
+        and the JSON object_state.
+        """
         field_data = {
             key: value for key, value
             in self.model_dump(mode='json').items()
             if key in self.CRITERIA_FIELDS
+            and key not in self.GENERATED_FIELDS
         }
         field_data[
             'object_state'
         ] = self.model_dump_json()
-        field_names = []
-        field_placeholders = []
-        field_values = []
-        update_names = []
-        update_values = []
-        for key, value in field_data.items():
-            field_names.append(key)
-            field_values.append(value)
-            field_placeholders.append('%s')
-            update_names.append(f'{key} = %s')
-            update_values.append(value)
-        final_sql = self.WRITE_TEMPLATE.format(
-            TABLE_NAME=db_source_name
-            or self.__class__.TABLE_NAME,
-            FIELD_NAMES=', '.join(field_names),
-            FIELD_VALUES=', '.join(field_placeholders),
-            UPDATE_NAMES_VALUES=', '.join(update_names),
-        )
-        parameters = tuple(field_values + update_values)
-
-        # Get the connector, create a cursor, execute the
-        # query (with parameters if any are supplied)
-        connector = get_env_database_connector()
-        with connector.cursor() as cursor:
-            if parameters:
-                cursor.execute(final_sql, parameters)
-            else:
-                cursor.execute(final_sql)
-            connector.commit()
+        return field_data
 
     @classmethod
     @typechecked
     def from_record(
         cls,
-        data: dict[str, Any] | tuple[tuple[str, Any]]
+        data: dict[str, Any] | tuple[tuple[str, Any]],
+        *,
+        trusted: bool = False
     ) -> BaseModel:
         """
         Creates and returns an instance of the class from
@@ -502,7 +1400,14 @@ class BaseDataObject(metaclass=abc.ABCMeta):
             store. Expected to be either a dict of field
             names and values, or a tuple of key/value
             tuples that can be converted to such a dict
+        trusted : bool
+            Whether the data is known to be valid, having
+            been written by save, in which case the object
+            is created with construct_trusted, skipping
+            validation (default False).
         """
+        if trusted:
+            return construct_trusted(cls, dict(data))
         if isinstance(data, tuple):
             data = dict(data)
         return cls(**data)
@@ -515,12 +1420,18 @@ class BaseDataObject(metaclass=abc.ABCMeta):
         db_source_name: str | None = None,
         page_size: int | None = None,
         page_number: int | None = None,
+        page_token: str | None = None,
+        fields: Iterable[str] | None = None,
+        include: Iterable[str]
+        | dict[str, dict[str, Any]] | None = None,
+        trusted: bool = False,
         **criteria: Any
-    ) -> list[Self]:
+    ) -> list[Self] | list[dict[str, Any]]:
         """
         Queries the database for a collection of <cls>
         business objects, returning a list of those that
-        were retrieved.
+        were retrieved, or of records of the requested
+        fields of them.
 
         Parameters:
         -----------
@@ -536,6 +1447,42 @@ class BaseDataObject(metaclass=abc.ABCMeta):
             objects to return, as a "page" of results.
         page_number : optional int
             The number of the "page" of records to return.
+        page_token : optional str
+            Retrieves page_size records using keyset
+            pagination instead of page_number: an empty
+            string retrieves the first page, and the
+            next_token of the ResultList returned for one
+            page retrieves the next one. The results are
+            sorted by the field identified by get_keyset_
+            sort, then by oid, and the query seeks past
+            the previous page instead of scanning it, so
+            later pages are as cheap as the first.
+        fields : optional iterable of str
+            The names of the fields to retrieve. When
+            specified, only those fields are extracted
+            from each record's object_state by the
+            database, and the results are dicts of their
+            (JSON-compatible) values rather than <cls>
+            instances, avoiding the cost of transferring,
+            parsing and validating the full state of each
+            object when only a few fields are needed.
+        include : optional iterable of str, or dict
+            The names of RELATIONS of <cls> to load and
+            attach to each result, each of which is
+            retrieved with one query for all the results.
+            May also be a dict of those names and the
+            criteria to retrieve the related objects with,
+            for example:
+                include={'product_images': {'is_active': True}}
+        trusted : bool
+            Whether to create the objects retrieved, and
+            any related objects, without validating their
+            state data, which was validated when it was
+            saved, using construct_trusted (default False).
+            This is much faster for objects with costly
+            validation, like e-mail addresses, but should
+            only be used where the objects are read, not
+            modified and saved again.
         criteria : any
             The names and values to be used to generate
             the query, or (less ideally) to be used to
@@ -563,6 +1510,9 @@ class BaseDataObject(metaclass=abc.ABCMeta):
               comparison.
             - _like to use a LIKE (LIKE '%some value%')
               evaluation.
+            - _startswith to use a prefix LIKE (LIKE
+              'some value%') evaluation, which unlike
+              _like can use an index on the field.
             - _in to use a "membership" comparison with a
               list or tuple of specific values to match.
               For example:
@@ -574,12 +1524,61 @@ class BaseDataObject(metaclass=abc.ABCMeta):
         -------
         ValueError:
             If any oids value is not a UUID, or a string
-            representation of one.
+            representation of one, or if a page_token is
+            not valid for the requested sort, or if any
+            fields value is not a field of <cls>, or if
+            any include value is not one of its RELATIONS,
+            or is used with fields that omit the oid.
+        TypeError:
+            If page_number or page_token is specified
+            without a page_size, or both are specified.
         """
         # Build the WHERE clause from **criteria,
         # including any oids values specified
         logger.info(f'{cls.__name__}.get called')
         logger.debug(vars())
+        # Build the column list, projecting only the
+        # requested fields if any are specified
+        if fields is None:
+            select_list = '*'
+        else:
+            fields = tuple(fields)
+            unknown_fields = [
+                field for field in fields
+                if field not in cls.model_fields
+            ]
+            if unknown_fields:
+                raise ValueError(
+                    f'{cls.__name__}.get cannot retrieve '
+                    f'{unknown_fields}, which are not fields '
+                    f'of {cls.__name__}'
+                )
+            select_list = build_select_list(
+                fields, cls.CRITERIA_FIELDS
+            )
+        logger.debug(f'select_list: {select_list}')
+
+        # Make sure any relations to load are known, and
+        # that the results will have oids to relate them to
+        if include is not None:
+            if not isinstance(include, dict):
+                include = {name: {} for name in include}
+            unknown_relations = [
+                name for name in include
+                if name not in cls.RELATIONS
+            ]
+            if unknown_relations:
+                raise ValueError(
+                    f'{cls.__name__}.get cannot include '
+                    f'{unknown_relations}, which are not '
+                    f'relations of {cls.__name__}'
+                )
+            if fields is not None and 'oid' not in fields:
+                raise ValueError(
+                    f'{cls.__name__}.get requires "oid" in '
+                    'its fields to include related objects'
+                )
+
         if oids:
             try:
                 if len(oids) == 1:
@@ -601,6 +1600,35 @@ class BaseDataObject(metaclass=abc.ABCMeta):
                     'not be converted to a UUID'
                 ) from error
 
+        # Single-object reads with no more than simple
+        # criteria are served from the object cache, if
+        # there is one. They query by oid alone, so that
+        # the result can be cached whatever the criteria,
+        # and apply the criteria to the object afterwards.
+        # Reads in a UnitOfWork bypass the caches, since they
+        # can see writes that have not been committed yet
+        in_unit_of_work = UnitOfWork.current() is not None
+        object_cache = None if in_unit_of_work \
+            else cls._get_object_cache()
+        source = db_source_name or cls.TABLE_NAME
+        cache_filters = None
+        if object_cache is not None and source \
+                and len(oids) == 1 and fields is None \
+                and page_size is None and page_number is None \
+                and page_token is None and all(
+                    key in cls.CRITERIA_FIELDS
+                    and key not in cls.GENERATED_FIELDS
+                    for key in criteria
+                ):
+            cache_filters = {
+                key: value for key, value in criteria.items()
+                if key != 'oid'
+            }
+            criteria = {'oid': criteria['oid']}
+            cached, cached_state = object_cache.get(
+                source, criteria['oid']
+            )
+
         where, parameters = build_where_clause(
             criteria, cls.CRITERIA_FIELDS
         )
@@ -614,6 +1642,32 @@ class BaseDataObject(metaclass=abc.ABCMeta):
         logger.debug(f'order_by: {order_by or None}')
 
         # Build the LIMIT clause, if one is called for
+        if page_token is not None:
+            if page_size is None or page_number is not None:
+                raise TypeError(
+                    f'{cls.__name__}.get requires a page_size, '
+                    'and may not specify a page_number, with '
+                    'a page_token'
+                )
+            # Keyset pagination replaces the ORDER BY
+            # clause, and seeks past the previous page
+            # rather than using an offset
+            sort_field, direction = get_keyset_sort(
+                criteria, cls.CRITERIA_FIELDS
+            )
+            order_by = f'ORDER BY {sort_field} {direction}'
+            if sort_field != 'oid':
+                order_by += f', oid {direction}'
+            if page_token:
+                seek, seek_parameters = build_seek_clause(
+                    sort_field, direction, page_token
+                )
+                where = f'{where} AND {seek}' if where \
+                    else f'WHERE {seek}'
+                parameters += seek_parameters
+            logger.debug(f'keyset where: {where}')
+            logger.debug(f'keyset order_by: {order_by}')
+
         if page_size is not None:
             try:
                 limit = build_limit_clause(
@@ -633,38 +1687,237 @@ class BaseDataObject(metaclass=abc.ABCMeta):
 
         # Generate the final SQL to execute
         final_sql = cls.GET_TEMPLATE.format(
+            FIELDS=select_list,
             TABLE_NAME=db_source_name or cls.TABLE_NAME,
             WHERE=where, ORDER_BY=order_by,
             LIMIT=limit
-        )
+        ).strip()
 
-        # Get a connector, create a cursor, execute the
-        # query (with parameters if any are supplied)
-        connector = get_env_database_connector()
-        logger.debug(f'connector: {connector}')
-        final_sql = final_sql.strip()
-        logger.debug(f'final_sql: {final_sql}')
-        with connector.cursor() as cursor:
-            logger.debug(f'cursor: {cursor}')
-            if parameters:
-                logger.debug('Executing cursor.execute(final_sql, parameters)')
-                cursor.execute(final_sql, parameters)
-            else:
-                logger.debug('Executing cursor.execute(final_sql)')
-                cursor.execute(final_sql)
-            rows = cursor.fetchall()
-            logger.debug(f'rows: {rows}')
-            results = [
+        # Other reads are served from the query cache, if
+        # there is one, keyed by the final SQL and its
+        # parameters, which capture everything about them
+        query_cache = cls._get_query_cache() \
+            if cache_filters is None and source \
+            and not in_unit_of_work else None
+        if query_cache is not None:
+            query_key = json.dumps(
+                [final_sql, parameters], default=str
+            )
+            cached, cached_rows, query_version = query_cache.get(
+                source, query_key
+            )
+
+        if cache_filters is not None and cached:
+            rows = [] if cached_state is None \
+                else [{'object_state': cached_state}]
+        elif query_cache is not None and cached:
+            rows = json.loads(cached_rows)
+        else:
+            # Get a connector, create a cursor, execute the
+            # query (with parameters if any are supplied),
+            # then return the connector to the pool, unless
+            # it belongs to the current UnitOfWork
+            logger.debug(f'final_sql: {final_sql}')
+            with database_connector() as connector:
+                logger.debug(f'connector: {connector}')
+                with connector.cursor() as cursor:
+                    logger.debug(f'cursor: {cursor}')
+                    if parameters:
+                        logger.debug('Executing cursor.execute(final_sql, parameters)')
+                        cursor.execute(final_sql, parameters)
+                    else:
+                        logger.debug('Executing cursor.execute(final_sql)')
+                        cursor.execute(final_sql)
+                    rows = cursor.fetchall()
+                    logger.debug(f'rows: {rows}')
+                    cursor.nextset()
+            if cache_filters is not None:
+                object_cache.set(
+                    source, criteria['oid'],
+                    rows[0]['object_state'] if rows else None
+                )
+            elif query_cache is not None:
+                # Cached under the version the rows were read
+                # at, so a write in between drops them at once
+                query_cache.set(
+                    source, query_key,
+                    json.dumps(rows, default=str), query_version
+                )
+
+        if fields is None and trusted:
+            # Skip the from_record wrapper as well as
+            # validation for trusted records
+            results = ResultList(
+                construct_trusted(
+                    cls, json.loads(row['object_state'])
+                )
+                for row in rows
+            )
+        elif fields is None:
+            results = ResultList(
                 cls.from_record(
                     json.loads(row['object_state'])
                 )
                 for row in rows
-            ]
-            logger.debug(f'results: {results}')
-            cursor.nextset()
+            )
+        else:
+            results = ResultList(
+                json.loads(row['object_state'])
+                for row in rows
+            )
+        if page_token is not None and len(rows) == page_size:
+            results.next_token = build_page_token(
+                sort_field, direction, rows[-1]
+            )
+        if cache_filters:
+            # The criteria are converted to their fields' types
+            # before they are compared, as the database would
+            # convert them, so that is_active=1 matches True,
+            # and an upper-case oid matches its UUID. Criteria
+            # that are not valid for their fields match nothing
+            try:
+                expected = {
+                    key: _get_field_adapter(cls, key).dump_python(
+                        _get_field_adapter(cls, key)
+                        .validate_python(value),
+                        mode='json'
+                    )
+                    for key, value in cache_filters.items()
+                }
+            except ValidationError:
+                results = ResultList()
+            else:
+                results = ResultList(
+                    item for item in results
+                    if all(
+                        item.model_dump(mode='json')[key] == value
+                        for key, value in expected.items()
+                    )
+                )
+        if include and results:
+            cls._load_relations(results, include, trusted)
+        logger.debug(f'results: {results}')
 
         return results
 
+    @classmethod
+    def _get_object_cache(cls) -> ObjectCache | None:
+        """
+        Returns the ObjectCache that the class' objects
+        are cached in: its OBJECT_CACHE, if one is set, or
+        the one configured by the environment, if any.
+        """
+        if cls.OBJECT_CACHE is not None:
+            return cls.OBJECT_CACHE
+        return get_env_object_cache()
+
+    @classmethod
+    def _get_query_cache(cls) -> QueryCache | None:
+        """
+        Returns the QueryCache that the results of the
+        class' queries are cached in: its QUERY_CACHE, if
+        one is set, or the one configured by the
+        environment, if any.
+        """
+        if cls.QUERY_CACHE is not None:
+            return cls.QUERY_CACHE
+        return get_env_query_cache()
+
+    @classmethod
+    def _invalidate_cached(
+        cls, db_source_name: str | None, *oids: UUID | str
+    ) -> None:
+        """
+        Removes the objects identified by the oids from
+        the class' object cache, and bumps the version of
+        their table in its query cache, if it has them,
+        after they have been written or deleted.
+
+        Parameters:
+        -----------
+        db_source_name : str or None
+            The name of the table or view the objects
+            were written to or deleted from, or None for
+            the class' TABLE_NAME.
+        oids : UUID | str
+            The unique object identifiers of the objects.
+
+        Notes:
+        ------
+        In a UnitOfWork, the invalidation is deferred until
+        the unit of work commits, so that the previous state
+        of the objects cannot be cached again in between.
+        """
+        unit_of_work = UnitOfWork.current()
+        if unit_of_work is not None:
+            unit_of_work.on_commit(
+                partial(cls._invalidate_cached, db_source_name, *oids)
+            )
+            return
+        object_cache = cls._get_object_cache()
+        source = db_source_name or cls.TABLE_NAME
+        if object_cache is not None and source:
+            object_cache.invalidate(source, *oids)
+        query_cache = cls._get_query_cache()
+        if query_cache is not None and source:
+            query_cache.bump(source)
+
+    @classmethod
+    def _load_relations(
+        cls,
+        results: list[Self] | list[dict[str, Any]],
+        include: dict[str, dict[str, Any]],
+        trusted: bool = False,
+    ) -> None:
+        """
+        Retrieves the related objects of each of the named
+        RELATIONS for all of the results with a single get
+        call per relation, and attaches them to the result
+        they relate to.
+
+        Parameters:
+        -----------
+        results : list of <cls> instances, or of dicts
+            The results of a get call to load relations
+            for.
+        include : dict
+            The names of the relations to load, and the
+            criteria to retrieve their objects with.
+        trusted : bool
+            Whether to create the related objects without
+            validation, as described in get.
+        """
+        oids = [
+            str(item['oid']) if isinstance(item, dict)
+            else str(item.oid)
+            for item in results
+        ]
+        for name, relation_criteria in include.items():
+            related_class, key_field = cls.RELATIONS[name]
+            relation_criteria = dict(relation_criteria)
+            if len(oids) == 1:
+                relation_criteria[key_field] = oids[0]
+            else:
+                relation_criteria[f'{key_field}_in'] = oids
+            related_objects = related_class.get(
+                trusted=trusted, **relation_criteria
+            )
+            logger.debug(
+                f'{cls.__name__}.{name}: '
+                f'{len(related_objects)} related objects '
+                f'retrieved for {len(oids)} results'
+            )
+            related = {oid: [] for oid in oids}
+            for related_object in related_objects:
+                related[
+                    str(getattr(related_object, key_field))
+                ].append(related_object)
+            for oid, item in zip(oids, results):
+                if isinstance(item, dict):
+                    item[name] = related[oid]
+                else:
+                    setattr(item, name, related[oid])
+
     @classmethod
     @typechecked
     def delete(
@@ -703,18 +1956,462 @@ class BaseDataObject(metaclass=abc.ABCMeta):
             TABLE_NAME=db_source_name or cls.TABLE_NAME,
             WHERE=where
         )
-        # Get the connector, create a cursor, execute the
-        # query (with parameters if any are supplied)
-        connector = get_env_database_connector()
-        with connector.cursor() as cursor:
-            if parameters:
-                cursor.execute(final_sql, parameters)
-            else:
-                cursor.execute(final_sql)
-        connector.commit()
+        # Get a connector, create a cursor and execute the
+        # query (with parameters if any are supplied). The
+        # connector commits and is returned to the pool, or
+        # belongs to the current UnitOfWork, which commits
+        with database_connector(commit=True) as connector:
+            with connector.cursor() as cursor:
+                if parameters:
+                    cursor.execute(final_sql, parameters)
+                else:
+                    cursor.execute(final_sql)
+        cls._invalidate_cached(db_source_name, *oids)
 
 
 # Module Concrete Classes
+class ConnectionPool:
+    """
+    Provides a bounded, thread-safe pool of database connections that can be checked out and checked back in, with health checks on checkout and recycling of idle or long-lived connections.
+    """  # noqa: E501
+
+    @typechecked
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        *,
+        pool_size: int = 5,
+        max_overflow: int = 5,
+        timeout: float = 30.0,
+        max_idle: float = 300.0,
+        max_lifetime: float = 3600.0,
+    ) -> None:
+        """
+        Parameters:
+        -----------
+        connect : callable
+            A callable that creates and returns a new
+            DB-API connection when called with no
+            arguments.
+        pool_size : int
+            The number of connections to keep open in the
+            pool once they have been created.
+        max_overflow : int
+            The number of additional connections that can
+            be opened when all pool_size connections are
+            in use. These are closed when checked in.
+        timeout : float
+            The number of seconds that checkout will wait
+            for a connection to become available before
+            raising a PoolTimeoutError.
+        max_idle : float
+            The number of seconds that a connection can
+            sit unused in the pool before it is recycled.
+        max_lifetime : float
+            The number of seconds after its creation that
+            a connection will be recycled.
+        """
+        assert pool_size > 0, \
+            'ConnectionPool expects a positive pool_size ' \
+            f'value, but {pool_size} was passed.'
+        assert max_overflow >= 0, \
+            'ConnectionPool expects a non-negative ' \
+            f'max_overflow value, but {max_overflow} ' \
+            'was passed.'
+        self.connect = connect
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self._condition = threading.Condition()
+        # Idle connections, as (connection, created,
+        # last_used) tuples, most recently used last
+        self._idle = deque()
+        # Creation times and pool generations of checked-out
+        # connections, keyed by the id of the connection
+        self._created = {}
+        # Incremented by dispose, so that connections checked
+        # out before it are closed when checked back in
+        self._generation = 0
+        self._size = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._timeouts = 0
+        self._recycled = 0
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        """
+        Gets a snapshot of the pool's usage statistics:
+        size : The number of open connections
+        idle : The number of connections in the pool
+        in_use : The number of checked-out connections
+        overflow : The number of connections open beyond
+            the pool_size
+        checkouts : The total number of checkouts
+        waits : The number of checkouts that had to wait
+            for a connection to be checked in
+        wait_time : The total time, in seconds, spent
+            waiting for connections
+        timeouts : The number of checkouts that failed
+            with a PoolTimeoutError
+        recycled : The number of connections closed
+            because they were idle or open too long, or
+            failed a health check
+        """
+        with self._condition:
+            return {
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': self._size - len(self._idle),
+                'overflow': max(
+                    self._size - self.pool_size, 0
+                ),
+                'checkouts': self._checkouts,
+                'waits': self._waits,
+                'wait_time': self._wait_time,
+                'timeouts': self._timeouts,
+                'recycled': self._recycled,
+            }
+
+    def checkin(self, connection: Any) -> None:
+        """
+        Returns a connection to the pool, rolling back any
+        uncommitted work on it. Overflow connections, and
+        any connection that is closed, expired, or cannot
+        be rolled back, are closed instead.
+
+        Parameters:
+        -----------
+        connection : DB-API connection
+            The connection to return, which must have
+            been checked out from this pool.
+        """
+        with self._condition:
+            created, generation = self._created.pop(id(connection))
+        try:
+            reusable = bool(getattr(connection, 'open', True))
+            if reusable:
+                connection.rollback()
+        except Exception as error:
+            logger.debug(
+                'ConnectionPool.checkin could not reset '
+                f'{connection}: {error}'
+            )
+            reusable = False
+        now = monotonic()
+        expired = not reusable \
+            or now - created >= self.max_lifetime
+        with self._condition:
+            if not expired \
+                    and generation == self._generation \
+                    and len(self._idle) < self.pool_size:
+                self._idle.append((connection, created, now))
+                connection = None
+            else:
+                self._size -= 1
+                self._recycled += expired
+            self._condition.notify()
+        if connection is not None:
+            self._close(connection)
+
+    def checkout(self) -> PooledConnection:
+        """
+        Checks out a connection from the pool, reusing an
+        idle one if a healthy one is available, opening a
+        new one if the pool is not at capacity, or waiting
+        for one to be checked in otherwise.
+
+        Raises:
+        -------
+        PoolTimeoutError
+            If no connection became available within the
+            pool's timeout.
+        """
+        started = monotonic()
+        deadline = started + self.timeout
+        waited = False
+        while True:
+            with self._condition:
+                while not self._idle and self._size \
+                        >= self.pool_size + self.max_overflow:
+                    remaining = deadline - monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeoutError(
+                            'ConnectionPool could not provide '
+                            'a connection within '
+                            f'{self.timeout} seconds '
+                            f'({self._size} in use).'
+                        )
+                    waited = True
+                    self._condition.wait(remaining)
+                if self._idle:
+                    connection, created, last_used = \
+                        self._idle.pop()
+                else:
+                    # Reserve a slot for the new connection
+                    connection = None
+                    self._size += 1
+
+            # Health-check or create the connection outside
+            # the lock, since both require a round-trip
+            if connection is None:
+                try:
+                    connection = self.connect()
+                except Exception:
+                    with self._condition:
+                        self._size -= 1
+                        self._condition.notify()
+                    raise
+                created = monotonic()
+            else:
+                now = monotonic()
+                healthy = now - last_used < self.max_idle \
+                    and now - created < self.max_lifetime
+                if healthy:
+                    try:
+                        connection.ping(reconnect=False)
+                    except Exception as error:
+                        logger.debug(
+                            'ConnectionPool.checkout ping '
+                            f'failed for {connection}: {error}'
+                        )
+                        healthy = False
+                if not healthy:
+                    self._close(connection)
+                    with self._condition:
+                        self._size -= 1
+                        self._recycled += 1
+                    continue
+
+            with self._condition:
+                self._created[id(connection)] = (
+                    created, self._generation
+                )
+                self._checkouts += 1
+                if waited:
+                    self._waits += 1
+                    self._wait_time += monotonic() - started
+            return PooledConnection(self, connection)
+
+    def dispose(self) -> None:
+        """
+        Closes all the idle connections in the pool.
+        Checked-out connections are closed when they are
+        checked back in.
+        """
+        with self._condition:
+            self._generation += 1
+            idle = [item[0] for item in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._condition.notify_all()
+        for connection in idle:
+            self._close(connection)
+
+    @staticmethod
+    def _close(connection: Any) -> None:
+        """
+        Closes a connection, ignoring any errors raised by
+        one that has already been dropped.
+        """
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+class LazyExamples(list):
+    """
+    A list of the examples for a pydantic Field that is empty until it is resolved, when it is populated by calling the factory function it was created with. Created by lazy_examples.
+    """  # noqa: E501
+
+    @typechecked
+    def __init__(self, factory: Callable[[], list]):
+        """
+        Object initialization.
+
+        Parameters:
+        -----------
+        factory : Callable
+            A function, called with no arguments, that
+            creates and returns the list of examples.
+        """
+        super().__init__()
+        self.factory = factory
+        self.resolved = False
+
+    @typechecked
+    def resolve(self) -> LazyExamples:
+        """
+        Populates the examples, the first time it is called,
+        and returns them.
+        """
+        if not self.resolved:
+            self.extend(self.factory())
+            self.resolved = True
+        return self
+
+    @typechecked
+    def update_schema(self, schema: dict[str, Any]) -> None:
+        """
+        Adds the examples, resolving them if necessary, to the
+        JSON schema of the field they belong to. Called by
+        pydantic as the field's json_schema_extra, since the
+        examples may not have been resolved when the schema
+        was otherwise generated.
+
+        Parameters:
+        -----------
+        schema : dict
+            The JSON schema of the field.
+        """
+        schema['examples'] = to_jsonable_python(
+            list(self.resolve())
+        )
+
+
+class ResultList(list):
+    """
+    A list of the objects returned by BaseDataObject.get, with the continuation token for the next page of results if keyset pagination was used and there may be more of them.
+    """  # noqa: E501
+
+    next_token: str | None = None
+
+
+class PooledConnection:
+    """
+    Wraps a connection that has been checked out of a ConnectionPool, passing everything but close through to it, and checking it back in to the pool when it is closed or exits a with block.
+    """  # noqa: E501
+
+    def __init__(
+        self, pool: ConnectionPool, connection: Any
+    ) -> None:
+        """
+        Parameters:
+        -----------
+        pool : ConnectionPool
+            The pool that the connection was checked out
+            from, and will be checked back in to.
+        connection : DB-API connection
+            The underlying connection.
+        """
+        self._pool = pool
+        self._connection = connection
+
+    def __enter__(self) -> PooledConnection:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        if self._connection is None:
+            raise AttributeError(
+                f'Cannot access {name} of a '
+                'PooledConnection that has been closed.'
+            )
+        return getattr(self._connection, name)
+
+    def close(self) -> None:
+        """
+        Checks the underlying connection back in to the
+        pool it came from. Calling close more than once
+        has no further effect.
+        """
+        connection, self._connection = \
+            self._connection, None
+        if connection is not None:
+            self._pool.checkin(connection)
+
+
+class UnitOfWork:
+    """
+    Provides a context manager that executes all of the database statements made by BaseDataObject methods (save, save_many, delete and get) in the current thread, inside its with block, on a single connection and in a single transaction, which is committed once when the block exits, or rolled back if an error is raised. Cache invalidations for the objects written and deleted are deferred until the commit, and reads bypass the caches. A unit of work entered inside another one joins it, and its with block provides the outer one.
+    """  # noqa: E501
+
+    def __init__(self) -> None:
+        self._connector = None
+        self._callbacks = []
+        self._entered = False
+        self._joined = None
+
+    def __enter__(self) -> UnitOfWork:
+        assert not self._entered, \
+            f'{self.__class__.__name__} objects cannot be ' \
+            'entered more than once at a time.'
+        self._entered = True
+        self._joined = UnitOfWork.current()
+        if self._joined is not None:
+            return self._joined
+        _UNIT_OF_WORK.current = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._entered = False
+        if self._joined is not None:
+            # The outer unit of work commits, or rolls back
+            self._joined = None
+            return
+        _UNIT_OF_WORK.current = None
+        connector, self._connector = self._connector, None
+        callbacks, self._callbacks = self._callbacks, []
+        if exc_type is not None:
+            # Checking the connector back in to the pool
+            # rolls back the uncommitted statements
+            if connector is not None:
+                connector.close()
+            return
+        if connector is not None:
+            try:
+                connector.commit()
+            finally:
+                connector.close()
+        for callback in callbacks:
+            callback()
+
+    @property
+    def connector(self) -> PooledConnection:
+        """
+        Gets the connector that the unit of work's statements
+        are executed with, checking it out from the connection
+        pool the first time it is needed.
+        """
+        if not self._entered:
+            raise RuntimeError(
+                f'{self.__class__.__name__}.connector is only '
+                'available inside the unit of work\'s with block.'
+            )
+        if self._connector is None:
+            self._connector = get_env_database_connector()
+        return self._connector
+
+    @classmethod
+    def current(cls) -> UnitOfWork | None:
+        """
+        Returns the unit of work that the current thread's
+        database statements are executed in, if any.
+        """
+        return getattr(_UNIT_OF_WORK, 'current', None)
+
+    @typechecked
+    def on_commit(self, callback: Callable[[], Any]) -> None:
+        """
+        Registers a function to be called, with no arguments,
+        after the unit of work has been committed. Functions
+        registered with a unit of work that is rolled back are
+        not called.
+
+        Parameters:
+        -----------
+        callback : Callable
+            The function to call.
+        """
+        self._callbacks.append(callback)
+
 
 # Code to run if the module is executed directly
 if __name__ == '__main__':
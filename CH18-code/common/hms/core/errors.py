@@ -0,0 +1,48 @@
+#!/usr/bin/env python3.11
+"""
+Provides the exceptions raised when business objects cannot be
+found. They are kept apart from hms.core.business_objects, and
+import nothing, so that Lambda handlers can catch them without
+importing the business objects and their dependencies before
+they are needed.
+"""
+from __future__ import annotations
+
+# Built-In Imports
+
+# Third-Party Imports
+
+# Path Manipulations (avoid these!) and "Local" Imports
+
+# Module "Constants" and Other Attributes
+
+
+# Module Custom Exceptions
+class ArtisanNotFoundError(Exception):
+    """
+    An exception to be raised if Artisan.get does not
+    return an expected collection of Artisan objects.
+    """
+    ...
+
+
+class ProductImageNotFoundError(Exception):
+    """
+    An exception to be raised if Product.get does not
+    return an expected collection of Product objects.
+    """
+    ...
+
+
+class ProductNotFoundError(Exception):
+    """
+    An exception to be raised if Product.get does not
+    return an expected collection of Product objects.
+    """
+    ...
+
+
+# Code to run if the module is executed directly
+if __name__ == '__main__':
+
+    pass
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3.11
+"""
+Provides the building of API responses for JSON results that
+can be cached by clients: each response has an ETag, computed
+from its results or provided by the handler, a request with a
+matching If-None-Match header is answered with a 304 (Not
+Modified) response before the results are serialized (or,
+with not_modified, before they are read), and larger bodies
+are compressed for clients that accept compressed responses.
+"""
+from __future__ import annotations
+
+# Built-In Imports
+import base64
+import hashlib
+import json
+import os
+
+from functools import cache
+from typing import Any
+
+# Third-Party Imports
+
+# Path Manipulations (avoid these!) and "Local" Imports
+from hms.core.typechecks import typechecked
+
+# Module "Constants" and Other Attributes
+
+# Default response settings, which can be overridden by an
+# environment variable of the same name. Bodies smaller than
+# HMS_COMPRESSION_MIN_SIZE bytes are not compressed, and no
+# bodies are compressed unless it is a positive number.
+RESPONSE_DEFAULTS = {
+    'HMS_COMPRESSION_MIN_SIZE': 1024,
+}
+
+# The content-codings that bodies can be compressed with, in
+# order of preference when a client accepts more than one
+# equally; "br" is only used if the brotli package is
+# installed
+CONTENT_ENCODINGS = ('br', 'gzip')
+
+# The compression level (gzip) and quality (brotli) to use,
+# which favor speed over the last few percent of compression
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# Module Custom Exceptions
+
+
+# Module Functions
+def _get_env_response_settings() -> dict[str, int]:
+    """
+    Returns the response settings in RESPONSE_DEFAULTS, with
+    any that are set as environment variables overridden.
+    """
+    return {
+        name: type(default)(os.getenv(name, default))
+        for name, default in RESPONSE_DEFAULTS.items()
+    }
+
+
+@cache
+def _import_brotli() -> Any:
+    """
+    Imports and returns the brotli module, or None if it is
+    not installed, importing it only when the first response
+    that could use it is compressed.
+    """
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+@typechecked
+def compress_body(body: bytes, encoding: str) -> bytes:
+    """
+    Returns a body compressed with a content-coding.
+
+    Parameters:
+    -----------
+    body : bytes
+        The body to compress.
+    encoding : str
+        The content-coding to compress it with; one of
+        CONTENT_ENCODINGS.
+
+    Raises:
+    -------
+    ValueError
+        If the encoding is not supported.
+    """
+    if encoding == 'gzip':
+        import gzip
+        # mtime=0 keeps the output the same for the same body
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    if encoding == 'br' and _import_brotli() is not None:
+        return _import_brotli().compress(body, quality=BROTLI_QUALITY)
+    raise ValueError(
+        f'compress_body does not support "{encoding}" encoding.'
+    )
+
+
+@typechecked
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Returns whether an If-None-Match header value matches an
+    ETag, using the weak comparison that If-None-Match calls
+    for, so that "W/" prefixes are ignored.
+
+    Parameters:
+    -----------
+    if_none_match : str | None
+        The value of the If-None-Match header, which may be
+        "*", or a comma-separated list of ETags.
+    etag : str
+        The ETag of the current results.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    opaque_tag = etag.removeprefix('W/')
+    return any(
+        candidate.strip().removeprefix('W/') == opaque_tag
+        for candidate in if_none_match.split(',')
+    )
+
+
+@typechecked
+def get_content_encoding(accept_encoding: str | None) -> str | None:
+    """
+    Returns the content-coding to compress a response with,
+    given the Accept-Encoding header of the request: the
+    supported coding with the highest quality value (or the
+    most preferred of those tied for it), or None if the
+    client accepts none of them.
+
+    Parameters:
+    -----------
+    accept_encoding : str | None
+        The value of the Accept-Encoding header.
+    """
+    if not accept_encoding:
+        return None
+    supported = [
+        encoding for encoding in CONTENT_ENCODINGS
+        if encoding != 'br' or _import_brotli() is not None
+    ]
+    qualities = {}
+    for item in accept_encoding.split(','):
+        coding, _, parameters = item.strip().partition(';')
+        quality = 1.0
+        name, _, value = parameters.strip().partition('=')
+        if name.strip().lower() == 'q':
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    wildcard = qualities.get('*', 0.0)
+    best = max(
+        supported,
+        key=lambda encoding: qualities.get(encoding, wildcard),
+        default=None
+    )
+    if best is None or qualities.get(best, wildcard) <= 0:
+        return None
+    return best
+
+
+@typechecked
+def get_etag(data: Any) -> str:
+    """
+    Returns a weak ETag for JSON-compatible results, computed
+    from a hash of their repr rather than their JSON encoding,
+    so that it can be compared to a request's If-None-Match
+    header before the results are serialized. Weak ETags are
+    used because the same results can be sent with different
+    content-codings.
+
+    Parameters:
+    -----------
+    data : Any
+        The results, made up of JSON-compatible values.
+    """
+    digest = hashlib.blake2b(
+        repr(data).encode('utf-8'), digest_size=16
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+@typechecked
+def get_request_header(event: dict, name: str) -> str | None:
+    """
+    Returns the value of a request header from an API event,
+    or None if it was not sent. Header names are compared
+    case-insensitively, since API Gateway passes them as
+    the client sent them.
+
+    Parameters:
+    -----------
+    event : dict
+        The API event.
+    name : str
+        The name of the header.
+    """
+    name = name.lower()
+    for key, value in (event.get('headers') or {}).items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+@typechecked
+def json_response(
+    event: dict,
+    data: Any,
+    *,
+    status_code: int = 200,
+    etag: str | None = None,
+) -> dict:
+    """
+    Returns the API response for JSON-compatible results,
+    with an ETag header. If the request's If-None-Match header
+    matches the ETag, the response is a 304 (Not Modified)
+    response without a body, and the results are never
+    serialized. Otherwise the body is the results' JSON,
+    compressed if the client accepts a supported content-
+    coding and it is at least HMS_COMPRESSION_MIN_SIZE bytes
+    long, in which case it is base 64 encoded, as API Gateway
+    expects binary bodies to be.
+
+    Parameters:
+    -----------
+    event : dict
+        The API event being responded to.
+    data : Any
+        The results to respond with.
+    status_code : int
+        The status code of the response, if it is not a 304.
+    etag : optional str
+        The ETag of the results, if it was determined without
+        them, from table version stamps (see
+        QueryCache.etag), for example; otherwise it is a hash
+        of the results.
+    """
+    etag = etag or get_etag(data)
+    response = not_modified(event, etag)
+    if response is not None:
+        return response
+
+    min_size = _get_env_response_settings()['HMS_COMPRESSION_MIN_SIZE']
+    headers = {'ETag': etag}
+    if min_size > 0:
+        headers['Vary'] = 'Accept-Encoding'
+    headers['Content-Type'] = 'application/json'
+    body = json.dumps(data)
+    encoding = get_content_encoding(
+        get_request_header(event, 'Accept-Encoding')
+    ) if min_size > 0 else None
+    if encoding and len(body.encode('utf-8')) >= min_size:
+        headers['Content-Encoding'] = encoding
+        return {
+            'statusCode': status_code,
+            'headers': headers,
+            'body': base64.b64encode(
+                compress_body(body.encode('utf-8'), encoding)
+            ).decode('ascii'),
+            'isBase64Encoded': True,
+        }
+    return {
+        'statusCode': status_code,
+        'headers': headers,
+        'body': body,
+    }
+
+
+@typechecked
+def not_modified(event: dict, etag: str) -> dict | None:
+    """
+    Returns a 304 (Not Modified) response without a body if
+    the request's If-None-Match header matches the ETag of the
+    current results, or None if the results must be sent. This
+    allows handlers that can determine the ETag before reading
+    the results to skip reading them.
+
+    Parameters:
+    -----------
+    event : dict
+        The API event being responded to.
+    etag : str
+        The ETag of the current results.
+    """
+    if not etag_matches(get_request_header(event, 'If-None-Match'), etag):
+        return None
+    headers = {'ETag': etag}
+    if _get_env_response_settings()['HMS_COMPRESSION_MIN_SIZE'] > 0:
+        headers['Vary'] = 'Accept-Encoding'
+    return {
+        'statusCode': 304,
+        'headers': headers,
+        'body': '',
+    }
+
+
+# Module Metaclasses
+
+# Module Abstract Base Classes
+
+# Module Concrete Classes
+
+# Code to run if the module is executed directly
+if __name__ == '__main__':
+
+    pass
@@ -0,0 +1,461 @@
+#!/usr/bin/env python3.11
+"""
+Provides an S3 (or S3-compatible) object-store back end for
+files like product images: a writer that uploads data as it
+is written, using a multipart upload for anything larger than
+a single part, and batched deletes. Also provides the deletion
+of product image files from either S3 or local file locations.
+"""
+from __future__ import annotations
+
+# Built-In Imports
+import io
+import os
+import threading
+
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+# Third-Party Imports
+
+# Path Manipulations (avoid these!) and "Local" Imports
+from hms.core.typechecks import typechecked
+from logger import logger
+
+# Module "Constants" and Other Attributes
+
+# The environment variable that sets the endpoint URL of the
+# object store, so that a local S3 stand-in (MinIO, LocalStack,
+# moto's server mode, etc.) can be used instead of AWS S3
+S3_ENDPOINT_URL_ENV_VAR = 'HMS_S3_ENDPOINT_URL'
+
+# The size of the parts of a multipart upload. Data smaller
+# than this is uploaded with a single put_object call instead.
+# S3 requires every part but the last to be at least 5MB.
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+MINIMUM_PART_SIZE = 5 * 1024 * 1024
+
+# The most keys that a single delete_objects call can delete
+MAX_DELETE_KEYS = 1000
+
+# The extensions that image files can be saved with. S3 objects
+# have to be deleted by their exact keys, so one with each of
+# these extensions is deleted, which is not an error if they do
+# not exist, instead of listing them first.
+IMAGE_FILE_EXTENSIONS = ('jpg', 'png', 'webp')
+
+# Keeps concurrent callers, like the threads that save image
+# variants, from creating more than one client
+_S3_CLIENT_LOCK = threading.Lock()
+
+
+# Module Custom Exceptions
+class ObjectStoreError(Exception):
+    """
+    An exception to be raised if the object store reports that a request failed for some of the objects it applied to.
+    """  # noqa: E501
+    ...
+
+
+# Module Functions
+@cache
+def _create_s3_client() -> Any:
+    """
+    Creates an S3 client, importing boto3 only when the first
+    one is needed.
+    """
+    import boto3
+
+    from botocore.config import Config
+
+    endpoint_url = os.getenv(S3_ENDPOINT_URL_ENV_VAR) or None
+    logger.debug(f'Creating S3 client (endpoint: {endpoint_url})')
+    return boto3.session.Session().client(
+        's3',
+        endpoint_url=endpoint_url,
+        config=Config(
+            retries={'mode': 'standard'},
+            tcp_keepalive=True,
+        ),
+    )
+
+
+@typechecked
+def _get_s3_image_urls(location: str, oids: list) -> list[str]:
+    """
+    Returns the URLs of every S3 object that an image file
+    for each oid could have been saved as, in an S3 location.
+
+    Parameters:
+    -----------
+    location : str (S3 URL)
+        The location the images were saved to.
+    oids : list[str | UUID]
+        The oids of the images.
+    """
+    base_url = location.format(**os.environ).rstrip('/')
+    return [
+        f'{base_url}/{oid}.{extension}'
+        for oid in oids
+        for extension in IMAGE_FILE_EXTENSIONS
+    ]
+
+
+@typechecked
+def delete_image(location: str, oid: str) -> None:
+    """
+    Deletes the image from the specified location.
+
+    Parameters:
+    -----------
+    location : str (local file path or S3 URL)
+        The location to delete the image files from.
+    oid : str (UUID format)
+        The oid of the image, used to create a common
+        file name for the original, detail and thumbnail
+        images that is distinct from any other image's
+        original, detail and thumbnail file names.
+
+    Notes:
+    ------
+    * If the location is a local file URL (starting with
+      "file:///"), the file will be deleted from the local
+      file system at that location.
+    * If the location is an S3 URL, then the file will be
+      deleted from the S3 bucket and path specified.
+    """
+    logger.info('delete_image called')
+    logger.debug(f'vars: {vars()}')
+
+    # Images are saved with the extension of their format,
+    # which varies, so any file named for the oid is deleted
+    image_pattern = f'{oid}.*'
+
+    if location.startswith('s3://'):
+        delete_objects(*_get_s3_image_urls(location, [oid]))
+    elif location.startswith('file:///'):
+        save_path = Path(
+            location[8:].format(**os.environ)
+        )
+        logger.debug(
+            f'save_path: {save_path} '
+            f'({type(save_path).__name__})'
+        )
+        for image_path in save_path.glob(image_pattern):
+            image_path.unlink()
+            logger.info(
+                f'delete_image deleted {image_path}'
+            )
+
+    else:
+        raise RuntimeError(
+            f'Unsupported location type ({location}) '
+            'to delete image files from.'
+        )
+    logger.info('delete_image completed')
+
+
+@typechecked
+def delete_images(oids: list, *locations: str) -> None:
+    """
+    Deletes the image files for a number of oids from a
+    number of locations. All of the files in S3 locations are
+    deleted together, with a single delete_objects call for
+    each bucket.
+
+    Parameters:
+    -----------
+    oids : list[str | UUID]
+        The oids of the images to delete.
+    locations : str (local file path or S3 URL)
+        The locations to delete the image files from.
+    """
+    image_urls = []
+    for location in locations:
+        if location.startswith('s3://'):
+            image_urls += _get_s3_image_urls(location, oids)
+        else:
+            for oid in oids:
+                delete_image(location, str(oid))
+    delete_objects(*image_urls)
+
+
+@typechecked
+def delete_objects(*urls: str) -> None:
+    """
+    Deletes objects, by s3:// URL, with as few delete_objects
+    calls as possible: one for each bucket, for every
+    MAX_DELETE_KEYS objects. Deleting an object that does not
+    exist is not an error.
+
+    Parameters:
+    -----------
+    urls : str
+        The s3://<bucket>/<key> URLs of the objects to delete.
+
+    Raises:
+    -------
+    ObjectStoreError
+        If any of the objects could not be deleted.
+    """
+    keys_by_bucket = {}
+    for url in urls:
+        bucket, key = parse_s3_url(url)
+        keys_by_bucket.setdefault(bucket, []).append(key)
+    if not keys_by_bucket:
+        return
+    client = get_s3_client()
+    for bucket, keys in keys_by_bucket.items():
+        for start in range(0, len(keys), MAX_DELETE_KEYS):
+            response = client.delete_objects(
+                Bucket=bucket,
+                Delete={
+                    'Objects': [
+                        {'Key': key}
+                        for key in keys[start:start + MAX_DELETE_KEYS]
+                    ],
+                    'Quiet': True,
+                }
+            )
+            errors = response.get('Errors')
+            if errors:
+                raise ObjectStoreError(
+                    f'Could not delete {len(errors)} object(s) '
+                    f'from {bucket}: {errors}'
+                )
+            logger.debug(
+                f'Deleted {len(keys[start:start + MAX_DELETE_KEYS])} '
+                f'object(s) from {bucket}'
+            )
+
+
+def get_s3_client() -> Any:
+    """
+    Returns the S3 client for the process, creating it the
+    first time it is called. The client, and the connections
+    it pools, are reused by every later call, including across
+    Lambda invocations in the same container.
+    """
+    with _S3_CLIENT_LOCK:
+        return _create_s3_client()
+
+
+@typechecked
+def parse_s3_url(url: str) -> tuple[str, str]:
+    """
+    Returns the bucket and key of an s3://<bucket>/<key> URL.
+
+    Parameters:
+    -----------
+    url : str
+        The URL to parse.
+
+    Raises:
+    -------
+    ValueError
+        If the URL is not an s3:// URL with a bucket and key.
+    """
+    if not url.startswith('s3://'):
+        raise ValueError(
+            f'parse_s3_url expects an s3:// URL, but was '
+            f'passed "{url}".'
+        )
+    bucket, _, key = url[5:].partition('/')
+    if not bucket or not key:
+        raise ValueError(
+            f'parse_s3_url expects an s3://<bucket>/<key> '
+            f'URL, but was passed "{url}".'
+        )
+    return bucket, key
+
+
+# Module Metaclasses
+
+# Module Abstract Base Classes
+
+
+# Module Concrete Classes
+class S3ObjectWriter(io.RawIOBase):
+    """
+    Provides a writable file that uploads to an S3 object as it is written to, so that data (an image being encoded, for example) never has to be held in memory, or in a temporary file, all at once. Data smaller than a part is uploaded with a single put_object call when the writer is closed; anything larger is uploaded as a multipart upload, a part at a time, which is completed when the writer is closed, or aborted if it is used as a context manager and an error is raised, or if it is garbage-collected without having been closed.
+    """  # noqa: E501
+
+    @typechecked
+    def __init__(
+        self, url: str, content_type: str | None = None,
+        part_size: int = MULTIPART_PART_SIZE
+    ) -> None:
+        """
+        Parameters:
+        -----------
+        url : str
+            The s3://<bucket>/<key> URL of the object to
+            write.
+        content_type : str | None
+            The MIME type of the object.
+        part_size : int
+            The size of the parts of a multipart upload, which
+            must be at least MINIMUM_PART_SIZE.
+        """
+        assert part_size >= MINIMUM_PART_SIZE, \
+            f'{self.__class__.__name__} expects a part_size of ' \
+            f'at least {MINIMUM_PART_SIZE}, but {part_size} ' \
+            'was passed.'
+        super().__init__()
+        self._bucket, self._key = parse_s3_url(url)
+        self._extra_args = {'ContentType': content_type} \
+            if content_type else {}
+        self._part_size = part_size
+        self._client = get_s3_client()
+        self._buffer = bytearray()
+        self._parts = []
+        self._upload_id = None
+        self._completed = False
+
+    def __del__(self) -> None:
+        """
+        Aborts the upload if the writer was never closed,
+        rather than completing it as IOBase.__del__ would,
+        so that a writer dropped part-way through writing
+        (by an error outside of a with block, for example)
+        never leaves a partial object behind.
+        """
+        # Writers whose __init__ failed have nothing to abort
+        if getattr(self, '_completed', True):
+            return
+        try:
+            self.abort()
+        except Exception as error:
+            logger.warning(
+                f'Could not abort the upload to s3://{self._bucket}/'
+                f'{self._key}: {error.__class__.__name__}: {error}'
+            )
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Completes the upload, or aborts it if an error was
+        raised.
+        """
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _upload_part(self, data: bytes) -> None:
+        """
+        Uploads a part of a multipart upload, starting the
+        upload first if this is the first part.
+
+        Parameters:
+        -----------
+        data : bytes
+            The data of the part.
+        """
+        if self._upload_id is None:
+            self._upload_id = self._client.create_multipart_upload(
+                Bucket=self._bucket, Key=self._key,
+                **self._extra_args
+            )['UploadId']
+        part_number = len(self._parts) + 1
+        response = self._client.upload_part(
+            Bucket=self._bucket, Key=self._key,
+            UploadId=self._upload_id, PartNumber=part_number,
+            Body=data
+        )
+        self._parts.append(
+            {'ETag': response['ETag'], 'PartNumber': part_number}
+        )
+
+    def abort(self) -> None:
+        """
+        Discards any data written, aborting the multipart
+        upload if one was started, and closes the writer.
+        """
+        if self.closed:
+            return
+        self._buffer.clear()
+        try:
+            if self._upload_id is not None:
+                self._client.abort_multipart_upload(
+                    Bucket=self._bucket, Key=self._key,
+                    UploadId=self._upload_id
+                )
+                logger.debug(
+                    f'Aborted upload to s3://{self._bucket}/'
+                    f'{self._key}'
+                )
+        finally:
+            super().close()
+
+    def close(self) -> None:
+        """
+        Uploads any data that has not been uploaded yet, and
+        completes the upload, aborting it if that fails.
+        """
+        if self.closed:
+            return
+        try:
+            if self._upload_id is None:
+                self._client.put_object(
+                    Bucket=self._bucket, Key=self._key,
+                    Body=bytes(self._buffer), **self._extra_args
+                )
+            else:
+                if self._buffer:
+                    self._upload_part(bytes(self._buffer))
+                self._client.complete_multipart_upload(
+                    Bucket=self._bucket, Key=self._key,
+                    UploadId=self._upload_id,
+                    MultipartUpload={'Parts': self._parts}
+                )
+        except Exception:
+            self.abort()
+            raise
+        self._buffer.clear()
+        self._completed = True
+        super().close()
+        logger.debug(
+            f'Uploaded s3://{self._bucket}/{self._key} '
+            f'({len(self._parts) or 1} part(s))'
+        )
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        """
+        Writes data, uploading a part each time a full part's
+        worth has been written, and returns the number of bytes
+        written.
+
+        Parameters:
+        -----------
+        data : bytes-like object
+            The data to write.
+        """
+        if self.closed:
+            raise ValueError('write to closed file')
+        view = memoryview(data).cast('B')
+        position = 0
+        while len(self._buffer) + len(view) - position \
+                >= self._part_size:
+            if self._buffer:
+                # Top up the buffered data to a full part
+                end = position + self._part_size - len(self._buffer)
+                self._buffer += view[position:end]
+                self._upload_part(bytes(self._buffer))
+                self._buffer.clear()
+            else:
+                # Upload a full part straight from the data
+                end = position + self._part_size
+                self._upload_part(bytes(view[position:end]))
+            position = end
+        self._buffer += view[position:]
+        return len(view)
+
+
+# Code to run if the module is executed directly
+if __name__ == '__main__':
+
+    pass
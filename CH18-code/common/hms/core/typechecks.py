@@ -0,0 +1,76 @@
+#!/usr/bin/env python3.11
+"""
+Provides the typechecked decorator used by the hms.core
+modules, which is typeguard's unless run-time type-checking
+has been switched off in the environment, in which case it
+is a no-op that returns the decorated object unchanged.
+"""
+from __future__ import annotations
+
+# Built-In Imports
+import os
+
+from typing import Any
+
+# Third-Party Imports
+from typeguard import typechecked as typeguard_typechecked
+
+# Path Manipulations (avoid these!) and "Local" Imports
+
+# Module "Constants" and Other Attributes
+
+# The environment variable that switches type-checking off
+# when set to one of the TYPECHECKS_OFF_VALUES. It is read
+# once, when this module is imported, so it must be set
+# before any hms.core module is imported.
+TYPECHECKS_ENV_VAR = 'HMS_TYPECHECKS'
+TYPECHECKS_OFF_VALUES = ('0', 'false', 'no', 'off')
+
+# Module Custom Exceptions
+
+
+# Module Functions
+def _no_op_typechecked(target: Any = None, **options: Any) -> Any:
+    """
+    Stands in for typeguard's typechecked decorator when
+    type-checking is switched off, returning the decorated
+    object unchanged, whether it is used with or without
+    arguments.
+
+    Parameters:
+    -----------
+    target : Any
+        The function, method or class being decorated, or
+        None if the decorator is called with options.
+    options : Any
+        The typeguard options passed to the decorator,
+        which are ignored.
+    """
+    if target is None:
+        return _no_op_typechecked
+    return target
+
+
+def typechecks_enabled() -> bool:
+    """
+    Returns whether run-time type-checking is enabled, which
+    it is unless the HMS_TYPECHECKS environment variable is
+    set to one of the TYPECHECKS_OFF_VALUES.
+    """
+    value = os.getenv(TYPECHECKS_ENV_VAR, 'on')
+    return value.strip().lower() not in TYPECHECKS_OFF_VALUES
+
+
+typechecked = typeguard_typechecked if typechecks_enabled() \
+    else _no_op_typechecked
+
+# Module Metaclasses
+
+# Module Abstract Base Classes
+
+# Module Concrete Classes
+
+# Code to run if the module is executed directly
+if __name__ == '__main__':
+
+    pass
@@ -0,0 +1,12 @@
+ALTER TABLE Products
+    ADD COLUMN name VARCHAR(255)
+    AS (LEFT(JSON_UNQUOTE(JSON_EXTRACT(object_state, '$.name')), 255)) VIRTUAL
+    COMMENT 'The name of the Product, generated from the object_state (truncated to 255 characters).',
+    ADD COLUMN price DECIMAL(12, 2)
+    AS (CAST(JSON_UNQUOTE(JSON_EXTRACT(object_state, '$.price')) AS DECIMAL(12, 2))) VIRTUAL
+    COMMENT 'The price of the Product, generated from the object_state.',
+    ADD INDEX products_artisan_status (artisan_oid, is_active, is_deleted, created),
+    ADD INDEX products_status_created (is_active, is_deleted, created),
+    ADD INDEX products_name (name),
+    ADD INDEX products_price (price)
+;
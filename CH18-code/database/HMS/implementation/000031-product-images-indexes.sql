@@ -0,0 +1,4 @@
+ALTER TABLE ProductImages
+    ADD INDEX product_images_product_status (product_oid, is_active, is_deleted, created),
+    ADD INDEX product_images_status_created (is_active, is_deleted, created)
+;
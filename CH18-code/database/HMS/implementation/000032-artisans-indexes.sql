@@ -0,0 +1,10 @@
+ALTER TABLE Artisan
+    ADD COLUMN family_name VARCHAR(255)
+    AS (LEFT(JSON_UNQUOTE(JSON_EXTRACT(object_state, '$.family_name')), 255)) VIRTUAL
+    COMMENT 'The family name of the Artisan, generated from the object_state (truncated to 255 characters).',
+    ADD COLUMN given_name VARCHAR(255)
+    AS (LEFT(JSON_UNQUOTE(JSON_EXTRACT(object_state, '$.given_name')), 255)) VIRTUAL
+    COMMENT 'The given name of the Artisan, generated from the object_state (truncated to 255 characters).',
+    ADD INDEX artisan_status_created (is_active, is_deleted, created),
+    ADD INDEX artisan_name (family_name, given_name)
+;
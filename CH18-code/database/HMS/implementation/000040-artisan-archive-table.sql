@@ -0,0 +1 @@
+CREATE TABLE Artisan_Archive LIKE Artisan;
@@ -0,0 +1,5 @@
+ALTER TABLE Artisan_Archive
+    ADD COLUMN archived DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL
+    COMMENT 'The UTC date/time that the record was archived.',
+    COMMENT='Holds deleted Artisan records, moved out of the Artisan table once they have been deleted for long enough.'
+;
@@ -0,0 +1 @@
+CREATE TABLE Products_Archive LIKE Products;
@@ -0,0 +1,5 @@
+ALTER TABLE Products_Archive
+    ADD COLUMN archived DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL
+    COMMENT 'The UTC date/time that the record was archived.',
+    COMMENT='Holds deleted Product records, moved out of the Products table once they have been deleted for long enough.'
+;
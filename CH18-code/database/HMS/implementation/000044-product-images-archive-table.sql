@@ -0,0 +1 @@
+CREATE TABLE ProductImages_Archive LIKE ProductImages;
@@ -0,0 +1,5 @@
+ALTER TABLE ProductImages_Archive
+    ADD COLUMN archived DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL
+    COMMENT 'The UTC date/time that the record was archived.',
+    COMMENT='Holds deleted ProductImage records, moved out of the ProductImages table once they have been deleted for long enough. Their image files are deleted when they are archived.'
+;
@@ -0,0 +1 @@
+CREATE TABLE ProductMetadata_Archive LIKE ProductMetadata;
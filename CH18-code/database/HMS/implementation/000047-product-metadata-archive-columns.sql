@@ -0,0 +1,5 @@
+ALTER TABLE ProductMetadata_Archive
+    ADD COLUMN archived DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL
+    COMMENT 'The UTC date/time that the record was archived.',
+    COMMENT='Holds the metadata of archived Products.'
+;
@@ -0,0 +1,3 @@
+ALTER TABLE Artisan
+    ADD INDEX artisan_deleted_created (is_deleted, created)
+;
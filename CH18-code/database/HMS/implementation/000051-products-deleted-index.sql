@@ -0,0 +1,3 @@
+ALTER TABLE Products
+    ADD INDEX products_deleted_created (is_deleted, created)
+;
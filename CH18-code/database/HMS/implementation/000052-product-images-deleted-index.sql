@@ -0,0 +1,3 @@
+ALTER TABLE ProductImages
+    ADD INDEX product_images_deleted_created (is_deleted, created)
+;
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3.11
+"""
+A developer tool that measures the time taken to create business
+objects from the records of a query, with full validation and with
+the trusted hydration path in hms.core.data_objects.
+"""
+
+# Built-In Imports
+import argparse
+import json
+import sys
+
+from pathlib import Path
+from timeit import repeat
+from unittest.mock import MagicMock, patch
+
+# Module "Constants" and Other Attributes
+EPILOG = """No database is needed: the records are generated from the
+examples of each class, and the database connector is replaced
+with a stub that returns them, so only the Python-side work of
+creating the objects is measured."""
+
+PROJECT_ROOT = Path(__file__).parent.parent
+common_dir = PROJECT_ROOT / 'common'
+
+# Path Manipulations (avoid these!) and "Local" Imports
+sys.path.insert(0, str(common_dir))
+
+from hms.core import data_objects  # noqa: E402
+from hms.core.business_objects import Artisan, Product, \
+    ProductImage  # noqa: E402
+
+
+def make_records(cls, count, **overrides):
+    """
+    Creates object_state records like those written by save,
+    cycling through the examples of a class.
+    """
+    examples = data_objects.get_examples(cls)
+    records = []
+    for index in range(count):
+        example = dict(examples[index % len(examples)])
+        example.update(overrides)
+        records.append(
+            {'object_state': cls(**example).model_dump_json()}
+        )
+    return records
+
+
+def time_hydration(label, cls, records, repeats):
+    """
+    Times creating objects from all of the records, validated
+    and trusted, and prints the best times for each.
+    """
+    def validated():
+        [
+            cls.from_record(json.loads(record['object_state']))
+            for record in records
+        ]
+
+    def trusted():
+        [
+            data_objects.construct_trusted(
+                cls, json.loads(record['object_state'])
+            )
+            for record in records
+        ]
+
+    results = {
+        mode: min(repeat(function, number=1, repeat=repeats))
+        for mode, function in (
+            ('validated', validated), ('trusted', trusted)
+        )
+    }
+    print(
+        f'{label:<28} '
+        f'{results["validated"] * 1000:>10.1f}ms '
+        f'{results["trusted"] * 1000:>10.1f}ms '
+        f'{results["validated"] / results["trusted"]:>8.1f}x'
+    )
+
+
+def __main__(rows: int, repeats: int, *args, **kwargs):
+    """
+    Runs the benchmarks.
+
+    Parameters:
+    -----------
+    rows : int
+        The number of records to create objects from.
+    repeats : int
+        The number of runs; the fastest run is reported.
+    """
+    print(f'Creating objects from {rows:,} records')
+    print(
+        f'{"":<28} {"Validated":>12} {"Trusted":>12} '
+        f'{"Speed-up":>9}'
+    )
+    cases = (
+        ('ProductImage', ProductImage, {}),
+        ('Product', Product, {'product_images': None}),
+        ('Artisan', Artisan, {'products': None}),
+        ('Artisan (with products)', Artisan, {}),
+    )
+    for label, cls, overrides in cases:
+        time_hydration(
+            label, cls, make_records(cls, rows, **overrides),
+            repeats
+        )
+
+    # The whole of a get call, with the query stubbed out
+    records = make_records(Product, rows, product_images=None)
+    mock_connector = MagicMock()
+    mock_connector.cursor.return_value.__enter__.return_value \
+        .fetchall.return_value = records
+    with patch.object(
+        data_objects, 'get_env_database_connector',
+        return_value=mock_connector
+    ), patch.object(
+        data_objects, 'get_env_object_cache', return_value=None
+    ), patch.object(
+        data_objects, 'get_env_query_cache', return_value=None
+    ):
+        results = {
+            trusted: min(
+                repeat(
+                    lambda: Product.get(trusted=trusted),
+                    number=1, repeat=repeats
+                )
+            )
+            for trusted in (False, True)
+        }
+    print(
+        f'{"Product.get":<28} '
+        f'{results[False] * 1000:>10.1f}ms '
+        f'{results[True] * 1000:>10.1f}ms '
+        f'{results[False] / results[True]:>8.1f}x'
+    )
+
+
+# Argument Parser
+parser = argparse.ArgumentParser(
+    prog='benchmark-hydration',
+    description=__doc__,
+    epilog=EPILOG
+)
+parser.add_argument(
+    '--rows', '-n', type=int, default=10_000,
+    help='The number of records to create objects from.'
+)
+parser.add_argument(
+    '--repeats', '-r', type=int, default=3,
+    help='The number of runs; the fastest is reported.'
+)
+
+if __name__ == '__main__':
+    arguments = parser.parse_args()
+    __main__(**vars(arguments))
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3.11
+"""
+A developer tool that measures how long it takes to import
+hms.core.business_objects in a fresh interpreter, as a Lambda
+cold start does.
+"""
+
+# Built-In Imports
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+from pathlib import Path
+
+# Module "Constants" and Other Attributes
+EPILOG = """Each import is timed in a new process. The time to import
+the business objects alone is measured after hms.core.data_objects
+(and the third-party packages it needs) have been imported, so it
+shows the cost of defining the business-object classes themselves."""
+
+PROJECT_ROOT = Path(__file__).parent.parent
+common_dir = PROJECT_ROOT / 'common'
+
+# The code run in each new process, which prints the time taken
+# to import everything, and the business objects alone
+MEASURE_CODE = """
+from time import perf_counter
+start = perf_counter()
+import hms.core.data_objects
+middle = perf_counter()
+import hms.core.business_objects
+end = perf_counter()
+print(end - start, end - middle)
+"""
+
+
+def measure_once() -> tuple[float, float]:
+    """
+    Imports hms.core.business_objects in a new process, and
+    returns the total import time, and the time taken by the
+    business objects alone, in seconds.
+    """
+    environment = dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join(
+            [str(common_dir), os.environ.get('PYTHONPATH', '')]
+        ),
+        PYTHONDONTWRITEBYTECODE='1',
+    )
+    completed = subprocess.run(
+        [sys.executable, '-c', MEASURE_CODE],
+        env=environment, capture_output=True, text=True,
+        check=True
+    )
+    total, business_objects = completed.stdout.split()[-2:]
+    return float(total), float(business_objects)
+
+
+def __main__(repeats: int, *args, **kwargs):
+    """
+    Runs the benchmark.
+
+    Parameters:
+    -----------
+    repeats : int
+        The number of new processes to time the import in.
+    """
+    timings = [measure_once() for _ in range(repeats)]
+    print(f'Importing hms.core.business_objects ({repeats} runs)')
+    print(f'{"":<22} {"Best":>10} {"Median":>10}')
+    for index, label in enumerate(('Total', 'Business objects')):
+        values = [timing[index] * 1000 for timing in timings]
+        print(
+            f'{label:<22} '
+            f'{min(values):>8.1f}ms '
+            f'{statistics.median(values):>8.1f}ms'
+        )
+
+
+# Argument Parser
+parser = argparse.ArgumentParser(
+    prog='benchmark-import-time',
+    description=__doc__,
+    epilog=EPILOG
+)
+parser.add_argument(
+    '--repeats', '-r', type=int, default=10,
+    help='The number of new processes to time the import in.'
+)
+
+if __name__ == '__main__':
+    arguments = parser.parse_args()
+    __main__(**vars(arguments))
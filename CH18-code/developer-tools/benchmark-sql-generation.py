@@ -0,0 +1,179 @@
+#!/usr/bin/env python3.11
+"""
+A developer tool that measures the per-call overhead of generating
+the SQL for BaseDataObject get, save and delete calls, with and
+without the memoized SQL templates in hms.core.data_objects.
+"""
+
+# Built-In Imports
+import argparse
+import sys
+
+from contextlib import contextmanager
+from decimal import Decimal
+from pathlib import Path
+from timeit import repeat
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+# Module "Constants" and Other Attributes
+EPILOG = """No database is needed: the database connector is replaced
+with a stub that returns no rows, so only the Python-side work
+of each call is measured."""
+
+PROJECT_ROOT = Path(__file__).parent.parent
+common_dir = PROJECT_ROOT / 'common'
+
+# Path Manipulations (avoid these!) and "Local" Imports
+sys.path.insert(0, str(common_dir))
+
+from hms.core import data_objects  # noqa: E402
+from hms.core.business_objects import Product  # noqa: E402
+
+MEMOIZED_FUNCTIONS = (
+    '_build_where_template',
+    '_build_order_by_template',
+    'build_write_sql',
+)
+
+# Criteria like those used by the public_read_products Lambda
+LIST_CRITERIA = {
+    'is_active': True, 'is_deleted': False,
+    'artisan_oid_in': [str(uuid4()) for _ in range(5)],
+    'name_startswith': 'Dragon',
+    'sort_created': 'desc',
+}
+
+
+@contextmanager
+def unmemoized():
+    """
+    Replaces the memoized SQL-template functions with the
+    functions they wrap for the duration of the context,
+    so that the SQL is generated on every call.
+    """
+    with patch.multiple(
+        data_objects,
+        **{
+            name: getattr(data_objects, name).__wrapped__
+            for name in MEMOIZED_FUNCTIONS
+        }
+    ):
+        yield
+
+
+def generate_get_clauses():
+    """
+    Generates the WHERE, ORDER BY and LIMIT clauses for a
+    typical list-query.
+    """
+    data_objects.build_where_clause(
+        LIST_CRITERIA, Product.CRITERIA_FIELDS
+    )
+    data_objects.build_order_by_clause(
+        LIST_CRITERIA, Product.CRITERIA_FIELDS
+    )
+    data_objects.build_limit_clause(20, 3)
+
+
+def make_product():
+    """
+    Creates a Product to save in the benchmarks.
+    """
+    return Product(
+        artisan_oid=uuid4(), name='Dragon Scarf',
+        summary='Summary', description='Description',
+        price=Decimal('12.34'), shipping_weight=Decimal('3.2'),
+    )
+
+
+def time_calls(label, statement, number, repeats):
+    """
+    Times a statement with and without the memoized SQL
+    templates, and prints the best per-call times.
+    """
+    results = {}
+    for mode in ('unmemoized', 'memoized'):
+        if mode == 'unmemoized':
+            with unmemoized():
+                timings = repeat(
+                    statement, number=number, repeat=repeats
+                )
+        else:
+            timings = repeat(
+                statement, number=number, repeat=repeats
+            )
+        results[mode] = min(timings) / number * 1_000_000
+    saved = results['unmemoized'] - results['memoized']
+    print(
+        f'{label:<28} '
+        f'{results["unmemoized"]:>10.2f}µs '
+        f'{results["memoized"]:>10.2f}µs '
+        f'{saved:>10.2f}µs '
+        f'({saved / results["unmemoized"]:.0%})'
+    )
+
+
+def __main__(number: int, repeats: int, *args, **kwargs):
+    """
+    Runs the benchmarks.
+
+    Parameters:
+    -----------
+    number : int
+        The number of calls to time in each run.
+    repeats : int
+        The number of runs; the fastest run is reported.
+    """
+    product = make_product()
+    mock_connector = MagicMock()
+    mock_connector.cursor.return_value.__enter__.return_value \
+        .fetchall.return_value = []
+    print(
+        f'{"Per call":<28} {"Before":>12} {"After":>12} '
+        f'{"Saved":>12}'
+    )
+    with patch.object(
+        data_objects, 'get_env_database_connector',
+        return_value=mock_connector
+    ), patch.object(
+        data_objects, 'get_env_object_cache', return_value=None
+    ), patch.object(
+        data_objects, 'get_env_query_cache', return_value=None
+    ):
+        time_calls(
+            'get clauses', generate_get_clauses, number, repeats
+        )
+        time_calls(
+            'Product.get (list)',
+            lambda: Product.get(page_size=20, **LIST_CRITERIA),
+            number, repeats
+        )
+        time_calls(
+            'Product.save', product.save, number, repeats
+        )
+        time_calls(
+            'Product.delete',
+            lambda: Product.delete(product.oid),
+            number, repeats
+        )
+
+
+# Argument Parser
+parser = argparse.ArgumentParser(
+    prog='benchmark-sql-generation',
+    description=__doc__,
+    epilog=EPILOG
+)
+parser.add_argument(
+    '--number', '-n', type=int, default=2000,
+    help='The number of calls to time in each run.'
+)
+parser.add_argument(
+    '--repeats', '-r', type=int, default=5,
+    help='The number of runs; the fastest is reported.'
+)
+
+if __name__ == '__main__':
+    arguments = parser.parse_args()
+    __main__(**vars(arguments))
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3.11
+"""
+A developer tool that measures the per-call overhead of run-time
+type-checking on BaseDataObject get, save and delete calls, by
+timing them with HMS_TYPECHECKS switched on and off.
+"""
+
+# Built-In Imports
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from decimal import Decimal
+from pathlib import Path
+from timeit import repeat
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+# Module "Constants" and Other Attributes
+EPILOG = """No database is needed: the database connector is replaced
+with a stub that returns a page of records, so only the Python-side
+work of each call is measured. The switch is read when hms.core is
+imported, so each setting is measured in its own process."""
+
+PROJECT_ROOT = Path(__file__).parent.parent
+common_dir = PROJECT_ROOT / 'common'
+
+
+def measure(number: int, repeats: int) -> dict[str, float]:
+    """
+    Times get, save and delete calls in this process, with
+    whatever type-checking setting it was started with, and
+    returns the best per-call times, in microseconds.
+    """
+    # Path Manipulations (avoid these!) and "Local" Imports
+    sys.path.insert(0, str(common_dir))
+    from hms.core import data_objects
+    from hms.core.business_objects import Product
+
+    product = Product(
+        artisan_oid=uuid4(), name='Dragon Scarf',
+        summary='Summary', description='Description',
+        price=Decimal('12.34'), shipping_weight=Decimal('3.2'),
+    )
+    records = [
+        {'object_state': product.model_dump_json()}
+    ] * 20
+    mock_connector = MagicMock()
+    mock_connector.cursor.return_value.__enter__.return_value \
+        .fetchall.return_value = records
+    statements = {
+        'Product.get (20 records)': lambda: Product.get(
+            page_size=20, is_active=True,
+            sort_created='desc'
+        ),
+        'Product.save': product.save,
+        'Product.delete': lambda: Product.delete(product.oid),
+    }
+    with patch.object(
+        data_objects, 'get_env_database_connector',
+        return_value=mock_connector
+    ), patch.object(
+        data_objects, 'get_env_object_cache', return_value=None
+    ), patch.object(
+        data_objects, 'get_env_query_cache', return_value=None
+    ):
+        return {
+            label: min(
+                repeat(statement, number=number, repeat=repeats)
+            ) / number * 1_000_000
+            for label, statement in statements.items()
+        }
+
+
+def measure_in_process(
+    setting: str, number: int, repeats: int
+) -> dict[str, float]:
+    """
+    Runs measure in a new process with HMS_TYPECHECKS set to
+    the setting provided, and returns its results.
+    """
+    environment = dict(os.environ, HMS_TYPECHECKS=setting)
+    completed = subprocess.run(
+        [
+            sys.executable, __file__, '--measure',
+            '-n', str(number), '-r', str(repeats)
+        ],
+        env=environment, capture_output=True, text=True,
+        check=True
+    )
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+def __main__(
+    number: int, repeats: int, measure_only: bool,
+    *args, **kwargs
+):
+    """
+    Runs the benchmarks.
+
+    Parameters:
+    -----------
+    number : int
+        The number of calls to time in each run.
+    repeats : int
+        The number of runs; the fastest run is reported.
+    measure_only : bool
+        Whether to only measure, with the current setting,
+        and print the results as JSON.
+    """
+    if measure_only:
+        print(json.dumps(measure(number, repeats)))
+        return
+    results = {
+        setting: measure_in_process(setting, number, repeats)
+        for setting in ('on', 'off')
+    }
+    print(
+        f'{"Per call":<28} {"Checks on":>12} {"Checks off":>12} '
+        f'{"Saved":>12}'
+    )
+    for label, checked in results['on'].items():
+        unchecked = results['off'][label]
+        saved = checked - unchecked
+        print(
+            f'{label:<28} '
+            f'{checked:>10.2f}µs '
+            f'{unchecked:>10.2f}µs '
+            f'{saved:>10.2f}µs '
+            f'({saved / checked:.0%})'
+        )
+
+
+# Argument Parser
+parser = argparse.ArgumentParser(
+    prog='benchmark-typechecks',
+    description=__doc__,
+    epilog=EPILOG
+)
+parser.add_argument(
+    '--number', '-n', type=int, default=2000,
+    help='The number of calls to time in each run.'
+)
+parser.add_argument(
+    '--repeats', '-r', type=int, default=5,
+    help='The number of runs; the fastest is reported.'
+)
+parser.add_argument(
+    '--measure', dest='measure_only', action='store_true',
+    help='Only measure, with the current HMS_TYPECHECKS '
+    'setting, printing the results as JSON (used internally).'
+)
+
+if __name__ == '__main__':
+    arguments = parser.parse_args()
+    __main__(**vars(arguments))
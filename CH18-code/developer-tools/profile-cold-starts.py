@@ -0,0 +1,312 @@
+#!/usr/bin/env python3.11
+"""
+A developer tool that measures the cold-start import time of the
+Lambda Function handlers in the project's src directory, by importing
+each one in a fresh interpreter with -X importtime, and checks them
+against per-handler import-time budgets.
+"""
+
+# Built-In Imports
+import argparse
+import json
+import math
+import os
+import sys
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from subprocess import run
+
+# Module "Constants" and Other Attributes
+EPILOG = """Exits with a non-zero status if any handler's import time is
+over its budget, or it cannot be imported, so that it can be run as
+a check in a build. Import times vary from machine to machine, so
+budgets should be generated with --update-budgets on the machine
+that will check them, and have some headroom. The best of several
+runs is used for each handler to reduce noise. Handlers are imported
+with HMS_TYPECHECKS=off by default, as they are in production,
+because typeguard's instrumentation of hms.core adds most of a
+second to the import time when it is on."""
+
+PROJECT_ROOT = Path(__file__).parent.parent
+src_dir = PROJECT_ROOT / 'src'
+common_dir = PROJECT_ROOT / 'common'
+budgets_file = Path(__file__).parent / 'cold-start-budgets.json'
+
+# The least headroom, in ms, given to a budget when it is updated,
+# so that the budgets of handlers that import quickly are not
+# exceeded by ordinary noise
+MINIMUM_HEADROOM_MS = 25
+
+
+def _get_targets() -> list[str]:
+    """
+    Returns the names of the handler directories under the
+    src_dir directory, which are those with a module of the
+    same name.
+    """
+    return sorted(
+        item.name for item in src_dir.iterdir()
+        if (item / f'{item.name}.py').exists()
+    )
+
+
+def _parse_importtime(output: str) -> list[tuple[int, int, int, str]]:
+    """
+    Parses the output of python -X importtime, returning a
+    (self µs, cumulative µs, depth, module name) tuple for
+    each module imported, in the order they were reported.
+    """
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        try:
+            self_us, cumulative_us, name = \
+                line[len('import time:'):].split('|')
+            self_us, cumulative_us = int(self_us), int(cumulative_us)
+        except ValueError:
+            # The header line
+            continue
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append(
+            (self_us, cumulative_us, depth, name.strip())
+        )
+    return entries
+
+
+def profile_target(target: str, typechecks: str) -> dict:
+    """
+    Imports a handler in a fresh interpreter with -X
+    importtime, returning its total import time, in ms, and
+    the parsed import-time tree, or the error it raised.
+    """
+    environment = dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join(
+            [str(src_dir / target), str(common_dir)]
+        ),
+        HMS_TYPECHECKS=typechecks,
+    )
+    result = run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {target}'],
+        env=environment, capture_output=True, text=True,
+        cwd=PROJECT_ROOT
+    )
+    if result.returncode != 0:
+        return {
+            'target': target,
+            'error': result.stderr.strip().splitlines()[-1],
+        }
+    entries = _parse_importtime(result.stderr)
+    # The handler module's own entry is the last one, and its
+    # cumulative time includes everything it imported
+    handler_entries = [
+        entry for entry in entries
+        if entry[3] == target and entry[2] == 0
+    ]
+    return {
+        'target': target,
+        'total_ms': handler_entries[-1][1] / 1000,
+        'entries': entries,
+        'tree': result.stderr,
+    }
+
+
+def profile_best(target: str, repeats: int, typechecks: str) -> dict:
+    """
+    Profiles a handler repeats times, returning the fastest
+    result, or the first error.
+    """
+    best = None
+    for _ in range(repeats):
+        result = profile_target(target, typechecks)
+        if 'error' in result:
+            return result
+        if best is None or result['total_ms'] < best['total_ms']:
+            best = result
+    return best
+
+
+def __main__(
+    targets: list[str] | None = None,
+    repeats: int = 5,
+    jobs: int = 1,
+    top: int = 5,
+    budgets: Path = budgets_file,
+    output: Path | None = None,
+    update_budgets: bool = False,
+    headroom: float = 50.0,
+    typechecks: str = 'off',
+    *args, **kwargs
+) -> int:
+    """
+    Profiles the import time of one or more handlers, reports
+    the results and checks them against their budgets,
+    returning the exit status of the check.
+
+    Parameters:
+    -----------
+    targets : list[str]
+        The names of the Lambda directories (src/*) whose
+        handlers will be profiled. If not specified, ALL of
+        them will be.
+    repeats : int
+        The number of times to import each handler; the
+        fastest is reported.
+    jobs : int
+        The number of handlers to profile at once. More than
+        one is faster, but makes the timings noisier.
+    top : int
+        The number of the slowest modules to report for each
+        handler, by their own (not cumulative) import time.
+    budgets : Path
+        The JSON file of import-time budgets, in ms, with a
+        "default" budget and a "handlers" mapping of budgets
+        for specific handlers.
+    output : Path | None
+        A directory to write the raw -X importtime tree of
+        each handler to.
+    update_budgets : bool
+        Whether to write new budgets for the handlers
+        profiled, from their import times plus the headroom,
+        instead of checking them.
+    headroom : float
+        The percentage to add to import times when updating
+        budgets, which is at least MINIMUM_HEADROOM_MS.
+    typechecks : str
+        The HMS_TYPECHECKS setting to import the handlers
+        with.
+    """
+    targets = targets or _get_targets()
+    budget_data = json.loads(budgets.read_text()) \
+        if budgets.exists() else {'default': None, 'handlers': {}}
+    print(
+        f'Profiling {len(targets)} handlers, best of {repeats}, '
+        f'with HMS_TYPECHECKS={typechecks}'
+    )
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        results = list(
+            executor.map(
+                lambda target: profile_best(
+                    target, repeats, typechecks
+                ),
+                targets
+            )
+        )
+
+    if output:
+        output.mkdir(parents=True, exist_ok=True)
+
+    failures = []
+    print(f'{"Handler":<34} {"Import":>10} {"Budget":>10}')
+    for result in results:
+        target = result['target']
+        if 'error' in result:
+            failures.append(target)
+            print(f'{target:<34} {"ERROR":>10}  {result["error"]}')
+            continue
+        budget = budget_data['handlers'].get(
+            target, budget_data.get('default')
+        )
+        over = budget is not None and result['total_ms'] > budget
+        if over:
+            failures.append(target)
+        print(
+            f'{target:<34} {result["total_ms"]:>8.1f}ms '
+            + (f'{budget:>8.1f}ms' if budget else f'{"-":>10}')
+            + ('  OVER BUDGET' if over else '')
+        )
+        slowest = sorted(result['entries'], reverse=True)[:top]
+        for self_us, cumulative_us, _, name in slowest:
+            print(f'    {name:<38} {self_us / 1000:>8.1f}ms self')
+        if output:
+            (output / f'{target}.importtime.txt').write_text(
+                result['tree']
+            )
+
+    if update_budgets:
+        for result in results:
+            if 'error' not in result:
+                total_ms = result['total_ms']
+                budget_data['handlers'][result['target']] = \
+                    math.ceil(
+                        max(
+                            total_ms * (1 + headroom / 100),
+                            total_ms + MINIMUM_HEADROOM_MS
+                        )
+                    )
+        budget_data['default'] = max(
+            budget_data['handlers'].values(), default=None
+        )
+        budgets.write_text(
+            json.dumps(budget_data, indent=2, sort_keys=True)
+            + '\n'
+        )
+        print(f'Budgets written to {budgets}')
+        return 0
+
+    if failures:
+        print(
+            f'{len(failures)} handler(s) failed: '
+            f'{", ".join(failures)}'
+        )
+        return 1
+    print('All handlers are within their budgets')
+    return 0
+
+
+# Argument Parser
+parser = argparse.ArgumentParser(
+    prog='profile-cold-starts',
+    description=__doc__,
+    epilog=EPILOG
+)
+parser.add_argument(
+    '--targets', '-t', type=str, nargs='*',
+    help='The Lambda Function directories whose handlers '
+    'will be profiled. If not specified, ALL of them will be.'
+)
+parser.add_argument(
+    '--repeats', '-r', type=int, default=5,
+    help='The number of times to import each handler; the '
+    'fastest is reported.'
+)
+parser.add_argument(
+    '--jobs', '-j', type=int, default=1,
+    help='The number of handlers to profile at once.'
+)
+parser.add_argument(
+    '--top', '-n', type=int, default=5,
+    help='The number of the slowest modules to report for '
+    'each handler.'
+)
+parser.add_argument(
+    '--budgets', '-b', type=Path, default=budgets_file,
+    help='The JSON file of import-time budgets, in ms.'
+)
+parser.add_argument(
+    '--output', '-o', type=Path,
+    help='A directory to write the -X importtime tree of '
+    'each handler to.'
+)
+parser.add_argument(
+    '--update-budgets', '-u', action='store_true',
+    help='Write new budgets from the import times measured, '
+    'instead of checking them.'
+)
+parser.add_argument(
+    '--headroom', type=float, default=50.0,
+    help='The percentage to add to import times when '
+    'updating budgets.'
+)
+parser.add_argument(
+    '--typechecks', type=str, default='off',
+    help='The HMS_TYPECHECKS setting to import the handlers '
+    'with (off, as in production, by default).'
+)
+
+if __name__ == '__main__':
+    arguments = parser.parse_args()
+    sys.exit(__main__(**vars(arguments)))
@@ -12,7 +12,7 @@ from pathlib import Path
 
 # Third-Party Imports
 from hms.core.business_objects import Product, \
-    ProductNotFoundError, ProductImage
+    ProductNotFoundError
 
 from awslambdaric.lambda_context import LambdaContext
 from goblinfish.metrics.trackers import ProcessTracker
@@ -67,7 +67,8 @@ def api_handler(
         # long the process takes for metrics purposes
         with tracker.timer('product_db_access'):
             products = Product.get(
-                product_oid, db_source_name='Products'
+                product_oid, db_source_name='Products',
+                include=('product_images',), trusted=True,
             )
         # Raise an error if no Product could be found
         if len(products) == 0:
@@ -76,11 +77,6 @@ def api_handler(
                 f'identified by "{product_oid}".'
             )
         product = products[0]
-        with tracker.timer('product_image_db_access'):
-            product.product_images = ProductImage.get(
-                product_oid=product_oid,
-                db_source_name='ProductImages'
-            )
         _authnz_reconcile()
         result = {
             'statusCode': 200,
@@ -46,9 +46,15 @@ LIST_FIELD_NAMES = (
     # Images
 #    'product_images'
 )
+# The Product.get arguments that api_handler sets itself, which
+# are dropped from the query-string parameters if a client
+# sends them
+RESERVED_GET_PARAMS = (
+    'db_source_name', 'fields', 'include', 'trusted',
+)
 
-# Lambda Handlers
 
+# Lambda Handlers
 @tracker
 def api_handler(
     event: LambdaProxyInput, context: LambdaContext
@@ -69,6 +75,13 @@ def api_handler(
         page_number : int
             The page-number of resuls to return
             (zero-indexed)
+        page_token : str
+            The next_token from a previous page of results,
+            or an empty string for the first page, to use
+            keyset pagination instead of page_number. When
+            provided, the response body is an object with
+            "results" and "next_token" members instead of
+            a list of results.
         sort_{field-name} : str ("asc" or "desc")
             Sorts the {field-name} field in ascending
             ("asc") or descending ("desc") order.
@@ -82,7 +95,11 @@ def api_handler(
         logger.debug(f'context: {repr(context)}')
 
         # Convert the query-strings for pagination
-        get_params = event.get('queryStringParameters') or {}
+        get_params = {
+            key: value for key, value
+            in (event.get('queryStringParameters') or {}).items()
+            if key not in RESERVED_GET_PARAMS
+        }
         pagination_params = {
             key: int(get_params.get(key, 0)) or None
             for key in ('page_size', 'page_number')
@@ -95,20 +112,22 @@ def api_handler(
         _authnz_preflight()
         with tracker.timer('product_db_access'):
             products = Product.get(
-                db_source_name='Products', **get_params
+                db_source_name='Products', **get_params,
+                fields=LIST_FIELD_NAMES,
             )
         _authnz_reconcile()
 
-        # Filter the results' fields
-        results = [
-            {
-                key: value for key, value
-                in product.model_dump(mode='json').items()
-                if key in LIST_FIELD_NAMES
-            }
-            for product in products
-        ]
-        body = json.dumps(results)
+        # The results' fields were filtered by the query
+        results = list(products)
+        if 'page_token' in get_params:
+            body = json.dumps(
+                {
+                    'results': results,
+                    'next_token': products.next_token,
+                }
+            )
+        else:
+            body = json.dumps(results)
         result = {
             'statusCode': 200,
             'body': body
@@ -15,8 +15,10 @@ from awslambdaric.lambda_context import LambdaContext
 from goblinfish.metrics.trackers import ProcessTracker
 
 # Path Manipulations (avoid these!) and "Local" Imports
-from hms.core.business_objects import ProductImage, \
-    ProductImageNotFoundError
+# The business objects are imported by the handler, once the
+# request has been checked, so that bad requests do not pay
+# for importing them on a cold start
+from hms.core.errors import ProductImageNotFoundError
 from logger import logger
 
 # Module "Constants" and Other Attributes
@@ -108,6 +110,8 @@ def api_handler(
                 'which are not allowed in an update.'
             )
 
+        from hms.core.business_objects import ProductImage
+
         # Retrieve the current ProductImage and convert
         # it to a dict
         _authnz_preflight()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3.11
+"""
+Provides the backing Lambda Function for the scheduled job
+that archives records that have been deleted (flagged with
+is_deleted) for long enough, moving them out of the tables
+that the API reads into their archive tables, and deleting
+the image files of archived product images.
+"""
+from __future__ import annotations
+
+# Built-In Imports
+import json
+import os
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Third-Party Imports
+from awslambdaric.lambda_context import LambdaContext
+from goblinfish.metrics.trackers import ProcessTracker
+
+# Path Manipulations (avoid these!) and "Local" Imports
+from hms.core.business_objects import Artisan, Product, ProductImage
+from hms.core.storage import delete_images
+from logger import logger
+
+# Module "Constants" and Other Attributes
+tracker = ProcessTracker()
+
+module = Path(__file__).stem
+
+# Defaults for the job's settings, any of which can be
+# overridden by an environment variable of the same name
+ARCHIVE_DEFAULTS = {
+    # How many days a record must have been deleted for
+    'ARCHIVE_AFTER_DAYS': 30.0,
+    # The most records to archive in each transaction
+    'ARCHIVE_BATCH_SIZE': 500,
+    # How long to pause after each batch, as a multiple of
+    # how long the batch took, to limit replication lag
+    'ARCHIVE_THROTTLE': 1.0,
+    # The number of seconds before the Lambda Function's
+    # timeout after which no new batch is started
+    'ARCHIVE_TIME_MARGIN': 30.0,
+}
+
+
+# Lambda Handlers
+@tracker
+def lambda_handler(event: dict, context: LambdaContext) -> dict:
+    """
+    The scheduled handler that archives deleted records.
+    Product images are archived first, then Products, then
+    Artisans, so that a run that stops early has archived
+    the records that own the most data first.
+
+    Parameters:
+    -----------
+    event : dict
+        The scheduled event; its contents are not used.
+    context : LambdaContext
+        The standard Lambda context object provided
+        by AWS during a Lambda invocation.
+
+    Returns:
+    --------
+    A dict with the number of records archived from each
+    table, and whether the job archived all of them before
+    it ran out of time.
+    """
+    settings = {
+        name: type(default)(os.getenv(name, default))
+        for name, default in ARCHIVE_DEFAULTS.items()
+    }
+    logger.debug(f'settings: {settings}')
+    older_than = datetime.utcnow() \
+        - timedelta(days=settings['ARCHIVE_AFTER_DAYS'])
+    image_locations = (
+        os.environ['ORIGINAL_IMAGES_LOCATION'],
+        os.environ['DETAIL_IMAGES_LOCATION'],
+        os.environ['THUMBNAIL_IMAGES_LOCATION'],
+    )
+
+    def delete_image_files(oids: list[str]) -> None:
+        # The image files of each batch are deleted before it
+        # is committed, so that if deleting them fails, the
+        # batch is rolled back, and tried again on the next run
+        delete_images(oids, *image_locations)
+
+    jobs = (
+        (ProductImage, 'ProductImages', delete_image_files),
+        (Product, 'Products', None),
+        (Artisan, 'Artisan', None),
+    )
+    archived = {}
+    complete = True
+    for data_class, table_name, on_batch in jobs:
+        time_limit = _get_time_limit(
+            context, settings['ARCHIVE_TIME_MARGIN']
+        )
+        if time_limit <= 0:
+            complete = False
+            break
+        with tracker.timer(f'{table_name}_archive'):
+            timings = data_class.archive_deleted(
+                older_than,
+                batch_size=settings['ARCHIVE_BATCH_SIZE'],
+                throttle=settings['ARCHIVE_THROTTLE'],
+                time_limit=time_limit,
+                on_batch=on_batch,
+                db_source_name=table_name,
+            )
+        archived[table_name] = sum(
+            timing['rows'] for timing in timings
+        )
+        tracker.set_metric(
+            f'{table_name}_archived', archived[table_name]
+        )
+        tracker.set_metric(f'{table_name}_batches', len(timings))
+        tracker.set_metric(
+            f'{table_name}_paused',
+            round(sum(timing['paused'] for timing in timings), 3)
+        )
+    # Running out of time, whether in the last table or
+    # before reaching it, may have left records to archive
+    if _get_time_limit(context, settings['ARCHIVE_TIME_MARGIN']) <= 0:
+        complete = False
+    tracker.set_metric('complete', complete)
+
+    result = {
+        'archived': archived,
+        'complete': complete,
+    }
+    logger.info(f'{module}.lambda_handler result: {result}')
+    return result
+
+
+# Module Functions
+
+def _get_time_limit(context: LambdaContext, margin: float) -> float:
+    """
+    Returns the number of seconds that the job can keep
+    starting new batches for: the time remaining before the
+    Lambda Function times out, less a margin.
+
+    Parameters:
+    -----------
+    context : LambdaContext
+        The Lambda context of the invocation.
+    margin : float
+        The number of seconds to leave before the timeout.
+    """
+    return context.get_remaining_time_in_millis() / 1000 - margin
+
+
+# Code to run if the module is executed directly
+
+if __name__ == '__main__':
+
+    import logging
+
+    from unittest.mock import MagicMock
+
+    formatter = logging.Formatter(
+        "[%(levelname)s]  %(message)s"
+    )
+    handler = logging.StreamHandler()
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+
+    logger.info(f'Running {module}.__main__')
+    context = MagicMock()
+    context.get_remaining_time_in_millis.return_value = 900_000
+    result = lambda_handler({}, context)
+    logger.info(
+        'lambda_handler result: '
+        f'{json.dumps(result, indent=4)}'
+    )
+    logger.info(f'{module}.__main__ completed')
@@ -6,26 +6,34 @@ that handles create product_image functionality.
 from __future__ import annotations
 
 # Built-In Imports
+import binascii
 import io
 import json
+import logging
 import os
+import warnings
 
-from base64 import b64decode
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 from uuid import uuid4
 
 # Third-Party Imports
-from PIL import Image
 from awslambdaric.lambda_context import LambdaContext
 from goblinfish.metrics.trackers import ProcessTracker
 
 # Path Manipulations (avoid these!) and "Local" Imports
-from hms.core.business_objects import ProductImage, \
-    Product, ProductNotFoundError
+# Pillow, the business objects and the object store are imported
+# by the handler, once the request has been checked, so that bad
+# requests do not pay for importing them on a cold start
+from hms.core.errors import ProductNotFoundError
 
 from logger import logger
 
+if TYPE_CHECKING:
+    from PIL import Image
+
 # Custom Exceptions
 class VirusScanFailedError(Exception):
     """
@@ -48,7 +56,13 @@ ALLOWED_MIME_TYPES = {
 }
 FORMAT_TO_FILE_EXT = {
     'JPEG': 'jpg',
-    'PNG': 'png'
+    'PNG': 'png',
+    'WEBP': 'webp',
+}
+FORMAT_TO_MIME_TYPE = {
+    'JPEG': 'image/jpeg',
+    'PNG': 'image/png',
+    'WEBP': 'image/webp',
 }
 
 ImageAndSize = namedtuple(
@@ -56,6 +70,60 @@ ImageAndSize = namedtuple(
     ['image', 'width', 'height']
 )
 
+# An image variant to be saved: its name (original, detail or
+# thumbnail), the pillow Image, or the data for an original,
+# which is saved as it was uploaded, its format, and the
+# location to save it to
+ImageVariant = namedtuple(
+    'ImageVariant',
+    ['name', 'image', 'image_format', 'location']
+)
+
+# The default format of the detail and thumbnail images, which
+# can be overridden with the DETAIL_IMAGE_FORMAT and
+# THUMBNAIL_IMAGE_FORMAT environment variables. WebP is smaller
+# than JPEG for the same quality, and keeps transparency; JPEG
+# is used instead if the pillow build cannot write WebP.
+DEFAULT_VARIANT_IMAGE_FORMAT = 'WEBP'
+
+# The options that images are encoded with, by format
+FORMAT_SAVE_OPTIONS = {
+    'JPEG': {'quality': 85},
+    'PNG': {},
+    'WEBP': {'quality': 80},
+}
+
+# The default largest (width, height) of the detail and
+# thumbnail images, which can be overridden with a
+# "<width>x<height>" value in the DETAIL_IMAGE_MAX_SIZE and
+# THUMBNAIL_IMAGE_MAX_SIZE environment variables. Images are
+# scaled down to fit, keeping their aspect ratio, and never
+# scaled up.
+DEFAULT_DETAIL_IMAGE_MAX_SIZE = (1024, 1024)
+DEFAULT_THUMBNAIL_IMAGE_MAX_SIZE = (240, 240)
+
+# The default largest number of pixels (width x height) that an
+# uploaded image may have, which can be overridden with the
+# MAX_IMAGE_PIXELS environment variable. Larger images are
+# rejected before their pixel data is decoded, to guard against
+# decompression bombs: small files that decode to images too
+# large for the Lambda's memory.
+DEFAULT_MAX_IMAGE_PIXELS = 40_000_000
+
+# How much larger than the target size an image is reduced to,
+# with a fast reduce, before it is resampled: larger values are
+# slower but better quality
+REDUCING_GAP = 2.0
+
+# The image modes that are resized and saved as they are;
+# others (CMYK, palette, etc.) are converted to RGB or RGBA,
+# since they cannot be saved as PNG, or resize poorly
+IMAGE_MODES = ('L', 'LA', 'RGB', 'RGBA')
+
+# The number of Base 64 characters decoded at a time, which must
+# be a multiple of 4, so that each chunk decodes on its own
+BASE64_CHUNK_SIZE = 256 * 1024
+
 # Lambda Handlers
 
 @tracker
@@ -76,7 +144,10 @@ def api_handler(
     """
     try:
         logger.info(f'{module}.api_handler called')
-        logger.debug(f'event: {json.dumps(event)}')
+        # The event includes the whole image upload, so it is
+        # only serialized when it will actually be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'event: {json.dumps(event)}')
         logger.debug(f'context: {repr(context)}')
 
         _authnz_preflight()
@@ -99,6 +170,20 @@ def api_handler(
                 'oid, but that path parameter resolved to '
                 f'"{product_oid}" ({type(product_oid).__name__}).'
             )
+
+        # Get and check the image data, removing it from the
+        # body as it is decoded, so that only the decoded
+        # copy is kept
+        original_image = _decode_image_data(
+            body.pop('image_data')
+        )
+        assert original_image, (
+            'No "image_data" present in event.body'
+        )
+
+        from hms.core.business_objects import \
+            Product, ProductImage
+
         # Get the Product objects, keeping track of how
         # long the process takes for metrics purposes
         with tracker.timer('product_db_access'):
@@ -112,23 +197,13 @@ def api_handler(
                 f'identified by "{product_oid}".'
             )
 
-        # Get and check the image data
-        image_base64_str = body['image_data'] \
-            .split(',')[-1].strip()
-        assert image_base64_str, (
-            'No "image_data" present in event.body'
-        )
+        # Check the image data for viruses with external
+        # API calls
+        _call_virus_check_api(original_image)
 
-        # Use the string representation for virus
-        # checking with external API calls
-        _call_virus_check_api(image_base64_str)
+        from PIL import Image
 
-        # Decode the Base 64 string to get the
-        # actual binary data for the file
-        image_base64 = bytes(image_base64_str, 'utf-8')
-        original_image = b64decode(image_base64)
-        image_io = io.BytesIO(original_image)
-        image = Image.open(image_io)
+        image = _open_image(original_image)
         logger.debug(
             f'image: format={image.format} '
             f'({Image.MIME.get(image.format)}) '
@@ -143,33 +218,33 @@ def api_handler(
 
         # Resize and convert the image as needed to
         # create a product-detail image
-        detail_image = _create_detail_image(image)
+        detail_image = _create_detail_image(original_image)
 
-        # Resize and convert the image as needed to
-        # create a product-thumbnail image
-        thumbnail_image = _create_thumbnail_image(image)
+        # Resize the detail image to create a
+        # product-thumbnail image
+        thumbnail_image = _create_thumbnail_image(detail_image)
 
         # Save the image files to the appropriate
-        # locations
-        # Use a common oid for each
+        # locations, using a common oid for each. The
+        # original is saved as it was uploaded, without
+        # being encoded again
         new_image_oid = body.get('oid', str(uuid4()))
-        # Save the original image
-        save_image(
-            image,
-            os.environ['ORIGINAL_IMAGES_LOCATION'],
-            new_image_oid
-        )
-        # The detail image
-        save_image(
-            detail_image,
-            os.environ['DETAIL_IMAGES_LOCATION'],
-            new_image_oid
-        )
-        # The thumbnail image
-        save_image(
-            thumbnail_image,
-            os.environ['THUMBNAIL_IMAGES_LOCATION'],
-            new_image_oid
+        _save_variants(
+            new_image_oid,
+            ImageVariant(
+                'original', original_image, image.format,
+                os.environ['ORIGINAL_IMAGES_LOCATION']
+            ),
+            ImageVariant(
+                'detail', detail_image,
+                _get_env_format('DETAIL_IMAGE_FORMAT'),
+                os.environ['DETAIL_IMAGES_LOCATION']
+            ),
+            ImageVariant(
+                'thumbnail', thumbnail_image,
+                _get_env_format('THUMBNAIL_IMAGE_FORMAT'),
+                os.environ['THUMBNAIL_IMAGES_LOCATION']
+            ),
         )
 
         request_params = {
@@ -276,49 +351,322 @@ def _authnz_reconcile(*args, **kwargs):
     ...
 
 
-def _call_virus_check_api(image_base64_str: str):
+def _call_virus_check_api(image_data: memoryview):
     """
-    Submits the supplied base64-encoded string to an
-    external virus-checking API. If the results of
-    the check indicate a virus, raises a
-    VirusScanFailedError
+    Submits the supplied image data to an external
+    virus-checking API. If the results of the check
+    indicate a virus, raises a VirusScanFailedError
     """
     # TODO: Implement the actual API call.
     ...
 
 
-def _create_detail_image(original_image: Image) -> Image:
+def _convert_image(image: Image) -> Image:
     """
-    Placeholder code
+    Returns the image as it is if its mode is one of the
+    IMAGE_MODES, or converted to RGB, or RGBA if it has
+    transparency, if it is not.
+
+    Parameters:
+    -----------
+    image : Image
+        The image to convert.
     """
-    # TODO: Handle the maximum size, scaling, cropping,
-    #       etc. based on business rules for detail
-    #       images that are TBD.
-    # For now, just return the original image and its
-    # width and height.
-    return original_image
+    if image.mode in IMAGE_MODES:
+        return image
+    return image.convert(
+        'RGBA' if image.has_transparency_data else 'RGB'
+    )
 
 
-def _create_thumbnail_image(original_image: bytes) -> Image:
+def _create_detail_image(image_data: memoryview) -> Image:
     """
-    Placeholder code
+    Creates the product-detail image from the original image
+    data, scaled down to fit DETAIL_IMAGE_MAX_SIZE.
+
+    Parameters:
+    -----------
+    image_data : memoryview
+        The binary data of the original image.
     """
-    # TODO: Handle the maximum size, scaling, cropping,
-    #       etc. based on business rules for detail
-    #       images that are TBD.
-    # For now, just return the original image and its
-    # width and height.
-    return original_image
+    max_size = _get_env_size(
+        'DETAIL_IMAGE_MAX_SIZE', DEFAULT_DETAIL_IMAGE_MAX_SIZE
+    )
+    return _resize_image(_open_image(image_data), max_size)
 
 
-def save_image(image: Image, location: str, oid: str) -> None:
+def _create_thumbnail_image(detail_image: Image) -> Image:
     """
-    Saves the image to the specified location.
+    Creates the product-thumbnail image from the detail image,
+    which is smaller, and so quicker to resize, than the
+    original, scaled down to fit THUMBNAIL_IMAGE_MAX_SIZE.
+
+    Parameters:
+    -----------
+    detail_image : Image
+        The product-detail image.
+    """
+    max_size = _get_env_size(
+        'THUMBNAIL_IMAGE_MAX_SIZE',
+        DEFAULT_THUMBNAIL_IMAGE_MAX_SIZE
+    )
+    return _resize_image(detail_image.copy(), max_size)
+
+
+def _decode_image_data(image_data: str) -> memoryview:
+    """
+    Decodes Base 64 image data, with or without a data URL
+    prefix ("data:image/png;base64,"), a chunk at a time into
+    a single preallocated buffer, and returns a view of the
+    decoded bytes, so that no other copies of the whole
+    upload are made.
+
+    Parameters:
+    -----------
+    image_data : str
+        The Base 64 image data from the request body.
+
+    Raises:
+    -------
+    ValueError
+        If the image data is not valid Base 64.
+    """
+    # The encoded data is everything after the last comma,
+    # without surrounding whitespace, found without slicing
+    # a copy of it
+    start = image_data.rfind(',') + 1
+    end = len(image_data)
+    while start < end and image_data[start].isspace():
+        start += 1
+    while end > start and image_data[end - 1].isspace():
+        end -= 1
+
+    buffer = bytearray((end - start + 3) // 4 * 3)
+    view = memoryview(buffer)
+    length = 0
+    try:
+        for chunk_start in range(start, end, BASE64_CHUNK_SIZE):
+            decoded = binascii.a2b_base64(
+                image_data[
+                    chunk_start:min(chunk_start + BASE64_CHUNK_SIZE, end)
+                ]
+            )
+            view[length:length + len(decoded)] = decoded
+            length += len(decoded)
+    except binascii.Error:
+        # Data with line-breaks or other characters in it
+        # does not split into 4-character chunks, so it is
+        # decoded in one go instead
+        view.release()
+        return memoryview(
+            binascii.a2b_base64(image_data[start:end])
+        )
+    return view[:length]
+
+
+def _encode_image(
+    image: Image, image_format: str, image_file: io.RawIOBase
+) -> None:
+    """
+    Encodes an image in a format, writing the encoded data to
+    a file as it is produced. Images with transparency are
+    flattened onto a white background for formats that cannot
+    store it.
 
     Parameters:
     -----------
     image : Image
-        The pillow Image data to write.
+        The image to encode.
+    image_format : str
+        The pillow name of the format to encode the image in.
+    image_file : io.RawIOBase
+        The writable file to write the encoded data to.
+    """
+    from PIL import Image
+
+    if image_format == 'JPEG' and image.mode in ('LA', 'RGBA'):
+        background = Image.new('RGB', image.size, 'white')
+        background.paste(image, mask=image.getchannel('A'))
+        image = background
+    image.save(
+        image_file, image_format,
+        **FORMAT_SAVE_OPTIONS.get(image_format, {})
+    )
+
+
+def _get_env_format(name: str) -> str:
+    """
+    Returns the image format set in an environment variable,
+    or DEFAULT_VARIANT_IMAGE_FORMAT if it is not set, falling
+    back to JPEG if the pillow build cannot write WebP.
+
+    Parameters:
+    -----------
+    name : str
+        The name of the environment variable.
+    """
+    from PIL import features
+
+    image_format = os.getenv(
+        name, DEFAULT_VARIANT_IMAGE_FORMAT
+    ).upper()
+    if image_format == 'WEBP' and not features.check('webp'):
+        return 'JPEG'
+    return image_format
+
+
+def _get_env_size(
+    name: str, default: tuple[int, int]
+) -> tuple[int, int]:
+    """
+    Returns the (width, height) set in an environment variable
+    in "<width>x<height>" format, or the default if it is not
+    set.
+
+    Parameters:
+    -----------
+    name : str
+        The name of the environment variable.
+    default : tuple[int, int]
+        The (width, height) to return if the variable is not
+        set.
+    """
+    value = os.getenv(name)
+    if not value:
+        return default
+    width, height = value.lower().split('x')
+    return int(width), int(height)
+
+
+def _open_image(image_data: memoryview) -> Image:
+    """
+    Opens image data without decoding its pixels, raising a
+    ValueError if it is not an image Pillow can read, or if it
+    has more pixels than MAX_IMAGE_PIXELS allows.
+
+    Parameters:
+    -----------
+    image_data : memoryview
+        The binary data of the image.
+    """
+    from PIL import Image, UnidentifiedImageError
+
+    max_pixels = int(
+        os.getenv('MAX_IMAGE_PIXELS', DEFAULT_MAX_IMAGE_PIXELS)
+    )
+    # Pillow itself refuses to open images with more than
+    # twice this many pixels, and warns about those with more
+    # than this many, which are rejected below anyway
+    Image.MAX_IMAGE_PIXELS = max_pixels
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter(
+                'ignore', Image.DecompressionBombWarning
+            )
+            image = Image.open(BufferReader(image_data))
+    except (
+        Image.DecompressionBombError, UnidentifiedImageError
+    ) as error:
+        raise ValueError(
+            f'{module} could not open the uploaded image: '
+            f'{error}'
+        ) from error
+    if image.width * image.height > max_pixels:
+        raise ValueError(
+            f'{module} cannot accept an image of '
+            f'{image.width}x{image.height} pixels, which is '
+            f'more than the limit of {max_pixels:,} pixels.'
+        )
+    return image
+
+
+def _resize_image(image: Image, max_size: tuple[int, int]) -> Image:
+    """
+    Scales an image down, in place, to fit within a maximum
+    width and height, keeping its aspect ratio, and returns it.
+
+    Parameters:
+    -----------
+    image : Image
+        The image to resize, which may not have been
+        loaded yet.
+    max_size : tuple[int, int]
+        The largest (width, height) of the resized image.
+    """
+    # If the image is a JPEG that has not been loaded yet, have
+    # the decoder scale it down by a power of two, to no smaller
+    # than max_size, as it loads, so that its full-size pixel
+    # data is never held in memory. thumbnail would only do this
+    # for images at least REDUCING_GAP times max_size, and not
+    # at all once the image has been loaded to convert it.
+    image.draft(None, max_size)
+    image = _convert_image(image)
+    image.thumbnail(max_size, reducing_gap=REDUCING_GAP)
+    return image
+
+
+def _save_variant(oid: str, variant: ImageVariant) -> None:
+    """
+    Encodes an image variant straight into its file, unless it
+    is the data of an original, which is written as it is, and
+    tracks the time taken to encode and to finish writing it.
+
+    Parameters:
+    -----------
+    oid : str (UUID format)
+        The oid of the image.
+    variant : ImageVariant
+        The variant to save.
+    """
+    with open_image_file(
+        variant.location, oid, variant.image_format
+    ) as image_file:
+        if isinstance(variant.image, memoryview):
+            with tracker.timer(f'{variant.name}_image_write'):
+                image_file.write(variant.image)
+                image_file.close()
+        else:
+            with tracker.timer(f'{variant.name}_image_encode'):
+                _encode_image(
+                    variant.image, variant.image_format,
+                    image_file
+                )
+            with tracker.timer(f'{variant.name}_image_write'):
+                image_file.close()
+
+
+def _save_variants(oid: str, *variants: ImageVariant) -> None:
+    """
+    Encodes and saves image variants concurrently, in a thread
+    pool, which pillow allows by releasing the GIL while it
+    encodes, re-raising the first error that any of them
+    raised.
+
+    Parameters:
+    -----------
+    oid : str (UUID format)
+        The oid of the image.
+    variants : ImageVariant
+        The variants to save.
+    """
+    with ThreadPoolExecutor(max_workers=len(variants)) as executor:
+        futures = [
+            executor.submit(_save_variant, oid, variant)
+            for variant in variants
+        ]
+    for future in futures:
+        future.result()
+
+
+def open_image_file(
+    location: str, oid: str, image_format: str
+) -> io.RawIOBase:
+    """
+    Opens a writable file for an image at the specified
+    location. The image is saved when the file is closed.
+
+    Parameters:
+    -----------
     location : str (local file path or S3 URL)
         The location to write the image data to
     oid : str (UUID format)
@@ -326,12 +674,9 @@ def save_image(image: Image, location: str, oid: str) -> None:
         file name for the original, detail and thumbnail
         images that is distinct from any other image's
         original, detail and thumbnail file names.
-
-    Raises:
-    -------
-    NotImplementedError
-        If called with an S3 URL as the location.
-        This will be implemented later.
+    image_format : str
+        The pillow name of the format the image data is
+        in, which sets the file extension.
 
     Notes:
     ------
@@ -339,17 +684,25 @@ def save_image(image: Image, location: str, oid: str) -> None:
       "file:///"), the file will be written to the local
       file system at that location.
     * If the location is an S3 URL, then the file will be
-      written to the S3 bucket and path specified.
+      written to the S3 bucket and path specified, using a
+      multipart upload if it is larger than a single part,
+      and the upload is aborted if the file is used as a
+      context manager and an error is raised.
     """
-    logger.info(f'{module}.save_image called')
+    logger.info(f'{module}.open_image_file called')
     logger.debug(f'vars: {vars()}')
 
-    image_name = f'{oid}.png'
+    image_name = f'{oid}.{FORMAT_TO_FILE_EXT[image_format]}'
 
     if location.startswith('s3://'):
-        raise NotImplementedError(
-            'Saving images to an S3 bucket is not yet '
-            'supported.'
+        from hms.core.storage import S3ObjectWriter
+
+        image_url = location.format(**os.environ).rstrip('/') \
+            + f'/{image_name}'
+        logger.debug(f'image_url: {image_url}')
+        return S3ObjectWriter(
+            image_url,
+            content_type=FORMAT_TO_MIME_TYPE.get(image_format)
         )
     elif location.startswith('file:///'):
         save_path = Path(
@@ -361,20 +714,16 @@ def save_image(image: Image, location: str, oid: str) -> None:
         )
         if not save_path.exists():
             logger.debug(f'Creating {save_path} directory')
-            save_path.mkdir(parents=True)
+            save_path.mkdir(parents=True, exist_ok=True)
         image_path = save_path / image_name
-        image.save(image_path)
-        logger.info(
-            f'{module}.save_image completed: {image} '
-            f'saved to {image_path}'
-        )
+        logger.debug(f'image_path: {image_path}')
+        return image_path.open('wb', buffering=0)
 
     else:
         raise RuntimeError(
             f'Unsupported location type ({location}) '
             'to save image files.'
         )
-    logger.info(f'{module}.save_image completed')
 
 
 # Module Metaclasses (if any)
@@ -382,13 +731,61 @@ def save_image(image: Image, location: str, oid: str) -> None:
 # Module Abstract Base Classes (if any, requires abc)
 
 # Module Concrete Classes
+class BufferReader(io.RawIOBase):
+    """
+    A read-only, seekable file over a memoryview, which lets Pillow read image data without the copy of it that io.BytesIO would make.
+    """  # noqa: E501
+
+    def __init__(self, buffer: memoryview):
+        """
+        Object initialization.
+
+        Parameters:
+        -----------
+        buffer : memoryview
+            The data to read.
+        """
+        self._buffer = buffer
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        """
+        Reads data from the current position into a
+        pre-allocated, writable bytes-like object, returning
+        the number of bytes read.
+        """
+        data = self._buffer[self._position:self._position + len(target)]
+        target[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Changes the current position, relative to the start,
+        the current position or the end of the data, and
+        returns the new position.
+        """
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._buffer)
+        self._position = max(offset, 0)
+        return self._position
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
 
 # Code to run if the module is executed directly
 
 if __name__ == '__main__':
 
-    import logging
-
     from os import sep, extsep
 
     formatter = logging.Formatter(
@@ -12,14 +12,15 @@ import os
 from pathlib import Path
 
 # Third-Party Imports
-from hms.core.business_objects import \
-    Product, ProductNotFoundError, \
-    ProductImage, ProductImageNotFoundError
-
 from awslambdaric.lambda_context import LambdaContext
 from goblinfish.metrics.trackers import ProcessTracker
 
 # Path Manipulations (avoid these!) and "Local" Imports
+# The business objects, and the object store, are imported by the
+# handler, once the request has been checked, so that bad requests
+# do not pay for importing them on a cold start
+from hms.core.errors import \
+    ProductNotFoundError, ProductImageNotFoundError
 from logger import logger
 
 # Module "Constants" and Other Attributes
@@ -76,13 +77,19 @@ def api_handler(
                 f'"{product_oid}" ({type(product_oid).__name__}).'
             )
 
+        from hms.core.business_objects import \
+            Product, ProductImage
+        from hms.core.data_objects import UnitOfWork
+        from hms.core.storage import ObjectStoreError, delete_images
+
         # Get the Product objects, keeping track of how
         # long the process takes for metrics purposes
         with tracker.timer('product_db_access'):
             products = Product.get(
                 product_oid,
                 db_source_name='Products',
-                artisan_oid=artisan_oid
+                artisan_oid=artisan_oid,
+                include=('product_images',),
             )
         # Raise an error if no Product could be found
         if len(products) == 0:
@@ -93,33 +100,44 @@ def api_handler(
         product = products[0]
         logger.debug('product: {product}')
 
-        with tracker.timer('product_image_db_access'):
-            product.product_images = ProductImage.get(
-                db_source_name='ProductImages',
-                product_oid=product_oid
-            )
         image_oids = [
             img.oid for img in product.product_images
         ]
 
         _authnz_reconcile()
 
-        # Perform the actual deletion(s)
-        for image_oid in image_oids:
-            for location in (
+        # Perform the actual deletion(s): the records in a
+        # single transaction, then, once that has been
+        # committed, the image files, so that no record is
+        # left referring to an image that has been deleted
+        with tracker.timer('product_db_delete'):
+            with UnitOfWork():
+                if image_oids:
+                    ProductImage.delete(
+                        *image_oids,
+                        db_source_name='ProductImages',
+                    )
+                Product.delete(
+                    product_oid,
+                    db_source_name='Products',
+                )
+        # The product has been deleted once the records are,
+        # so image files that cannot be deleted are logged, to
+        # be cleaned up later, rather than failing the request
+        try:
+            delete_images(
+                image_oids,
                 os.environ['ORIGINAL_IMAGES_LOCATION'],
                 os.environ['DETAIL_IMAGES_LOCATION'],
                 os.environ['THUMBNAIL_IMAGES_LOCATION'],
-            ):
-                delete_image(location, image_oid)
-        ProductImage.delete(
-            *image_oids,
-            db_source_name='ProductImages',
-        )
-        Product.delete(
-            product_oid,
-            db_source_name='Products',
-        )
+            )
+        except (ObjectStoreError, OSError) as error:
+            logger.exception(
+                f'{error.__class__.__name__}: {error} '
+                'occured deleting the image files of the '
+                f'Product identified by "{product_oid}": '
+                f'{[str(oid) for oid in image_oids]}'
+            )
 
         result = {
             'statusCode': 200,
@@ -142,6 +160,19 @@ def api_handler(
             f'({context.aws_request_id})'
         }
 
+    except ValueError as error:
+        logger.exception(
+            f'{error.__class__.__name__}: {error} '
+            'occured in api_handler'
+        )
+        logger.error(f'event: {json.dumps(event)}')
+        logger.error(f'context: {repr(context)}')
+        result = {
+            'statusCode': 400,
+            'body': 'Bad Request: '
+            f'({context.aws_request_id})'
+        }
+
     except Exception as error:
         logger.exception(
             f'{error.__class__.__name__}: {error} '
@@ -169,68 +200,6 @@ def _authnz_reconcile(*args, **kwargs):
     ...
 
 
-def delete_image(location: str, oid: str) -> None:
-    """
-    Deletes the image from the specified location.
-
-    Parameters:
-    -----------
-    location : str (local file path or S3 URL)
-        The location to write the image data to
-    oid : str (UUID format)
-        The oid of the image, used to create a common
-        file name for the original, detail and thumbnail
-        images that is distinct from any other image's
-        original, detail and thumbnail file names.
-
-    Raises:
-    -------
-    NotImplementedError
-        If called with an S3 URL as the location.
-        This will be implemented later.
-
-    Notes:
-    ------
-    * If the location is a local file URL (starting with
-      "file:///"), the file will be written to the local
-      file system at that location.
-    * If the location is an S3 URL, then the file will be
-      written to the S3 bucket and path specified.
-    """
-    logger.info(f'{module}.save_image called')
-    logger.debug(f'vars: {vars()}')
-
-    image_name = f'{oid}.png'
-
-    if location.startswith('s3://'):
-        raise NotImplementedError(
-            'Deleting images from an S3 bucket is not '
-            'yet supported.'
-        )
-    elif location.startswith('file:///'):
-        save_path = Path(
-            location[8:].format(**os.environ)
-        )
-        logger.debug(
-            f'save_path: {save_path} '
-            f'({type(save_path).__name__})'
-        )
-        image_path = save_path / image_name
-        if image_path.exists():
-            image_path.unlink()
-        logger.info(
-            f'{module}.delete_image completed: '
-            f'deleted {image_path}'
-        )
-
-    else:
-        raise RuntimeError(
-            f'Unsupported location type ({location}) '
-            'to save image files.'
-        )
-    logger.info(f'{module}.save_image completed')
-
-
 # Module Metaclasses (if any)
 
 # Module Abstract Base Classes (if any, requires abc)
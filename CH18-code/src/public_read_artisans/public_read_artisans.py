@@ -11,10 +11,14 @@ import json
 from pathlib import Path
 
 # Third-Party Imports
+from hms.core.business_objects import Artisan
+
 from awslambdaric.lambda_context import LambdaContext
 from goblinfish.metrics.trackers import ProcessTracker
 
 # Path Manipulations (avoid these!) and "Local" Imports
+from hms.core.caching import get_env_query_cache
+from hms.core.responses import json_response, not_modified
 from logger import logger
 
 # Module "Constants" and Other Attributes
@@ -25,8 +29,26 @@ module = Path(__file__).stem
 LambdaProxyInput = dict[str, str]
 LambdaProxyOutput = dict[str, str]
 
-# Lambda Handlers
+ARTISAN_FIELD_NAMES = (
+    # Unique identifier
+    'oid',
+    # Person name fields
+    'honorific',
+    'given_name', 'middle_name', 'family_name',
+    'suffix',
+    # Company fields
+    'company_name'
+)
+# The Artisan.get arguments that api_handler sets itself, which
+# are dropped from the query-string parameters if a client
+# sends them
+RESERVED_GET_PARAMS = (
+    'db_source_name', 'fields', 'include', 'trusted',
+    'is_active', 'is_deleted',
+)
 
+
+# Lambda Handlers
 @tracker
 def api_handler(
     event: LambdaProxyInput, context: LambdaContext
@@ -39,6 +61,32 @@ def api_handler(
     -----------
     event : LambdaProxyInput (dict)
         The API event to be handled.
+        Fields that contribute to the response include
+        queryStringParameters:
+        page_size: int
+            The number of items to return in a single
+            page of results.
+        page_number : int
+            The page-number of resuls to return
+            (zero-indexed)
+        page_token : str
+            The next_token from a previous page of results,
+            or an empty string for the first page, to use
+            keyset pagination instead of page_number. When
+            provided, the response body is an object with
+            "results" and "next_token" members instead of
+            a list of results.
+        sort_{field-name} : str ("asc" or "desc")
+            Sorts the {field-name} field in ascending
+            ("asc") or descending ("desc") order.
+        headers:
+        If-None-Match : str
+            The ETag of results that the client already
+            has, which are not sent again if they have not
+            changed.
+        Accept-Encoding : str
+            The content-codings (gzip, br) that the client
+            accepts compressed responses in.
     context : LambdaContext
         The standard Lambda context object provided
         by AWS during a Lambda invocation.
@@ -47,12 +95,53 @@ def api_handler(
         logger.info(f'{module}.api_handler called')
         logger.debug(f'event: {json.dumps(event)}')
         logger.debug(f'context: {repr(context)}')
-        # TODO: Replace this with actual logic
-        result = {
-            'statusCode': 501,
-            'body': 'Not Implemented '
-            f'({context.aws_request_id})'
+
+        # Convert the query-strings for pagination
+        get_params = {
+            key: value for key, value
+            in (event.get('queryStringParameters') or {}).items()
+            if key not in RESERVED_GET_PARAMS
+        }
+        pagination_params = {
+            key: int(get_params.get(key, 0)) or None
+            for key in ('page_size', 'page_number')
         }
+        get_params.update(pagination_params)
+        logger.debug(f'get_params: {get_params}')
+
+        # Clients that already have the current results get
+        # a 304 response without the database being queried,
+        # if the query cache keeps version stamps of the
+        # table that the results are read from in a back end
+        # shared by every process; otherwise the ETag is a
+        # hash of the results
+        query_cache = get_env_query_cache()
+        etag = query_cache.etag(
+            json.dumps([module, get_params], sort_keys=True),
+            'Artisan'
+        ) if query_cache is not None else None
+        result = not_modified(event, etag) if etag else None
+
+        if result is None:
+            # Get the active Artisans' public fields, keeping
+            # track of how long the process takes for metrics
+            # purposes
+            with tracker.timer('artisan_db_access'):
+                artisans = Artisan.get(
+                    db_source_name='Artisan', **get_params,
+                    is_active=True, is_deleted=False,
+                    fields=ARTISAN_FIELD_NAMES,
+                )
+
+            if 'page_token' in get_params:
+                data = {
+                    'results': list(artisans),
+                    'next_token': artisans.next_token,
+                }
+            else:
+                data = list(artisans)
+            # Large bodies are compressed
+            result = json_response(event, data, etag=etag)
 
     # TODO: Add other exception-handling if needed
 
@@ -12,7 +12,7 @@ from pathlib import Path
 
 # Third-Party Imports
 from hms.core.business_objects import Product, \
-    ProductNotFoundError, ProductImage
+    ProductNotFoundError
 
 from awslambdaric.lambda_context import LambdaContext
 from goblinfish.metrics.trackers import ProcessTracker
@@ -69,6 +69,12 @@ def api_handler(
             products = Product.get(
                 product_oid, db_source_name='Products',
                 is_active=True, is_deleted=False,
+                trusted=True,
+                include={
+                    'product_images': {
+                        'is_active': True, 'is_deleted': False,
+                    },
+                },
             )
         # Raise an error if no Product could be found
         if len(products) == 0:
@@ -77,12 +83,6 @@ def api_handler(
                 f'identified by "{product_oid}".'
             )
         product = products[0]
-        with tracker.timer('product_image_db_access'):
-            product.product_images = ProductImage.get(
-                product_oid=product_oid,
-                db_source_name='ProductImages',
-                is_active=True, is_deleted=False,
-            )
         result = {
             'statusCode': 200,
             'body': product.model_dump_json()
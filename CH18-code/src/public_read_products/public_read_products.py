@@ -9,16 +9,16 @@ from __future__ import annotations
 import json
 
 from pathlib import Path
-from uuid import UUID
 
 # Third-Party Imports
-from hms.core.business_objects import Product, \
-    ProductImage
+from hms.core.business_objects import Product
 
 from awslambdaric.lambda_context import LambdaContext
 from goblinfish.metrics.trackers import ProcessTracker
 
 # Path Manipulations (avoid these!) and "Local" Imports
+from hms.core.caching import get_env_query_cache
+from hms.core.responses import json_response, not_modified
 from logger import logger
 
 # Module "Constants" and Other Attributes
@@ -35,7 +35,6 @@ PRODUCT_FIELD_NAMES = (
     # Product fields
     'name',
     'summary',
-    'product_images',
     'price',
 )
 PRODUCT_IMAGE_FIELD_NAMES = (
@@ -46,6 +45,13 @@ PRODUCT_IMAGE_FIELD_NAMES = (
     'alt_text',
     'thumbnail_image_size',
 )
+# The Product.get arguments that api_handler sets itself, which
+# are dropped from the query-string parameters if a client
+# sends them
+RESERVED_GET_PARAMS = (
+    'db_source_name', 'fields', 'include', 'trusted',
+    'is_active', 'is_deleted',
+)
 
 
 # Lambda Handlers
@@ -70,9 +76,24 @@ def api_handler(
         page_number : int
             The page-number of resuls to return
             (zero-indexed)
+        page_token : str
+            The next_token from a previous page of results,
+            or an empty string for the first page, to use
+            keyset pagination instead of page_number. When
+            provided, the response body is an object with
+            "results" and "next_token" members instead of
+            a list of results.
         sort_{field-name} : str ("asc" or "desc")
             Sorts the {field-name} field in ascending
             ("asc") or descending ("desc") order.
+        headers:
+        If-None-Match : str
+            The ETag of results that the client already
+            has, which are not sent again if they have not
+            changed.
+        Accept-Encoding : str
+            The content-codings (gzip, br) that the client
+            accepts compressed responses in.
     context : LambdaContext
         The standard Lambda context object provided
         by AWS during a Lambda invocation.
@@ -83,7 +104,11 @@ def api_handler(
         logger.debug(f'context: {repr(context)}')
 
         # Convert the query-strings for pagination
-        get_params = event.get('queryStringParameters') or {}
+        get_params = {
+            key: value for key, value
+            in (event.get('queryStringParameters') or {}).items()
+            if key not in RESERVED_GET_PARAMS
+        }
         pagination_params = {
             key: int(get_params.get(key, 0)) or None
             for key in ('page_size', 'page_number')
@@ -91,60 +116,62 @@ def api_handler(
         get_params.update(pagination_params)
         logger.debug(f'get_params: {get_params}')
 
-        # Get the Product objects, keeping track of how
-        # long the process takes for metrics purposes
-        with tracker.timer('product_db_access'):
-            products = Product.get(
-                db_source_name='Products', **get_params,
-                is_active=True, is_deleted=False,
-            )
-        # Get the ProductImage objects, keeping track of
-        # how long the process takes for metrics purposes
-        product_oids = [str(prod.oid) for prod in products]
-        logger.debug(f'product_oids: {product_oids}')
-        with tracker.timer('product_image_db_access'):
-            product_images = ProductImage.get(
-                db_source_name='ProductImages',
-                product_oid_in=product_oids,
-                is_active=True, is_deleted=False,
-            )
-            logger.debug(f'product_images: {product_images}')
-        with tracker.timer('product_image_selection'):
-            product_image_dict = {
-                UUID(oid): [] for oid in product_oids
-            }
-            for product_image in product_images:
-                product_image_dict[product_image.product_oid].append(product_image)
-
-        # Filter the results' fields
-        results = [
-            {
-                key: value for key, value
-                in product.model_dump(mode='json').items()
-                if key in PRODUCT_FIELD_NAMES
-            }
-            for product in products
-        ]
-        for item in results:
-            product_oid = UUID(item['oid'])
-            if product_image_dict[product_oid]:
-                image = sorted(
-                    product_image_dict[product_oid],
-                    key = lambda img: img.is_primary_image,
-                    reverse=True
-                )[0]
-                item['product_images'] = [
-                    {
-                        key: value for key, value
-                        in image.model_dump(mode='json').items()
-                        if key in PRODUCT_IMAGE_FIELD_NAMES
-                    }
-                ]
-        body = json.dumps(results)
-        result = {
-            'statusCode': 200,
-            'body': body
-        }
+        # Clients that already have the current results get
+        # a 304 response without the database being queried,
+        # if the query cache keeps version stamps of the
+        # tables that the results are read from in a back end
+        # shared by every process; otherwise the ETag is a
+        # hash of the results
+        query_cache = get_env_query_cache()
+        etag = query_cache.etag(
+            json.dumps([module, get_params], sort_keys=True),
+            'Products', 'ProductImages'
+        ) if query_cache is not None else None
+        result = not_modified(event, etag) if etag else None
+
+        if result is None:
+            # Get the Product objects and their ProductImage
+            # objects, keeping track of how long the process
+            # takes for metrics purposes
+            with tracker.timer('product_db_access'):
+                products = Product.get(
+                    db_source_name='Products', **get_params,
+                    is_active=True, is_deleted=False,
+                    fields=PRODUCT_FIELD_NAMES, trusted=True,
+                    include={
+                        'product_images': {
+                            'is_active': True, 'is_deleted': False,
+                        },
+                    },
+                )
+
+            # The results' fields were filtered by the query,
+            # and their images attached, but only the primary
+            # image of each is returned
+            results = list(products)
+            for item in results:
+                if item['product_images']:
+                    image = sorted(
+                        item['product_images'],
+                        key=lambda img: img.is_primary_image,
+                        reverse=True
+                    )[0]
+                    item['product_images'] = [
+                        {
+                            key: value for key, value
+                            in image.model_dump(mode='json').items()
+                            if key in PRODUCT_IMAGE_FIELD_NAMES
+                        }
+                    ]
+            if 'page_token' in get_params:
+                data = {
+                    'results': results,
+                    'next_token': products.next_token,
+                }
+            else:
+                data = results
+            # Large bodies are compressed
+            result = json_response(event, data, etag=etag)
 
     # TODO: Add other exception-handling if needed
 
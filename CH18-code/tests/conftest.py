@@ -0,0 +1,12 @@
+"""
+Shared pytest configuration for the HMS test suite.
+"""
+
+# Built-In Imports
+import os
+
+# The tests check that type-errors are raised, so run-time
+# type-checking is always switched on for them, whatever
+# HMS_TYPECHECKS is set to in the environment. This must
+# happen before any hms.core module is imported.
+os.environ['HMS_TYPECHECKS'] = 'on'
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3.11
+"""
+"""
+
+# Built-In Imports
+import json
+import sys
+import unittest
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Third-Party Imports
+from goblinfish.testing.pact.modules import \
+    ExaminesModuleMembers
+from goblinfish.testing.pact.module_members import \
+    ExaminesSourceFunction
+
+# Path Manipulations (avoid these!) and "Local" Imports
+# Handler modules are deployed as top-level modules
+sys.path.insert(
+    0, str(Path(__file__).parents[3] / 'src' / 'admin_read_products')
+)
+
+# Import the test target
+from admin_read_products import LIST_FIELD_NAMES, \
+    _authnz_preflight, _authnz_reconcile, api_handler  # noqa: E402
+
+CONTEXT = MagicMock(aws_request_id='some-request-id')
+
+
+# Source-to-test-module correspondance test
+class test_ProjectTestMembersExist(
+    unittest.TestCase,
+    ExaminesModuleMembers
+):
+    """
+    Tests that all source module members have
+    corresponding test module members in this
+    test module.
+    """
+    TARGET_MODULE = 'admin_read_products'
+
+
+class test__authnz_preflight(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'admin_read_products'
+    TARGET_FUNCTION = '_authnz_preflight'
+
+    def test__authnz_preflight_bad_args(self):
+        # A placeholder, which accepts any arguments
+        self.assertIsNone(_authnz_preflight(None, 1))
+
+    def test__authnz_preflight_bad_kwargs(self):
+        # A placeholder, which accepts any arguments
+        self.assertIsNone(_authnz_preflight(user=None))
+
+    def test__authnz_preflight_happy_paths(self):
+        self.assertIsNone(_authnz_preflight())
+
+
+class test__authnz_reconcile(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'admin_read_products'
+    TARGET_FUNCTION = '_authnz_reconcile'
+
+    def test__authnz_reconcile_bad_args(self):
+        # A placeholder, which accepts any arguments
+        self.assertIsNone(_authnz_reconcile(None, 1))
+
+    def test__authnz_reconcile_bad_kwargs(self):
+        # A placeholder, which accepts any arguments
+        self.assertIsNone(_authnz_reconcile(user=None))
+
+    def test__authnz_reconcile_happy_paths(self):
+        self.assertIsNone(_authnz_reconcile())
+
+
+class test_api_handler(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'admin_read_products'
+    TARGET_FUNCTION = 'api_handler'
+
+    def setUp(self):
+        self.get_patcher = patch(
+            'admin_read_products.Product.get',
+            return_value=[{'oid': 'some-oid', 'name': 'Product'}]
+        )
+        self.mock_get = self.get_patcher.start()
+
+    def tearDown(self):
+        self.get_patcher.stop()
+
+    def test_api_handler_happy_paths(self):
+        result = api_handler(
+            {'queryStringParameters': {'page_size': '10'}}, CONTEXT
+        )
+        self.assertEqual(result['statusCode'], 200)
+        self.assertEqual(
+            json.loads(result['body']),
+            [{'oid': 'some-oid', 'name': 'Product'}]
+        )
+        self.mock_get.assert_called_once_with(
+            db_source_name='Products', page_size=10,
+            page_number=None, fields=LIST_FIELD_NAMES,
+        )
+
+    def test_api_handler_reserved_params(self):
+        # Parameters that the handler sets itself are dropped,
+        # instead of colliding with its own arguments
+        result = api_handler(
+            {
+                'queryStringParameters': {
+                    'fields': 'name', 'include': 'product_images',
+                    'trusted': 'true', 'db_source_name': 'Artisan',
+                },
+            },
+            CONTEXT
+        )
+        self.assertEqual(result['statusCode'], 200)
+        self.mock_get.assert_called_once_with(
+            db_source_name='Products', page_size=None,
+            page_number=None, fields=LIST_FIELD_NAMES,
+        )
+
+    def test_api_handler_bad_context(self):
+        # The context is only logged unless an error occurs
+        result = api_handler({}, None)
+        self.assertEqual(result['statusCode'], 200)
+
+    def test_api_handler_bad_event(self):
+        result = api_handler(
+            {'queryStringParameters': {'page_size': 'ten'}}, CONTEXT
+        )
+        self.assertEqual(result['statusCode'], 500)
+        self.assertIn('some-request-id', result['body'])
+        self.mock_get.assert_not_called()
+
+
+# Code to run if the module is executed directly
+if __name__ == '__main__':
+
+    unittest.main()
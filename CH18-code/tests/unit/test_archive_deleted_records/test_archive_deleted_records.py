@@ -0,0 +1,288 @@
+#!/usr/bin/env python3.11
+"""
+"""
+
+# Built-In Imports
+import json
+import os
+import sys
+import unittest
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Third-Party Imports
+from goblinfish.testing.pact.modules import \
+    ExaminesModuleMembers
+from goblinfish.testing.pact.module_members import \
+    ExaminesSourceFunction
+
+# Path Manipulations (avoid these!) and "Local" Imports
+# Handler modules are deployed as top-level modules
+sys.path.insert(
+    0, str(Path(__file__).parents[3] / 'src' / 'archive_deleted_records')
+)
+
+# Import the test target
+import archive_deleted_records  # noqa: E402
+
+from archive_deleted_records import _get_time_limit, \
+    lambda_handler  # noqa: E402
+
+LOCATIONS = {
+    'ORIGINAL_IMAGES_LOCATION': 's3://images/original',
+    'DETAIL_IMAGES_LOCATION': 's3://images/detail',
+    'THUMBNAIL_IMAGES_LOCATION': 's3://images/thumbnail',
+}
+
+
+def make_context(*remaining_millis):
+    """
+    Creates and returns a Lambda context whose remaining time
+    is each of the remaining_millis in turn, and then the
+    last of them from then on.
+    """
+    context = MagicMock(aws_request_id='some-request-id')
+    values = iter(remaining_millis)
+    last = [remaining_millis[-1]]
+
+    def get_remaining_time_in_millis():
+        last[0] = next(values, last[0])
+        return last[0]
+
+    context.get_remaining_time_in_millis.side_effect = \
+        get_remaining_time_in_millis
+    return context
+
+
+# Source-to-test-module correspondance test
+class test_ProjectTestMembersExist(
+    unittest.TestCase,
+    ExaminesModuleMembers
+):
+    """
+    Tests that all source module members have
+    corresponding test module members in this
+    test module.
+    """
+    TARGET_MODULE = 'archive_deleted_records'
+
+
+class test__get_time_limit(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'archive_deleted_records'
+    TARGET_FUNCTION = '_get_time_limit'
+
+    def test__get_time_limit_bad_context(self):
+        with self.assertRaises(AttributeError):
+            _get_time_limit(None, 30.0)
+
+    def test__get_time_limit_bad_margin(self):
+        with self.assertRaises(TypeError):
+            _get_time_limit(make_context(60_000), '30')
+
+    def test__get_time_limit_happy_paths(self):
+        self.assertEqual(
+            _get_time_limit(make_context(60_000), 30.0), 30.0
+        )
+        self.assertEqual(
+            _get_time_limit(make_context(10_000), 30.0), -20.0
+        )
+
+
+class test_lambda_handler(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'archive_deleted_records'
+    TARGET_FUNCTION = 'lambda_handler'
+
+    def setUp(self):
+        # A parent mock records the calls to all of the
+        # classes' archive_deleted methods, in order
+        self.archiver = MagicMock()
+        patchers = {
+            'environ': patch.dict(os.environ, LOCATIONS),
+            'output': patch.object(
+                archive_deleted_records.tracker, '_output'
+            ),
+            'delete_images': patch(
+                'archive_deleted_records.delete_images'
+            ),
+        }
+        for name in ('ProductImage', 'Product', 'Artisan'):
+            patchers[name] = patch(
+                f'archive_deleted_records.{name}.archive_deleted',
+                getattr(self.archiver, name)
+            )
+            getattr(self.archiver, name).return_value = [
+                {'rows': 2, 'elapsed': 0.1, 'paused': 0.1},
+                {'rows': 1, 'elapsed': 0.05, 'paused': 0.05},
+            ]
+        self.mocks = {
+            name: patcher.start()
+            for name, patcher in patchers.items()
+        }
+        for patcher in patchers.values():
+            self.addCleanup(patcher.stop)
+
+    def get_metrics(self):
+        """
+        Returns the metrics that the tracker output.
+        """
+        self.mocks['output'].assert_called_once()
+        return json.loads(
+            self.mocks['output'].call_args.args[0]
+        )['metrics']
+
+    def test_lambda_handler_bad_context(self):
+        with self.assertRaises(AttributeError):
+            lambda_handler({}, None)
+        self.archiver.assert_not_called()
+
+    def test_lambda_handler_bad_event(self):
+        # The scheduled event's contents are not used
+        for event in (None, {}, {'detail': 'anything'}):
+            with self.subTest(msg=f'Testing with {event!r}'):
+                result = lambda_handler(event, make_context(900_000))
+                self.assertTrue(result['complete'])
+
+    def test_lambda_handler_happy_paths(self):
+        before = datetime.utcnow()
+        result = lambda_handler({}, make_context(900_000))
+        after = datetime.utcnow()
+        self.assertEqual(
+            result,
+            {
+                'archived': {
+                    'ProductImages': 3, 'Products': 3, 'Artisan': 3,
+                },
+                'complete': True,
+            }
+        )
+        # Product images are archived first, then Products,
+        # then Artisans
+        self.assertEqual(
+            [name for name, args, kwargs in self.archiver.mock_calls],
+            ['ProductImage', 'Product', 'Artisan']
+        )
+        for name, args, kwargs in self.archiver.mock_calls:
+            with self.subTest(msg=f'Testing {name} arguments'):
+                older_than, = args
+                self.assertTrue(
+                    before - timedelta(days=30) <= older_than
+                    <= after - timedelta(days=30)
+                )
+                self.assertEqual(kwargs['batch_size'], 500)
+                self.assertEqual(kwargs['throttle'], 1.0)
+                self.assertEqual(kwargs['time_limit'], 870.0)
+        self.assertEqual(
+            [
+                kwargs['db_source_name']
+                for name, args, kwargs in self.archiver.mock_calls
+            ],
+            ['ProductImages', 'Products', 'Artisan']
+        )
+        self.assertEqual(
+            self.get_metrics(),
+            {
+                'ProductImages_archived': 3,
+                'ProductImages_batches': 2,
+                'ProductImages_paused': 0.15,
+                'Products_archived': 3,
+                'Products_batches': 2,
+                'Products_paused': 0.15,
+                'Artisan_archived': 3,
+                'Artisan_batches': 2,
+                'Artisan_paused': 0.15,
+                'complete': True,
+            }
+        )
+
+    def test_lambda_handler_image_files(self):
+        lambda_handler({}, make_context(900_000))
+        # Only product images have files to delete, which are
+        # deleted from every image location for each batch
+        on_batch = self.archiver.ProductImage.call_args.kwargs['on_batch']
+        self.assertIsNone(
+            self.archiver.Product.call_args.kwargs['on_batch']
+        )
+        self.assertIsNone(
+            self.archiver.Artisan.call_args.kwargs['on_batch']
+        )
+        on_batch(['image-1', 'image-2'])
+        self.mocks['delete_images'].assert_called_once_with(
+            ['image-1', 'image-2'], *LOCATIONS.values()
+        )
+
+    @patch.dict(
+        os.environ,
+        {
+            'ARCHIVE_AFTER_DAYS': '7', 'ARCHIVE_BATCH_SIZE': '100',
+            'ARCHIVE_THROTTLE': '0.5', 'ARCHIVE_TIME_MARGIN': '60',
+        }
+    )
+    def test_lambda_handler_settings(self):
+        before = datetime.utcnow()
+        lambda_handler({}, make_context(900_000))
+        after = datetime.utcnow()
+        older_than, = self.archiver.ProductImage.call_args.args
+        self.assertTrue(
+            before - timedelta(days=7) <= older_than
+            <= after - timedelta(days=7)
+        )
+        self.assertEqual(
+            self.archiver.ProductImage.call_args.kwargs,
+            {
+                'batch_size': 100, 'throttle': 0.5,
+                'time_limit': 840.0,
+                'on_batch': self.archiver.ProductImage.call_args
+                .kwargs['on_batch'],
+                'db_source_name': 'ProductImages',
+            }
+        )
+
+    def test_lambda_handler_time_out(self):
+        with self.subTest(msg='Testing before the last table'):
+            # Time runs out while product images are archived
+            result = lambda_handler({}, make_context(900_000, 10_000))
+            self.assertEqual(
+                result,
+                {'archived': {'ProductImages': 3}, 'complete': False}
+            )
+            self.assertEqual(
+                [name for name, args, kwargs in self.archiver.mock_calls],
+                ['ProductImage']
+            )
+            metrics = self.get_metrics()
+            self.assertIs(metrics['complete'], False)
+            self.assertNotIn('Products_archived', metrics)
+
+        self.archiver.reset_mock()
+        self.mocks['output'].reset_mock()
+        with self.subTest(msg='Testing in the last table'):
+            # Time runs out while artisans are archived, which
+            # may have left some of them to archive
+            result = lambda_handler(
+                {}, make_context(900_000, 900_000, 900_000, 10_000)
+            )
+            self.assertEqual(len(result['archived']), 3)
+            self.assertIs(result['complete'], False)
+            self.assertIs(self.get_metrics()['complete'], False)
+
+        self.archiver.reset_mock()
+        with self.subTest(msg='Testing with no time to start'):
+            result = lambda_handler({}, make_context(10_000))
+            self.assertEqual(
+                result, {'archived': {}, 'complete': False}
+            )
+            self.assertEqual(self.archiver.mock_calls, [])
+
+
+# Code to run if the module is executed directly
+if __name__ == '__main__':
+
+    unittest.main()
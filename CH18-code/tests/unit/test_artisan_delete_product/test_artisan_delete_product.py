@@ -0,0 +1,196 @@
+#!/usr/bin/env python3.11
+"""
+"""
+
+# Built-In Imports
+import os
+import sys
+import unittest
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Third-Party Imports
+from goblinfish.testing.pact.modules import \
+    ExaminesModuleMembers
+from goblinfish.testing.pact.module_members import \
+    ExaminesSourceFunction
+
+# Path Manipulations (avoid these!) and "Local" Imports
+from hms.core.storage import ObjectStoreError
+
+# Handler modules are deployed as top-level modules
+sys.path.insert(
+    0, str(Path(__file__).parents[3] / 'src' / 'artisan_delete_product')
+)
+
+# Import the test target
+from artisan_delete_product import _authnz_preflight, \
+    _authnz_reconcile, api_handler  # noqa: E402
+
+CONTEXT = MagicMock(aws_request_id='some-request-id')
+
+EVENT = {
+    'pathParameters': {
+        'artisan_oid': 'some-artisan-oid', 'oid': 'some-oid',
+    },
+}
+
+LOCATIONS = {
+    'ORIGINAL_IMAGES_LOCATION': 's3://images/original',
+    'DETAIL_IMAGES_LOCATION': 's3://images/detail',
+    'THUMBNAIL_IMAGES_LOCATION': 's3://images/thumbnail',
+}
+
+
+# Source-to-test-module correspondance test
+class test_ProjectTestMembersExist(
+    unittest.TestCase,
+    ExaminesModuleMembers
+):
+    """
+    Tests that all source module members have
+    corresponding test module members in this
+    test module.
+    """
+    TARGET_MODULE = 'artisan_delete_product'
+
+
+class test__authnz_preflight(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'artisan_delete_product'
+    TARGET_FUNCTION = '_authnz_preflight'
+
+    def test__authnz_preflight_bad_args(self):
+        # A placeholder, which accepts any arguments
+        self.assertIsNone(_authnz_preflight(None, 1))
+
+    def test__authnz_preflight_bad_kwargs(self):
+        # A placeholder, which accepts any arguments
+        self.assertIsNone(_authnz_preflight(user=None))
+
+    def test__authnz_preflight_happy_paths(self):
+        self.assertIsNone(_authnz_preflight())
+
+
+class test__authnz_reconcile(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'artisan_delete_product'
+    TARGET_FUNCTION = '_authnz_reconcile'
+
+    def test__authnz_reconcile_bad_args(self):
+        # A placeholder, which accepts any arguments
+        self.assertIsNone(_authnz_reconcile(None, 1))
+
+    def test__authnz_reconcile_bad_kwargs(self):
+        # A placeholder, which accepts any arguments
+        self.assertIsNone(_authnz_reconcile(user=None))
+
+    def test__authnz_reconcile_happy_paths(self):
+        self.assertIsNone(_authnz_reconcile())
+
+
+class test_api_handler(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'artisan_delete_product'
+    TARGET_FUNCTION = 'api_handler'
+
+    def setUp(self):
+        self.product = MagicMock(
+            product_images=[
+                MagicMock(oid='image-1'), MagicMock(oid='image-2'),
+            ]
+        )
+        self.product.model_dump_json.return_value = \
+            '{"oid": "some-oid"}'
+        patchers = {
+            'environ': patch.dict(os.environ, LOCATIONS),
+            'get': patch(
+                'hms.core.business_objects.Product.get',
+                return_value=[self.product]
+            ),
+            'delete': patch(
+                'hms.core.business_objects.Product.delete'
+            ),
+            'delete_image_records': patch(
+                'hms.core.business_objects.ProductImage.delete'
+            ),
+            'unit_of_work': patch('hms.core.data_objects.UnitOfWork'),
+            'delete_images': patch('hms.core.storage.delete_images'),
+        }
+        self.mocks = {
+            name: patcher.start()
+            for name, patcher in patchers.items()
+        }
+        for patcher in patchers.values():
+            self.addCleanup(patcher.stop)
+
+    def test_api_handler_bad_context(self):
+        # The context is only logged unless an error occurs
+        result = api_handler(EVENT, None)
+        self.assertEqual(result['statusCode'], 200)
+
+    def test_api_handler_bad_event(self):
+        for event in (
+            {},
+            {'pathParameters': {'oid': 'some-oid'}},
+            {'pathParameters': {'artisan_oid': 'one,two', 'oid': 'oid'}},
+            {'pathParameters': {'artisan_oid': 'some-artisan-oid'}},
+        ):
+            with self.subTest(msg=f'Testing with {event}'):
+                result = api_handler(event, CONTEXT)
+                self.assertEqual(result['statusCode'], 400)
+                self.assertIn('some-request-id', result['body'])
+        self.mocks['get'].return_value = []
+        result = api_handler(EVENT, CONTEXT)
+        self.assertEqual(result['statusCode'], 404)
+        self.mocks['delete'].assert_not_called()
+
+    def test_api_handler_happy_paths(self):
+        result = api_handler(EVENT, CONTEXT)
+        self.assertEqual(result['statusCode'], 200)
+        self.assertEqual(result['body'], '{"oid": "some-oid"}')
+        self.mocks['get'].assert_called_once_with(
+            'some-oid', db_source_name='Products',
+            artisan_oid='some-artisan-oid',
+            include=('product_images',),
+        )
+        self.mocks['delete_image_records'].assert_called_once_with(
+            'image-1', 'image-2', db_source_name='ProductImages'
+        )
+        self.mocks['delete'].assert_called_once_with(
+            'some-oid', db_source_name='Products'
+        )
+        self.mocks['unit_of_work'].assert_called_once()
+        self.mocks['delete_images'].assert_called_once_with(
+            ['image-1', 'image-2'], *LOCATIONS.values()
+        )
+
+    def test_api_handler_image_files_not_deleted(self):
+        # The records are deleted, and committed, before the
+        # image files are, so the product is still deleted
+        for error in (
+            ObjectStoreError('Could not delete'),
+            PermissionError('Could not delete'),
+        ):
+            with self.subTest(msg=f'Testing with {error!r}'):
+                self.mocks['delete_images'].side_effect = error
+                with self.assertLogs(level='ERROR') as logs:
+                    result = api_handler(EVENT, CONTEXT)
+                self.assertEqual(result['statusCode'], 200)
+                self.assertIn('image-1', logs.output[0])
+        self.mocks['delete_images'].side_effect = RuntimeError()
+        result = api_handler(EVENT, CONTEXT)
+        self.assertEqual(result['statusCode'], 500)
+
+
+# Code to run if the module is executed directly
+if __name__ == '__main__':
+
+    unittest.main()
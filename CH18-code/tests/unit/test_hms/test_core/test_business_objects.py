@@ -6,6 +6,7 @@
 import unittest
 
 from datetime import datetime
+from unittest.mock import patch
 from uuid import UUID
 
 # Third-Party Imports
@@ -553,6 +554,22 @@ class test_Artisan(unittest.TestCase):
                     'returned instead.'
                 )
 
+    def test_json_schema_examples(self):
+        """
+        Tests that the examples of the Artisan class' fields
+        that are only created when needed are in its schema
+        """
+        schema = Artisan.model_json_schema()
+        self.assertEqual(
+            schema['properties']['business_address']['examples'],
+            get_examples(Address, max_items=2)
+        )
+        product_examples = schema['properties']['products'][
+            'examples'
+        ]
+        self.assertEqual(product_examples[0], [])
+        self.assertEqual(len(product_examples[1]), 2)
+
     def test_email_address(self):
         """
         Tests the email_address field of the Artisan class
@@ -746,6 +763,94 @@ class test_Product(unittest.TestCase):
             with self.assertRaises(ValidationError):
                 del inst.artisan_oid
 
+    @patch(
+        'hms.core.data_objects.get_env_database_connector'
+    )
+    def test_archive_deleted(self, mock_connect):
+        connector = mock_connect.return_value
+        cursor = connector.cursor.return_value \
+            .__enter__.return_value
+        cursor.fetchall.side_effect = [[{'oid': '1'}]]
+        timings = Product.archive_deleted(datetime(2025, 1, 1))
+        self.assertEqual(timings[0]['rows'], 1)
+        # The metadata of the Products is archived with them,
+        # in the same transaction
+        executed = [
+            call.args[0] for call in cursor.execute.call_args_list
+        ]
+        self.assertEqual(
+            executed[3:],
+            list(Product.METADATA_ARCHIVE_TEMPLATES)
+        )
+        self.assertTrue(
+            executed[1].startswith(
+                'INSERT INTO Products_Archive '
+                '(oid, is_active, is_deleted, created, modified, '
+                'artisan_oid, object_state) '
+            )
+        )
+        mock_connect.assert_called_once()
+        connector.commit.assert_called_once()
+
+    @patch(
+        'hms.core.data_objects.get_env_database_connector'
+    )
+    def test_save(self, mock_connect):
+        connector = mock_connect.return_value
+        cursor = connector.cursor.return_value \
+            .__enter__.return_value
+        inst = Product(**self.EXAMPLE_ARGS)
+        with self.subTest(msg='Testing without metadata'):
+            inst.save(db_source_name='Products')
+            self.assertEqual(cursor.execute.call_count, 1)
+            connector.commit.assert_called_once()
+        with self.subTest(msg='Testing with metadata'):
+            mock_connect.reset_mock()
+            inst.save(db_source_name='Products', color='Blue')
+            # The Product and its metadata are saved in a
+            # single transaction
+            mock_connect.assert_called_once()
+            self.assertEqual(cursor.execute.call_count, 3)
+            connector.commit.assert_called_once()
+            connector.close.assert_called_once()
+
+    @patch(
+        'hms.core.data_objects.get_env_database_connector'
+    )
+    def test_save_metadata(self, mock_connect):
+        connector = mock_connect.return_value
+        cursor = connector.cursor.return_value \
+            .__enter__.return_value
+        inst = Product(**self.EXAMPLE_ARGS)
+        oid = str(inst.oid)
+        with self.subTest(msg='Testing with metadata'):
+            inst.save_metadata(color='Blue', material='Oak')
+            self.assertEqual(
+                [call.args for call in cursor.execute.call_args_list],
+                [
+                    (
+                        'DELETE FROM ProductMetadata '
+                        'WHERE product_oid = %s;',
+                        (oid,)
+                    ),
+                    (
+                        'INSERT INTO ProductMetadata '
+                        '(product_oid, category_name, value) '
+                        'VALUES (%s, %s, %s), (%s, %s, %s);',
+                        (
+                            oid, 'color', 'Blue',
+                            oid, 'material', 'Oak'
+                        )
+                    ),
+                ]
+            )
+            connector.commit.assert_called_once()
+        with self.subTest(msg='Testing with no metadata'):
+            mock_connect.reset_mock()
+            inst.save_metadata()
+            self.assertEqual(cursor.execute.call_count, 1)
+            connector.commit.assert_called_once()
+
 
 class test_ProductImage(unittest.TestCase):
     """
@@ -0,0 +1,522 @@
+#!/usr/bin/env python3.11
+"""
+"""
+
+# Built-In Imports
+import os
+import unittest
+
+from unittest.mock import patch
+from uuid import UUID
+
+# Third-Party Imports
+from goblinfish.testing.pact.modules import \
+    ExaminesModuleMembers
+from goblinfish.testing.pact.module_members import \
+    ExaminesSourceClass, ExaminesSourceFunction
+
+from typeguard import TypeCheckError
+
+# Path Manipulations (avoid these!) and "Local" Imports
+
+# Import the test target
+from hms.core.caching import \
+    _get_env_cache_settings, CACHE_DEFAULTS, CacheBackend, \
+    get_env_object_cache, get_env_query_cache, LocalCache, \
+    ObjectCache, QueryCache
+
+
+# Source-to-test-module correspondance test
+class test_ProjectTestMembersExist(
+    unittest.TestCase,
+    ExaminesModuleMembers
+):
+    """
+    Tests that all source module members have
+    corresponding test module members in this
+    test module.
+    """
+    TARGET_MODULE = 'hms.core.caching'
+
+
+class test_CacheBackend(
+    unittest.TestCase,
+    ExaminesSourceClass
+):
+    TARGET_MODULE = 'hms.core.caching'
+    TARGET_CLASS = 'CacheBackend'
+
+    class PartialBackend(CacheBackend):
+        """A back end that calls the abstract methods"""
+        def clear(self):
+            return super().clear()
+
+        def delete(self, key):
+            return super().delete(key)
+
+        def get(self, key):
+            return super().get(key)
+
+        def set(self, key, value, ttl):
+            return super().set(key, value, ttl)
+
+    def test_clear_happy_paths(self):
+        with self.assertRaises(NotImplementedError):
+            self.PartialBackend().clear()
+
+    def test_delete_happy_paths(self):
+        with self.assertRaises(NotImplementedError):
+            self.PartialBackend().delete('key')
+
+    def test_get_happy_paths(self):
+        with self.assertRaises(NotImplementedError):
+            self.PartialBackend().get('key')
+
+    def test_set_happy_paths(self):
+        with self.assertRaises(NotImplementedError):
+            self.PartialBackend().set('key', 'value', 1.0)
+
+    def test_stats_happy_paths(self):
+        self.assertEqual(self.PartialBackend().stats, {})
+
+    def test_stats_invalid_del(self):
+        with self.assertRaises(AttributeError):
+            del self.PartialBackend().stats
+
+    def test_stats_set_bad_instance(self):
+        with self.assertRaises(AttributeError):
+            self.PartialBackend().stats = {}
+
+    def test_stats_set_bad_value(self):
+        with self.assertRaises(AttributeError):
+            self.PartialBackend().stats = None
+
+
+class test_LocalCache(
+    unittest.TestCase,
+    ExaminesSourceClass
+):
+    TARGET_MODULE = 'hms.core.caching'
+    TARGET_CLASS = 'LocalCache'
+
+    def test___init___happy_paths(self):
+        cache = LocalCache(max_size=2)
+        self.assertEqual(
+            cache.stats,
+            {'size': 0, 'evictions': 0, 'expirations': 0}
+        )
+        with self.assertRaises(AssertionError):
+            LocalCache(max_size=0)
+        with self.assertRaises(TypeCheckError):
+            LocalCache(max_size='2')
+
+    def test_clear_happy_paths(self):
+        cache = LocalCache()
+        cache.set('key', 'value', 60)
+        cache.clear()
+        self.assertEqual(cache.get('key'), (False, None))
+
+    def test_delete_happy_paths(self):
+        cache = LocalCache()
+        cache.set('key', 'value', 60)
+        cache.delete('key')
+        cache.delete('no-such-key')
+        self.assertEqual(cache.get('key'), (False, None))
+
+    @patch('hms.core.caching.monotonic')
+    def test_get_happy_paths(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        cache = LocalCache()
+        cache.set('key', 'value', 10)
+        cache.set('negative', None, 10)
+        self.assertEqual(cache.get('key'), (True, 'value'))
+        self.assertEqual(cache.get('negative'), (True, None))
+        self.assertEqual(cache.get('no-such-key'), (False, None))
+        # Expired values are removed
+        mock_monotonic.return_value = 110.0
+        self.assertEqual(cache.get('key'), (False, None))
+        self.assertEqual(cache.stats['expirations'], 1)
+        self.assertEqual(cache.stats['size'], 1)
+
+    def test_set_happy_paths(self):
+        cache = LocalCache(max_size=2)
+        cache.set('a', '1', 60)
+        cache.set('b', '2', 60)
+        # Reading "a" makes "b" the least recently used
+        cache.get('a')
+        cache.set('c', '3', 60)
+        self.assertEqual(cache.get('b'), (False, None))
+        self.assertEqual(cache.get('a'), (True, '1'))
+        self.assertEqual(cache.get('c'), (True, '3'))
+        self.assertEqual(cache.stats['evictions'], 1)
+        with self.assertRaises(TypeCheckError):
+            cache.set('d', 4, 60)
+
+    def test_stats_happy_paths(self):
+        cache = LocalCache(max_size=1)
+        cache.set('a', '1', 60)
+        cache.set('b', '2', 60)
+        self.assertEqual(
+            cache.stats,
+            {'size': 1, 'evictions': 1, 'expirations': 0}
+        )
+
+    def test_stats_invalid_del(self):
+        with self.assertRaises(AttributeError):
+            del LocalCache().stats
+
+    def test_stats_set_bad_instance(self):
+        with self.assertRaises(AttributeError):
+            LocalCache().stats = {}
+
+    def test_stats_set_bad_value(self):
+        with self.assertRaises(AttributeError):
+            LocalCache().stats = None
+
+
+class test_ObjectCache(
+    unittest.TestCase,
+    ExaminesSourceClass
+):
+    TARGET_MODULE = 'hms.core.caching'
+    TARGET_CLASS = 'ObjectCache'
+
+    oid = UUID('073f2f01-64b6-441f-a053-b3aaa3cf5a1e')
+
+    def test___init___happy_paths(self):
+        backend = LocalCache()
+        cache = ObjectCache(backend, ttl=30, negative_ttl=0)
+        self.assertIs(cache.backend, backend)
+        self.assertEqual(cache.ttl, 30)
+        self.assertEqual(cache.negative_ttl, 0)
+        with self.assertRaises(TypeCheckError):
+            ObjectCache({})
+
+    def test__count_happy_paths(self):
+        cache = ObjectCache(LocalCache())
+        cache._count('hits')
+        self.assertEqual(cache.stats['hits'], 1)
+
+    def test__key_happy_paths(self):
+        self.assertEqual(
+            ObjectCache._key('Products', self.oid),
+            ObjectCache._key('Products', str(self.oid).upper())
+        )
+        self.assertNotEqual(
+            ObjectCache._key('Products', self.oid),
+            ObjectCache._key('Artisan', self.oid)
+        )
+
+    def test_clear_happy_paths(self):
+        cache = ObjectCache(LocalCache())
+        cache.set('Products', self.oid, '{}')
+        cache.clear()
+        self.assertEqual(
+            cache.get('Products', self.oid), (False, None)
+        )
+
+    def test_get_happy_paths(self):
+        cache = ObjectCache(LocalCache())
+        missing_oid = UUID(int=1)
+        cache.set('Products', self.oid, '{}')
+        cache.set('Products', missing_oid, None)
+        self.assertEqual(
+            cache.get('Products', self.oid), (True, '{}')
+        )
+        self.assertEqual(
+            cache.get('Products', missing_oid), (True, None)
+        )
+        self.assertEqual(
+            cache.get('Artisan', self.oid), (False, None)
+        )
+        self.assertEqual(
+            {
+                key: value for key, value in cache.stats.items()
+                if key in ('hits', 'misses', 'negative_hits')
+            },
+            {'hits': 1, 'misses': 1, 'negative_hits': 1}
+        )
+
+    def test_invalidate_happy_paths(self):
+        cache = ObjectCache(LocalCache())
+        other_oid = UUID(int=1)
+        cache.set('Products', self.oid, '{}')
+        cache.set('Products', other_oid, '{}')
+        cache.invalidate('Products', self.oid, str(other_oid))
+        self.assertEqual(
+            cache.get('Products', self.oid), (False, None)
+        )
+        self.assertEqual(
+            cache.get('Products', other_oid), (False, None)
+        )
+        self.assertEqual(cache.stats['invalidations'], 2)
+
+    def test_set_happy_paths(self):
+        cache = ObjectCache(LocalCache(), negative_ttl=0)
+        cache.set('Products', self.oid, None)
+        # Negative entries are not cached without a TTL
+        self.assertEqual(
+            cache.get('Products', self.oid), (False, None)
+        )
+        with self.assertRaises(TypeCheckError):
+            cache.set('Products', self.oid, {})
+
+    def test_stats_happy_paths(self):
+        cache = ObjectCache(LocalCache())
+        self.assertEqual(
+            cache.stats,
+            {
+                'hits': 0, 'misses': 0,
+                'negative_hits': 0, 'invalidations': 0,
+                'size': 0, 'evictions': 0, 'expirations': 0,
+            }
+        )
+
+    def test_stats_invalid_del(self):
+        with self.assertRaises(AttributeError):
+            del ObjectCache(LocalCache()).stats
+
+    def test_stats_set_bad_instance(self):
+        with self.assertRaises(AttributeError):
+            ObjectCache(LocalCache()).stats = {}
+
+    def test_stats_set_bad_value(self):
+        with self.assertRaises(AttributeError):
+            ObjectCache(LocalCache()).stats = None
+
+
+class test_QueryCache(
+    unittest.TestCase,
+    ExaminesSourceClass
+):
+    TARGET_MODULE = 'hms.core.caching'
+    TARGET_CLASS = 'QueryCache'
+
+    query = '["SELECT * FROM Products WHERE oid = %s", ["x"]]'
+
+    def test___init___happy_paths(self):
+        backend = LocalCache()
+        cache = QueryCache(backend, ttl=5, version_ttl=60)
+        self.assertIs(cache.backend, backend)
+        self.assertEqual(cache.ttl, 5)
+        self.assertEqual(cache.version_ttl, 60)
+        with self.assertRaises(TypeCheckError):
+            QueryCache(None)
+
+    def test__count_happy_paths(self):
+        cache = QueryCache(LocalCache())
+        cache._count('bumps')
+        self.assertEqual(cache.stats['bumps'], 1)
+
+    def test__key_happy_paths(self):
+        cache = QueryCache(LocalCache())
+        key = cache._key('Products', self.query, 'v1')
+        self.assertEqual(key, cache._key('Products', self.query, 'v1'))
+        self.assertTrue(key.startswith('query:Products:v1:'))
+        self.assertNotEqual(
+            key, cache._key('Products', self.query + ' ', 'v1')
+        )
+        self.assertNotEqual(
+            key, cache._key('Artisan', self.query, 'v1')
+        )
+        self.assertNotEqual(
+            key, cache._key('Products', self.query, 'v2')
+        )
+
+    def test_bump_happy_paths(self):
+        cache = QueryCache(LocalCache())
+        cache.set('Products', self.query, '[]')
+        cache.set('Artisan', self.query, '[]')
+        cache.bump('Products')
+        self.assertEqual(
+            cache.get('Products', self.query)[:2], (False, None)
+        )
+        self.assertEqual(
+            cache.get('Artisan', self.query)[:2], (True, '[]')
+        )
+        self.assertEqual(cache.stats['bumps'], 1)
+
+    def test_etag_happy_paths(self):
+
+        class SharedCache(LocalCache):
+            SHARED = True
+
+        cache = QueryCache(SharedCache())
+        etag = cache.etag(self.query, 'Products', 'ProductImages')
+        self.assertRegex(etag, r'^W/"[0-9a-f]{32}"$')
+        self.assertEqual(
+            cache.etag(self.query, 'Products', 'ProductImages'),
+            etag
+        )
+        self.assertNotEqual(
+            cache.etag(self.query + ' ', 'Products', 'ProductImages'),
+            etag
+        )
+        with self.subTest(msg='Test after a table changes'):
+            cache.bump('ProductImages')
+            self.assertNotEqual(
+                cache.etag(self.query, 'Products', 'ProductImages'),
+                etag
+            )
+        with self.subTest(msg='Test with a process-local back end'):
+            # Other processes' writes are not seen, so the
+            # version stamps cannot vouch for the results
+            self.assertIsNone(
+                QueryCache(LocalCache()).etag(self.query, 'Products')
+            )
+
+    def test_get_happy_paths(self):
+        cache = QueryCache(LocalCache())
+        version = cache.version('Products')
+        self.assertEqual(
+            cache.get('Products', self.query), (False, None, version)
+        )
+        cache.set('Products', self.query, '[]')
+        self.assertEqual(
+            cache.get('Products', self.query), (True, '[]', version)
+        )
+        self.assertEqual(cache.stats['hits'], 1)
+        self.assertEqual(cache.stats['misses'], 1)
+
+    @patch('hms.core.caching.monotonic')
+    def test_set_happy_paths(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        cache = QueryCache(LocalCache(), ttl=5)
+        cache.set('Products', self.query, '[]')
+        mock_monotonic.return_value = 105.0
+        self.assertEqual(
+            cache.get('Products', self.query)[:2], (False, None)
+        )
+        with self.subTest(msg='Test with a version from get'):
+            found, _, version = cache.get('Products', self.query)
+            # The table changes while the results are read...
+            cache.bump('Products')
+            cache.set('Products', self.query, '[]', version)
+            # ... so they are not cached as current
+            self.assertEqual(
+                cache.get('Products', self.query)[:2],
+                (False, None)
+            )
+        with self.assertRaises(TypeCheckError):
+            cache.set('Products', self.query, [])
+
+    def test_stats_happy_paths(self):
+        self.assertEqual(
+            QueryCache(LocalCache()).stats,
+            {
+                'hits': 0, 'misses': 0, 'bumps': 0,
+                'size': 0, 'evictions': 0, 'expirations': 0,
+            }
+        )
+
+    def test_stats_invalid_del(self):
+        with self.assertRaises(AttributeError):
+            del QueryCache(LocalCache()).stats
+
+    def test_stats_set_bad_instance(self):
+        with self.assertRaises(AttributeError):
+            QueryCache(LocalCache()).stats = {}
+
+    def test_stats_set_bad_value(self):
+        with self.assertRaises(AttributeError):
+            QueryCache(LocalCache()).stats = None
+
+    def test_version_happy_paths(self):
+        backend = LocalCache(max_size=1)
+        cache = QueryCache(backend)
+        version = cache.version('Products')
+        self.assertEqual(cache.version('Products'), version)
+        # A version that has been evicted is replaced
+        backend.clear()
+        self.assertNotEqual(cache.version('Products'), version)
+
+
+class test__get_env_cache_settings(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.caching'
+    TARGET_FUNCTION = '_get_env_cache_settings'
+
+    def test__get_env_cache_settings_happy_paths(self):
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(
+                _get_env_cache_settings(), CACHE_DEFAULTS
+            )
+        with patch.dict(
+            os.environ, {'HMS_QUERY_CACHE_SIZE': '12'}
+        ):
+            self.assertEqual(
+                _get_env_cache_settings()['HMS_QUERY_CACHE_SIZE'],
+                12
+            )
+
+
+class test_get_env_object_cache(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.caching'
+    TARGET_FUNCTION = 'get_env_object_cache'
+
+    def setUp(self):
+        get_env_object_cache.cache_clear()
+
+    def tearDown(self):
+        get_env_object_cache.cache_clear()
+
+    def test_get_env_object_cache_happy_paths(self):
+        with self.subTest(msg='Testing the default'):
+            with patch.dict(os.environ, {}, clear=True):
+                self.assertIsNone(get_env_object_cache())
+
+        get_env_object_cache.cache_clear()
+        with self.subTest(msg='Testing a configured cache'):
+            with patch.dict(
+                os.environ,
+                {
+                    'HMS_OBJECT_CACHE_TTL': '30',
+                    'HMS_OBJECT_CACHE_SIZE': '10',
+                }
+            ):
+                cache = get_env_object_cache()
+                self.assertIsInstance(cache, ObjectCache)
+                self.assertIsInstance(cache.backend, LocalCache)
+                self.assertEqual(cache.ttl, 30.0)
+                self.assertEqual(cache.negative_ttl, 5.0)
+                self.assertIs(get_env_object_cache(), cache)
+
+
+class test_get_env_query_cache(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.caching'
+    TARGET_FUNCTION = 'get_env_query_cache'
+
+    def setUp(self):
+        get_env_query_cache.cache_clear()
+
+    def tearDown(self):
+        get_env_query_cache.cache_clear()
+
+    def test_get_env_query_cache_happy_paths(self):
+        with self.subTest(msg='Testing the default'):
+            with patch.dict(os.environ, {}, clear=True):
+                self.assertIsNone(get_env_query_cache())
+
+        get_env_query_cache.cache_clear()
+        with self.subTest(msg='Testing a configured cache'):
+            with patch.dict(
+                os.environ, {'HMS_QUERY_CACHE_TTL': '5'}
+            ):
+                cache = get_env_query_cache()
+                self.assertIsInstance(cache, QueryCache)
+                self.assertEqual(cache.ttl, 5.0)
+                self.assertIs(get_env_query_cache(), cache)
+
+
+# Code to run if the module is executed directly
+if __name__ == '__main__':
+
+    unittest.main()
@@ -5,34 +5,47 @@
 # Built-In Imports
 import json
 import os
+import threading
 import unittest
 
 from datetime import datetime
-from typing import ClassVar
-from unittest.mock import patch, MagicMock
-from uuid import UUID
+from decimal import Decimal
+from typing import ClassVar, Optional
+from unittest.mock import call, patch, MagicMock
+from uuid import UUID, uuid4
 
 # Third-Party Imports
-from mysql.connector.connection_cext import \
-    CMySQLConnection
+import pymysql
 
 from goblinfish.testing.pact.modules import \
     ExaminesModuleMembers
 from goblinfish.testing.pact.module_members import \
     ExaminesSourceClass, ExaminesSourceFunction
 
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, EmailStr, Field, \
+    ValidationError
 
 from typeguard import TypeCheckError
 
 # Path Manipulations (avoid these!) and "Local" Imports
 
+from hms.core.caching import LocalCache, ObjectCache, QueryCache
+
 # Import the test target
 from hms.core.data_objects import \
+    _build_order_by_template, _build_where_template, \
     BaseDataObject, build_limit_clause, \
-    build_order_by_clause, build_where_clause, \
-    get_env_database_connector, get_examples, \
-    SQL_OPERATORS
+    build_order_by_clause, build_page_token, \
+    build_seek_clause, build_select_list, \
+    build_where_clause, build_write_sql, \
+    ConnectionPool, construct_trusted, _convert_items, \
+    database_connector, get_env_database_connector, _get_field_adapter, \
+    _get_trusted_converters, \
+    get_env_database_pool, get_examples, \
+    get_keyset_sort, lazy_examples, LazyExamples, \
+    PooledConnection, resolve_examples, \
+    PoolTimeoutError, POOL_DEFAULTS, ResultList, \
+    SQL_OPERATORS, UnitOfWork
 
 
 # Set up a class to test with
@@ -550,6 +563,534 @@ class test_BaseDataObject(
                 page_size='one', page_number=0
             )
 
+    @patch(
+        'hms.core.data_objects.get_env_database_connector'
+    )
+    def test_get_bad_page_token(self, mock_connect):
+        # Arrange
+        # - A class that implements BaseDataObject
+        #   and BaseModel
+        class ConcreteDataObject(
+            BaseDataObject, BaseModel
+        ):
+            TABLE_NAME: ClassVar = 'no_such_table'
+
+        with self.assertRaises(TypeError):
+            ConcreteDataObject.get(page_token='')
+
+        with self.assertRaises(TypeError):
+            ConcreteDataObject.get(
+                page_size=10, page_number=1, page_token=''
+            )
+
+        with self.assertRaises(ValueError):
+            ConcreteDataObject.get(
+                page_size=10, page_token='not-a-token'
+            )
+
+        with self.assertRaises(TypeCheckError):
+            ConcreteDataObject.get(page_size=10, page_token=1)
+
+    @patch(
+        'hms.core.data_objects.get_env_database_connector'
+    )
+    def test_get_bad_fields(self, mock_connect):
+        # Arrange
+        # - A class that implements BaseDataObject
+        #   and BaseModel
+        class ConcreteDataObject(
+            BaseDataObject, BaseModel
+        ):
+            TABLE_NAME: ClassVar = 'no_such_table'
+
+        with self.assertRaises(ValueError):
+            ConcreteDataObject.get(fields=('oid', 'no_such_field'))
+
+        with self.assertRaises(ValueError):
+            ConcreteDataObject.get(fields=())
+
+        with self.assertRaises(TypeCheckError):
+            ConcreteDataObject.get(fields=1)
+
+        mock_connect.assert_not_called()
+
+    def _make_cached_class(self):
+        class CachedDataObject(BaseDataObject, BaseModel):
+            TABLE_NAME: ClassVar = 'cached_table'
+            OBJECT_CACHE: ClassVar = ObjectCache(
+                LocalCache(), ttl=60, negative_ttl=60
+            )
+        return CachedDataObject
+
+    @patch('hms.core.data_objects.get_env_object_cache')
+    def test__get_object_cache_happy_paths(self, mock_env_cache):
+        mock_env_cache.return_value = None
+        self.assertIsNone(ExampleModel._get_object_cache())
+        env_cache = ObjectCache(LocalCache())
+        mock_env_cache.return_value = env_cache
+        self.assertIs(ExampleModel._get_object_cache(), env_cache)
+        Cached = self._make_cached_class()
+        self.assertIs(
+            Cached._get_object_cache(), Cached.OBJECT_CACHE
+        )
+
+    def test__invalidate_cached_happy_paths(self):
+        Cached = self._make_cached_class()
+        object_cache = Cached.OBJECT_CACHE
+        item = Cached()
+        object_cache.set('cached_table', item.oid, '{}')
+        object_cache.set('other_table', item.oid, '{}')
+        Cached._invalidate_cached(None, item.oid)
+        self.assertEqual(
+            object_cache.get('cached_table', item.oid),
+            (False, None)
+        )
+        self.assertEqual(
+            object_cache.get('other_table', item.oid),
+            (True, '{}')
+        )
+        Cached._invalidate_cached('other_table', str(item.oid))
+        self.assertEqual(
+            object_cache.get('other_table', item.oid),
+            (False, None)
+        )
+
+    @patch('hms.core.data_objects.get_env_query_cache')
+    def test__get_query_cache_happy_paths(self, mock_env_cache):
+        mock_env_cache.return_value = None
+        self.assertIsNone(ExampleModel._get_query_cache())
+        env_cache = QueryCache(LocalCache())
+        mock_env_cache.return_value = env_cache
+        self.assertIs(ExampleModel._get_query_cache(), env_cache)
+
+        class Cached(BaseDataObject, BaseModel):
+            QUERY_CACHE: ClassVar = QueryCache(LocalCache())
+
+        self.assertIs(Cached._get_query_cache(), Cached.QUERY_CACHE)
+
+    @patch(
+        'hms.core.data_objects.get_env_database_connector'
+    )
+    def test_get_query_cache(self, mock_connect):
+        class Cached(BaseDataObject, BaseModel):
+            TABLE_NAME: ClassVar = 'cached_table'
+            QUERY_CACHE: ClassVar = QueryCache(LocalCache())
+
+        query_cache = Cached.QUERY_CACHE
+        item = Cached()
+        rows = [
+            {
+                'oid': str(item.oid),
+                'created': datetime(2025, 1, 4, 14, 52, 39),
+                'object_state': item.model_dump_json(),
+            }
+        ]
+
+        # Configure the database-related mocks and patches
+        mock_connection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_connect.return_value = mock_connection
+        mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = rows
+
+        with self.subTest(msg='Testing a cache miss and hit'):
+            first = Cached.get(page_size=1, page_token='')
+            second = Cached.get(page_size=1, page_token='')
+            self.assertEqual(first, [item])
+            self.assertEqual(second, [item])
+            self.assertEqual(first.next_token, second.next_token)
+            mock_cursor.execute.assert_called_once()
+            self.assertEqual(query_cache.stats['hits'], 1)
+
+        with self.subTest(msg='Testing different queries'):
+            Cached.get(page_size=2)
+            Cached.get(is_active=True)
+            self.assertEqual(mock_cursor.execute.call_count, 3)
+
+        with self.subTest(msg='Testing invalidation by save'):
+            item.save()
+            Cached.get(page_size=1, page_token='')
+            # One execute for the save, one for the get
+            self.assertEqual(mock_cursor.execute.call_count, 5)
+
+    @patch(
+        'hms.core.data_objects.get_env_database_connector'
+    )
+    def test_get_object_cache(self, mock_connect):
+        Cached = self._make_cached_class()
+        object_cache = Cached.OBJECT_CACHE
+        item = Cached(is_active=True)
+        missing_oid = str(UUID(int=1))
+
+        # Configure the database-related mocks and patches
+        mock_connection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_connect.return_value = mock_connection
+        mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = [
+            {'object_state': item.model_dump_json()}
+        ]
+
+        with self.subTest(msg='Testing a cache miss'):
+            results = Cached.get(item.oid, is_active=True)
+            self.assertEqual(results, [item])
+            # Only the oid is queried, so that the result can
+            # be cached whatever the criteria
+            mock_cursor.execute.assert_called_once_with(
+                'SELECT * FROM cached_table WHERE oid = %s  ;',
+                (str(item.oid),)
+            )
+            self.assertEqual(object_cache.stats['misses'], 1)
+
+        with self.subTest(msg='Testing cache hits'):
+            self.assertEqual(Cached.get(item.oid), [item])
+            self.assertEqual(
+                Cached.get(str(item.oid), is_active=True), [item]
+            )
+            self.assertEqual(
+                Cached.get(str(item.oid), is_active=False), []
+            )
+            mock_cursor.execute.assert_called_once()
+            self.assertEqual(object_cache.stats['hits'], 3)
+
+        with self.subTest(msg='Testing negative caching'):
+            mock_cursor.fetchall.return_value = []
+            self.assertEqual(Cached.get(missing_oid), [])
+            self.assertEqual(Cached.get(missing_oid), [])
+            self.assertEqual(mock_cursor.execute.call_count, 2)
+            self.assertEqual(object_cache.stats['negative_hits'], 1)
+
+        with self.subTest(msg='Testing uncached reads'):
+            Cached.get(item.oid, missing_oid)
+            Cached.get(item.oid, page_size=1)
+            Cached.get(item.oid, sort_created='desc')
+            self.assertEqual(mock_cursor.execute.call_count, 5)
+
+        with self.subTest(msg='Testing invalidation by save'):
+            item.save()
+            self.assertEqual(
+                object_cache.get('cached_table', item.oid),
+                (False, None)
+            )
+
+        with self.subTest(msg='Testing invalidation by delete'):
+            object_cache.set('cached_table', item.oid, '{}')
+            Cached.delete(item.oid)
+            self.assertEqual(
+                object_cache.get('cached_table', item.oid),
+                (False, None)
+            )
+
+    @patch(
+        'hms.core.data_objects.get_env_database_connector'
+    )
+    def test_get_object_cache_criteria_types(self, mock_connect):
+        class Cached(BaseDataObject, BaseModel):
+            TABLE_NAME: ClassVar = 'cached_table'
+            CRITERIA_FIELDS: ClassVar = \
+                BaseDataObject.CRITERIA_FIELDS + ['parent_oid']
+            OBJECT_CACHE: ClassVar = ObjectCache(
+                LocalCache(), ttl=60, negative_ttl=60
+            )
+            parent_oid: UUID
+
+        item = Cached(parent_oid=uuid4(), is_active=True)
+
+        # Configure the database-related mocks and patches
+        mock_connection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_connect.return_value = mock_connection
+        mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = [
+            {'object_state': item.model_dump_json()}
+        ]
+
+        # The criteria match as they would in the database,
+        # whether the object is cached yet or not
+        for expected, criteria in (
+            ([item], {'is_active': 1}),
+            ([item], {'is_active': True}),
+            ([], {'is_active': 0}),
+            ([item], {'parent_oid': str(item.parent_oid).upper()}),
+            ([item], {'parent_oid': item.parent_oid}),
+            ([], {'parent_oid': str(uuid4())}),
+            ([], {'parent_oid': 'not-a-uuid'}),
+        ):
+            with self.subTest(msg=f'Testing with {criteria}'):
+                self.assertEqual(
+                    Cached.get(item.oid, **criteria), expected
+                )
+        mock_cursor.execute.assert_called_once()
+
+    def _make_related_classes(self):
+        class ChildDataObject(BaseDataObject, BaseModel):
+            TABLE_NAME: ClassVar = 'children'
+            CRITERIA_FIELDS: ClassVar = \
+                BaseDataObject.CRITERIA_FIELDS + ['parent_oid']
+            parent_oid: UUID
+
+        class ParentDataObject(BaseDataObject, BaseModel):
+            TABLE_NAME: ClassVar = 'parents'
+            RELATIONS: ClassVar = {
+                'children': (ChildDataObject, 'parent_oid'),
+            }
+            children: list[ChildDataObject] = []
+
+        return ParentDataObject, ChildDataObject
+
+    def test__load_relations_happy_paths(self):
+        Parent, Child = self._make_related_classes()
+        parents = [Parent(), Parent()]
+        children = [
+            Child(parent_oid=parents[0].oid),
+            Child(parent_oid=parents[0].oid),
+        ]
+        with self.subTest(msg='Testing several results'):
+            with patch.object(
+                Child, 'get', return_value=children
+            ) as mock_get:
+                Parent._load_relations(
+                    parents, {'children': {'is_active': True}}
+                )
+            mock_get.assert_called_once_with(
+                trusted=False, is_active=True,
+                parent_oid_in=[str(p.oid) for p in parents],
+            )
+            self.assertEqual(parents[0].children, children)
+            self.assertEqual(parents[1].children, [])
+
+        with self.subTest(msg='Testing one dict result'):
+            records = [{'oid': str(parents[0].oid)}]
+            with patch.object(
+                Child, 'get', return_value=children
+            ) as mock_get:
+                Parent._load_relations(records, {'children': {}})
+            mock_get.assert_called_once_with(
+                trusted=False, parent_oid=str(parents[0].oid)
+            )
+            self.assertEqual(records[0]['children'], children)
+
+        with self.subTest(msg='Testing trusted'):
+            with patch.object(
+                Child, 'get', return_value=children
+            ) as mock_get:
+                Parent._load_relations(
+                    parents[:1], {'children': {}}, True
+                )
+            mock_get.assert_called_once_with(
+                trusted=True, parent_oid=str(parents[0].oid)
+            )
+
+    @patch(
+        'hms.core.data_objects.get_env_database_connector'
+    )
+    def test_get_bad_include(self, mock_connect):
+        Parent, Child = self._make_related_classes()
+
+        with self.assertRaises(ValueError):
+            Parent.get(include=('no_such_relation',))
+
+        with self.assertRaises(ValueError):
+            Parent.get(fields=('created',), include=('children',))
+
+        with self.assertRaises(TypeCheckError):
+            Parent.get(include=1)
+
+        mock_connect.assert_not_called()
+
+    @patch(
+        'hms.core.data_objects.get_env_database_connector'
+    )
+    def test_get_include(self, mock_connect):
+        Parent, Child = self._make_related_classes()
+        parent = Parent()
+        child = Child(parent_oid=parent.oid)
+
+        # Configure the database-related mocks and patches
+        mock_connection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_connect.return_value = mock_connection
+        mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_cursor.fetchall.side_effect = [
+            [{'object_state': parent.model_dump_json()}],
+            [{'object_state': child.model_dump_json()}],
+        ]
+
+        # Act
+        results = Parent.get(include=['children'])
+
+        # Assert
+        self.assertEqual(
+            [call.args for call in mock_cursor.execute.call_args_list],
+            [
+                ('SELECT * FROM parents   ;',),
+                (
+                    'SELECT * FROM children '
+                    'WHERE parent_oid = %s  ;',
+                    (str(parent.oid),)
+                ),
+            ]
+        )
+        self.assertEqual(results[0].children, [child])
+
+    @patch(
+        'hms.core.data_objects.get_env_database_connector'
+    )
+    def test_get_trusted(self, mock_connect):
+        # Arrange
+        # - A class whose validation rejects a value
+        #   that was (somehow) written to the database
+        class ConcreteDataObject(
+            BaseDataObject, BaseModel
+        ):
+            TABLE_NAME: ClassVar = 'no_such_table'
+            code: str = Field(pattern='^[A-Z]+$')
+
+        item = ConcreteDataObject.model_construct(code='ok')
+        mock_connection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_connect.return_value = mock_connection
+        mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = [
+            {'object_state': item.model_dump_json()}
+        ]
+
+        with self.subTest(msg='Untrusted records are validated'):
+            with self.assertRaises(ValidationError):
+                ConcreteDataObject.get()
+
+        with self.subTest(msg='Trusted records are not'):
+            results = ConcreteDataObject.get(trusted=True)
+            self.assertEqual(results, [item])
+            self.assertIsInstance(results[0].oid, UUID)
+            self.assertIsInstance(results[0].created, datetime)
+
+    @patch(
+        'hms.core.data_objects.get_env_database_connector'
+    )
+    def test_get_fields_projection(self, mock_connect):
+        # Arrange
+        # - A class that implements BaseDataObject
+        #   and BaseModel
+        class ConcreteDataObject(
+            BaseDataObject, BaseModel
+        ):
+            TABLE_NAME: ClassVar = 'no_such_table'
+            name: str = 'Name'
+
+        # Configure the database-related mocks and patches
+        mock_connection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_connect.return_value = mock_connection
+        mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
+        item = ConcreteDataObject()
+        mock_cursor.fetchall.return_value = [
+            {
+                'oid': str(item.oid),
+                'created': '2025-01-04 14:52:39',
+                'object_state': json.dumps(
+                    {'oid': str(item.oid), 'name': 'Name'}
+                ),
+            }
+        ]
+
+        # Act
+        results = ConcreteDataObject.get(
+            fields=['oid', 'name'], is_active=True
+        )
+
+        # Assert
+        mock_cursor.execute.assert_called_with(
+            'SELECT oid, is_active, is_deleted, created, '
+            'modified, JSON_OBJECT('
+            "'oid', JSON_EXTRACT(object_state, '$.oid'), "
+            "'name', JSON_EXTRACT(object_state, '$.name')"
+            ') AS object_state FROM no_such_table '
+            'WHERE is_active = %s  ;',
+            (True,)
+        )
+        self.assertEqual(
+            results, [{'oid': str(item.oid), 'name': 'Name'}]
+        )
+
+    @patch(
+        'hms.core.data_objects.get_env_database_connector'
+    )
+    def test_get_keyset_pagination(self, mock_connect):
+        # Arrange
+        # - A class that implements BaseDataObject
+        #   and BaseModel
+        class ConcreteDataObject(
+            BaseDataObject, BaseModel
+        ):
+            GET_TEMPLATE: ClassVar = 'SELECT * ' \
+                'FROM {TABLE_NAME} ' \
+                '{WHERE} {ORDER_BY} {LIMIT}'
+            TABLE_NAME: ClassVar = 'no_such_table'
+
+        # Configure the database-related mocks and patches
+        mock_connection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_connect.return_value = mock_connection
+        mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
+        items = [ConcreteDataObject() for _ in range(2)]
+        rows = [
+            {
+                'oid': str(item.oid),
+                'created': '2025-01-04 14:52:39',
+                'object_state': item.model_dump_json(),
+            }
+            for item in items
+        ]
+
+        with self.subTest(msg='Testing the first page'):
+            mock_cursor.fetchall.return_value = rows
+            results = ConcreteDataObject.get(
+                page_size=2, page_token='',
+                is_active=True, sort_created='desc'
+            )
+            mock_cursor.execute.assert_called_with(
+                'SELECT * FROM no_such_table '
+                'WHERE is_active = %s '
+                'ORDER BY created desc, oid desc '
+                'LIMIT 2 OFFSET 0',
+                (True,)
+            )
+            self.assertIsInstance(results, ResultList)
+            self.assertEqual(results, items)
+            self.assertEqual(
+                results.next_token,
+                build_page_token('created', 'desc', rows[-1])
+            )
+
+        with self.subTest(msg='Testing the next page'):
+            mock_cursor.fetchall.return_value = rows[0:1]
+            results = ConcreteDataObject.get(
+                page_size=2, page_token=results.next_token,
+                is_active=True, sort_created='desc'
+            )
+            mock_cursor.execute.assert_called_with(
+                'SELECT * FROM no_such_table '
+                'WHERE is_active = %s AND '
+                '(created < %s OR '
+                '(created = %s AND oid < %s)) '
+                'ORDER BY created desc, oid desc '
+                'LIMIT 2 OFFSET 0',
+                (
+                    True,
+                    '2025-01-04 14:52:39',
+                    '2025-01-04 14:52:39',
+                    rows[-1]['oid'],
+                )
+            )
+            # A short page is the last one
+            self.assertIsNone(results.next_token)
+
+        with self.subTest(msg='Testing without keyset'):
+            mock_cursor.fetchall.return_value = rows
+            results = ConcreteDataObject.get(page_size=2)
+            self.assertIsNone(results.next_token)
+
     @patch.dict(
         os.environ,
         {
@@ -687,6 +1228,21 @@ class test_BaseDataObject(
                 with self.assertRaises(TypeCheckError):
                     BaseDataObject.from_record(data)
 
+    def test_from_record_trusted(self):
+        class ConcreteDataObject(BaseDataObject, BaseModel):
+            code: str = Field(pattern='^[A-Z]+$')
+
+        item = ConcreteDataObject.model_construct(code='ok')
+        data = json.loads(item.model_dump_json())
+        with self.assertRaises(ValidationError):
+            ConcreteDataObject.from_record(data)
+        self.assertEqual(
+            ConcreteDataObject.from_record(data, trusted=True),
+            item
+        )
+        # The data passed is not changed
+        self.assertEqual(data['oid'], str(item.oid))
+
     @unittest.skip(
         'Test in integration; too many variables to '
         'test here.'
@@ -812,41 +1368,800 @@ class test_BaseDataObject(
                 mock_connect.reset_mock()
                 mock_connect.cache_clear()
 
+    @patch(
+        'hms.core.data_objects.get_env_database_connector'
+    )
+    def test_save_many_happy_paths(self, mock_connect):
+        # Arrange
+        # - A class that implements BaseDataObject
+        #   and BaseModel
+        class ConcreteDataObject(
+            BaseDataObject, BaseModel
+        ):
+            TABLE_NAME: ClassVar = 'no_such_table'
 
-class test_build_limit_clause(
-    unittest.TestCase,
-    ExaminesSourceFunction
-):
-    TARGET_MODULE = 'hms.core.data_objects'
-    TARGET_FUNCTION = 'build_limit_clause'
-
-    valid_arguments = {
-        'page_size': (1, 2),
-        'page_number': (0, 1),
-    }
+        # Configure the database-related mocks and patches
+        mock_connection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_connect.return_value = mock_connection
+        mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
 
-    invalid_arguments = {
-        'page_size': (0, 1.2, 'three'),
-        'page_number': (-1, 2.3, 'four'),
-    }
+        items = [ConcreteDataObject() for _ in range(5)]
+        field_names = (
+            'oid', 'is_active', 'is_deleted', 'created',
+            'modified', 'object_state'
+        )
+        row = '(' + ', '.join(['%s'] * 6) + ')'
 
-    def test_build_limit_clause_bad_page_number(self):
-        page_size = self.valid_arguments['page_size'][0]
-        for page_number \
-                in self.invalid_arguments['page_number']:
-            with self.subTest(
-                msg=f'Testing page_size {page_size}, '
-                f'page_number {page_number}'
-            ):
-                with self.assertRaises(
-                    (AssertionError, TypeCheckError)
-                ):
-                    build_limit_clause(
-                        page_size, page_number
-                    )
+        with self.subTest(msg='Testing batched writes'):
+            # Act
+            timings = ConcreteDataObject.save_many(
+                (item for item in items), batch_size=2
+            )
+            # Assert
+            mock_connect.assert_called_once()
+            self.assertEqual(mock_cursor.execute.call_count, 3)
+            self.assertEqual(mock_connection.commit.call_count, 3)
+            mock_connection.close.assert_called_once()
+            self.assertEqual(
+                [timing['rows'] for timing in timings],
+                [2, 2, 1]
+            )
+            self.assertEqual(
+                [timing['batch'] for timing in timings],
+                [0, 1, 2]
+            )
+            final_sql, parameters = \
+                mock_cursor.execute.call_args_list[0].args
+            self.assertEqual(
+                final_sql,
+                'INSERT INTO no_such_table '
+                f'({", ".join(field_names)}) '
+                f'VALUES {row}, {row} '
+                'ON DUPLICATE KEY UPDATE '
+                + ', '.join(
+                    f'{name} = VALUES({name})'
+                    for name in field_names
+                ) + ';'
+            )
+            self.assertEqual(
+                parameters,
+                tuple(items[0]._get_field_data().values())
+                + tuple(items[1]._get_field_data().values())
+            )
 
-    def test_build_limit_clause_bad_page_size(self):
-        page_number = self.valid_arguments['page_number'][0]  # noqa: E501
+        with self.subTest(msg='Testing with db_source_name'):
+            mock_cursor.reset_mock()
+            ConcreteDataObject.save_many(
+                items[0:1], db_source_name='other_table'
+            )
+            final_sql, _ = mock_cursor.execute.call_args.args
+            self.assertTrue(
+                final_sql.startswith('INSERT INTO other_table ')
+            )
+
+        with self.subTest(msg='Testing with no objects'):
+            mock_cursor.reset_mock()
+            self.assertEqual(ConcreteDataObject.save_many([]), [])
+            mock_cursor.execute.assert_not_called()
+
+        with self.subTest(msg='Testing with bad objects'):
+            with self.assertRaises(TypeError):
+                ConcreteDataObject.save_many([object()])
+            with self.assertRaises(AssertionError):
+                ConcreteDataObject.save_many(
+                    items, batch_size=0
+                )
+
+    @patch('hms.core.data_objects.sleep')
+    @patch(
+        'hms.core.data_objects.get_env_database_connector'
+    )
+    def test_archive_deleted_happy_paths(self, mock_connect, mock_sleep):
+        # Arrange
+        # - A class that implements BaseDataObject
+        #   and BaseModel
+        class ConcreteDataObject(
+            BaseDataObject, BaseModel
+        ):
+            TABLE_NAME: ClassVar = 'no_such_table'
+            CRITERIA_FIELDS: ClassVar = \
+                BaseDataObject.CRITERIA_FIELDS + ['name']
+            GENERATED_FIELDS: ClassVar = ['name']
+            OBJECT_CACHE: ClassVar = MagicMock()
+
+        # Configure the database-related mocks and patches
+        mock_connection = mock_connect.return_value
+        mock_cursor = MagicMock()
+        mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
+        older_than = datetime(2025, 1, 1)
+        field_names = 'oid, is_active, is_deleted, created, ' \
+            'modified, object_state'
+
+        with self.subTest(msg='Testing batched archiving'):
+            # Two full batches, then a short one
+            mock_cursor.fetchall.side_effect = [
+                [{'oid': '1'}, {'oid': '2'}],
+                [{'oid': '3'}, {'oid': '4'}],
+                [{'oid': '5'}],
+            ]
+            on_batch = MagicMock()
+            # Act
+            timings = ConcreteDataObject.archive_deleted(
+                older_than, batch_size=2, throttle=0.5,
+                on_batch=on_batch
+            )
+            # Assert
+            self.assertEqual(
+                [timing['rows'] for timing in timings], [2, 2, 1]
+            )
+            # Each batch is a transaction of its own
+            self.assertEqual(mock_connect.call_count, 3)
+            self.assertEqual(mock_connection.commit.call_count, 3)
+            self.assertEqual(
+                mock_cursor.execute.call_args_list[:3],
+                [
+                    call(
+                        'SELECT oid FROM no_such_table '
+                        'WHERE is_deleted = 1 AND created < %s '
+                        'AND (modified IS NULL OR modified < %s) '
+                        'LIMIT %s FOR UPDATE;',
+                        (older_than, older_than, 2)
+                    ),
+                    call(
+                        'INSERT INTO no_such_table_Archive '
+                        f'({field_names}) SELECT {field_names} '
+                        'FROM no_such_table WHERE oid IN %s;',
+                        (['1', '2'],)
+                    ),
+                    call(
+                        'DELETE FROM no_such_table '
+                        'WHERE oid IN %s;',
+                        (['1', '2'],)
+                    ),
+                ]
+            )
+            self.assertEqual(
+                on_batch.call_args_list,
+                [call(['1', '2']), call(['3', '4']), call(['5'])]
+            )
+            self.assertEqual(
+                ConcreteDataObject.OBJECT_CACHE.invalidate.call_count,
+                3
+            )
+            # Pauses follow full batches only
+            self.assertEqual(mock_sleep.call_count, 2)
+            self.assertEqual(timings[-1]['paused'], 0.0)
+
+        with self.subTest(msg='Testing with nothing to archive'):
+            mock_connect.reset_mock()
+            mock_cursor.reset_mock()
+            mock_cursor.fetchall.side_effect = [[]]
+            self.assertEqual(
+                ConcreteDataObject.archive_deleted(older_than), []
+            )
+            self.assertEqual(mock_cursor.execute.call_count, 1)
+
+        with self.subTest(msg='Testing a failed batch'):
+            mock_connect.reset_mock()
+            mock_cursor.reset_mock()
+            mock_cursor.fetchall.side_effect = [[{'oid': '1'}]]
+            with self.assertRaises(RuntimeError):
+                ConcreteDataObject.archive_deleted(
+                    older_than,
+                    on_batch=MagicMock(side_effect=RuntimeError)
+                )
+            mock_connection.commit.assert_not_called()
+            mock_connection.close.assert_called_once()
+
+        with self.subTest(msg='Testing the time limit'):
+            mock_cursor.reset_mock()
+            self.assertEqual(
+                ConcreteDataObject.archive_deleted(
+                    older_than, time_limit=0
+                ),
+                []
+            )
+            mock_cursor.execute.assert_not_called()
+
+        with self.subTest(msg='Testing bad arguments'):
+            with self.assertRaises(TypeCheckError):
+                ConcreteDataObject.archive_deleted('2025-01-01')
+            with self.assertRaises(AssertionError):
+                ConcreteDataObject.archive_deleted(
+                    older_than, batch_size=0
+                )
+            with self.assertRaises(AssertionError):
+                ConcreteDataObject.archive_deleted(
+                    older_than, throttle=-1.0
+                )
+            with self.assertRaises(RuntimeError):
+                with UnitOfWork():
+                    ConcreteDataObject.archive_deleted(older_than)
+
+    @patch(
+        'hms.core.data_objects.get_env_database_connector'
+    )
+    def test__archive_related_happy_paths(self, mock_connect):
+        # Nothing else is archived by default
+        BaseDataObject._archive_related(['1', '2'])
+        mock_connect.assert_not_called()
+
+    def test__get_field_data_happy_paths(self):
+        # Arrange
+        class ConcreteDataObject(
+            BaseDataObject, BaseModel
+        ):
+            given_name: str = Field()
+        inst = ConcreteDataObject(given_name='John')
+        # Act
+        actual = inst._get_field_data()
+        # Assert
+        self.assertEqual(
+            list(actual.keys()),
+            BaseDataObject.CRITERIA_FIELDS + ['object_state']
+        )
+        self.assertEqual(actual['oid'], str(inst.oid))
+        self.assertEqual(
+            json.loads(actual['object_state'])['given_name'],
+            'John'
+        )
+
+        with self.subTest(msg='Testing GENERATED_FIELDS'):
+            class GeneratedDataObject(
+                BaseDataObject, BaseModel
+            ):
+                CRITERIA_FIELDS: ClassVar = \
+                    BaseDataObject.CRITERIA_FIELDS + ['given_name']
+                GENERATED_FIELDS: ClassVar = ['given_name']
+                given_name: str = Field()
+            inst = GeneratedDataObject(given_name='John')
+            actual = inst._get_field_data()
+            self.assertEqual(
+                list(actual.keys()),
+                BaseDataObject.CRITERIA_FIELDS + ['object_state']
+            )
+
+
+class test_ConnectionPool(
+    unittest.TestCase,
+    ExaminesSourceClass
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_CLASS = 'ConnectionPool'
+
+    def _make_pool(self, **kwargs):
+        """
+        Creates a pool whose connections are MagicMock
+        objects, keeping track of the ones it creates.
+        """
+        self.created = []
+
+        def connect():
+            connection = MagicMock()
+            self.created.append(connection)
+            return connection
+
+        return ConnectionPool(connect, **kwargs)
+
+    def test___init___happy_paths(self):
+        # Act
+        pool = self._make_pool(
+            pool_size=2, max_overflow=1, timeout=1.5,
+            max_idle=10.0, max_lifetime=20.0
+        )
+        # Assert
+        self.assertEqual(pool.pool_size, 2)
+        self.assertEqual(pool.max_overflow, 1)
+        self.assertEqual(pool.timeout, 1.5)
+        self.assertEqual(pool.max_idle, 10.0)
+        self.assertEqual(pool.max_lifetime, 20.0)
+        # No connections are made until they are needed
+        self.assertEqual(self.created, [])
+        with self.subTest(msg='Testing bad pool_size'):
+            with self.assertRaises(AssertionError):
+                self._make_pool(pool_size=0)
+        with self.subTest(msg='Testing bad max_overflow'):
+            with self.assertRaises(AssertionError):
+                self._make_pool(max_overflow=-1)
+        with self.subTest(msg='Testing bad connect'):
+            with self.assertRaises(TypeCheckError):
+                ConnectionPool('not-callable')
+
+    def test__close_happy_paths(self):
+        connection = MagicMock()
+        connection.close.side_effect = OSError('dropped')
+        # Should not raise
+        ConnectionPool._close(connection)
+        connection.close.assert_called_once()
+
+    def test_checkin_happy_paths(self):
+        with self.subTest(msg='Pooled connections are kept'):
+            pool = self._make_pool(pool_size=1)
+            pooled = pool.checkout()
+            pool.checkin(self.created[0])
+            self.created[0].rollback.assert_called_once()
+            self.created[0].close.assert_not_called()
+            self.assertEqual(pool.stats['idle'], 1)
+            self.assertEqual(pool.stats['in_use'], 0)
+            del pooled
+        with self.subTest(msg='Overflow connections are closed'):
+            pool = self._make_pool(pool_size=1, max_overflow=1)
+            first = pool.checkout()
+            second = pool.checkout()
+            self.assertEqual(pool.stats['overflow'], 1)
+            first.close()
+            second.close()
+            self.created[1].close.assert_called_once()
+            self.assertEqual(pool.stats['size'], 1)
+            self.assertEqual(pool.stats['idle'], 1)
+        with self.subTest(msg='Broken connections are closed'):
+            pool = self._make_pool(pool_size=1)
+            pool.checkout().close()
+            connection = self.created[0]
+            connection.rollback.side_effect = OSError('lost')
+            pool.checkout().close()
+            connection.close.assert_called_once()
+            self.assertEqual(pool.stats['size'], 0)
+            self.assertEqual(pool.stats['recycled'], 1)
+        with self.subTest(msg='Expired connections are closed'):
+            pool = self._make_pool(max_lifetime=0.0)
+            pool.checkout().close()
+            self.created[0].close.assert_called_once()
+            self.assertEqual(pool.stats['size'], 0)
+
+    def test_checkout_happy_paths(self):
+        with self.subTest(msg='Idle connections are reused'):
+            pool = self._make_pool()
+            first = pool.checkout()
+            self.assertIsInstance(first, PooledConnection)
+            first.close()
+            pool.checkout().close()
+            self.assertEqual(len(self.created), 1)
+            self.created[0].ping.assert_called_once_with(
+                reconnect=False
+            )
+            self.assertEqual(pool.stats['checkouts'], 2)
+        with self.subTest(msg='Failed pings are replaced'):
+            pool = self._make_pool()
+            pool.checkout().close()
+            self.created[0].ping.side_effect = OSError('gone')
+            pool.checkout().close()
+            self.assertEqual(len(self.created), 2)
+            self.created[0].close.assert_called_once()
+            self.assertEqual(pool.stats['recycled'], 1)
+        with self.subTest(msg='Idle connections are recycled'):
+            pool = self._make_pool(max_idle=0.0)
+            pool.checkout().close()
+            pool.checkout().close()
+            self.assertEqual(len(self.created), 2)
+            self.created[0].ping.assert_not_called()
+        with self.subTest(msg='Checkout times out when full'):
+            pool = self._make_pool(
+                pool_size=1, max_overflow=0, timeout=0.01
+            )
+            held = pool.checkout()
+            with self.assertRaises(PoolTimeoutError):
+                pool.checkout()
+            self.assertEqual(pool.stats['timeouts'], 1)
+            held.close()
+        with self.subTest(msg='Waiting checkouts are recorded'):
+            pool = self._make_pool(
+                pool_size=1, max_overflow=0, timeout=5.0
+            )
+            held = pool.checkout()
+            timer = threading.Timer(0.05, held.close)
+            timer.start()
+            pool.checkout().close()
+            timer.join()
+            self.assertEqual(pool.stats['waits'], 1)
+            self.assertGreater(pool.stats['wait_time'], 0)
+        with self.subTest(msg='Failed connects free the slot'):
+            pool = ConnectionPool(
+                MagicMock(side_effect=OSError('refused')),
+                pool_size=1, max_overflow=0
+            )
+            with self.assertRaises(OSError):
+                pool.checkout()
+            self.assertEqual(pool.stats['size'], 0)
+
+    def test_dispose_happy_paths(self):
+        pool = self._make_pool()
+        first = pool.checkout()
+        second = pool.checkout()
+        first.close()
+        pool.dispose()
+        self.created[0].close.assert_called_once()
+        self.assertEqual(pool.stats['idle'], 0)
+        self.assertEqual(pool.stats['size'], 1)
+        # Connections checked out before dispose are closed
+        # when they are checked back in
+        second.close()
+        self.created[1].close.assert_called_once()
+        self.assertEqual(pool.stats['idle'], 0)
+        self.assertEqual(pool.stats['size'], 0)
+        # ... but new connections are pooled as usual
+        pool.checkout().close()
+        self.assertEqual(pool.stats['idle'], 1)
+
+    def test_stats_happy_paths(self):
+        pool = self._make_pool(pool_size=1)
+        self.assertEqual(
+            pool.stats,
+            {
+                'size': 0, 'idle': 0, 'in_use': 0,
+                'overflow': 0, 'checkouts': 0, 'waits': 0,
+                'wait_time': 0.0, 'timeouts': 0,
+                'recycled': 0,
+            }
+        )
+        held = pool.checkout()
+        self.assertEqual(pool.stats['size'], 1)
+        self.assertEqual(pool.stats['in_use'], 1)
+        self.assertEqual(pool.stats['checkouts'], 1)
+        held.close()
+
+    def test_stats_invalid_del(self):
+        pool = self._make_pool()
+        with self.assertRaises(AttributeError):
+            del pool.stats
+
+    def test_stats_set_bad_instance(self):
+        # stats is read-only, so there is no instance
+        # that it can be set on
+        with self.assertRaises(AttributeError):
+            ConnectionPool.stats.__set__(
+                self._make_pool(), {}
+            )
+
+    def test_stats_set_bad_value(self):
+        pool = self._make_pool()
+        with self.assertRaises(AttributeError):
+            pool.stats = {}
+
+
+class test_PooledConnection(
+    unittest.TestCase,
+    ExaminesSourceClass
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_CLASS = 'PooledConnection'
+
+    def test___init___happy_paths(self):
+        pool = MagicMock()
+        connection = MagicMock()
+        pooled = PooledConnection(pool, connection)
+        self.assertIs(pooled._pool, pool)
+        self.assertIs(pooled._connection, connection)
+
+    def test___enter___happy_paths(self):
+        pooled = PooledConnection(MagicMock(), MagicMock())
+        with pooled as connector:
+            self.assertIs(connector, pooled)
+
+    def test___exit___happy_paths(self):
+        pool = MagicMock()
+        connection = MagicMock()
+        with self.assertRaises(RuntimeError):
+            with PooledConnection(pool, connection):
+                raise RuntimeError('Checkin should still occur')
+        pool.checkin.assert_called_once_with(connection)
+
+    def test___getattr___happy_paths(self):
+        connection = MagicMock()
+        pooled = PooledConnection(MagicMock(), connection)
+        self.assertIs(pooled.cursor, connection.cursor)
+        pooled.commit()
+        connection.commit.assert_called_once()
+        pooled.close()
+        with self.assertRaises(AttributeError):
+            pooled.cursor
+
+    def test_close_happy_paths(self):
+        pool = MagicMock()
+        connection = MagicMock()
+        pooled = PooledConnection(pool, connection)
+        pooled.close()
+        pooled.close()
+        pool.checkin.assert_called_once_with(connection)
+        connection.close.assert_not_called()
+
+
+class test_UnitOfWork(
+    unittest.TestCase,
+    ExaminesSourceClass
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_CLASS = 'UnitOfWork'
+
+    def setUp(self):
+        patcher = patch(
+            'hms.core.data_objects.get_env_database_connector'
+        )
+        self.mock_connect = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.connector = self.mock_connect.return_value
+        self.cursor = self.connector.cursor.return_value \
+            .__enter__.return_value
+
+        class ConcreteDataObject(BaseDataObject, BaseModel):
+            TABLE_NAME: ClassVar = 'no_such_table'
+            OBJECT_CACHE: ClassVar = MagicMock()
+            QUERY_CACHE: ClassVar = MagicMock()
+
+        self.ConcreteDataObject = ConcreteDataObject
+
+    def test___init___happy_paths(self):
+        unit_of_work = UnitOfWork()
+        self.assertIsNone(unit_of_work._connector)
+        self.assertEqual(unit_of_work._callbacks, [])
+        self.mock_connect.assert_not_called()
+
+    def test___enter___happy_paths(self):
+        with self.subTest(msg='Testing an outer unit of work'):
+            with UnitOfWork() as unit_of_work:
+                self.assertIs(UnitOfWork.current(), unit_of_work)
+            self.assertIsNone(UnitOfWork.current())
+
+        with self.subTest(msg='Testing a nested unit of work'):
+            with UnitOfWork() as outer:
+                with UnitOfWork() as inner:
+                    self.assertIs(inner, outer)
+                self.assertIs(UnitOfWork.current(), outer)
+            self.assertIsNone(UnitOfWork.current())
+
+        with self.subTest(msg='Testing re-entry'):
+            unit_of_work = UnitOfWork()
+            with unit_of_work:
+                with self.assertRaises(AssertionError):
+                    with unit_of_work:
+                        pass
+
+    def test___exit___happy_paths(self):
+        with self.subTest(msg='Testing a single commit'):
+            items = [self.ConcreteDataObject() for _ in range(2)]
+            with UnitOfWork():
+                items[0].save()
+                self.ConcreteDataObject.save_many(items)
+                self.ConcreteDataObject.delete(items[1].oid)
+                self.connector.commit.assert_not_called()
+            self.mock_connect.assert_called_once()
+            self.assertEqual(self.cursor.execute.call_count, 3)
+            self.connector.commit.assert_called_once()
+            self.connector.close.assert_called_once()
+
+        with self.subTest(msg='Testing a rollback'):
+            self.mock_connect.reset_mock()
+            with self.assertRaises(RuntimeError):
+                with UnitOfWork():
+                    items[0].save()
+                    raise RuntimeError('Rolled back')
+            self.connector.commit.assert_not_called()
+            # Checking the connector in rolls it back
+            self.connector.close.assert_called_once()
+            self.assertIsNone(UnitOfWork.current())
+
+        with self.subTest(msg='Testing with no statements'):
+            self.mock_connect.reset_mock()
+            with UnitOfWork():
+                pass
+            self.mock_connect.assert_not_called()
+
+        with self.subTest(msg='Testing a failed commit'):
+            self.mock_connect.reset_mock()
+            callback = MagicMock()
+            self.connector.commit.side_effect = RuntimeError
+            with self.assertRaises(RuntimeError):
+                with UnitOfWork() as unit_of_work:
+                    unit_of_work.on_commit(callback)
+                    items[0].save()
+            self.connector.commit.side_effect = None
+            self.connector.close.assert_called_once()
+            callback.assert_not_called()
+
+    def test_connector_happy_paths(self):
+        with UnitOfWork() as unit_of_work:
+            self.mock_connect.assert_not_called()
+            self.assertIs(unit_of_work.connector, self.connector)
+            self.assertIs(unit_of_work.connector, self.connector)
+        self.mock_connect.assert_called_once()
+        with self.assertRaises(RuntimeError):
+            unit_of_work.connector
+
+    def test_connector_invalid_del(self):
+        with self.assertRaises(AttributeError):
+            del UnitOfWork().connector
+
+    def test_connector_set_bad_instance(self):
+        # connector is read-only, so there is no instance
+        # that it can be set on
+        with self.assertRaises(AttributeError):
+            UnitOfWork.connector.__set__(
+                UnitOfWork(), MagicMock()
+            )
+
+    def test_connector_set_bad_value(self):
+        unit_of_work = UnitOfWork()
+        with self.assertRaises(AttributeError):
+            unit_of_work.connector = MagicMock()
+
+    def test_current_happy_paths(self):
+        self.assertIsNone(UnitOfWork.current())
+        with UnitOfWork() as unit_of_work:
+            self.assertIs(UnitOfWork.current(), unit_of_work)
+            # Units of work belong to the thread that entered them
+            other = []
+            thread = threading.Thread(
+                target=lambda: other.append(UnitOfWork.current())
+            )
+            thread.start()
+            thread.join()
+            self.assertEqual(other, [None])
+        self.assertIsNone(UnitOfWork.current())
+
+    def test_on_commit_happy_paths(self):
+        object_cache = self.ConcreteDataObject.OBJECT_CACHE
+        object_cache.reset_mock()
+        callback = MagicMock()
+        item = self.ConcreteDataObject()
+        with self.subTest(msg='Testing after a commit'):
+            with UnitOfWork() as unit_of_work:
+                unit_of_work.on_commit(callback)
+                item.save()
+                callback.assert_not_called()
+                # Cache invalidations are deferred too
+                object_cache.invalidate.assert_not_called()
+            callback.assert_called_once_with()
+            object_cache.invalidate.assert_called_once_with(
+                'no_such_table', item.oid
+            )
+        with self.subTest(msg='Testing after a rollback'):
+            callback.reset_mock()
+            object_cache.reset_mock()
+            with self.assertRaises(RuntimeError):
+                with UnitOfWork() as unit_of_work:
+                    unit_of_work.on_commit(callback)
+                    item.save()
+                    raise RuntimeError('Rolled back')
+            callback.assert_not_called()
+            object_cache.invalidate.assert_not_called()
+
+    def test_on_commit_bad_callback(self):
+        with UnitOfWork() as unit_of_work:
+            with self.assertRaises(TypeCheckError):
+                unit_of_work.on_commit('not-callable')
+
+    def test_get_bypasses_caches(self):
+        object_cache = self.ConcreteDataObject.OBJECT_CACHE
+        query_cache = self.ConcreteDataObject.QUERY_CACHE
+        object_cache.reset_mock()
+        query_cache.reset_mock()
+        self.cursor.fetchall.return_value = []
+        with UnitOfWork():
+            self.ConcreteDataObject.get(UUID('0' * 32))
+            self.ConcreteDataObject.get()
+        object_cache.get.assert_not_called()
+        object_cache.set.assert_not_called()
+        query_cache.get.assert_not_called()
+        query_cache.set.assert_not_called()
+        self.assertEqual(self.cursor.execute.call_count, 2)
+        self.connector.close.assert_called_once()
+
+
+class test_PoolTimeoutError(
+    unittest.TestCase,
+    ExaminesSourceClass
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_CLASS = 'PoolTimeoutError'
+
+
+class test_LazyExamples(
+    unittest.TestCase,
+    ExaminesSourceClass
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_CLASS = 'LazyExamples'
+    # The builtin list provides this, but it is not detected
+    # as inherited, and has no signature to inspect
+    IGNORE_MEMBERS = ExaminesSourceClass.IGNORE_MEMBERS.union(
+        ['__class_getitem__']
+    )
+
+    def test___init___happy_paths(self):
+        factory = MagicMock(return_value=[1, 2])
+        examples = LazyExamples(factory)
+        self.assertEqual(examples, [])
+        self.assertIs(examples.factory, factory)
+        self.assertFalse(examples.resolved)
+        factory.assert_not_called()
+        with self.assertRaises(TypeCheckError):
+            LazyExamples('not callable')
+
+    def test_resolve_happy_paths(self):
+        factory = MagicMock(return_value=[1, 2])
+        examples = LazyExamples(factory)
+        self.assertIs(examples.resolve(), examples)
+        self.assertEqual(examples, [1, 2])
+        self.assertTrue(examples.resolved)
+        # The factory is only called once
+        examples.resolve()
+        self.assertEqual(examples, [1, 2])
+        factory.assert_called_once_with()
+
+    def test_update_schema_happy_paths(self):
+        examples = LazyExamples(
+            lambda: [UUID(int=1), {'price': Decimal('1.5')}]
+        )
+        schema = {'type': 'string', 'examples': []}
+        examples.update_schema(schema)
+        self.assertEqual(
+            schema,
+            {
+                'type': 'string',
+                'examples': [
+                    '00000000-0000-0000-0000-000000000001',
+                    {'price': '1.5'},
+                ],
+            }
+        )
+        self.assertTrue(examples.resolved)
+
+
+class test_ResultList(
+    unittest.TestCase,
+    ExaminesSourceClass
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_CLASS = 'ResultList'
+    # The builtin list provides this, but it is not detected
+    # as inherited, and has no signature to inspect
+    IGNORE_MEMBERS = ExaminesSourceClass.IGNORE_MEMBERS.union(
+        ['__class_getitem__']
+    )
+
+    def test_next_token(self):
+        results = ResultList([1, 2])
+        self.assertEqual(results, [1, 2])
+        self.assertIsNone(results.next_token)
+        results.next_token = 'token'
+        self.assertEqual(results.next_token, 'token')
+
+
+class test_build_limit_clause(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_FUNCTION = 'build_limit_clause'
+
+    valid_arguments = {
+        'page_size': (1, 2),
+        'page_number': (0, 1),
+    }
+
+    invalid_arguments = {
+        'page_size': (0, 1.2, 'three'),
+        'page_number': (-1, 2.3, 'four'),
+    }
+
+    def test_build_limit_clause_bad_page_number(self):
+        page_size = self.valid_arguments['page_size'][0]
+        for page_number \
+                in self.invalid_arguments['page_number']:
+            with self.subTest(
+                msg=f'Testing page_size {page_size}, '
+                f'page_number {page_number}'
+            ):
+                with self.assertRaises(
+                    (AssertionError, TypeCheckError)
+                ):
+                    build_limit_clause(
+                        page_size, page_number
+                    )
+
+    def test_build_limit_clause_bad_page_size(self):
+        page_number = self.valid_arguments['page_number'][0]  # noqa: E501
         for page_size in \
                 self.invalid_arguments['page_size']:
             with self.subTest(
@@ -948,6 +2263,147 @@ class test_build_order_by_clause(
         self.assertEqual(actual, expected)
 
 
+class test_build_page_token(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_FUNCTION = 'build_page_token'
+
+    row = {
+        'oid': '00000000-0000-0000-0000-000000000001',
+        'created': datetime(2025, 1, 4, 14, 52, 39),
+    }
+
+    def test_build_page_token_bad_direction(self):
+        with self.assertRaises(TypeCheckError):
+            build_page_token('created', None, self.row)
+
+    def test_build_page_token_bad_row(self):
+        with self.assertRaises(KeyError):
+            build_page_token('created', 'asc', {'oid': 'x'})
+        with self.assertRaises(TypeCheckError):
+            build_page_token('created', 'asc', None)
+
+    def test_build_page_token_bad_sort_field(self):
+        with self.assertRaises(KeyError):
+            build_page_token('modified', 'asc', self.row)
+
+    def test_build_page_token_happy_paths(self):
+        # Act
+        token = build_page_token('created', 'asc', self.row)
+        # Assert
+        self.assertNotIn('=', token)
+        self.assertEqual(
+            build_seek_clause('created', 'asc', token),
+            (
+                '(created > %s OR '
+                '(created = %s AND oid > %s))',
+                (
+                    '2025-01-04 14:52:39',
+                    '2025-01-04 14:52:39',
+                    self.row['oid'],
+                )
+            )
+        )
+
+
+class test_build_seek_clause(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_FUNCTION = 'build_seek_clause'
+
+    row = {
+        'oid': '00000000-0000-0000-0000-000000000001',
+        'created': '2025-01-04 14:52:39',
+        'modified': None,
+    }
+
+    def test_build_seek_clause_bad_direction(self):
+        token = build_page_token('created', 'asc', self.row)
+        with self.assertRaises(ValueError):
+            build_seek_clause('created', 'desc', token)
+
+    def test_build_seek_clause_bad_page_token(self):
+        for bad_token in ('not-a-token', 'e30', ''):
+            with self.subTest(msg=f'Testing "{bad_token}"'):
+                with self.assertRaises(ValueError):
+                    build_seek_clause(
+                        'created', 'asc', bad_token
+                    )
+        with self.subTest(msg='Testing a null value'):
+            token = build_page_token(
+                'modified', 'asc', self.row
+            )
+            with self.assertRaises(ValueError):
+                build_seek_clause('modified', 'asc', token)
+
+    def test_build_seek_clause_bad_sort_field(self):
+        token = build_page_token('created', 'asc', self.row)
+        with self.assertRaises(ValueError):
+            build_seek_clause('oid', 'asc', token)
+
+    def test_build_seek_clause_happy_paths(self):
+        with self.subTest(msg='Testing descending order'):
+            token = build_page_token(
+                'created', 'desc', self.row
+            )
+            self.assertEqual(
+                build_seek_clause('created', 'desc', token),
+                (
+                    '(created < %s OR '
+                    '(created = %s AND oid < %s))',
+                    (
+                        self.row['created'],
+                        self.row['created'],
+                        self.row['oid'],
+                    )
+                )
+            )
+        with self.subTest(msg='Testing oid order'):
+            token = build_page_token('oid', 'asc', self.row)
+            self.assertEqual(
+                build_seek_clause('oid', 'asc', token),
+                ('oid > %s', (self.row['oid'],))
+            )
+
+
+class test_build_select_list(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_FUNCTION = 'build_select_list'
+
+    def test_build_select_list_bad_criteria_fields(self):
+        with self.assertRaises(TypeCheckError):
+            build_select_list(['name'], None)
+
+    def test_build_select_list_bad_fields(self):
+        bad_values = (
+            [], ['name; DROP TABLE Products'], ["name'"],
+        )
+        for bad_value in bad_values:
+            with self.subTest(msg=f'Testing {bad_value}'):
+                with self.assertRaises(ValueError):
+                    build_select_list(bad_value, ['oid'])
+        with self.assertRaises(TypeCheckError):
+            build_select_list('name', ['oid'])
+
+    def test_build_select_list_happy_paths(self):
+        self.assertEqual(
+            build_select_list(
+                ('oid', 'name', 'name'), ['oid', 'created']
+            ),
+            'oid, created, JSON_OBJECT('
+            "'oid', JSON_EXTRACT(object_state, '$.oid'), "
+            "'name', JSON_EXTRACT(object_state, '$.name')"
+            ') AS object_state'
+        )
+
+
 class test_build_where_clause(
     unittest.TestCase,
     ExaminesSourceFunction
@@ -985,6 +2441,11 @@ class test_build_where_clause(
                 expected = (
                     'WHERE count IN (%s, %s)', (1, 2)
                 )
+            elif suffix == '_startswith':
+                criteria = {f'count{suffix}': '2_%'}
+                expected = (
+                    f'WHERE count{operator}', ('2\\_\\%%',)
+                )
             else:
                 criteria = {f'count{suffix}': 2}
                 expected = (
@@ -1007,6 +2468,60 @@ class test_build_where_clause(
                 )
 
 
+class test_database_connector(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_FUNCTION = 'database_connector'
+
+    def test_database_connector_bad_commit(self):
+        with self.assertRaises(TypeCheckError):
+            with database_connector(commit='yes'):
+                pass
+
+    @patch(
+        'hms.core.data_objects.get_env_database_connector'
+    )
+    def test_database_connector_happy_paths(self, mock_connect):
+        with self.subTest(msg='Testing with commit'):
+            with database_connector(commit=True) as connector:
+                self.assertIs(connector, mock_connect.return_value)
+                connector.commit.assert_not_called()
+            connector.commit.assert_called_once()
+            connector.close.assert_called_once()
+
+        with self.subTest(msg='Testing without commit'):
+            mock_connect.reset_mock()
+            with database_connector() as connector:
+                pass
+            connector.commit.assert_not_called()
+            connector.close.assert_called_once()
+
+        with self.subTest(msg='Testing with an error'):
+            mock_connect.reset_mock()
+            with self.assertRaises(RuntimeError):
+                with database_connector(commit=True) as connector:
+                    raise RuntimeError('Not committed')
+            connector.commit.assert_not_called()
+            connector.close.assert_called_once()
+
+        with self.subTest(msg='Testing in a UnitOfWork'):
+            mock_connect.reset_mock()
+            with UnitOfWork() as unit_of_work:
+                with database_connector(commit=True) as first:
+                    pass
+                with database_connector(commit=True) as second:
+                    pass
+                self.assertIs(first, unit_of_work.connector)
+                self.assertIs(second, unit_of_work.connector)
+                first.commit.assert_not_called()
+                first.close.assert_not_called()
+            mock_connect.assert_called_once()
+            first.commit.assert_called_once()
+            first.close.assert_called_once()
+
+
 class test_get_env_database_connector(
     unittest.TestCase,
     ExaminesSourceFunction
@@ -1014,6 +2529,38 @@ class test_get_env_database_connector(
     TARGET_MODULE = 'hms.core.data_objects'
     TARGET_FUNCTION = 'get_env_database_connector'
 
+    @patch(
+        'hms.core.data_objects.get_env_database_pool'
+    )
+    def test_get_env_database_connector_happy_paths(
+        self, patch_pool
+    ):
+        """Test checking a connection out of the pool."""
+        # Arrange
+        pooled = MagicMock()
+        patch_pool.return_value.checkout.return_value = \
+            pooled
+        # Act
+        connector = get_env_database_connector()
+        # Assert
+        patch_pool.return_value.checkout \
+            .assert_called_once_with()
+        self.assertIs(connector, pooled)
+
+
+class test_get_env_database_pool(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_FUNCTION = 'get_env_database_pool'
+
+    def setUp(self):
+        get_env_database_pool.cache_clear()
+
+    def tearDown(self):
+        get_env_database_pool.cache_clear()
+
     @patch.dict(
         os.environ,
         {
@@ -1022,37 +2569,43 @@ class test_get_env_database_connector(
             'MYSQL_DB': 'some-database-name',
             'MYSQL_USER': 'some-user-name',
             'MYSQL_PASS': 'super-secret-password-really',
+            'MYSQL_POOL_SIZE': '3',
         }
     )
-    @patch('mysql.connector.connect', autospec=True)
-    def test_get_env_database_connector_happy_paths(
+    @patch('pymysql.connect', autospec=True)
+    def test_get_env_database_pool_happy_paths(
         self, patch_connection
     ):
-        """Test getting a cached database connection."""
-        # INITIAL connection retrieval: Arrange
-        patch_connection.return_value = CMySQLConnection()
-        # Act - initial connection retrieval
-        connector = get_env_database_connector()
+        """Test getting a cached database connection pool."""
+        # INITIAL pool retrieval: Act
+        pool = get_env_database_pool()
         # Assert
-        patch_connection.assert_called_once_with(
-            host=os.environ['MYSQL_HOST'],
-            port=os.environ['MYSQL_PORT'],
-            user=os.environ['MYSQL_USER'],
-            password=os.environ['MYSQL_PASS'],
-            database=os.environ['MYSQL_DB'],
+        self.assertIsInstance(pool, ConnectionPool)
+        self.assertEqual(pool.pool_size, 3)
+        self.assertEqual(
+            pool.max_overflow,
+            POOL_DEFAULTS['MYSQL_POOL_MAX_OVERFLOW']
         )
-        # CACHED connection retrieval: Arrange
-        # Act
-        cached_connector = get_env_database_connector()
+        # No connection is made until one is checked out
+        patch_connection.assert_not_called()
+        with pool.checkout():
+            patch_connection.assert_called_once_with(
+                host=os.environ['MYSQL_HOST'],
+                port=int(os.environ['MYSQL_PORT']),
+                user=os.environ['MYSQL_USER'],
+                password=os.environ['MYSQL_PASS'],
+                database=os.environ['MYSQL_DB'],
+                cursorclass=pymysql.cursors.DictCursor
+            )
+        # CACHED pool retrieval: Act
+        cached_pool = get_env_database_pool()
         # Assert
-        # Do not try to test the underlying cached
-        # call, it's mocked out of existance.
         self.assertTrue(
-            connector is cached_connector,
+            pool is cached_pool,
             'Second and subsequent calls to get_env_'
-            'database_connector should return the same '
-            f'object, but {connector} and '
-            f'{cached_connector} are not the same object.'
+            'database_pool should return the same '
+            f'object, but {pool} and {cached_pool} are '
+            'not the same object.'
         )
 
 
@@ -1125,6 +2678,381 @@ class test_get_examples(
             )
 
 
+class test_get_keyset_sort(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_FUNCTION = 'get_keyset_sort'
+
+    def test_get_keyset_sort_bad_criteria(self):
+        with self.assertRaises(TypeCheckError):
+            get_keyset_sort(None, ['created'])
+
+    def test_get_keyset_sort_bad_criteria_fields(self):
+        with self.assertRaises(TypeCheckError):
+            get_keyset_sort({'sort_created': 'asc'}, None)
+
+    def test_get_keyset_sort_happy_paths(self):
+        criteria_fields = ['oid', 'created', 'modified']
+        cases = (
+            ({}, ('oid', 'asc')),
+            ({'sort_created': 'DESC'}, ('created', 'desc')),
+            ({'sort_created': 'asc'}, ('created', 'asc')),
+            ({'sort_name': 'desc'}, ('oid', 'asc')),
+            (
+                {'sort_modified': 'desc', 'sort_created': 'asc'},
+                ('modified', 'desc')
+            ),
+        )
+        for criteria, expected in cases:
+            with self.subTest(msg=f'Testing {criteria}'):
+                self.assertEqual(
+                    get_keyset_sort(criteria, criteria_fields),
+                    expected
+                )
+
+
+class test__build_order_by_template(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_FUNCTION = '_build_order_by_template'
+
+    def test__build_order_by_template_bad_criteria_fields(self):
+        # Unhashable arguments fail before type-checking
+        with self.assertRaises(TypeError):
+            _build_order_by_template(
+                (('created', 'asc'),), ['created']
+            )
+
+    def test__build_order_by_template_bad_sort_shape(self):
+        with self.assertRaises(TypeCheckError):
+            _build_order_by_template(
+                (('created', None),), ('created',)
+            )
+
+    def test__build_order_by_template_happy_paths(self):
+        _build_order_by_template.cache_clear()
+        sort_shape = (
+            ('created', 'DESC'), ('name', 'asc'),
+            ('no_such_field', 'asc'),
+        )
+        expected = 'ORDER BY created DESC, name'
+        for _ in range(2):
+            self.assertEqual(
+                _build_order_by_template(
+                    sort_shape, ('created', 'name')
+                ),
+                expected
+            )
+        self.assertEqual(
+            _build_order_by_template.cache_info().hits, 1
+        )
+        self.assertEqual(
+            _build_order_by_template(
+                (('no_such_field', 'asc'),), ('created',)
+            ),
+            ''
+        )
+
+
+class test__build_where_template(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_FUNCTION = '_build_where_template'
+
+    def test__build_where_template_bad_criteria_fields(self):
+        # Unhashable arguments fail before type-checking
+        with self.assertRaises(TypeError):
+            _build_where_template((('oid', None),), ['oid'])
+
+    def test__build_where_template_bad_criteria_shape(self):
+        with self.assertRaises(TypeCheckError):
+            _build_where_template((('oid', 'x'),), ('oid',))
+
+    def test__build_where_template_happy_paths(self):
+        _build_where_template.cache_clear()
+        criteria_shape = (
+            ('oid', None), ('name_startswith', None),
+            ('count_in', 3), ('count_gt', None),
+            ('unsupported', None),
+        )
+        expected = (
+            'WHERE oid = %s AND name LIKE %s AND '
+            'count IN (%s, %s, %s) AND count > %s',
+            (
+                ('oid', 'value'), ('name_startswith', 'prefix'),
+                ('count_in', 'values'), ('count_gt', 'value'),
+            )
+        )
+        for _ in range(2):
+            self.assertEqual(
+                _build_where_template(criteria_shape, ('oid',)),
+                expected
+            )
+        self.assertEqual(
+            _build_where_template.cache_info().hits, 1
+        )
+        self.assertEqual(
+            _build_where_template((('unsupported', None),), ()),
+            ('', ())
+        )
+
+
+class test_build_write_sql(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_FUNCTION = 'build_write_sql'
+
+    def test_build_write_sql_bad_field_names(self):
+        # Unhashable arguments fail before type-checking
+        with self.assertRaises(TypeError):
+            build_write_sql(
+                BaseDataObject.WRITE_TEMPLATE, 'table', ['oid']
+            )
+
+    def test_build_write_sql_bad_table_name(self):
+        with self.assertRaises(TypeCheckError):
+            build_write_sql(
+                BaseDataObject.WRITE_TEMPLATE, 1, ('oid',)
+            )
+
+    def test_build_write_sql_bad_template(self):
+        with self.assertRaises(TypeCheckError):
+            build_write_sql(None, 'table', ('oid',))
+
+    def test_build_write_sql_happy_paths(self):
+        self.assertEqual(
+            build_write_sql(
+                BaseDataObject.WRITE_TEMPLATE, 'table',
+                ('oid', 'object_state')
+            ),
+            'INSERT INTO table (oid, object_state) '
+            'VALUES (%s, %s) ON DUPLICATE KEY UPDATE '
+            'oid = %s, object_state = %s;'
+        )
+
+
+class test_lazy_examples(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_FUNCTION = 'lazy_examples'
+
+    def test_lazy_examples_bad_factory(self):
+        for factory in (None, 1, ['example']):
+            with self.subTest(msg=f'Testing with {factory!r}'):
+                with self.assertRaises(TypeCheckError):
+                    lazy_examples(factory)
+
+    def test_lazy_examples_happy_paths(self):
+        factory = MagicMock(return_value=['Alpha', 'Beta'])
+
+        class LazyModel(BaseModel):
+            name: str = Field(
+                title='Name', **lazy_examples(factory)
+            )
+
+        # Nothing is created when the class is defined
+        factory.assert_not_called()
+        with self.subTest(msg='Testing get_examples'):
+            self.assertEqual(
+                get_examples(LazyModel),
+                [{'name': 'Alpha'}, {'name': 'Beta'}]
+            )
+        with self.subTest(msg='Testing JSON schema'):
+            schema = LazyModel.model_json_schema()
+            self.assertEqual(
+                schema['properties']['name']['examples'],
+                ['Alpha', 'Beta']
+            )
+        factory.assert_called_once_with()
+
+
+class test_resolve_examples(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_FUNCTION = 'resolve_examples'
+
+    def test_resolve_examples_bad_examples(self):
+        for examples in (1, 'two', (3,)):
+            with self.subTest(msg=f'Testing with {examples!r}'):
+                with self.assertRaises(TypeCheckError):
+                    resolve_examples(examples)
+
+    def test_resolve_examples_happy_paths(self):
+        self.assertEqual(resolve_examples(None), [])
+        examples = [1, 2]
+        self.assertIs(resolve_examples(examples), examples)
+        lazy = LazyExamples(lambda: [3])
+        self.assertIs(resolve_examples(lazy), lazy)
+        self.assertEqual(lazy, [3])
+
+
+# Models to test trusted construction with
+class TrustedPart(BaseModel):
+    made: datetime
+    weight: Decimal
+
+
+class TrustedWidget(BaseModel):
+    oid: UUID
+    name: str
+    email: EmailStr
+    price: Decimal
+    main_part: TrustedPart
+    parts: Optional[list[TrustedPart]] = None
+    spare: TrustedPart | None = None
+    code: int | str = 0
+
+
+class test_construct_trusted(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_FUNCTION = 'construct_trusted'
+
+    def test_construct_trusted_bad_data(self):
+        # Not type-checked, for speed, but still fails
+        for data in (1, 'two', [('name', 'x')]):
+            with self.subTest(msg=f'Testing with {data!r}'):
+                with self.assertRaises(AttributeError):
+                    construct_trusted(TrustedWidget, data)
+
+    def test_construct_trusted_bad_model_class(self):
+        # Checked when its converters are retrieved
+        for model_class in (1, 'two', object):
+            with self.subTest(
+                msg=f'Testing with {model_class!r}'
+            ):
+                with self.assertRaises(TypeCheckError):
+                    construct_trusted(model_class, {})
+
+    def test_construct_trusted_happy_paths(self):
+        part = {
+            'made': '2025-01-04T14:52:39.842206',
+            'weight': '1.25',
+        }
+        for extra in (
+            {},
+            {'parts': [part, part], 'spare': part},
+            {'parts': None, 'spare': None, 'code': 'A1'},
+        ):
+            with self.subTest(msg=f'Testing with {extra}'):
+                expected = TrustedWidget(
+                    oid=UUID(int=1), name='Widget',
+                    email='someone@example.com',
+                    price=Decimal('12.34'), main_part=part,
+                    **extra
+                )
+                data = json.loads(expected.model_dump_json())
+                actual = construct_trusted(TrustedWidget, data)
+                self.assertEqual(actual, expected)
+                self.assertEqual(
+                    actual.model_dump_json(),
+                    expected.model_dump_json()
+                )
+
+
+class test__get_trusted_converters(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_FUNCTION = '_get_trusted_converters'
+
+    def test__get_trusted_converters_bad_model_class(self):
+        for model_class in (1, 'two', object):
+            with self.subTest(
+                msg=f'Testing with {model_class!r}'
+            ):
+                with self.assertRaises(TypeCheckError):
+                    _get_trusted_converters(model_class)
+
+    def test__get_trusted_converters_happy_paths(self):
+        converters = dict(
+            _get_trusted_converters(TrustedWidget)
+        )
+        # Fields whose JSON values are already the right
+        # type, or have non-Optional union types, are not
+        # converted
+        self.assertEqual(
+            list(converters),
+            ['oid', 'price', 'main_part', 'parts', 'spare']
+        )
+        self.assertIs(converters['oid'], UUID)
+        self.assertIs(
+            _get_trusted_converters(TrustedWidget),
+            _get_trusted_converters(TrustedWidget)
+        )
+
+
+class test__get_field_adapter(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_FUNCTION = '_get_field_adapter'
+
+    def test__get_field_adapter_bad_model_class(self):
+        for model_class in (1, 'two', object):
+            with self.subTest(
+                msg=f'Testing with {model_class!r}'
+            ):
+                with self.assertRaises(TypeCheckError):
+                    _get_field_adapter(model_class, 'oid')
+
+    def test__get_field_adapter_bad_name(self):
+        with self.assertRaises(TypeCheckError):
+            _get_field_adapter(ExampleModel, 1)
+        with self.assertRaises(KeyError):
+            _get_field_adapter(ExampleModel, 'no_such_field')
+
+    def test__get_field_adapter_happy_paths(self):
+        adapter = _get_field_adapter(ExampleModel, 'is_active')
+        self.assertIs(adapter.validate_python(1), True)
+        oid = uuid4()
+        self.assertEqual(
+            _get_field_adapter(ExampleModel, 'oid')
+            .validate_python(str(oid).upper()),
+            oid
+        )
+        self.assertIs(
+            _get_field_adapter(ExampleModel, 'oid'),
+            _get_field_adapter(ExampleModel, 'oid')
+        )
+
+
+class test__convert_items(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.data_objects'
+    TARGET_FUNCTION = '_convert_items'
+
+    def test__convert_items_bad_converter(self):
+        with self.assertRaises(TypeError):
+            _convert_items(None, ['1'])
+
+    def test__convert_items_bad_values(self):
+        with self.assertRaises(TypeError):
+            _convert_items(int, 1)
+
+    def test__convert_items_happy_paths(self):
+        self.assertEqual(_convert_items(int, ['1', '2']), [1, 2])
+        self.assertEqual(_convert_items(int, []), [])
+
+
 # Code to run if the module is executed directly
 if __name__ == '__main__':
 
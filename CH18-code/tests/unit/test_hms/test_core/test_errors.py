@@ -0,0 +1,110 @@
+#!/usr/bin/env python3.11
+"""
+"""
+
+# Built-In Imports
+import subprocess
+import sys
+import unittest
+
+# Third-Party Imports
+from goblinfish.testing.pact.modules import \
+    ExaminesModuleMembers
+from goblinfish.testing.pact.module_members import \
+    ExaminesSourceClass
+
+# Path Manipulations (avoid these!) and "Local" Imports
+from hms.core import business_objects
+
+# Import the test target
+from hms.core.errors import ArtisanNotFoundError, \
+    ProductImageNotFoundError, ProductNotFoundError
+
+
+# Source-to-test-module correspondance test
+class test_ProjectTestMembersExist(
+    unittest.TestCase,
+    ExaminesModuleMembers
+):
+    """
+    Tests that all source module members have
+    corresponding test module members in this
+    test module.
+    """
+    TARGET_MODULE = 'hms.core.errors'
+
+    def test_errors_imports_nothing_heavy(self):
+        # Importing the errors must not import the business
+        # objects, or the packages they depend on
+        completed = subprocess.run(
+            [
+                sys.executable, '-c',
+                'import sys, hms.core.errors; print(sorted('
+                'name for name in ("hms.core.business_objects", '
+                '"pydantic", "pymysql", "typeguard") '
+                'if name in sys.modules))'
+            ],
+            capture_output=True, text=True, check=True,
+            env={'PYTHONPATH': ':'.join(sys.path)}
+        )
+        self.assertEqual(completed.stdout.strip(), '[]')
+
+
+class test_ArtisanNotFoundError(
+    unittest.TestCase,
+    ExaminesSourceClass
+):
+    TARGET_MODULE = 'hms.core.errors'
+    TARGET_CLASS = 'ArtisanNotFoundError'
+
+    def test_is_available_from_business_objects(self):
+        self.assertIs(
+            business_objects.ArtisanNotFoundError,
+            ArtisanNotFoundError
+        )
+
+    def test_is_an_exception(self):
+        with self.assertRaises(Exception):
+            raise ArtisanNotFoundError('No Artisan')
+
+
+class test_ProductImageNotFoundError(
+    unittest.TestCase,
+    ExaminesSourceClass
+):
+    TARGET_MODULE = 'hms.core.errors'
+    TARGET_CLASS = 'ProductImageNotFoundError'
+
+    def test_is_available_from_business_objects(self):
+        self.assertIs(
+            business_objects.ProductImageNotFoundError,
+            ProductImageNotFoundError
+        )
+
+    def test_is_an_exception(self):
+        with self.assertRaises(Exception):
+            raise ProductImageNotFoundError('No ProductImage')
+
+
+class test_ProductNotFoundError(
+    unittest.TestCase,
+    ExaminesSourceClass
+):
+    TARGET_MODULE = 'hms.core.errors'
+    TARGET_CLASS = 'ProductNotFoundError'
+
+    def test_is_available_from_business_objects(self):
+        self.assertIs(
+            business_objects.ProductNotFoundError,
+            ProductNotFoundError
+        )
+
+    def test_is_an_exception(self):
+        with self.assertRaises(Exception):
+            raise ProductNotFoundError('No Product')
+
+
+# Code to run if the module is executed directly
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3.11
+"""
+"""
+
+# Built-In Imports
+import base64
+import gzip
+import json
+import os
+import unittest
+
+from unittest.mock import MagicMock, patch
+
+# Third-Party Imports
+from goblinfish.testing.pact.modules import \
+    ExaminesModuleMembers
+from goblinfish.testing.pact.module_members import \
+    ExaminesSourceFunction
+
+from typeguard import TypeCheckError
+
+# Path Manipulations (avoid these!) and "Local" Imports
+
+# Import the test target
+from hms.core.responses import _get_env_response_settings, \
+    _import_brotli, compress_body, etag_matches, \
+    get_content_encoding, get_etag, get_request_header, \
+    json_response, not_modified, RESPONSE_DEFAULTS
+
+# Results large enough to be compressed by default
+LARGE_RESULTS = [
+    {'oid': f'{number:032x}', 'name': 'A product name'}
+    for number in range(50)
+]
+
+
+# Source-to-test-module correspondance test
+class test_ProjectTestMembersExist(
+    unittest.TestCase,
+    ExaminesModuleMembers
+):
+    """
+    Tests that all source module members have
+    corresponding test module members in this
+    test module.
+    """
+    TARGET_MODULE = 'hms.core.responses'
+
+
+class test__get_env_response_settings(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.responses'
+    TARGET_FUNCTION = '_get_env_response_settings'
+
+    def test__get_env_response_settings_happy_paths(self):
+        with patch.dict(os.environ, clear=True):
+            self.assertEqual(
+                _get_env_response_settings(), RESPONSE_DEFAULTS
+            )
+        with patch.dict(
+            os.environ, {'HMS_COMPRESSION_MIN_SIZE': '0'}
+        ):
+            self.assertEqual(
+                _get_env_response_settings(),
+                {'HMS_COMPRESSION_MIN_SIZE': 0}
+            )
+
+
+class test__import_brotli(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.responses'
+    TARGET_FUNCTION = '_import_brotli'
+
+    def setUp(self):
+        _import_brotli.cache_clear()
+
+    def tearDown(self):
+        _import_brotli.cache_clear()
+
+    def test__import_brotli_happy_paths(self):
+        mock_brotli = MagicMock()
+        with patch.dict('sys.modules', {'brotli': mock_brotli}):
+            self.assertIs(_import_brotli(), mock_brotli)
+        _import_brotli.cache_clear()
+        with patch.dict('sys.modules', {'brotli': None}):
+            self.assertIsNone(_import_brotli())
+
+
+class test_compress_body(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.responses'
+    TARGET_FUNCTION = 'compress_body'
+
+    def test_compress_body_bad_body(self):
+        with self.assertRaises(TypeCheckError):
+            compress_body('not bytes', 'gzip')
+
+    def test_compress_body_bad_encoding(self):
+        with self.assertRaises(TypeCheckError):
+            compress_body(b'body', None)
+        with self.assertRaises(ValueError):
+            compress_body(b'body', 'deflate')
+
+    @patch('hms.core.responses._import_brotli')
+    def test_compress_body_happy_paths(self, mock_import):
+        body = json.dumps(LARGE_RESULTS).encode('utf-8')
+        compressed = compress_body(body, 'gzip')
+        self.assertEqual(gzip.decompress(compressed), body)
+        # The same body is always compressed the same way
+        self.assertEqual(compress_body(body, 'gzip'), compressed)
+        mock_import.return_value.compress.return_value = b'br'
+        self.assertEqual(compress_body(body, 'br'), b'br')
+        mock_import.return_value.compress.assert_called_once_with(
+            body, quality=5
+        )
+        with self.subTest(msg='Test br without brotli'):
+            mock_import.return_value = None
+            with self.assertRaises(ValueError):
+                compress_body(body, 'br')
+
+
+class test_etag_matches(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.responses'
+    TARGET_FUNCTION = 'etag_matches'
+
+    def test_etag_matches_bad_if_none_match(self):
+        with self.assertRaises(TypeCheckError):
+            etag_matches(['W/"abc"'], 'W/"abc"')
+
+    def test_etag_matches_bad_etag(self):
+        with self.assertRaises(TypeCheckError):
+            etag_matches('W/"abc"', None)
+
+    def test_etag_matches_happy_paths(self):
+        etag = 'W/"abc"'
+        for if_none_match, expected in (
+            (None, False),
+            ('', False),
+            ('*', True),
+            ('W/"abc"', True),
+            ('"abc"', True),
+            ('"xyz", W/"abc"', True),
+            ('"xyz"', False),
+            ('"ab"', False),
+        ):
+            with self.subTest(if_none_match=if_none_match):
+                self.assertEqual(
+                    etag_matches(if_none_match, etag), expected
+                )
+
+
+class test_get_content_encoding(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.responses'
+    TARGET_FUNCTION = 'get_content_encoding'
+
+    def test_get_content_encoding_bad_accept_encoding(self):
+        with self.assertRaises(TypeCheckError):
+            get_content_encoding(['gzip'])
+
+    @patch('hms.core.responses._import_brotli')
+    def test_get_content_encoding_happy_paths(self, mock_import):
+        for accept_encoding, expected in (
+            (None, None),
+            ('', None),
+            ('identity', None),
+            ('deflate', None),
+            ('gzip', 'gzip'),
+            ('GZIP;q=0.5', 'gzip'),
+            ('gzip, deflate, br', 'br'),
+            ('gzip;q=1.0, br;q=0.8', 'gzip'),
+            ('br;q=0', None),
+            ('br;q=0, gzip', 'gzip'),
+            ('*', 'br'),
+            ('*, br;q=0', 'gzip'),
+            ('gzip;q=bad', None),
+        ):
+            with self.subTest(accept_encoding=accept_encoding):
+                self.assertEqual(
+                    get_content_encoding(accept_encoding), expected
+                )
+        with self.subTest(msg='Test without brotli'):
+            mock_import.return_value = None
+            self.assertEqual(
+                get_content_encoding('gzip, deflate, br'), 'gzip'
+            )
+            self.assertIsNone(get_content_encoding('br'))
+
+
+class test_get_etag(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.responses'
+    TARGET_FUNCTION = 'get_etag'
+
+    def test_get_etag_bad_data(self):
+        # Any data is allowed, but it must have a repr
+
+        class Unrepresentable:
+            def __repr__(self):
+                raise RuntimeError('No repr')
+
+        with self.assertRaises(RuntimeError):
+            get_etag([Unrepresentable()])
+
+    def test_get_etag_happy_paths(self):
+        etag = get_etag(LARGE_RESULTS)
+        self.assertRegex(etag, r'^W/"[0-9a-f]{32}"$')
+        self.assertEqual(
+            get_etag([dict(item) for item in LARGE_RESULTS]), etag
+        )
+        self.assertNotEqual(get_etag(LARGE_RESULTS[1:]), etag)
+        self.assertNotEqual(get_etag([]), get_etag({}))
+
+
+class test_get_request_header(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.responses'
+    TARGET_FUNCTION = 'get_request_header'
+
+    def test_get_request_header_bad_event(self):
+        with self.assertRaises(TypeCheckError):
+            get_request_header(None, 'ETag')
+
+    def test_get_request_header_bad_name(self):
+        with self.assertRaises(TypeCheckError):
+            get_request_header({}, None)
+
+    def test_get_request_header_happy_paths(self):
+        event = {'headers': {'if-none-match': 'W/"abc"'}}
+        self.assertEqual(
+            get_request_header(event, 'If-None-Match'), 'W/"abc"'
+        )
+        self.assertIsNone(get_request_header(event, 'Accept'))
+        self.assertIsNone(get_request_header({}, 'Accept'))
+        self.assertIsNone(
+            get_request_header({'headers': None}, 'Accept')
+        )
+
+
+class test_json_response(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.responses'
+    TARGET_FUNCTION = 'json_response'
+
+    def setUp(self):
+        self.environ_patcher = patch.dict(os.environ, clear=True)
+        self.environ_patcher.start()
+
+    def tearDown(self):
+        self.environ_patcher.stop()
+
+    def test_json_response_bad_event(self):
+        with self.assertRaises(TypeCheckError):
+            json_response(None, [])
+
+    def test_json_response_bad_data(self):
+        # Any data is allowed, but it must be serializable
+        with self.assertRaises(TypeError):
+            json_response({}, [object()])
+
+    def test_json_response_bad_status_code(self):
+        with self.assertRaises(TypeCheckError):
+            json_response({}, [], status_code='200')
+
+    def test_json_response_bad_etag(self):
+        with self.assertRaises(TypeCheckError):
+            json_response({}, [], etag=123)
+
+    def test_json_response_happy_paths(self):
+        etag = get_etag(LARGE_RESULTS)
+        with self.subTest(msg='Test without compression'):
+            self.assertEqual(
+                json_response({}, LARGE_RESULTS),
+                {
+                    'statusCode': 200,
+                    'headers': {
+                        'ETag': etag,
+                        'Vary': 'Accept-Encoding',
+                        'Content-Type': 'application/json',
+                    },
+                    'body': json.dumps(LARGE_RESULTS),
+                }
+            )
+        with self.subTest(msg='Test with compression'):
+            result = json_response(
+                {'headers': {'Accept-Encoding': 'gzip'}},
+                LARGE_RESULTS, status_code=201
+            )
+            self.assertEqual(result['statusCode'], 201)
+            self.assertTrue(result['isBase64Encoded'])
+            self.assertEqual(
+                result['headers']['Content-Encoding'], 'gzip'
+            )
+            self.assertEqual(
+                json.loads(
+                    gzip.decompress(base64.b64decode(result['body']))
+                ),
+                LARGE_RESULTS
+            )
+        with self.subTest(msg='Test with a small body'):
+            result = json_response(
+                {'headers': {'Accept-Encoding': 'gzip'}},
+                LARGE_RESULTS[:1]
+            )
+            self.assertNotIn('Content-Encoding', result['headers'])
+            self.assertNotIn('isBase64Encoded', result)
+        with self.subTest(msg='Test with compression switched off'):
+            with patch.dict(
+                os.environ, {'HMS_COMPRESSION_MIN_SIZE': '0'}
+            ):
+                result = json_response(
+                    {'headers': {'Accept-Encoding': 'gzip'}},
+                    LARGE_RESULTS
+                )
+            self.assertEqual(result['headers'], {
+                'ETag': etag, 'Content-Type': 'application/json'
+            })
+        with self.subTest(msg='Test with a matching If-None-Match'):
+            with patch('hms.core.responses.json.dumps') as mock_dumps:
+                result = json_response(
+                    {'headers': {'if-none-match': etag}},
+                    LARGE_RESULTS
+                )
+            # The results are never serialized
+            mock_dumps.assert_not_called()
+            self.assertEqual(
+                result,
+                {
+                    'statusCode': 304,
+                    'headers': {
+                        'ETag': etag, 'Vary': 'Accept-Encoding'
+                    },
+                    'body': '',
+                }
+            )
+        with self.subTest(msg='Test with an ETag provided'):
+            result = json_response(
+                {'headers': {'If-None-Match': '"v42"'}},
+                LARGE_RESULTS, etag='"v42"'
+            )
+            self.assertEqual(result['statusCode'], 304)
+            self.assertEqual(result['headers']['ETag'], '"v42"')
+
+
+class test_not_modified(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.responses'
+    TARGET_FUNCTION = 'not_modified'
+
+    def setUp(self):
+        self.environ_patcher = patch.dict(os.environ, clear=True)
+        self.environ_patcher.start()
+
+    def tearDown(self):
+        self.environ_patcher.stop()
+
+    def test_not_modified_bad_event(self):
+        with self.assertRaises(TypeCheckError):
+            not_modified(None, 'W/"abc"')
+
+    def test_not_modified_bad_etag(self):
+        with self.assertRaises(TypeCheckError):
+            not_modified({}, None)
+
+    def test_not_modified_happy_paths(self):
+        event = {'headers': {'If-None-Match': 'W/"abc"'}}
+        self.assertEqual(
+            not_modified(event, 'W/"abc"'),
+            {
+                'statusCode': 304,
+                'headers': {
+                    'ETag': 'W/"abc"', 'Vary': 'Accept-Encoding'
+                },
+                'body': '',
+            }
+        )
+        self.assertIsNone(not_modified(event, 'W/"xyz"'))
+        self.assertIsNone(not_modified({}, 'W/"abc"'))
+        with self.subTest(msg='Test with compression switched off'):
+            with patch.dict(
+                os.environ, {'HMS_COMPRESSION_MIN_SIZE': '0'}
+            ):
+                self.assertEqual(
+                    not_modified(event, 'W/"abc"')['headers'],
+                    {'ETag': 'W/"abc"'}
+                )
+
+
+# Code to run if the module is executed directly
+if __name__ == '__main__':
+
+    unittest.main()
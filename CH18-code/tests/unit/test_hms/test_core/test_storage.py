@@ -0,0 +1,621 @@
+#!/usr/bin/env python3.11
+"""
+"""
+
+# Built-In Imports
+import gc
+import os
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest.mock import MagicMock, call, patch
+from uuid import uuid4
+
+# Third-Party Imports
+from goblinfish.testing.pact.modules import \
+    ExaminesModuleMembers
+from goblinfish.testing.pact.module_members import \
+    ExaminesSourceClass, ExaminesSourceFunction
+
+from typeguard import TypeCheckError
+
+# Path Manipulations (avoid these!) and "Local" Imports
+
+# Import the test target
+from hms.core.storage import \
+    _create_s3_client, delete_image, delete_images, \
+    delete_objects, _get_s3_image_urls, get_s3_client, \
+    IMAGE_FILE_EXTENSIONS, MAX_DELETE_KEYS, MINIMUM_PART_SIZE, ObjectStoreError, \
+    parse_s3_url, S3_ENDPOINT_URL_ENV_VAR, S3ObjectWriter
+
+# The bucket used by the tests that run against a local S3
+# stand-in, when HMS_S3_ENDPOINT_URL is set
+TEST_BUCKET = os.getenv('HMS_S3_TEST_BUCKET', 'hms-storage-tests')
+
+
+def make_mock_client():
+    """
+    Creates a MagicMock S3 client that returns the responses
+    the S3ObjectWriter and delete_objects use.
+    """
+    mock_client = MagicMock()
+    mock_client.create_multipart_upload.return_value = {
+        'UploadId': 'upload-id'
+    }
+    mock_client.upload_part.side_effect = \
+        lambda **kwargs: {'ETag': f'etag-{kwargs["PartNumber"]}'}
+    mock_client.delete_objects.return_value = {}
+    return mock_client
+
+
+# Source-to-test-module correspondance test
+class test_ProjectTestMembersExist(
+    unittest.TestCase,
+    ExaminesModuleMembers
+):
+    """
+    Tests that all source module members have
+    corresponding test module members in this
+    test module.
+    """
+    TARGET_MODULE = 'hms.core.storage'
+
+
+class test__create_s3_client(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.storage'
+    TARGET_FUNCTION = '_create_s3_client'
+
+    def setUp(self):
+        _create_s3_client.cache_clear()
+
+    def tearDown(self):
+        _create_s3_client.cache_clear()
+
+    def test__create_s3_client_happy_paths(self):
+        with self.subTest(msg='Testing the default endpoint'):
+            with patch.dict(
+                os.environ, {'AWS_DEFAULT_REGION': 'us-east-1'}
+            ):
+                os.environ.pop(S3_ENDPOINT_URL_ENV_VAR, None)
+                client = _create_s3_client()
+                self.assertIn(
+                    'amazonaws.com', client.meta.endpoint_url
+                )
+                self.assertIs(_create_s3_client(), client)
+
+        _create_s3_client.cache_clear()
+        with self.subTest(msg='Testing a local stand-in'):
+            with patch.dict(
+                os.environ, {
+                    'AWS_DEFAULT_REGION': 'us-east-1',
+                    S3_ENDPOINT_URL_ENV_VAR: 'http://localhost:9000',
+                }
+            ):
+                client = _create_s3_client()
+                self.assertEqual(
+                    client.meta.endpoint_url,
+                    'http://localhost:9000'
+                )
+
+
+class test__get_s3_image_urls(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.storage'
+    TARGET_FUNCTION = '_get_s3_image_urls'
+
+    def test__get_s3_image_urls_bad_location(self):
+        with self.assertRaises(TypeCheckError):
+            _get_s3_image_urls(None, ['1'])
+
+    def test__get_s3_image_urls_bad_oids(self):
+        with self.assertRaises(TypeCheckError):
+            _get_s3_image_urls('s3://images', '1')
+
+    def test__get_s3_image_urls_happy_paths(self):
+        with patch.dict(os.environ, {'IMAGE_BUCKET': 'images'}):
+            self.assertEqual(
+                _get_s3_image_urls(
+                    's3://{IMAGE_BUCKET}/thumbnails/', ['1', '2']
+                ),
+                [
+                    f's3://images/thumbnails/{oid}.{extension}'
+                    for oid in ('1', '2')
+                    for extension in IMAGE_FILE_EXTENSIONS
+                ]
+            )
+
+
+class test_delete_image(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.storage'
+    TARGET_FUNCTION = 'delete_image'
+
+    def test_delete_image_bad_location(self):
+        with self.assertRaises(TypeCheckError):
+            delete_image(None, 'oid')
+        with self.assertRaises(RuntimeError):
+            delete_image('ftp://images', 'oid')
+
+    def test_delete_image_bad_oid(self):
+        with self.assertRaises(TypeCheckError):
+            delete_image('file:///tmp', uuid4())
+
+    @patch('hms.core.storage.delete_objects')
+    def test_delete_image_happy_paths(self, mock_delete_objects):
+        with self.subTest(msg='Testing a local location'):
+            with tempfile.TemporaryDirectory() as directory:
+                for name in ('1.jpg', '1.webp', '2.jpg'):
+                    (Path(directory) / name).touch()
+                delete_image(f'file:///{directory}', '1')
+                self.assertEqual(
+                    sorted(
+                        path.name for path
+                        in Path(directory).iterdir()
+                    ),
+                    ['2.jpg']
+                )
+            mock_delete_objects.assert_not_called()
+
+        with self.subTest(msg='Testing an S3 location'):
+            delete_image('s3://images/detail', '1')
+            mock_delete_objects.assert_called_once_with(
+                *_get_s3_image_urls('s3://images/detail', ['1'])
+            )
+
+
+class test_delete_images(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.storage'
+    TARGET_FUNCTION = 'delete_images'
+
+    def test_delete_images_bad_locations(self):
+        with self.assertRaises(TypeCheckError):
+            delete_images(['1'], None)
+
+    def test_delete_images_bad_oids(self):
+        with self.assertRaises(TypeCheckError):
+            delete_images('1', 's3://images/detail')
+
+    @patch('hms.core.storage.delete_objects')
+    def test_delete_images_happy_paths(self, mock_delete_objects):
+        oids = [uuid4(), uuid4()]
+        with tempfile.TemporaryDirectory() as directory:
+            for oid in oids:
+                (Path(directory) / f'{oid}.png').touch()
+            delete_images(
+                oids,
+                f'file:///{directory}',
+                's3://images/detail',
+                's3://thumbnails',
+            )
+            self.assertEqual(list(Path(directory).iterdir()), [])
+        # All of the S3 objects are deleted with one call
+        mock_delete_objects.assert_called_once_with(
+            *_get_s3_image_urls('s3://images/detail', oids),
+            *_get_s3_image_urls('s3://thumbnails', oids),
+        )
+
+
+class test_delete_objects(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.storage'
+    TARGET_FUNCTION = 'delete_objects'
+
+    def test_delete_objects_bad_urls(self):
+        with self.assertRaises(TypeCheckError):
+            delete_objects(1)
+        with self.assertRaises(ValueError):
+            delete_objects('file:///tmp/image.png')
+
+    @patch('hms.core.storage.get_s3_client')
+    def test_delete_objects_happy_paths(self, mock_get_client):
+        mock_client = mock_get_client.return_value = \
+            make_mock_client()
+
+        with self.subTest(msg='Testing no URLs'):
+            delete_objects()
+            mock_client.delete_objects.assert_not_called()
+
+        with self.subTest(msg='Testing one call per bucket'):
+            delete_objects(
+                's3://images/original/1.jpg',
+                's3://images/detail/1.webp',
+                's3://thumbnails/1.webp',
+            )
+            self.assertEqual(
+                mock_client.delete_objects.call_args_list,
+                [
+                    call(
+                        Bucket='images',
+                        Delete={
+                            'Objects': [
+                                {'Key': 'original/1.jpg'},
+                                {'Key': 'detail/1.webp'},
+                            ],
+                            'Quiet': True,
+                        }
+                    ),
+                    call(
+                        Bucket='thumbnails',
+                        Delete={
+                            'Objects': [{'Key': '1.webp'}],
+                            'Quiet': True,
+                        }
+                    ),
+                ]
+            )
+
+        mock_client.reset_mock()
+        with self.subTest(msg='Testing batches of MAX_DELETE_KEYS'):
+            delete_objects(
+                *[
+                    f's3://images/{number}.png'
+                    for number in range(MAX_DELETE_KEYS + 1)
+                ]
+            )
+            self.assertEqual(mock_client.delete_objects.call_count, 2)
+
+        with self.subTest(msg='Testing a failure'):
+            mock_client.delete_objects.return_value = {
+                'Errors': [{'Key': '1.png', 'Code': 'AccessDenied'}]
+            }
+            with self.assertRaises(ObjectStoreError):
+                delete_objects('s3://images/1.png')
+
+
+class test_get_s3_client(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.storage'
+    TARGET_FUNCTION = 'get_s3_client'
+
+    @patch('hms.core.storage._create_s3_client')
+    def test_get_s3_client_happy_paths(self, mock_create):
+        self.assertIs(get_s3_client(), mock_create.return_value)
+        mock_create.assert_called_once_with()
+
+
+class test_ObjectStoreError(
+    unittest.TestCase,
+    ExaminesSourceClass
+):
+    TARGET_MODULE = 'hms.core.storage'
+    TARGET_CLASS = 'ObjectStoreError'
+
+    def test_is_an_exception(self):
+        with self.assertRaises(Exception):
+            raise ObjectStoreError('Could not delete')
+
+
+class test_parse_s3_url(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.storage'
+    TARGET_FUNCTION = 'parse_s3_url'
+
+    def test_parse_s3_url_bad_url(self):
+        with self.assertRaises(TypeCheckError):
+            parse_s3_url(None)
+        for url in (
+            'file:///tmp/image.png', 's3://', 's3://bucket',
+            's3://bucket/', 's3:///key',
+        ):
+            with self.subTest(msg=f'Testing "{url}"'):
+                with self.assertRaises(ValueError):
+                    parse_s3_url(url)
+
+    def test_parse_s3_url_happy_paths(self):
+        self.assertEqual(
+            parse_s3_url('s3://images/original/1.jpg'),
+            ('images', 'original/1.jpg')
+        )
+        self.assertEqual(
+            parse_s3_url('s3://images/1.jpg'), ('images', '1.jpg')
+        )
+
+
+class test_S3ObjectWriter(
+    unittest.TestCase,
+    ExaminesSourceClass
+):
+    TARGET_MODULE = 'hms.core.storage'
+    TARGET_CLASS = 'S3ObjectWriter'
+
+    URL = 's3://images/original/1.jpg'
+
+    def setUp(self):
+        patcher = patch(
+            'hms.core.storage.get_s3_client',
+            return_value=make_mock_client()
+        )
+        self.mock_client = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+    def test___del___happy_paths(self):
+        mock_client = self.mock_client
+
+        with self.subTest(msg='Testing a single-part upload'):
+            writer = S3ObjectWriter(self.URL)
+            writer.write(b'data')
+            del writer
+            gc.collect()
+            mock_client.put_object.assert_not_called()
+
+        with self.subTest(msg='Testing a multipart upload'):
+            writer = S3ObjectWriter(
+                self.URL, part_size=MINIMUM_PART_SIZE
+            )
+            writer.write(bytes(MINIMUM_PART_SIZE + 1))
+            del writer
+            gc.collect()
+            mock_client.put_object.assert_not_called()
+            mock_client.upload_part.assert_called_once()
+            mock_client.complete_multipart_upload.assert_not_called()
+            mock_client.abort_multipart_upload.assert_called_once_with(
+                Bucket='images', Key='original/1.jpg',
+                UploadId='upload-id'
+            )
+
+        mock_client.reset_mock()
+        with self.subTest(msg='Testing a closed writer'):
+            writer = S3ObjectWriter(self.URL)
+            writer.write(b'data')
+            writer.close()
+            del writer
+            gc.collect()
+            mock_client.put_object.assert_called_once()
+            mock_client.abort_multipart_upload.assert_not_called()
+
+    def test___exit___happy_paths(self):
+        mock_client = self.mock_client
+
+        with self.subTest(msg='Testing completion'):
+            with S3ObjectWriter(self.URL) as writer:
+                writer.write(b'data')
+            self.assertTrue(writer.closed)
+            mock_client.put_object.assert_called_once()
+
+        mock_client.reset_mock()
+        with self.subTest(msg='Testing an aborted upload'):
+            with self.assertRaises(RuntimeError):
+                with S3ObjectWriter(
+                    self.URL, part_size=MINIMUM_PART_SIZE
+                ) as writer:
+                    writer.write(bytes(MINIMUM_PART_SIZE))
+                    raise RuntimeError('Encoding failed')
+            self.assertTrue(writer.closed)
+            mock_client.put_object.assert_not_called()
+            mock_client.complete_multipart_upload.assert_not_called()
+            mock_client.abort_multipart_upload.assert_called_once_with(
+                Bucket='images', Key='original/1.jpg',
+                UploadId='upload-id'
+            )
+
+    def test___init___happy_paths(self):
+        writer = S3ObjectWriter(self.URL, content_type='image/jpeg')
+        self.assertTrue(writer.writable())
+        self.assertFalse(writer.closed)
+        with self.assertRaises(AssertionError):
+            S3ObjectWriter(self.URL, part_size=MINIMUM_PART_SIZE - 1)
+        with self.assertRaises(ValueError):
+            S3ObjectWriter('s3://images')
+        with self.assertRaises(TypeCheckError):
+            S3ObjectWriter(self.URL, part_size='8MB')
+
+    def test__upload_part_happy_paths(self):
+        mock_client = self.mock_client
+        writer = S3ObjectWriter(self.URL, content_type='image/jpeg')
+        writer._upload_part(b'one')
+        writer._upload_part(b'two')
+        mock_client.create_multipart_upload.assert_called_once_with(
+            Bucket='images', Key='original/1.jpg',
+            ContentType='image/jpeg'
+        )
+        self.assertEqual(
+            writer._parts,
+            [
+                {'ETag': 'etag-1', 'PartNumber': 1},
+                {'ETag': 'etag-2', 'PartNumber': 2},
+            ]
+        )
+
+    def test_abort_happy_paths(self):
+        mock_client = self.mock_client
+
+        with self.subTest(msg='Testing before any parts'):
+            writer = S3ObjectWriter(self.URL)
+            writer.write(b'data')
+            writer.abort()
+            self.assertTrue(writer.closed)
+            mock_client.abort_multipart_upload.assert_not_called()
+            # Closing an aborted writer uploads nothing
+            writer.close()
+            mock_client.put_object.assert_not_called()
+
+        with self.subTest(msg='Testing after a part'):
+            writer = S3ObjectWriter(
+                self.URL, part_size=MINIMUM_PART_SIZE
+            )
+            writer.write(bytes(MINIMUM_PART_SIZE))
+            writer.abort()
+            mock_client.abort_multipart_upload.assert_called_once()
+
+    def test_close_happy_paths(self):
+        mock_client = self.mock_client
+
+        with self.subTest(msg='Testing a single put_object'):
+            writer = S3ObjectWriter(self.URL, content_type='image/jpeg')
+            writer.write(b'small')
+            writer.close()
+            writer.close()
+            mock_client.put_object.assert_called_once_with(
+                Bucket='images', Key='original/1.jpg',
+                Body=b'small', ContentType='image/jpeg'
+            )
+            mock_client.create_multipart_upload.assert_not_called()
+
+        mock_client.reset_mock()
+        with self.subTest(msg='Testing a multipart upload'):
+            writer = S3ObjectWriter(
+                self.URL, part_size=MINIMUM_PART_SIZE
+            )
+            writer.write(bytes(MINIMUM_PART_SIZE + 10))
+            writer.close()
+            mock_client.put_object.assert_not_called()
+            self.assertEqual(
+                len(mock_client.upload_part.call_args_list[-1]
+                    .kwargs['Body']),
+                10
+            )
+            mock_client.complete_multipart_upload \
+                .assert_called_once_with(
+                    Bucket='images', Key='original/1.jpg',
+                    UploadId='upload-id',
+                    MultipartUpload={
+                        'Parts': [
+                            {'ETag': 'etag-1', 'PartNumber': 1},
+                            {'ETag': 'etag-2', 'PartNumber': 2},
+                        ]
+                    }
+                )
+
+        mock_client.reset_mock()
+        with self.subTest(msg='Testing a failed completion'):
+            mock_client.complete_multipart_upload.side_effect = \
+                RuntimeError('Completion failed')
+            writer = S3ObjectWriter(
+                self.URL, part_size=MINIMUM_PART_SIZE
+            )
+            writer.write(bytes(MINIMUM_PART_SIZE))
+            with self.assertRaises(RuntimeError):
+                writer.close()
+            self.assertTrue(writer.closed)
+            mock_client.abort_multipart_upload.assert_called_once()
+
+    def test_writable_happy_paths(self):
+        self.assertTrue(S3ObjectWriter(self.URL).writable())
+
+    def test_write_happy_paths(self):
+        mock_client = self.mock_client
+        part_size = MINIMUM_PART_SIZE
+        data = os.urandom(part_size * 2 + part_size // 2)
+        writer = S3ObjectWriter(self.URL, part_size=part_size)
+
+        # Writes smaller than a part are buffered, and parts
+        # are uploaded as soon as they are full, whatever the
+        # sizes of the writes
+        self.assertEqual(writer.write(data[:100]), 100)
+        mock_client.upload_part.assert_not_called()
+        self.assertEqual(
+            writer.write(memoryview(data)[100:part_size * 2 + 50]),
+            part_size * 2 - 50
+        )
+        self.assertEqual(mock_client.upload_part.call_count, 2)
+        writer.write(data[part_size * 2 + 50:])
+        writer.close()
+        uploaded = b''.join(
+            part_call.kwargs['Body']
+            for part_call in mock_client.upload_part.call_args_list
+        )
+        self.assertEqual(uploaded, data)
+        with self.assertRaises(ValueError):
+            writer.write(b'more')
+
+
+@unittest.skipUnless(
+    os.getenv(S3_ENDPOINT_URL_ENV_VAR),
+    f'{S3_ENDPOINT_URL_ENV_VAR} is not set to the URL of a '
+    'local S3 stand-in'
+)
+class test_S3ObjectStore(unittest.TestCase):
+    """
+    Tests writing and deleting objects in a local S3 stand-in
+    (MinIO, LocalStack, moto's server mode, etc.) at the URL
+    in HMS_S3_ENDPOINT_URL.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        _create_s3_client.cache_clear()
+        cls.client = get_s3_client()
+        try:
+            cls.client.create_bucket(Bucket=TEST_BUCKET)
+        except cls.client.exceptions.BucketAlreadyOwnedByYou:
+            pass
+
+    @classmethod
+    def tearDownClass(cls):
+        _create_s3_client.cache_clear()
+
+    def _read(self, key):
+        return self.client.get_object(
+            Bucket=TEST_BUCKET, Key=key
+        )['Body'].read()
+
+    def test_write_and_delete(self):
+        small, large = f'{uuid4()}.jpg', f'{uuid4()}.jpg'
+        data = os.urandom(MINIMUM_PART_SIZE * 2 + 1024)
+
+        with S3ObjectWriter(
+            f's3://{TEST_BUCKET}/{small}', content_type='image/jpeg'
+        ) as writer:
+            writer.write(b'small')
+        with S3ObjectWriter(
+            f's3://{TEST_BUCKET}/{large}',
+            part_size=MINIMUM_PART_SIZE
+        ) as writer:
+            writer.write(data)
+        self.assertEqual(self._read(small), b'small')
+        self.assertEqual(self._read(large), data)
+        self.assertEqual(
+            self.client.head_object(
+                Bucket=TEST_BUCKET, Key=small
+            )['ContentType'],
+            'image/jpeg'
+        )
+
+        delete_objects(
+            f's3://{TEST_BUCKET}/{small}',
+            f's3://{TEST_BUCKET}/{large}',
+            f's3://{TEST_BUCKET}/no-such-object.png',
+        )
+        listed = self.client.list_objects_v2(Bucket=TEST_BUCKET)
+        keys = [item['Key'] for item in listed.get('Contents', [])]
+        self.assertNotIn(small, keys)
+        self.assertNotIn(large, keys)
+
+    def test_aborted_write(self):
+        key = f'{uuid4()}.jpg'
+        with self.assertRaises(RuntimeError):
+            with S3ObjectWriter(
+                f's3://{TEST_BUCKET}/{key}',
+                part_size=MINIMUM_PART_SIZE
+            ) as writer:
+                writer.write(bytes(MINIMUM_PART_SIZE))
+                raise RuntimeError('Encoding failed')
+        uploads = self.client.list_multipart_uploads(
+            Bucket=TEST_BUCKET
+        ).get('Uploads', [])
+        self.assertNotIn(key, [upload['Key'] for upload in uploads])
+        with self.assertRaises(self.client.exceptions.NoSuchKey):
+            self._read(key)
+
+
+# Code to run if the module is executed directly
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3.11
+"""
+"""
+
+# Built-In Imports
+import os
+import unittest
+
+from unittest.mock import patch
+
+# Third-Party Imports
+from goblinfish.testing.pact.modules import \
+    ExaminesModuleMembers
+from goblinfish.testing.pact.module_members import \
+    ExaminesSourceFunction
+
+from typeguard import typechecked as typeguard_typechecked
+
+# Path Manipulations (avoid these!) and "Local" Imports
+
+# Import the test target
+from hms.core import typechecks
+from hms.core.typechecks import \
+    _no_op_typechecked, typechecked, typechecks_enabled, \
+    TYPECHECKS_ENV_VAR, TYPECHECKS_OFF_VALUES
+
+
+# Source-to-test-module correspondance test
+class test_ProjectTestMembersExist(
+    unittest.TestCase,
+    ExaminesModuleMembers
+):
+    """
+    Tests that all source module members have
+    corresponding test module members in this
+    test module.
+    """
+    TARGET_MODULE = 'hms.core.typechecks'
+
+
+class test__no_op_typechecked(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.typechecks'
+    TARGET_FUNCTION = '_no_op_typechecked'
+
+    def test__no_op_typechecked_bad_options(self):
+        # Options are accepted, and ignored
+        def function(value: int) -> int:
+            return value
+
+        self.assertIs(
+            _no_op_typechecked(function, no_such_option=1),
+            function
+        )
+
+    def test__no_op_typechecked_bad_target(self):
+        # Anything can be "decorated"
+        for target in (1, 'two', object()):
+            with self.subTest(msg=f'Testing with {target!r}'):
+                self.assertIs(_no_op_typechecked(target), target)
+
+    def test__no_op_typechecked_happy_paths(self):
+        def function(value: int) -> int:
+            return value
+
+        with self.subTest(msg='Used without arguments'):
+            decorated = _no_op_typechecked(function)
+            self.assertIs(decorated, function)
+            # No type-checking happens
+            self.assertEqual(decorated('one'), 'one')
+
+        with self.subTest(msg='Used with arguments'):
+            decorator = _no_op_typechecked()
+            self.assertIs(decorator(function), function)
+
+
+class test_typechecks_enabled(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'hms.core.typechecks'
+    TARGET_FUNCTION = 'typechecks_enabled'
+
+    def test_typechecks_enabled_happy_paths(self):
+        with self.subTest(msg='Enabled when not set'):
+            with patch.dict(os.environ):
+                os.environ.pop(TYPECHECKS_ENV_VAR, None)
+                self.assertTrue(typechecks_enabled())
+        for value in ('on', '1', 'true', 'yes', ''):
+            with self.subTest(msg=f'Enabled by "{value}"'):
+                with patch.dict(
+                    os.environ, {TYPECHECKS_ENV_VAR: value}
+                ):
+                    self.assertTrue(typechecks_enabled())
+        for value in TYPECHECKS_OFF_VALUES + (' Off ', 'FALSE'):
+            with self.subTest(msg=f'Disabled by "{value}"'):
+                with patch.dict(
+                    os.environ, {TYPECHECKS_ENV_VAR: value}
+                ):
+                    self.assertFalse(typechecks_enabled())
+
+    def test_typechecked_is_typeguards_in_tests(self):
+        # The test-suite always runs with type-checking on
+        self.assertIs(typechecked, typeguard_typechecked)
+        self.assertIs(
+            typechecks.typechecked, typeguard_typechecked
+        )
+
+
+# Code to run if the module is executed directly
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3.11
+"""
+"""
+
+# Built-In Imports
+import os
+import sys
+import unittest
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Third-Party Imports
+from goblinfish.testing.pact.modules import \
+    ExaminesModuleMembers
+from goblinfish.testing.pact.module_members import \
+    ExaminesSourceFunction
+
+# Path Manipulations (avoid these!) and "Local" Imports
+from hms.core.caching import LocalCache, QueryCache
+
+# Handler modules are deployed as top-level modules
+sys.path.insert(
+    0, str(Path(__file__).parents[3] / 'src' / 'public_read_artisans')
+)
+
+# Import the test target
+from public_read_artisans import ARTISAN_FIELD_NAMES, \
+    api_handler  # noqa: E402
+
+CONTEXT = MagicMock(aws_request_id='some-request-id')
+
+
+class SharedCache(LocalCache):
+    """A back end standing in for one shared by processes"""
+    SHARED = True
+
+
+def make_artisans():
+    """
+    Creates and returns the records that Artisan.get returns.
+    """
+    return [
+        {
+            'oid': 'some-oid', 'honorific': None,
+            'given_name': 'Given', 'middle_name': None,
+            'family_name': 'Family', 'suffix': None,
+            'company_name': 'Company',
+        },
+        {
+            'oid': 'other-oid', 'honorific': None,
+            'given_name': 'Other', 'middle_name': None,
+            'family_name': 'Family', 'suffix': None,
+            'company_name': None,
+        },
+    ]
+
+
+# Source-to-test-module correspondance test
+class test_ProjectTestMembersExist(
+    unittest.TestCase,
+    ExaminesModuleMembers
+):
+    """
+    Tests that all source module members have
+    corresponding test module members in this
+    test module.
+    """
+    TARGET_MODULE = 'public_read_artisans'
+
+
+class test_api_handler(
+    unittest.TestCase,
+    ExaminesSourceFunction
+):
+    TARGET_MODULE = 'public_read_artisans'
+    TARGET_FUNCTION = 'api_handler'
+
+    def setUp(self):
+        self.environ_patcher = patch.dict(os.environ, clear=True)
+        self.environ_patcher.start()
+        self.get_patcher = patch(
+            'public_read_artisans.Artisan.get',
+            side_effect=lambda *args, **kwargs: make_artisans()
+        )
+        self.mock_get = self.get_patcher.start()
+        # No query cache by default
+        self.cache_patcher = patch(
+            'public_read_artisans.get_env_query_cache',
+            return_value=None
+        )
+        self.mock_env_cache = self.cache_patcher.start()
+
+    def tearDown(self):
+        self.cache_patcher.stop()
+        self.get_patcher.stop()
+        self.environ_patcher.stop()
+
+    def test_api_handler_bad_context(self):
+        # The context is only logged unless an error occurs
+        result = api_handler({}, None)
+        self.assertEqual(result['statusCode'], 200)
+
+    def test_api_handler_bad_event(self):
+        result = api_handler(
+            {'queryStringParameters': {'page_size': 'ten'}}, CONTEXT
+        )
+        self.assertEqual(result['statusCode'], 500)
+        self.assertIn('some-request-id', result['body'])
+        self.mock_get.assert_not_called()
+
+    def test_api_handler_happy_paths(self):
+        result = api_handler(
+            {
+                'queryStringParameters': {
+                    'page_size': '10', 'is_active': 'false',
+                },
+            },
+            CONTEXT
+        )
+        self.assertEqual(result['statusCode'], 200)
+        self.assertTrue(result['headers']['ETag'].startswith('W/"'))
+        # Reserved parameters are dropped
+        self.mock_get.assert_called_once_with(
+            db_source_name='Artisan', page_size=10,
+            page_number=None, is_active=True, is_deleted=False,
+            fields=ARTISAN_FIELD_NAMES,
+        )
+
+    def test_api_handler_not_modified(self):
+        etag = api_handler({}, CONTEXT)['headers']['ETag']
+        result = api_handler(
+            {'headers': {'If-None-Match': etag}}, CONTEXT
+        )
+        self.assertEqual(result['statusCode'], 304)
+        self.assertEqual(result['body'], '')
+        # Without a shared query cache, the ETag is a hash of
+        # the results, so they are still read
+        self.assertEqual(self.mock_get.call_count, 2)
+        with self.subTest(msg='Test with changed results'):
+            self.mock_get.side_effect = None
+            self.mock_get.return_value = make_artisans()[1:]
+            result = api_handler(
+                {'headers': {'If-None-Match': etag}}, CONTEXT
+            )
+            self.assertEqual(result['statusCode'], 200)
+            self.assertNotEqual(result['headers']['ETag'], etag)
+
+    def test_api_handler_not_modified_shared_cache(self):
+        query_cache = QueryCache(SharedCache())
+        self.mock_env_cache.return_value = query_cache
+        etag = api_handler({}, CONTEXT)['headers']['ETag']
+        result = api_handler(
+            {'headers': {'If-None-Match': etag}}, CONTEXT
+        )
+        # The version stamps vouch for the results, so they
+        # are not read again
+        self.assertEqual(result['statusCode'], 304)
+        self.mock_get.assert_called_once()
+        with self.subTest(msg='Test after an artisan changes'):
+            query_cache.bump('Artisan')
+            result = api_handler(
+                {'headers': {'If-None-Match': etag}}, CONTEXT
+            )
+            self.assertEqual(result['statusCode'], 200)
+            self.assertEqual(self.mock_get.call_count, 2)
+        with self.subTest(msg='Test with a process-local cache'):
+            self.mock_env_cache.return_value = \
+                QueryCache(LocalCache())
+            etag = api_handler({}, CONTEXT)['headers']['ETag']
+            api_handler({'headers': {'If-None-Match': etag}}, CONTEXT)
+            self.assertEqual(self.mock_get.call_count, 4)
+
+
+# Code to run if the module is executed directly
+if __name__ == '__main__':
+
+    unittest.main()